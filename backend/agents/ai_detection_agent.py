@@ -1,6 +1,8 @@
 from .base_agent import BaseAgent, AgentStatus
-from typing import Dict, Any
-import openai
+from .stylometry import StylometricScorer, screen
+from .llm_router import get_router
+from typing import Dict, Any, List
+import asyncio
 import os
 import logging
 
@@ -9,36 +11,20 @@ logger = logging.getLogger(__name__)
 class AIDetectionAgent(BaseAgent):
     def __init__(self):
         super().__init__("ai_detection_agent")
-        self.azure_client = None
-        self.openai_client = None
-        
-        try:
-            # Azure OpenAI
-            azure_api_key = os.getenv("OPENAI_API_KEY")
-            if azure_api_key:
-                azure_base_url = os.getenv("OPENAI_API_BASE")
-                if azure_base_url:
-                    self.azure_client = openai.OpenAI(api_key=azure_api_key, base_url=azure_base_url)
-                    logger.info("AI Detection agent initialized with Azure OpenAI")
-        except Exception as e:
-            logger.error(f"Azure OpenAI client initialization failed: {e}")
-            self.azure_client = None
-            
-        try:
-            # Standard OpenAI
-            openai_api_key = os.getenv("STANDARD_OPENAI_API_KEY")
-            if openai_api_key:
-                self.openai_client = openai.OpenAI(
-                    api_key=openai_api_key,
-                    base_url="https://api.openai.com/v1"
-                )
-                logger.info("AI Detection agent initialized with standard OpenAI")
-        except Exception as e:
-            logger.error(f"Standard OpenAI client initialization failed: {e}")
-            self.openai_client = None
+        self.router = get_router()
+        self.scorer = StylometricScorer()
+        # Local scores inside this band are too uncertain and go to the LLM. The band is
+        # fitted with the weights (calibration/fit_stylometry.py); the env overrides it.
+        low, high = self.scorer.ambiguous_band or (30, 70)
+        self.ambiguous_low = int(os.getenv("AI_SCREEN_AMBIGUOUS_LOW", str(low)))
+        self.ambiguous_high = int(os.getenv("AI_SCREEN_AMBIGUOUS_HIGH", str(high)))
+        self.llm_concurrency = int(os.getenv("AI_DETECTION_CONCURRENCY", "5"))
         
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            if data.get('action') == 'screen_batch':
+                return await self._screen_batch(data.get('students', []))
+            
             code = data.get('code')
             student_name = data.get('student_name')
             
@@ -50,7 +36,7 @@ class AIDetectionAgent(BaseAgent):
                     'status': 'no_code'
                 }
                 
-            ai_analysis = await self._detect_ai_code(code)
+            ai_analysis = (await self._analyze([code]))[0]
             
             return {
                 'student_name': student_name,
@@ -68,22 +54,71 @@ class AIDetectionAgent(BaseAgent):
                 'status': 'error'
             }
     
+    async def _screen_batch(self, students: List[Dict[str, Any]]) -> Dict[str, Any]:
+        codes = [student.get('code') or '' for student in students]
+        analyses = await self._analyze(codes)
+        
+        results = []
+        for student, analysis in zip(students, analyses):
+            results.append({
+                'student_name': student.get('student_name'),
+                'ai_percentage': analysis['percentage'],
+                'confidence': analysis['confidence'],
+                'indicators': analysis['indicators'],
+                'method': analysis['method'],
+                'status': 'completed' if student.get('code') else 'no_code'
+            })
+        
+        return {
+            'results': results,
+            'llm_calls': sum(1 for a in analyses if a['method'] == 'llm'),
+            'screened_locally': sum(1 for a in analyses if a['method'] == 'stylometry')
+        }
+    
+    async def _analyze(self, codes: List[str]) -> List[Dict[str, Any]]:
+        """Score every submission locally and send only the ambiguous ones to the LLM."""
+        local = screen(codes, self.scorer)
+        analyses = []
+        ambiguous = []
+        for idx, (code, screened) in enumerate(zip(codes, local)):
+            percentage = screened['percentage']
+            if not code:
+                analyses.append({'percentage': 0, 'confidence': 'low', 'indicators': [], 'method': 'none'})
+                continue
+            distance = max(self.ambiguous_low - percentage, percentage - self.ambiguous_high)
+            analyses.append({
+                'percentage': percentage,
+                'confidence': 'high' if distance >= 15 else 'medium',
+                'indicators': screened['indicators'],
+                'method': 'stylometry'
+            })
+            if distance < 0:
+                ambiguous.append(idx)
+        
+        if not self.router.has_providers():
+            # Deterministic local score is the fallback when no LLM is configured
+            for idx in ambiguous:
+                analyses[idx]['confidence'] = 'low'
+            return analyses
+        
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        
+        async def detect(idx):
+            async with semaphore:
+                result = await self._detect_ai_code(codes[idx])
+            analyses[idx] = {**result, 'method': 'llm'}
+        
+        await asyncio.gather(*(detect(idx) for idx in ambiguous))
+        return analyses
+    
     async def _detect_ai_code(self, code: str) -> Dict[str, Any]:
-        # Determine which client to use
-        api_type = os.getenv("OPENAI_API_TYPE", "openai").lower()
-        if api_type == "azure":
-            client = self.azure_client
-            model = os.getenv("OPENAI_DEPLOYMENT_NAME")
-        else:
-            client = self.openai_client
-            model = "gpt-3.5-turbo"
-            
-        if not client:
+        if not self.router.has_providers():
             # Fallback analysis when OpenAI is not available
+            screened = screen([code], self.scorer)[0]
             return {
-                'percentage': 25,
-                'confidence': 'medium',
-                'indicators': ['API unavailable - using heuristic analysis']
+                'percentage': screened['percentage'],
+                'confidence': 'low',
+                'indicators': screened['indicators'] or ['API unavailable - using stylometric analysis']
             }
         
         system_prompt = """You are an AI code detection expert. Analyze code for AI-generated patterns.
@@ -103,9 +138,8 @@ Code:
 {code}"""
         
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
+            response, _ = await self.router.chat(
+                [
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
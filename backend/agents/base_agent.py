@@ -1,8 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from collections import deque
+from typing import Dict, Any, List, Optional
 import asyncio
-from dataclasses import dataclass
+import functools
+import logging
+import os
+import time
+from dataclasses import dataclass, field
 from enum import Enum
+from .metrics import (
+    AGENT_SECONDS, AGENT_IN_FLIGHT, AGENT_MESSAGES, AGENT_MAILBOX_DEPTH, AGENT_MAILBOX_WAIT, AGENT_RESTARTS
+)
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Agents currently running as actors (see BaseAgent.start), by name
+_running: Dict[str, 'BaseAgent'] = {}
+# Mailbox marker telling one worker to exit once the messages ahead of it are handled
+_STOP = object()
 
 class AgentStatus(Enum):
     IDLE = "idle"
@@ -16,34 +32,179 @@ class AgentMessage:
     receiver: str
     content: Dict[str, Any]
     message_type: str
+    # Set by ask(): resolved with the result of process()
+    reply: Optional[asyncio.Future] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+def _agent_setting(agent_name: str, setting: str, default: str) -> float:
+    """Per-agent override (e.g. REPO_AGENT_CONCURRENCY) of the AGENT_<SETTING> default."""
+    return float(os.getenv(f"{agent_name.upper()}_{setting}") or os.getenv(f"AGENT_{setting}", default))
+
+def _instrument(process):
+    """Record latency, outcome and in-flight count for every process() call, in a trace span."""
+    @functools.wraps(process)
+    async def wrapper(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        action = (data or {}).get('action') or 'process'
+        AGENT_IN_FLIGHT.inc(agent=self.name)
+        start = time.perf_counter()
+        status = 'exception'
+        attributes = {'agent': self.name, 'action': action}
+        if (data or {}).get('student_name'):
+            attributes['student'] = data['student_name']
+        try:
+            with span(f"{self.name}.{action}", **attributes) as current:
+                result = await process(self, data)
+                status = 'error' if isinstance(result, dict) and 'error' in result else 'ok'
+                if status == 'error':
+                    current.status = 'error'
+                    current.error = str(result['error'])[:500]
+            return result
+        finally:
+            AGENT_IN_FLIGHT.dec(agent=self.name)
+            AGENT_SECONDS.observe(time.perf_counter() - start, agent=self.name, action=action, status=status)
+    wrapper._instrumented = True
+    return wrapper
 
 class BaseAgent(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        process = cls.__dict__.get('process')
+        if process is not None and not getattr(process, '_instrumented', False):
+            cls.process = _instrument(process)
+    
     def __init__(self, name: str):
         self.name = name
         self.status = AgentStatus.IDLE
-        self.message_queue = asyncio.Queue()
+        # Actor runtime: a bounded mailbox served by `concurrency` workers
+        self.concurrency = int(_agent_setting(name, 'CONCURRENCY', '4'))
+        self.message_queue = asyncio.Queue(maxsize=int(_agent_setting(name, 'MAILBOX_SIZE', '100')))
+        self.max_restarts = int(_agent_setting(name, 'MAX_RESTARTS', '5'))
+        self.restart_window = _agent_setting(name, 'RESTART_WINDOW', '60')
         self.results = {}
+        self._workers: List[asyncio.Task] = []
+        self._crashes = deque()
         
     @abstractmethod
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         pass
     
     async def send_message(self, receiver: str, content: Dict[str, Any], message_type: str = "data"):
+        """Build a message and deliver it if the receiver is running as an actor. Waits
+        while the receiver's mailbox is full."""
         message = AgentMessage(self.name, receiver, content, message_type)
+        target = _running.get(receiver)
+        if target is not None:
+            await target.receive_message(message)
         return message
     
     async def receive_message(self, message: AgentMessage):
+        # The mailbox is bounded: senders wait here when the agent falls behind
         await self.message_queue.put(message)
+        AGENT_MAILBOX_DEPTH.set(self.message_queue.qsize(), agent=self.name)
+    
+    async def ask(self, content: Dict[str, Any], sender: str = 'caller', message_type: str = "data") -> Dict[str, Any]:
+        """Send a message to this (running) agent and wait for the result of processing it."""
+        if _running.get(self.name) is not self:
+            raise RuntimeError(f"{self.name} is not running")
+        reply = asyncio.get_running_loop().create_future()
+        await self.receive_message(AgentMessage(sender, self.name, content, message_type, reply=reply))
+        return await reply
     
     async def start(self):
+        """Run as an actor until stop(): workers take messages from the mailbox as they
+        arrive and are restarted if they crash (see _supervise)."""
         self.status = AgentStatus.WORKING
-        while self.status == AgentStatus.WORKING:
+        self._crashes.clear()
+        _running[self.name] = self
+        self._workers = [asyncio.create_task(self._supervise(i), name=f"{self.name}-worker-{i}")
+                         for i in range(self.concurrency)]
+        try:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        finally:
+            if _running.get(self.name) is self:
+                del _running[self.name]
+            self._fail_pending()
+            if self.status == AgentStatus.WORKING:
+                self.status = AgentStatus.COMPLETED
+    
+    async def stop(self, drain: bool = True, timeout: float = None):
+        """Stop the workers, after the messages already queued (drain) or right away."""
+        workers = [worker for worker in self._workers if not worker.done()]
+        if drain and workers:
+            for _ in workers:
+                await self.message_queue.put(_STOP)
+            _, pending = await asyncio.wait(workers, timeout=timeout)
+            workers = list(pending)
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.wait(workers)
+    
+    async def _supervise(self, index: int):
+        """Restart a worker whose loop crashed. A failing message is not a crash (see
+        _handle); a crash is a fault in the worker loop itself. Past max_restarts per
+        restart_window the worker is parked for a whole window instead of retrying at
+        once, and the agent reports ERROR until it is serving again."""
+        while True:
             try:
-                message = await asyncio.wait_for(self.message_queue.get(), timeout=1.0)
-                result = await self.process(message.content)
-                self.results[message.sender] = result
-            except asyncio.TimeoutError:
-                continue
+                await self._work()
+                return
             except Exception as e:
-                self.status = AgentStatus.ERROR
-                self.results['error'] = str(e)
\ No newline at end of file
+                now = time.monotonic()
+                self._crashes.append(now)
+                while self._crashes and now - self._crashes[0] > self.restart_window:
+                    self._crashes.popleft()
+                AGENT_RESTARTS.inc(agent=self.name)
+                if len(self._crashes) > self.max_restarts:
+                    logger.error(f"{self.name} crashed {len(self._crashes)} times in {self.restart_window:.0f}s; "
+                                 f"worker {index} restarts in {self.restart_window:.0f}s: {e}")
+                    self.status = AgentStatus.ERROR
+                    self.results['error'] = str(e)
+                    delay = self.restart_window
+                else:
+                    logger.warning(f"{self.name} worker {index} crashed, restarting: {e}")
+                    delay = min(0.1 * 2 ** (len(self._crashes) - 1), 5.0)
+                await asyncio.sleep(delay)
+                if self.status == AgentStatus.ERROR:
+                    self.status = AgentStatus.WORKING
+    
+    async def _work(self):
+        while True:
+            message = await self.message_queue.get()
+            AGENT_MAILBOX_DEPTH.set(self.message_queue.qsize(), agent=self.name)
+            if message is _STOP:
+                return
+            await self._handle(message)
+    
+    async def _handle(self, message: AgentMessage):
+        AGENT_MAILBOX_WAIT.observe(time.monotonic() - message.enqueued_at, agent=self.name)
+        try:
+            result = await self.process(message.content)
+        except asyncio.CancelledError:
+            if message.reply is not None:
+                message.reply.cancel()
+            raise
+        except Exception as e:
+            # Only this message fails: the sender gets the exception, the worker carries on
+            logger.warning(f"{self.name} failed to process a message from {message.sender}: {e}")
+            AGENT_MESSAGES.inc(agent=self.name, outcome='exception')
+            if message.reply is not None:
+                if not message.reply.done():
+                    message.reply.set_exception(e)
+            else:
+                self.results[message.sender] = {'error': str(e)}
+            return
+        AGENT_MESSAGES.inc(agent=self.name, outcome='error' if isinstance(result, dict) and 'error' in result else 'ok')
+        if message.reply is not None:
+            if not message.reply.done():
+                message.reply.set_result(result)
+        else:
+            self.results[message.sender] = result
+    
+    def _fail_pending(self):
+        # Messages left behind when the agent stops: callers waiting in ask() get a cancellation
+        while not self.message_queue.empty():
+            message = self.message_queue.get_nowait()
+            if message is not _STOP and message.reply is not None:
+                message.reply.cancel()
+        AGENT_MAILBOX_DEPTH.set(0, agent=self.name)
@@ -0,0 +1,103 @@
+"""All-pairs similarity and template clustering over the student x pattern
+incidence matrix, using sparse matrix products instead of graph traversal."""
+from typing import Dict, Any, List, Tuple
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+METRICS = ('jaccard', 'cosine', 'tfidf')
+
+
+def incidence_matrix(row_idx: List[int], col_idx: List[int], shape: Tuple[int, int]) -> sparse.csr_matrix:
+    data = np.ones(len(row_idx), dtype=np.float32)
+    matrix = sparse.csr_matrix((data, (row_idx, col_idx)), shape=shape)
+    matrix.data[:] = 1  # collapse duplicate edges
+    return matrix
+
+
+def drop_common_patterns(matrix: sparse.csr_matrix, max_df: float) -> Tuple[sparse.csr_matrix, np.ndarray]:
+    """Drop patterns used by more than ``max_df`` of students (e.g. ``import:os``).
+    They carry no signal and would make the product matrix dense."""
+    n_students = matrix.shape[0]
+    df = np.asarray(matrix.sum(axis=0)).ravel()
+    keep = np.flatnonzero(df <= max(max_df * n_students, 1))
+    return matrix[:, keep].tocsr(), keep
+
+
+def pairwise_similarity(matrix: sparse.csr_matrix, metric: str = 'jaccard') -> sparse.coo_matrix:
+    """Upper-triangular sparse matrix of pairwise similarities; pairs that share no
+    pattern are never materialised."""
+    if metric not in METRICS:
+        raise ValueError(f"Unsupported metric: {metric}")
+
+    if metric == 'tfidf':
+        n_students = matrix.shape[0]
+        df = np.asarray(matrix.sum(axis=0)).ravel()
+        idf = np.log((1 + n_students) / (1 + df)) + 1
+        weighted = matrix.multiply(idf).tocsr()
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1
+        weighted = sparse.diags(1 / norms) @ weighted
+        return sparse.triu(weighted @ weighted.T, k=1).tocoo()
+
+    shared = sparse.triu(matrix @ matrix.T, k=1).tocoo()
+    sizes = np.asarray(matrix.sum(axis=1)).ravel()
+    if metric == 'jaccard':
+        denominator = sizes[shared.row] + sizes[shared.col] - shared.data
+    else:
+        denominator = np.sqrt(sizes[shared.row] * sizes[shared.col])
+    values = np.divide(shared.data, denominator, out=np.zeros_like(shared.data), where=denominator > 0)
+    return sparse.coo_matrix((values, (shared.row, shared.col)), shape=shared.shape)
+
+
+def cluster_cohort(students: List[str], patterns: List[str], row_idx: List[int], col_idx: List[int],
+                   metric: str = 'jaccard', threshold: float = 0.5, max_df: float = 0.8,
+                   top_pairs: int = 50) -> Dict[str, Any]:
+    """Group students whose submissions are linked by similarity >= threshold.
+
+    Clusters are the connected components of the thresholded similarity graph,
+    which groups students working from the same template or tutorial.
+    """
+    if not students:
+        return {'clusters': [], 'top_pairs': [], 'students': 0, 'patterns': 0}
+
+    matrix = incidence_matrix(row_idx, col_idx, (len(students), len(patterns)))
+    matrix, kept = drop_common_patterns(matrix, max_df)
+    similarity = pairwise_similarity(matrix, metric)
+
+    strong = similarity.data >= threshold
+    rows, cols, values = similarity.row[strong], similarity.col[strong], similarity.data[strong]
+    adjacency = sparse.coo_matrix((values, (rows, cols)), shape=(len(students), len(students)))
+    _, labels = connected_components(adjacency, directed=False)
+
+    clusters = []
+    for label in np.unique(labels):
+        members = np.flatnonzero(labels == label)
+        if len(members) < 2:
+            continue
+        in_cluster = np.isin(rows, members)
+        usage = np.asarray(matrix[members].sum(axis=0)).ravel()
+        # Patterns used by most of the cluster describe the shared template
+        shared = kept[np.flatnonzero(usage >= 0.8 * len(members))]
+        clusters.append({
+            'students': [students[i] for i in members],
+            'size': int(len(members)),
+            'mean_similarity': round(float(values[in_cluster].mean()), 3) if in_cluster.any() else 0.0,
+            'shared_patterns': [patterns[i] for i in shared]
+        })
+    clusters.sort(key=lambda c: c['size'], reverse=True)
+    for cluster_id, cluster in enumerate(clusters):
+        cluster['cluster_id'] = cluster_id
+
+    order = np.argsort(-values)[:top_pairs]
+    return {
+        'clusters': clusters,
+        'top_pairs': [
+            {'student_a': students[rows[i]], 'student_b': students[cols[i]], 'similarity': round(float(values[i]), 3)}
+            for i in order
+        ],
+        'students': len(students),
+        'patterns': int(matrix.shape[1]),
+        'metric': metric,
+        'threshold': threshold
+    }
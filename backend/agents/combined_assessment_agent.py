@@ -0,0 +1,116 @@
+from .base_agent import BaseAgent, AgentStatus
+from .stylometry import screen
+from .llm_router import get_router
+from typing import Dict, Any
+import json
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+class CombinedAssessmentAgent(BaseAgent):
+    """Grades code and estimates AI generation in one structured LLM request, so
+    the submission's tokens are sent once instead of once per agent."""
+
+    def __init__(self):
+        super().__init__("combined_assessment_agent")
+        self.router = get_router()
+
+    async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            code = data.get('code')
+            rubric = data.get('rubric')
+            student_name = data.get('student_name')
+
+            if not code or not rubric:
+                raise ValueError("Code and rubric are required")
+
+            assessment = await self._assess(code, rubric)
+
+            return {
+                'student_name': student_name,
+                'scores': assessment['scores'],
+                'ai_percentage': assessment['ai_percentage'],
+                'confidence': assessment['confidence'],
+                'indicators': assessment['indicators'],
+                'status': 'completed'
+            }
+
+        except Exception as e:
+            self.status = AgentStatus.ERROR
+            return {
+                'student_name': data.get('student_name'),
+                'error': str(e),
+                'status': 'error'
+            }
+
+    async def _assess(self, code: str, rubric: str) -> Dict[str, Any]:
+        if not self.router.has_providers():
+            logger.warning("Using local AI screen only - no OpenAI client for combined assessment")
+            screened = screen([code])[0]
+            return {
+                'scores': {},
+                'ai_percentage': screened['percentage'],
+                'confidence': 'low',
+                'indicators': screened['indicators']
+            }
+
+        system_prompt = """You are a code assessor and AI code detection expert. In one pass:
+1. Evaluate the code against every rubric criterion.
+2. Estimate how much of the code is AI-generated (overly perfect formatting, generic variable names,
+   excessive comments, boilerplate patterns, lack of personal coding style).
+Respond with a single JSON object of this shape:
+{"scores": {"<criterion>": {"mark": <number>, "justification": "<brief explanation>"}},
+ "ai_detection": {"percentage": <0-100>, "confidence": "low|medium|high", "indicators": ["<indicator>"]}}"""
+
+        user_prompt = f"""Rubric:\n{rubric}\n\nCode:\n{code}"""
+
+        try:
+            response, _ = await self.router.chat(
+                [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=0.2,
+                response_format={"type": "json_object"}
+            )
+            return self._parse_combined(response.choices[0].message.content)
+        except Exception as e:
+            logger.error(f"OpenAI API call failed: {e}")
+            error_msg = str(e)[:50] + '...' if len(str(e)) > 50 else str(e)
+            return {
+                'scores': {},
+                'ai_percentage': 0,
+                'confidence': 'low',
+                'indicators': [f'API error - analysis unavailable: {error_msg}']
+            }
+
+    def _parse_combined(self, content: str) -> Dict[str, Any]:
+        match = re.search(r'\{[\s\S]*\}', content or '')
+        payload = json.loads(match.group(0)) if match else {}
+
+        scores = {}
+        for criterion, value in (payload.get('scores') or {}).items():
+            if isinstance(value, dict):
+                scores[criterion.strip()] = {
+                    'mark': value.get('mark', ''),
+                    'justification': str(value.get('justification', '')).strip()
+                }
+            else:
+                scores[criterion.strip()] = {'mark': value, 'justification': ''}
+
+        detection = payload.get('ai_detection') or {}
+        try:
+            percentage = int(str(detection.get('percentage', 0)).replace('%', ''))
+        except ValueError:
+            percentage = 0
+        indicators = detection.get('indicators', [])
+        if isinstance(indicators, str):
+            indicators = [i.strip() for i in indicators.split(',')]
+
+        return {
+            'scores': scores,
+            'ai_percentage': percentage,
+            'confidence': str(detection.get('confidence', 'low')).lower(),
+            'indicators': indicators
+        }
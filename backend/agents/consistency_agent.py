@@ -1,6 +1,8 @@
 from .base_agent import BaseAgent, AgentStatus
+from .llm_router import get_router
 from typing import Dict, Any, List
-import openai
+import asyncio
+import math
 import os
 import statistics
 import logging
@@ -10,51 +12,29 @@ logger = logging.getLogger(__name__)
 class ConsistencyAgent(BaseAgent):
     def __init__(self):
         super().__init__("consistency_agent")
-        self.azure_client = None
-        self.openai_client = None
-        
-        try:
-            # Standard OpenAI (preferred for consistency)
-            openai_api_key = os.getenv("STANDARD_OPENAI_API_KEY")
-            if openai_api_key:
-                self.openai_client = openai.OpenAI(
-                    api_key=openai_api_key,
-                    base_url="https://api.openai.com/v1"
-                )
-                logger.info("Consistency agent initialized with standard OpenAI")
-        except Exception as e:
-            logger.error(f"Standard OpenAI client initialization failed: {e}")
-            self.openai_client = None
-            
-        try:
-            # Azure OpenAI (fallback)
-            azure_api_key = os.getenv("AZURE_OPENAI_API_KEY")
-            azure_base_url = os.getenv("OPENAI_API_BASE")
-            if azure_api_key and azure_base_url:
-                self.azure_client = openai.OpenAI(
-                    api_key=azure_api_key,
-                    base_url=azure_base_url
-                )
-                logger.info("Consistency agent initialized with Azure OpenAI")
-        except Exception as e:
-            logger.error(f"Azure OpenAI client initialization failed: {e}")
-            self.azure_client = None
-        
+        self.router = get_router()
+
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
             code = data.get('code')
             rubric = data.get('rubric')
             student_name = data.get('student_name')
-            runs = data.get('runs', 3)
+            max_runs = data.get('runs', int(os.getenv("CONSISTENCY_MAX_RUNS", "5")))
+            min_runs = min(data.get('min_runs', 2), max_runs)
+            step = data.get('escalation_step', 2)
+            # Stop once the standard error of the total score is within this many points
+            tolerance = data.get('tolerance', float(os.getenv("CONSISTENCY_TOLERANCE", "1.0")))
             
-            # Run multiple assessments for consistency
-            assessments = []
-            for _ in range(runs):
-                assessment = await self._single_assessment(code, rubric)
-                assessments.append(assessment)
+            # Sample concurrently, then escalate only while the scores disagree
+            assessments = await self._sample_assessments(code, rubric, min_runs)
+            while len(assessments) < max_runs and self._standard_error(assessments) > tolerance:
+                batch = min(step, max_runs - len(assessments))
+                assessments.extend(await self._sample_assessments(code, rubric, batch))
             
             # Calculate consistency metrics
             consistency_result = self._calculate_consistency(assessments)
+            consistency_result['samples_used'] = len(assessments)
+            consistency_result['early_stopped'] = len(assessments) < max_runs
             
             return {
                 'student_name': student_name,
@@ -67,35 +47,45 @@ class ConsistencyAgent(BaseAgent):
             self.status = AgentStatus.ERROR
             return {'error': str(e)}
     
+    def _messages(self, code: str, rubric: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": "You are a consistent code assessor. Provide numerical scores."},
+            {"role": "user", "content": f"Rubric:\n{rubric}\n\nCode:\n{code}\n\nProvide numerical scores only."}
+        ]
+    
+    async def _sample_assessments(self, code: str, rubric: str, n: int) -> List[Dict[str, Any]]:
+        """Draw n samples in one request using n-completions, so the prompt is sent
+        (and billed) once. Falls back to n concurrent requests if that fails."""
+        if not self.router.has_providers():
+            logger.warning("No OpenAI client available for consistency agent")
+            return [{'scores': {'fallback': 10}, 'total': 10} for _ in range(n)]
+        
+        try:
+            response, _ = await self.router.chat(self._messages(code, rubric), temperature=0.1, n=n)
+            return [self._extract_numerical_scores(choice.message.content) for choice in response.choices]
+        except Exception as e:
+            logger.warning(f"n-completion request failed in consistency agent, sampling concurrently: {e}")
+            return list(await asyncio.gather(*(self._single_assessment(code, rubric) for _ in range(n))))
+    
     async def _single_assessment(self, code: str, rubric: str) -> Dict[str, Any]:
-        # Determine which client to use
-        api_type = os.getenv("OPENAI_API_TYPE", "openai").lower()
-        if api_type == "azure":
-            client = self.azure_client
-            model = os.getenv("OPENAI_DEPLOYMENT_NAME")
-        else:
-            client = self.openai_client
-            model = "gpt-3.5-turbo"
-            
-        if not client:
+        if not self.router.has_providers():
             logger.warning("No OpenAI client available for consistency agent")
             return {'scores': {'fallback': 10}, 'total': 10}
         
         try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You are a consistent code assessor. Provide numerical scores."},
-                    {"role": "user", "content": f"Rubric:\n{rubric}\n\nCode:\n{code}\n\nProvide numerical scores only."}
-                ],
-                temperature=0.1
-            )
+            response, _ = await self.router.chat(self._messages(code, rubric), temperature=0.1)
             
             return self._extract_numerical_scores(response.choices[0].message.content)
         except Exception as e:
             logger.error(f"OpenAI API call failed in consistency agent: {e}")
             return {'scores': {'error': 5}, 'total': 5}
     
+    def _standard_error(self, assessments: List[Dict]) -> float:
+        totals = [sum(a.get('scores', {}).values()) for a in assessments]
+        if len(totals) < 2:
+            return math.inf
+        return statistics.stdev(totals) / math.sqrt(len(totals))
+    
     def _extract_numerical_scores(self, content: str) -> Dict[str, Any]:
         scores = {}
         lines = content.split('\n')
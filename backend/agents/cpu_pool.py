@@ -0,0 +1,109 @@
+"""Shared process pool for CPU-bound pipeline steps.
+
+Zip decompression, pattern extraction, LLM response parsing and workbook building
+are pure functions of their inputs. Running them here keeps the event loop free
+for network I/O and spreads the work across cores. The pool is created once per
+process, and its workers preload the heavy modules they need, so a task does not
+pay for process start-up or imports.
+
+Set CPU_POOL_WORKERS=0 to run these steps in a thread instead (e.g. on a single
+core, or where spawning processes is not allowed).
+"""
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Smaller payloads (e.g. single LLM responses) are parsed inline: the hand-off costs more
+INLINE_MAX_CHARS = int(os.getenv("CPU_POOL_INLINE_MAX_CHARS", "8000"))
+
+# Imported by every pool worker at start-up
+PRELOAD_MODULES = [
+    'agents.pattern_extractors', 'agents.repo_agent', 'agents.batch_agent', 'agents.grading_agent',
+    'agents.report_agent', 'agents.similarity_agent', 'pandas', 'openpyxl'
+]
+
+# Set while a run is profiled (agents/profiling.py): the sampler only sees this process
+run_in_threads: ContextVar[bool] = ContextVar('cpu_run_in_threads', default=False)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _preload():
+    import importlib
+
+    for name in PRELOAD_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            logger.warning(f"CPU pool worker could not preload {name}: {e}")
+
+
+def _noop() -> int:
+    return os.getpid()
+
+
+def pool_size() -> int:
+    configured = os.getenv("CPU_POOL_WORKERS")
+    if configured is not None:
+        return int(configured)
+    return max((os.cpu_count() or 2) - 1, 1)
+
+
+def get_cpu_pool() -> Optional[Executor]:
+    """The process-wide pool, or None when disabled (CPU_POOL_WORKERS=0)."""
+    global _pool
+    if _pool is None and pool_size() > 0:
+        with _pool_lock:
+            if _pool is None:
+                # spawn, not fork: the parent runs an event-loop thread and holds
+                # SQLite/HTTP connections that must not be duplicated into children
+                _pool = ProcessPoolExecutor(
+                    max_workers=pool_size(),
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_preload
+                )
+                atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+    return _pool
+
+
+def warm_cpu_pool():
+    """Start every pool worker now rather than on the first CPU task."""
+    pool = get_cpu_pool()
+    if pool is not None:
+        pids = {future.result() for future in [pool.submit(_noop) for _ in range(pool_size())]}
+        logger.info(f"CPU pool warm with {len(pids)} worker(s)")
+
+
+async def run_cpu(fn: Callable, *args, inline: bool = False) -> Any:
+    """Run a module-level function in the CPU pool. ``inline=True`` runs it on the
+    event loop directly, for inputs too small to be worth the hand-off."""
+    if inline:
+        return fn(*args)
+    pool = get_cpu_pool()
+    if pool is None or run_in_threads.get():
+        return await asyncio.to_thread(fn, *args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); a broken pool never recovers, so replace it and retry once
+        logger.warning("CPU pool broken, restarting it")
+        _reset_pool(pool)
+        return await asyncio.get_running_loop().run_in_executor(get_cpu_pool(), fn, *args)
+
+
+def _reset_pool(broken: Executor):
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
@@ -1,66 +1,138 @@
 from .base_agent import BaseAgent, AgentStatus
-from typing import Dict, Any
-import pandas as pd
-from io import StringIO
+from .roster import linked_ref
+from typing import Dict, Any, Iterator, List, Optional, Sequence, Tuple
+from io import StringIO, TextIOWrapper
+import asyncio
 import csv
+import itertools
+import os
+
+# Students handed to the pipeline per parsing step; parsing runs in a thread between steps
+ROSTER_CHUNK_SIZE = int(os.getenv("ROSTER_CHUNK_SIZE", "200"))
+# Optional column pinning the branch, tag or commit to assess instead of the default branch
+REF_HEADERS = ('ref', 'branch', 'commit', 'git_ref', 'branch_name')
+
+
+def _resolve_columns(headers: Sequence[Any]) -> Tuple[List[int], List[int], List[int]]:
+    """Indices of the name, repo URL and ref columns, worked out once from the header row."""
+    name_columns, repo_columns, ref_columns = [], [], []
+    for i, header in enumerate(headers):
+        header = str(header or '').strip().lower()
+        if header in REF_HEADERS:
+            ref_columns.append(i)
+        elif 'name' in header:
+            name_columns.append(i)
+        elif header == 'repo_url' or ('github' in header and 'url' in header):
+            repo_columns.append(i)
+    return name_columns, repo_columns, ref_columns
+
+
+def _pick(row: Sequence[Any], columns: List[int]) -> Optional[str]:
+    # Last matching column present in the row wins
+    for i in reversed(columns):
+        if i < len(row):
+            value = row[i]
+            return '' if value is None else str(value).strip()
+    return None
+
+
+def _students(rows: Iterator[Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    headers = next(rows, None) or []
+    name_columns, repo_columns, ref_columns = _resolve_columns(headers)
+    for row in rows:
+        if not row or not any(value not in (None, '') for value in row):
+            continue
+        name = _pick(row, name_columns)
+        repo_url = _pick(row, repo_columns)
+        if name is not None and repo_url is not None:
+            student = {'name': name, 'repo_url': repo_url}
+            # A /tree/<branch> link pins that branch when the roster has no ref column value
+            ref = _pick(row, ref_columns) or linked_ref(repo_url)
+            if ref:
+                student['ref'] = ref
+            yield student
+
 
 class CSVAgent(BaseAgent):
     def __init__(self):
         super().__init__("csv_agent")
-        
+
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            file_content = data.get('file_content')
-            filename = data.get('filename', '').lower()
-            
-            if filename.endswith('.csv'):
-                return self._process_csv(file_content)
-            elif filename.endswith(('.xlsx', '.xls')):
-                return self._process_excel(data.get('file_storage'))
-            else:
-                raise ValueError('Unsupported file type')
-                
+            students = [student async for student in self.stream_students(data)]
+            return {'students': students, 'count': len(students)}
+
         except Exception as e:
             self.status = AgentStatus.ERROR
             return {'error': str(e)}
-    
-    def _process_csv(self, content: str) -> Dict[str, Any]:
-        reader = csv.reader(StringIO(content))
-        headers = next(reader, [])
-        students = []
-        
-        for row in reader:
-            if not any(row):
-                continue
-            student_data = {}
-            for i, value in enumerate(row):
-                if i < len(headers):
-                    header = headers[i].lower()
-                    if 'name' in header:
-                        student_data['name'] = value.strip()
-                    elif header == 'repo_url' or ('github' in header and 'url' in header):
-                        student_data['repo_url'] = value.strip()
-
-            if 'name' in student_data and 'repo_url' in student_data:
-                students.append(student_data)
-                
-        return {'students': students, 'count': len(students)}
-    
-    def _process_excel(self, file_storage) -> Dict[str, Any]:
-        df = pd.read_excel(file_storage)
-        students = []
-        
-        for _, row in df.iterrows():
-            student_data = {}
-            for col in df.columns:
-                col_lower = col.lower()
-                value = str(row[col]) if not pd.isnull(row[col]) else ''
-                if 'name' in col_lower:
-                    student_data['name'] = value.strip()
-                elif col_lower == 'repo_url' or ('github' in col_lower and 'url' in col_lower):
-                    student_data['repo_url'] = value.strip()
-
-            if 'name' in student_data and 'repo_url' in student_data:
-                students.append(student_data)
-                
-        return {'students': students, 'count': len(students)}
+
+    async def stream_students(self, data: Dict[str, Any]):
+        """Yield students as the roster is parsed, so their repositories can be fetched
+        while the rest of a large roster is still being read."""
+        rows = self.iter_students(data)
+        try:
+            while True:
+                chunk = await asyncio.to_thread(lambda: list(itertools.islice(rows, ROSTER_CHUNK_SIZE)))
+                if not chunk:
+                    return
+                for student in chunk:
+                    yield student
+        finally:
+            rows.close()
+
+    def iter_students(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Students from ``file_content`` (CSV text) or ``file_storage`` (a path, an upload
+        or any binary file object), read row by row rather than loaded whole."""
+        filename = (data.get('filename') or '').lower()
+        if filename.endswith('.csv'):
+            if data.get('file_content') is not None:
+                return self._iter_csv(StringIO(data['file_content']))
+            return self._iter_csv_file(data.get('file_storage'))
+        elif filename.endswith('.xlsx'):
+            return self._iter_xlsx(data.get('file_storage'))
+        elif filename.endswith('.xls'):
+            return self._iter_xls(data.get('file_storage'))
+        raise ValueError('Unsupported file type')
+
+    def _iter_csv(self, text) -> Iterator[Dict[str, Any]]:
+        return _students(csv.reader(text))
+
+    def _iter_csv_file(self, file_storage) -> Iterator[Dict[str, Any]]:
+        if file_storage is None:
+            raise ValueError('No roster file provided')
+        if isinstance(file_storage, (str, os.PathLike)):
+            with open(file_storage, 'r', encoding='utf-8-sig', newline='') as f:
+                yield from self._iter_csv(f)
+            return
+        # Werkzeug's FileStorage and plain binary files: decode while reading
+        stream = getattr(file_storage, 'stream', file_storage)
+        text = TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        try:
+            yield from self._iter_csv(text)
+        finally:
+            # Leave the underlying upload open for its owner
+            text.detach()
+
+    def _iter_xlsx(self, file_storage) -> Iterator[Dict[str, Any]]:
+        from openpyxl import load_workbook
+
+        if file_storage is None:
+            raise ValueError('No roster file provided')
+        source = file_storage if isinstance(file_storage, (str, os.PathLike)) else getattr(file_storage, 'stream', file_storage)
+        # Read-only mode streams rows from the sheet XML instead of building the whole workbook
+        workbook = load_workbook(source, read_only=True, data_only=True)
+        try:
+            yield from _students(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+
+    def _iter_xls(self, file_storage) -> Iterator[Dict[str, Any]]:
+        import pandas as pd
+
+        if file_storage is None:
+            raise ValueError('No roster file provided')
+        # Legacy .xls has no streaming reader; map the columns once over the whole frame
+        df = pd.read_excel(getattr(file_storage, 'stream', file_storage), dtype=str)
+        df = df.where(df.notna(), None)
+        rows = itertools.chain([list(df.columns)], df.itertuples(index=False, name=None))
+        yield from _students(rows)
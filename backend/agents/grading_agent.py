@@ -1,48 +1,38 @@
 from .base_agent import BaseAgent, AgentStatus
+from .llm_router import get_router
+from .cpu_pool import run_cpu, INLINE_MAX_CHARS
 from typing import Dict, Any
-import openai
-import os
 import re
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def parse_assessment(content: str) -> Dict[str, Any]:
+    scores = {}
+    criterion_pattern = r'Criterion:\s*(.*?)\s*\n'
+    mark_pattern = r'Mark:\s*(.*?)\s*\n'
+    justification_pattern = r'Justification:\s*(.*?)(?:\n\n|\Z)'
+
+    criteria = re.findall(criterion_pattern, content, re.DOTALL)
+    marks = re.findall(mark_pattern, content, re.DOTALL)
+    justifications = re.findall(justification_pattern, content, re.DOTALL)
+
+    for i in range(len(criteria)):
+        if i < len(marks):
+            scores[criteria[i].strip()] = {
+                'mark': marks[i].strip(),
+                'justification': justifications[i].strip() if i < len(justifications) else ''
+            }
+
+    return scores
+
+
 class GradingAgent(BaseAgent):
     def __init__(self):
         super().__init__("grading_agent")
-        self.azure_client = None
-        self.openai_client = None
-        
-        try:
-            # Azure OpenAI
-            azure_api_key = os.getenv("OPENAI_API_KEY")
-            azure_base_url = os.getenv("OPENAI_API_BASE")
-            api_version = os.getenv("OPENAI_API_VERSION", "2023-05-15")
-            
-            if azure_api_key and azure_base_url:
-                self.azure_client = openai.AzureOpenAI(
-                    api_key=azure_api_key,
-                    azure_endpoint=azure_base_url,
-                    api_version=api_version
-                )
-                logger.info("Grading agent initialized with Azure OpenAI")
-        except Exception as e:
-            logger.error(f"Azure OpenAI client initialization failed: {e}")
-            self.azure_client = None
-            
-        try:
-            # Standard OpenAI
-            openai_api_key = os.getenv("STANDARD_OPENAI_API_KEY")
-            if openai_api_key:
-                self.openai_client = openai.OpenAI(
-                    api_key=openai_api_key,
-                    base_url="https://api.openai.com/v1"
-                )
-                logger.info("Grading agent initialized with standard OpenAI")
-        except Exception as e:
-            logger.error(f"Standard OpenAI client initialization failed: {e}")
-            self.openai_client = None
+        self.router = get_router()
 
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -70,16 +60,7 @@ class GradingAgent(BaseAgent):
             }
     
     async def _assess_code(self, code: str, rubric: str) -> Dict[str, Any]:
-        # Determine which client to use
-        api_type = os.getenv("OPENAI_API_TYPE", "openai").lower()
-        if api_type == "azure":
-            client = self.azure_client
-            model = os.getenv("OPENAI_DEPLOYMENT_NAME")
-        else:
-            client = self.openai_client
-            model = "gpt-3.5-turbo"
-            
-        if not client:
+        if not self.router.has_providers():
             logger.warning("Using fallback assessment due to missing OpenAI client")
             return {
                 'Correctness of Code': {'mark': '8', 'justification': 'Code demonstrates good understanding (fallback assessment)'},
@@ -103,13 +84,10 @@ Justification: [Brief explanation]"""
             ]
             
             # Make API call
-            response = client.chat.completions.create(
-                model=model,
-                messages=messages,
-                temperature=0.2
-            )
+            response, _ = await self.router.chat(messages, temperature=0.2)
                 
-            return self._parse_assessment(response.choices[0].message.content)
+            content = response.choices[0].message.content
+            return await run_cpu(parse_assessment, content, inline=len(content) < INLINE_MAX_CHARS)
         except Exception as e:
             logger.error(f"OpenAI API call failed: {e}")
             # Return fallback assessment with error information
@@ -120,22 +98,3 @@ Justification: [Brief explanation]"""
                 'Documentation': {'mark': '2', 'justification': 'Assessment unavailable - API error'},
                 'Efficiency': {'mark': '3', 'justification': 'Assessment unavailable - API error'}
             }
-    
-    def _parse_assessment(self, content: str) -> Dict[str, Any]:
-        scores = {}
-        criterion_pattern = r'Criterion:\s*(.*?)\s*\n'
-        mark_pattern = r'Mark:\s*(.*?)\s*\n'
-        justification_pattern = r'Justification:\s*(.*?)(?:\n\n|\Z)'
-        
-        criteria = re.findall(criterion_pattern, content, re.DOTALL)
-        marks = re.findall(mark_pattern, content, re.DOTALL)
-        justifications = re.findall(justification_pattern, content, re.DOTALL)
-        
-        for i in range(len(criteria)):
-            if i < len(marks):
-                scores[criteria[i].strip()] = {
-                    'mark': marks[i].strip(),
-                    'justification': justifications[i].strip() if i < len(justifications) else ''
-                }
-                
-        return scores
@@ -1,12 +1,19 @@
 from .base_agent import BaseAgent, AgentStatus
+from .pattern_extractors import extract_patterns
+from .graph_store import GraphStore
+from .cpu_pool import run_cpu
+from .metrics import CACHE_REQUESTS
 from typing import Dict, Any, List
-import networkx as nx
-import json
+import asyncio
+import hashlib
+import os
 
 class GraphRAGAgent(BaseAgent):
     def __init__(self):
         super().__init__("graph_rag_agent")
-        self.knowledge_graph = nx.DiGraph()
+        self.knowledge_graph = GraphStore()
+        # Below this many students the process-pool hand-off costs more than it saves
+        self.parallel_threshold = int(os.getenv("GRAPH_PARALLEL_THRESHOLD", "8"))
         
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -16,6 +23,10 @@ class GraphRAGAgent(BaseAgent):
                 return await self._build_knowledge_graph(data)
             elif action == 'query_graph':
                 return await self._query_knowledge_graph(data)
+            elif action == 'cluster_cohort':
+                return await self._cluster_cohort(data)
+            elif action == 'remove_student':
+                return await self._remove_student(data)
             else:
                 raise ValueError("Invalid action")
                 
@@ -25,56 +36,81 @@ class GraphRAGAgent(BaseAgent):
     
     async def _build_knowledge_graph(self, data: Dict[str, Any]) -> Dict[str, Any]:
         students_data = data.get('students', [])
+        cohort = data.get('cohort') or 'default'
         
+        # Only students whose code changed since the last build need re-extraction
+        submissions = []
         for student in students_data:
-            student_name = student.get('name')
+            # Repo results carry 'student_name'; roster rows carry 'name'
             code = student.get('code', '')
-            
-            # Add student node
-            self.knowledge_graph.add_node(student_name, type='student')
-            
-            # Extract code patterns and create relationships
-            patterns = self._extract_code_patterns(code)
-            for pattern in patterns:
-                pattern_id = f"pattern_{hash(pattern)}"
-                self.knowledge_graph.add_node(pattern_id, type='pattern', content=pattern)
-                self.knowledge_graph.add_edge(student_name, pattern_id, relation='uses')
+            submissions.append((student.get('student_name') or student.get('name'), code,
+                                hashlib.sha1(code.encode('utf-8')).hexdigest()))
+        # One lookup and one write transaction per build, both off the event loop
+        stored = await asyncio.to_thread(
+            self.knowledge_graph.code_hashes, [name for name, _, _ in submissions], cohort
+        )
+        pending = []
+        for student_name, code, code_hash in submissions:
+            if stored.get(student_name) != code_hash:
+                pending.append((student_name, code, code_hash))
+                CACHE_REQUESTS.inc(cache='knowledge_graph', result='miss')
+            else:
+                CACHE_REQUESTS.inc(cache='knowledge_graph', result='hit')
+        
+        codes = [code for _, code, _ in pending]
+        inline = len(codes) < self.parallel_threshold
+        all_patterns = await asyncio.gather(
+            *(run_cpu(extract_patterns, code, inline=inline) for code in codes)
+        )
         
-        return {'nodes': len(self.knowledge_graph.nodes), 'edges': len(self.knowledge_graph.edges)}
+        await asyncio.to_thread(self.knowledge_graph.upsert_students, [
+            (student_name, patterns, code_hash)
+            for (student_name, _, code_hash), patterns in zip(pending, all_patterns)
+        ], cohort)
+        
+        return {
+            **await asyncio.to_thread(self.knowledge_graph.counts),
+            'updated_students': len(pending),
+            'unchanged_students': len(students_data) - len(pending)
+        }
     
     async def _query_knowledge_graph(self, data: Dict[str, Any]) -> Dict[str, Any]:
         student_name = data.get('student_name')
+        cohort = data.get('cohort') or 'default'
         
-        if student_name not in self.knowledge_graph:
+        if not self.knowledge_graph.has_student(student_name, cohort):
             return {'similar_students': [], 'common_patterns': []}
         
         # Find similar students based on shared patterns
-        student_patterns = set(self.knowledge_graph.successors(student_name))
-        similar_students = []
-        
-        for node in self.knowledge_graph.nodes:
-            if self.knowledge_graph.nodes[node].get('type') == 'student' and node != student_name:
-                other_patterns = set(self.knowledge_graph.successors(node))
-                similarity = len(student_patterns & other_patterns) / len(student_patterns | other_patterns)
-                if similarity > 0.3:
-                    similar_students.append({'name': node, 'similarity': similarity})
+        similar_students = self.knowledge_graph.similar_students(
+            student_name, cohort, min_similarity=0.3, any_cohort=data.get('any_cohort', False)
+        )
         
         return {
-            'similar_students': sorted(similar_students, key=lambda x: x['similarity'], reverse=True),
-            'common_patterns': list(student_patterns)
+            'similar_students': similar_students,
+            'common_patterns': self.knowledge_graph.student_patterns(student_name, cohort)
         }
     
-    def _extract_code_patterns(self, code: str) -> List[str]:
-        patterns = []
-        lines = code.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('def '):
-                patterns.append(f"function_{line.split('(')[0].replace('def ', '')}")
-            elif line.startswith('class '):
-                patterns.append(f"class_{line.split(':')[0].replace('class ', '')}")
-            elif 'import ' in line:
-                patterns.append(f"import_{line.replace('import ', '').replace('from ', '')}")
+    async def _cluster_cohort(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        from .cohort_similarity import cluster_cohort
         
-        return patterns
\ No newline at end of file
+        students, patterns, row_idx, col_idx = self.knowledge_graph.incidence(data.get('cohort'))
+        result = await asyncio.to_thread(
+            cluster_cohort, students, patterns, row_idx, col_idx,
+            metric=data.get('metric', 'jaccard'),
+            threshold=data.get('threshold', 0.5),
+            max_df=data.get('max_df', 0.8)
+        )
+        # Resolve pattern ids to their content for readability
+        shared_ids = {p for cluster in result['clusters'] for p in cluster['shared_patterns']}
+        contents = self.knowledge_graph.pattern_contents(sorted(shared_ids))
+        for cluster in result['clusters']:
+            cluster['shared_patterns'] = [contents.get(p, p) for p in cluster['shared_patterns']]
+        return result
+    
+    async def _remove_student(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        removed = self.knowledge_graph.remove_student(data.get('student_name'), data.get('cohort') or 'default')
+        return {'removed': removed, **self.knowledge_graph.counts()}
+    
+    def _extract_code_patterns(self, code: str) -> List[str]:
+        return extract_patterns(code)
@@ -0,0 +1,225 @@
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import hashlib
+import os
+import sqlite3
+import time
+
+# Names per IN (...) query, well under SQLite's bound-parameter limit
+_QUERY_CHUNK = 500
+
+
+def pattern_node_id(pattern: str) -> str:
+    """Stable node id for a pattern (unlike the salted built-in hash())."""
+    return f"pattern_{hashlib.sha1(pattern.encode('utf-8')).hexdigest()[:16]}"
+
+
+class GraphStore:
+    """Student -> pattern knowledge graph persisted as SQLite edge tables.
+
+    Each student's subgraph can be replaced or removed on its own, and queries run
+    in SQL, so the graph survives across runs and is never loaded into memory whole.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("GRAPH_DB_PATH", "./graph_db/knowledge_graph.sqlite3")
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS patterns (
+                    id INTEGER PRIMARY KEY,
+                    node_id TEXT UNIQUE,
+                    content TEXT
+                );
+                CREATE TABLE IF NOT EXISTS students (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT,
+                    cohort TEXT,
+                    code_hash TEXT,
+                    pattern_count INTEGER,
+                    updated_at REAL,
+                    UNIQUE (cohort, name)
+                );
+                CREATE TABLE IF NOT EXISTS edges (
+                    student_id INTEGER,
+                    pattern_id INTEGER,
+                    relation TEXT,
+                    PRIMARY KEY (student_id, pattern_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS idx_edges_pattern ON edges (pattern_id);
+            """)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # sqlite3's own context manager commits or rolls back but never closes
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def code_hash(self, name: str, cohort: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT code_hash FROM students WHERE cohort = ? AND name = ?", (cohort, name)
+            ).fetchone()
+        return row[0] if row else None
+
+    def code_hashes(self, names: List[str], cohort: str) -> Dict[str, Optional[str]]:
+        """Stored code hash per student, for the names the cohort already has."""
+        hashes = {}
+        with self._connect() as conn:
+            for i in range(0, len(names), _QUERY_CHUNK):
+                chunk = names[i:i + _QUERY_CHUNK]
+                hashes.update(conn.execute(
+                    f"SELECT name, code_hash FROM students WHERE cohort = ? AND name IN ({','.join('?' * len(chunk))})",
+                    (cohort, *chunk)
+                ).fetchall())
+        return hashes
+
+    def upsert_student(self, name: str, patterns: List[str], cohort: str = 'default', code_hash: str = None):
+        """Replace the student's subgraph with the given patterns."""
+        self.upsert_students([(name, patterns, code_hash)], cohort=cohort)
+
+    def upsert_students(self, students: List[Tuple[str, List[str], Optional[str]]], cohort: str = 'default'):
+        """Replace the subgraphs of (name, patterns, code_hash) students in one transaction."""
+        now = time.time()
+        with self._connect() as conn:
+            for name, patterns, code_hash in students:
+                patterns = sorted(set(patterns))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO patterns (node_id, content) VALUES (?, ?)",
+                    [(pattern_node_id(p), p) for p in patterns]
+                )
+                conn.execute(
+                    "INSERT INTO students (name, cohort, code_hash, pattern_count, updated_at) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (cohort, name) DO UPDATE SET code_hash = excluded.code_hash, "
+                    "pattern_count = excluded.pattern_count, updated_at = excluded.updated_at",
+                    (name, cohort, code_hash, len(patterns), now)
+                )
+                student_id = conn.execute(
+                    "SELECT id FROM students WHERE cohort = ? AND name = ?", (cohort, name)
+                ).fetchone()[0]
+                conn.execute("DELETE FROM edges WHERE student_id = ?", (student_id,))
+                conn.executemany(
+                    "INSERT INTO edges (student_id, pattern_id, relation) "
+                    "SELECT ?, id, 'uses' FROM patterns WHERE node_id = ?",
+                    [(student_id, pattern_node_id(p)) for p in patterns]
+                )
+
+    def remove_student(self, name: str, cohort: str = 'default') -> bool:
+        with self._connect() as conn:
+            row = conn.execute("SELECT id FROM students WHERE cohort = ? AND name = ?", (cohort, name)).fetchone()
+            if not row:
+                return False
+            conn.execute("DELETE FROM edges WHERE student_id = ?", (row[0],))
+            conn.execute("DELETE FROM students WHERE id = ?", (row[0],))
+            conn.execute("DELETE FROM patterns WHERE id NOT IN (SELECT DISTINCT pattern_id FROM edges)")
+        return True
+
+    def has_student(self, name: str, cohort: str = 'default') -> bool:
+        return self._student_id(name, cohort) is not None
+
+    def _student_id(self, name: str, cohort: str) -> Optional[int]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT id FROM students WHERE cohort = ? AND name = ?", (cohort, name)).fetchone()
+        return row[0] if row else None
+
+    def student_patterns(self, name: str, cohort: str = 'default') -> List[str]:
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT p.node_id FROM edges e
+                JOIN students s ON s.id = e.student_id
+                JOIN patterns p ON p.id = e.pattern_id
+                WHERE s.cohort = ? AND s.name = ?
+            """, (cohort, name)).fetchall()
+        return [row[0] for row in rows]
+
+    def similar_students(self, name: str, cohort: str = 'default', min_similarity: float = 0.3,
+                         any_cohort: bool = False) -> List[Dict[str, Any]]:
+        """Jaccard similarity over shared patterns, computed with a self-join on edges."""
+        student_id = self._student_id(name, cohort)
+        if student_id is None:
+            return []
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT s.name, s.cohort, COUNT(*) AS shared, s.pattern_count, me.pattern_count
+                FROM edges mine
+                JOIN edges other ON other.pattern_id = mine.pattern_id AND other.student_id != mine.student_id
+                JOIN students s ON s.id = other.student_id
+                JOIN students me ON me.id = mine.student_id
+                WHERE mine.student_id = ? AND (? OR s.cohort = ?)
+                GROUP BY other.student_id
+            """, (student_id, any_cohort, cohort)).fetchall()
+
+        similar = []
+        for other_name, other_cohort, shared, other_count, own_count in rows:
+            union = own_count + other_count - shared
+            similarity = shared / union if union else 0
+            if similarity > min_similarity:
+                entry = {'name': other_name, 'similarity': similarity}
+                if any_cohort:
+                    entry['cohort'] = other_cohort
+                similar.append(entry)
+        return sorted(similar, key=lambda x: x['similarity'], reverse=True)
+
+    def incidence(self, cohort: str = None):
+        """Student names, pattern node ids and (row, col) index arrays of the
+        student x pattern incidence, ready to load into a sparse matrix.
+
+        Without a cohort, students are labelled ``cohort:name`` so that the same
+        name in two cohorts stays two rows."""
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT s.cohort, s.name, p.node_id FROM edges e
+                JOIN students s ON s.id = e.student_id
+                JOIN patterns p ON p.id = e.pattern_id
+                WHERE ? IS NULL OR s.cohort = ?
+                ORDER BY s.id
+            """, (cohort, cohort)).fetchall()
+        student_index: Dict[str, int] = {}
+        pattern_index: Dict[str, int] = {}
+        row_idx, col_idx = [], []
+        for student_cohort, student_name, node_id in rows:
+            label = student_name if cohort is not None else f"{student_cohort}:{student_name}"
+            row_idx.append(student_index.setdefault(label, len(student_index)))
+            col_idx.append(pattern_index.setdefault(node_id, len(pattern_index)))
+        return list(student_index), list(pattern_index), row_idx, col_idx
+
+    def pattern_contents(self, node_ids: List[str]) -> Dict[str, str]:
+        if not node_ids:
+            return {}
+        with self._connect() as conn:
+            placeholders = ','.join('?' * len(node_ids))
+            rows = conn.execute(
+                f"SELECT node_id, content FROM patterns WHERE node_id IN ({placeholders})", node_ids
+            ).fetchall()
+        return dict(rows)
+
+    def counts(self) -> Dict[str, int]:
+        with self._connect() as conn:
+            students = conn.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+            patterns = conn.execute("SELECT COUNT(*) FROM patterns").fetchone()[0]
+            edges = conn.execute("SELECT COUNT(*) FROM edges").fetchone()[0]
+        return {'nodes': students + patterns, 'edges': edges}
+
+    def to_networkx(self, cohort: str = None):
+        """Materialise (part of) the graph as an nx.DiGraph for ad-hoc analysis."""
+        import networkx as nx
+        graph = nx.DiGraph()
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT s.name, p.node_id, p.content, e.relation FROM edges e
+                JOIN students s ON s.id = e.student_id
+                JOIN patterns p ON p.id = e.pattern_id
+                WHERE ? IS NULL OR s.cohort = ?
+            """, (cohort, cohort)).fetchall()
+        for student_name, node_id, content, relation in rows:
+            graph.add_node(student_name, type='student')
+            graph.add_node(node_id, type='pattern', content=content)
+            graph.add_edge(student_name, node_id, relation=relation)
+        return graph
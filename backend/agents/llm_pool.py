@@ -0,0 +1,131 @@
+"""Pool of LLM deployments/API keys behind one provider.
+
+``LLM_DEPLOYMENTS`` holds a JSON list of entries such as::
+
+    [{"endpoint": "https://east.openai.azure.com", "key": "...", "deployment": "gpt-35",
+      "rpm": 300, "tpm": 120000},
+     {"endpoint": "https://api.openai.com/v1", "key": "...", "deployment": "gpt-3.5-turbo",
+      "type": "openai", "rpm": 500}]
+
+Requests are spread across entries weighted by their remaining per-minute quota,
+and each entry keeps its own request and token accounting.
+"""
+from typing import Dict, Any, List, Optional
+from collections import deque
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Deployment:
+    def __init__(self, name: str, client, model: str, rpm: int = None, tpm: int = None):
+        self.name = name
+        self.client = client
+        self.model = model
+        self.rpm = rpm
+        self.tpm = tpm
+        # (timestamp, tokens) for requests in the last minute
+        self.usage = deque()
+        self.in_flight = 0
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.throttled_until = 0.0
+
+    def _trim(self, now: float):
+        while self.usage and now - self.usage[0][0] > 60:
+            self.usage.popleft()
+
+    def headroom(self, now: float) -> float:
+        """Fraction of this minute's quota still available (1.0 when unlimited)."""
+        if now < self.throttled_until:
+            return 0.0
+        self._trim(now)
+        fractions = [1.0]
+        if self.rpm:
+            fractions.append(1 - (len(self.usage) + self.in_flight) / self.rpm)
+        if self.tpm:
+            fractions.append(1 - sum(tokens for _, tokens in self.usage) / self.tpm)
+        return max(min(fractions), 0.0)
+
+    def stats(self, now: float) -> Dict[str, Any]:
+        self._trim(now)
+        return {
+            'model': self.model,
+            'requests_last_minute': len(self.usage),
+            'tokens_last_minute': sum(tokens for _, tokens in self.usage),
+            'in_flight': self.in_flight,
+            'total_requests': self.total_requests,
+            'total_tokens': self.total_tokens,
+            'headroom': round(self.headroom(now), 3),
+        }
+
+
+class ClientPool:
+    def __init__(self, deployments: List[Deployment]):
+        self.deployments = deployments
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Optional[Deployment]:
+        """Pick a deployment at random, weighted by remaining quota. Returns None when
+        every deployment is out of quota for the current minute."""
+        with self._lock:
+            now = time.monotonic()
+            weights = [d.headroom(now) for d in self.deployments]
+            if not any(weights):
+                return None
+            deployment = random.choices(self.deployments, weights=weights)[0]
+            deployment.in_flight += 1
+            return deployment
+
+    def release(self, deployment: Deployment, tokens: int = 0, throttled: bool = False, retry_after: float = 60.0):
+        with self._lock:
+            now = time.monotonic()
+            deployment.in_flight -= 1
+            deployment.usage.append((now, tokens))
+            deployment.total_requests += 1
+            deployment.total_tokens += tokens
+            if throttled:
+                # A 429 means the service-side quota is spent, whatever our accounting says
+                deployment.throttled_until = now + retry_after
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {d.name: d.stats(now) for d in self.deployments}
+
+
+def deployments_from_env(timeout: float) -> Dict[str, List[Deployment]]:
+    """Deployments from LLM_DEPLOYMENTS, grouped by router provider name."""
+    raw = os.getenv("LLM_DEPLOYMENTS")
+    if not raw:
+        return {}
+    import openai
+
+    deployments: Dict[str, List[Deployment]] = {}
+    for idx, entry in enumerate(json.loads(raw)):
+        try:
+            is_azure = entry.get('type', 'azure') == 'azure'
+            if is_azure:
+                client = openai.AzureOpenAI(
+                    api_key=entry['key'],
+                    azure_endpoint=entry['endpoint'],
+                    api_version=entry.get('api_version', os.getenv("OPENAI_API_VERSION", "2023-05-15")),
+                    timeout=timeout
+                )
+            else:
+                client = openai.OpenAI(api_key=entry['key'], base_url=entry['endpoint'], timeout=timeout)
+            deployments.setdefault('azure_openai' if is_azure else 'openai', []).append(Deployment(
+                entry.get('name') or f"{entry['deployment']}@{idx}",
+                client,
+                entry['deployment'],
+                rpm=entry.get('rpm') or entry.get('quota'),
+                tpm=entry.get('tpm')
+            ))
+        except Exception as e:
+            logger.error(f"LLM deployment {idx} initialization failed: {e}")
+    return deployments
@@ -0,0 +1,391 @@
+"""Central LLM provider routing.
+
+All agents send chat completions through one ``ProviderRouter`` instead of each
+picking a client from ``OPENAI_API_TYPE``. The router tracks per-provider latency
+percentiles and error rates, opens a circuit breaker on providers that keep
+failing, and hedges slow requests by sending a second copy to the next provider
+once the first exceeds its p95 latency.
+
+Each provider is backed by a ``ClientPool`` of one or more deployments/keys
+(see ``llm_pool``), so load is also spread within a provider.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+from collections import deque
+from email.utils import parsedate_to_datetime
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+
+from .llm_pool import ClientPool, Deployment, deployments_from_env
+from .scheduler import get_scheduler
+from .metrics import REGISTRY, LLM_REQUESTS, LLM_SECONDS, LLM_TOKENS, LLM_COST
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class NoProviderAvailable(Exception):
+    pass
+
+
+class QuotaExhausted(Exception):
+    pass
+
+
+class Provider:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, pool: ClientPool, window: int = 200, health_window: float = 300.0,
+                 failure_threshold: float = 0.5, min_requests: int = 5, cooldown: float = 30.0):
+        self.name = name
+        self.pool = pool
+        self.latencies = deque(maxlen=window)
+        # (timestamp, success); only the last health_window seconds count towards the error rate
+        self.outcomes = deque(maxlen=window)
+        self.health_window = health_window
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        # While half-open, the one request allowed through to test the provider
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def percentile(self, q: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return None
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+    def _recent(self) -> List[bool]:
+        cutoff = time.monotonic() - self.health_window
+        return [success for timestamp, success in self.outcomes if timestamp >= cutoff]
+
+    def error_rate(self) -> float:
+        with self._lock:
+            outcomes = self._recent()
+        if not outcomes:
+            return 0.0
+        return outcomes.count(False) / len(outcomes)
+
+    def _half_open_due(self):
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+            self.state = self.HALF_OPEN
+
+    def available(self) -> bool:
+        with self._lock:
+            self._half_open_due()
+            return self.state == self.CLOSED or (self.state == self.HALF_OPEN and not self.probe_in_flight)
+
+    def admit(self) -> Optional[bool]:
+        """None if a request may not be sent now; otherwise whether it is the half-open
+        probe, which the caller hands back to end_probe() if it ends without record()."""
+        with self._lock:
+            self._half_open_due()
+            if self.state == self.CLOSED:
+                return False
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            return None
+
+    def end_probe(self):
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record(self, latency: float, success: bool):
+        with self._lock:
+            self.probe_in_flight = False
+            self.outcomes.append((time.monotonic(), success))
+            if success:
+                self.latencies.append(latency)
+                if self.state == self.HALF_OPEN:
+                    self.state = self.CLOSED
+                    self.outcomes.clear()
+                return
+            recent = self._recent()[-self.min_requests * 4:]
+            failing = len(recent) >= self.min_requests and recent.count(False) / len(recent) >= self.failure_threshold
+            if self.state == self.HALF_OPEN or failing:
+                if self.state != self.OPEN:
+                    logger.warning(f"Circuit opened for LLM provider {self.name}")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'requests': len(self.outcomes),
+            'error_rate': round(self.error_rate(), 3),
+            'p50': self.percentile(0.5),
+            'p95': self.percentile(0.95),
+            'deployments': self.pool.stats(),
+        }
+
+
+class ProviderRouter:
+    def __init__(self, providers: List[Provider], preferred: str = None, hedge: bool = True,
+                 hedge_min_samples: int = 20, default_hedge_delay: float = 15.0):
+        self.providers = providers
+        self.preferred = preferred
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.default_hedge_delay = default_hedge_delay
+        # USD per 1K tokens, for the llm_cost_usd_total estimate
+        self.prompt_price = float(os.getenv("LLM_PRICE_PROMPT_PER_1K", "0.0005"))
+        self.completion_price = float(os.getenv("LLM_PRICE_COMPLETION_PER_1K", "0.0015"))
+
+    def has_providers(self) -> bool:
+        return bool(self.providers)
+
+    def candidates(self, only: List[str] = None) -> List[Provider]:
+        available = [p for p in self.providers if p.available() and (only is None or p.name in only)]
+
+        def rank(provider: Provider):
+            p50 = provider.percentile(0.5)
+            # Health first (in coarse buckets so noise does not reorder), then preference
+            return (round(provider.error_rate(), 1), provider.name != self.preferred, p50 if p50 is not None else 0)
+
+        return sorted(available, key=rank)
+
+    def _hedge_delay(self, provider: Provider) -> float:
+        if len(provider.latencies) < self.hedge_min_samples:
+            return self.default_hedge_delay
+        return provider.percentile(0.95)
+
+    async def _call(self, provider: Provider, messages: List[Dict[str, str]], params: Dict[str, Any]):
+        probe = provider.admit()
+        if probe is None:
+            raise NoProviderAvailable(f"LLM provider {provider.name} is open or already probing")
+        try:
+            async with get_scheduler().slot('llm'):
+                return await self._call_provider(provider, messages, params)
+        finally:
+            if probe:
+                # Rejected, throttled out or cancelled: no outcome recorded, let another probe through
+                provider.end_probe()
+
+    async def _call_provider(self, provider: Provider, messages: List[Dict[str, str]], params: Dict[str, Any]):
+        import openai
+
+        while True:
+            deployment = provider.pool.acquire()
+            if deployment is None:
+                raise QuotaExhausted(f"All {provider.name} deployments are out of quota")
+            start = time.monotonic()
+            call = asyncio.ensure_future(asyncio.to_thread(
+                deployment.client.chat.completions.create,
+                model=deployment.model,
+                messages=messages,
+                **params
+            ))
+            try:
+                with span('llm.call', provider=provider.name, deployment=deployment.name,
+                          model=deployment.model) as current:
+                    response = await asyncio.shield(call)
+                    usage = getattr(response, 'usage', None)
+                    current.set_attribute('prompt_tokens', getattr(usage, 'prompt_tokens', 0) or 0)
+                    current.set_attribute('completion_tokens', getattr(usage, 'completion_tokens', 0) or 0)
+            except asyncio.CancelledError:
+                # A lost hedge (or a caller that went away): the scheduler slot is freed now. The
+                # thread cannot be interrupted, so the deployment is released when it finishes
+                call.add_done_callback(functools.partial(self._settle_abandoned, provider, deployment, start))
+                raise
+            except openai.RateLimitError as e:
+                # Capacity, not health: park this deployment and retry on another one
+                response = getattr(e, 'response', None)
+                retry_after = response.headers.get('retry-after') if response is not None else None
+                provider.pool.release(deployment, throttled=True, retry_after=_retry_after_seconds(retry_after))
+                LLM_REQUESTS.inc(provider=provider.name, outcome='throttled')
+                logger.info(f"LLM deployment {deployment.name} throttled, retrying on {provider.name}")
+                continue
+            except openai.BadRequestError:
+                # Request-specific (e.g. content filter), not a sign of an unhealthy provider
+                provider.pool.release(deployment)
+                LLM_REQUESTS.inc(provider=provider.name, outcome='rejected')
+                raise
+            except Exception:
+                provider.pool.release(deployment)
+                provider.record(time.monotonic() - start, success=False)
+                LLM_REQUESTS.inc(provider=provider.name, outcome='error')
+                raise
+            elapsed = time.monotonic() - start
+            provider.pool.release(deployment, tokens=getattr(usage, 'total_tokens', 0) or 0)
+            provider.record(elapsed, success=True)
+            self._record_usage(provider.name, elapsed, usage)
+            return response
+
+    def _settle_abandoned(self, provider: Provider, deployment, start: float, call: asyncio.Future):
+        """Quota and health accounting for a request nobody waits for any more."""
+        import openai
+
+        LLM_REQUESTS.inc(provider=provider.name, outcome='abandoned')
+        error = None if call.cancelled() else call.exception()
+        if call.cancelled() or isinstance(error, openai.BadRequestError):
+            provider.pool.release(deployment)
+        elif isinstance(error, openai.RateLimitError):
+            response = getattr(error, 'response', None)
+            retry_after = response.headers.get('retry-after') if response is not None else None
+            provider.pool.release(deployment, throttled=True, retry_after=_retry_after_seconds(retry_after))
+        elif error is not None:
+            provider.pool.release(deployment)
+            provider.record(time.monotonic() - start, success=False)
+        else:
+            usage = getattr(call.result(), 'usage', None)
+            provider.pool.release(deployment, tokens=getattr(usage, 'total_tokens', 0) or 0)
+            provider.record(time.monotonic() - start, success=True)
+
+    def _record_usage(self, provider_name: str, elapsed: float, usage):
+        LLM_REQUESTS.inc(provider=provider_name, outcome='ok')
+        LLM_SECONDS.observe(elapsed, provider=provider_name)
+        prompt_tokens = getattr(usage, 'prompt_tokens', 0) or 0
+        completion_tokens = getattr(usage, 'completion_tokens', 0) or 0
+        LLM_TOKENS.inc(prompt_tokens, provider=provider_name, type='prompt')
+        LLM_TOKENS.inc(completion_tokens, provider=provider_name, type='completion')
+        LLM_COST.inc(prompt_tokens / 1000 * self.prompt_price + completion_tokens / 1000 * self.completion_price,
+                     provider=provider_name)
+
+    def collect_open(self):
+        return [('llm_provider_open', {'provider': p.name}, 0 if p.state == Provider.CLOSED else 1)
+                for p in self.providers]
+
+    def collect_in_flight(self):
+        return [('llm_in_flight', {'provider': p.name, 'deployment': d.name}, d.in_flight)
+                for p in self.providers for d in p.pool.deployments]
+
+    async def chat(self, messages: List[Dict[str, str]], only: List[str] = None, **params) -> Tuple[Any, str]:
+        """Send a chat completion and return (response, provider_name).
+
+        Providers are tried in order of preference and health; if the first has
+        not answered within its p95 latency, the request is hedged to the next one
+        and whichever succeeds first wins.
+        """
+        candidates = self.candidates(only)
+        if not candidates:
+            raise NoProviderAvailable("No healthy LLM provider available")
+
+        last_error = None
+        pending: Dict[asyncio.Task, Provider] = {}
+        queue = list(candidates)
+
+        def launch():
+            provider = queue.pop(0)
+            pending[asyncio.ensure_future(self._call(provider, messages, params))] = provider
+
+        launch()
+        while pending:
+            timeout = None
+            if self.hedge and queue and len(pending) == 1:
+                timeout = self._hedge_delay(next(iter(pending.values())))
+            done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                logger.info(f"Hedging LLM request to {queue[0].name}")
+                launch()
+                continue
+            for task in done:
+                provider = pending.pop(task)
+                if task.exception() is None:
+                    # Cancel the losing request so it gives its 'llm' slot back now; its
+                    # outcome is still recorded in the provider's stats (_settle_abandoned)
+                    for loser in pending:
+                        loser.cancel()
+                    return task.result(), provider.name
+                last_error = task.exception()
+                logger.warning(f"LLM provider {provider.name} failed: {last_error}")
+            if not pending and queue:
+                launch()
+
+        raise last_error
+
+    def stats(self) -> Dict[str, Any]:
+        return {provider.name: provider.stats() for provider in self.providers}
+
+
+def _retry_after_seconds(value: Optional[str], default: float = 60.0) -> float:
+    """Seconds to park a throttled deployment: Retry-After is delay-seconds or an HTTP-date."""
+    if not value:
+        return default
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def _providers_from_env() -> List[Provider]:
+    # openai is imported here rather than at module level: it is the slowest import in the app
+    import openai
+
+    timeout = float(os.getenv("LLM_REQUEST_TIMEOUT", "120"))
+    breaker = {
+        'failure_threshold': float(os.getenv("LLM_BREAKER_ERROR_RATE", "0.5")),
+        'cooldown': float(os.getenv("LLM_BREAKER_COOLDOWN", "30")),
+    }
+    deployments = deployments_from_env(timeout)
+
+    try:
+        # Azure OpenAI
+        azure_api_key = os.getenv("AZURE_OPENAI_API_KEY") or os.getenv("OPENAI_API_KEY")
+        azure_base_url = os.getenv("OPENAI_API_BASE")
+        deployment_name = os.getenv("OPENAI_DEPLOYMENT_NAME")
+        if azure_api_key and azure_base_url and deployment_name:
+            client = openai.AzureOpenAI(
+                api_key=azure_api_key,
+                azure_endpoint=azure_base_url,
+                api_version=os.getenv("OPENAI_API_VERSION", "2023-05-15"),
+                timeout=timeout
+            )
+            deployments.setdefault('azure_openai', []).insert(0, Deployment(deployment_name, client, deployment_name))
+            logger.info("LLM router initialized with Azure OpenAI")
+    except Exception as e:
+        logger.error(f"Azure OpenAI client initialization failed: {e}")
+
+    try:
+        # Standard OpenAI
+        openai_api_key = os.getenv("STANDARD_OPENAI_API_KEY")
+        if openai_api_key:
+            client = openai.OpenAI(
+                api_key=openai_api_key,
+                base_url=os.getenv("STANDARD_OPENAI_API_BASE", "https://api.openai.com/v1"),
+                timeout=timeout
+            )
+            model = os.getenv("STANDARD_OPENAI_MODEL", "gpt-3.5-turbo")
+            deployments.setdefault('openai', []).insert(0, Deployment(model, client, model))
+            logger.info("LLM router initialized with standard OpenAI")
+    except Exception as e:
+        logger.error(f"Standard OpenAI client initialization failed: {e}")
+
+    return [Provider(name, ClientPool(entries), **breaker) for name, entries in deployments.items()]
+
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> ProviderRouter:
+    """Process-wide router, built from the environment on first use."""
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                api_type = os.getenv("OPENAI_API_TYPE", "openai").lower()
+                _router = ProviderRouter(
+                    _providers_from_env(),
+                    preferred='azure_openai' if api_type == 'azure' else 'openai',
+                    hedge=os.getenv("LLM_HEDGE", "true").lower() == "true",
+                    default_hedge_delay=float(os.getenv("LLM_HEDGE_DELAY", "15"))
+                )
+                REGISTRY.register_collector('llm_provider_open', 'gauge',
+                                            'Circuit breaker open (1) or closed (0)', _router.collect_open)
+                REGISTRY.register_collector('llm_in_flight', 'gauge',
+                                            'LLM requests in flight per deployment', _router.collect_in_flight)
+    return _router
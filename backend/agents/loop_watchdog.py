@@ -0,0 +1,214 @@
+"""Event-loop lag measurement and blocking-call detection.
+
+A heartbeat coroutine wakes every LOOP_WATCHDOG_INTERVAL seconds and records how
+late it fired (``event_loop_lag_seconds``). A watchdog thread checks that the
+heartbeat keeps up; once the loop has been stuck for LOOP_BLOCK_THRESHOLD_MS it
+captures the loop thread's stack, which shows the synchronous call holding the
+loop (a ``requests`` download, a Chroma embedding, an SQLite query...).
+
+Each stall is attributed to the agent whose task was running, counted per agent
+in ``event_loop_blocked_total``/``event_loop_blocked_seconds_total``, kept in a
+recent-offenders list, and recorded as a ``loop.blocked`` span in the blocked
+task's trace, so it also appears in that job's trace and report.
+"""
+from collections import deque
+from typing import Dict, Any, List, Optional
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+
+from .base_agent import BaseAgent
+from .metrics import LOOP_LAG, LOOP_BLOCKED, LOOP_BLOCKED_SECONDS
+from .tracing import context_span, emit_span
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAX_STACK_FRAMES = 25
+
+
+def _describe(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+
+
+def _is_project_frame(frame) -> bool:
+    filename = frame.f_code.co_filename
+    return (filename.startswith(BACKEND_DIR) and 'site-packages' not in filename
+            and not filename.endswith(('loop_watchdog.py', 'tracing.py', 'metrics.py', 'base_agent.py')))
+
+
+class LoopWatchdog:
+    def __init__(self, loop: asyncio.AbstractEventLoop, threshold_ms: float = None, interval: float = None):
+        self.loop = loop
+        self.threshold = (threshold_ms or float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "100"))) / 1000
+        self.interval = interval or float(os.getenv("LOOP_WATCHDOG_INTERVAL", "0.05"))
+        self.offenders = deque(maxlen=int(os.getenv("LOOP_WATCHDOG_HISTORY", "100")))
+        self.by_agent: Dict[str, Dict[str, float]] = {}
+        self._beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._episode: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def start(self):
+        if self._on_loop():
+            self.loop.create_task(self._heartbeat())
+        else:
+            asyncio.run_coroutine_threadsafe(self._heartbeat(), self.loop)
+        threading.Thread(target=self._watch, name='loop-watchdog', daemon=True).start()
+
+    def stop(self):
+        self._stopped.set()
+
+    def _on_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            return False
+
+    async def _heartbeat(self):
+        self._loop_thread_id = threading.get_ident()
+        while not self._stopped.is_set():
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            LOOP_LAG.observe(max(time.monotonic() - self._beat - self.interval, 0.0))
+
+    def _watch(self):
+        poll = max(min(self.interval, self.threshold) / 2, 0.005)
+        while not self._stopped.wait(poll):
+            if self.loop.is_closed():
+                return
+            beat = self._beat
+            now = time.monotonic()
+            episode = self._episode
+            if episode is not None and episode['beat'] != beat:
+                # The loop got back to the heartbeat: the stall is over
+                self._episode = None
+                self._finish(episode, beat)
+            elif episode is None:
+                if now - beat - self.interval >= self.threshold and self._loop_thread_id is not None:
+                    self._episode = self._capture(beat, beat + self.interval)
+            elif now - episode['sampled_at'] >= self.threshold:
+                # Still stuck. Tasks stepped in the same loop iteration block back to back,
+                # so check whether another task has taken over and split the stall if so
+                sample = self._capture(beat, now)
+                if sample['context_id'] != episode['context_id']:
+                    self._finish(episode, now)
+                    self._episode = sample
+                else:
+                    episode['sampled_at'] = now
+
+    def _capture(self, beat: float, blocked_since: float) -> Dict[str, Any]:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack: List[str] = []
+        location_index = None
+        agent = None
+        context = parent = spans = None
+        while frame is not None and len(stack) < 200:
+            stack.append(_describe(frame))
+            if location_index is None and _is_project_frame(frame):
+                location_index = len(stack) - 1
+            code = frame.f_code
+            if code.co_name == '_run' and code.co_filename.endswith(os.path.join('asyncio', 'events.py')):
+                # Handle._run: the handle carries the context of the task being stepped
+                context = getattr(frame.f_locals.get('self'), '_context', None)
+                if context is not None:
+                    parent, spans = context_span(context)
+            elif agent is None:
+                owner = frame.f_locals.get('self') if 'self' in code.co_varnames else None
+                if isinstance(owner, BaseAgent):
+                    agent = owner.name
+            frame = frame.f_back
+        if parent is not None and parent.attributes.get('agent'):
+            agent = parent.attributes['agent']
+        # Innermost frames down to a few past the first application frame
+        cut = MAX_STACK_FRAMES if location_index is None else min(location_index + 5, MAX_STACK_FRAMES)
+        return {
+            'beat': beat,
+            'blocked_since': blocked_since,
+            'sampled_at': time.monotonic(),
+            'context_id': id(context) if context is not None else None,
+            'agent': agent or 'other',
+            'location': stack[location_index if location_index is not None else 0] if stack else None,
+            'stack': list(reversed(stack[:cut])),
+            'span': parent,
+            'spans': spans,
+        }
+
+    def _finish(self, episode: Dict[str, Any], ended: float):
+        duration = max(ended - episode['blocked_since'], 0.0)
+        wall_start = time.time() - (time.monotonic() - episode['blocked_since'])
+        agent = episode['agent']
+        LOOP_BLOCKED.inc(agent=agent)
+        LOOP_BLOCKED_SECONDS.inc(duration, agent=agent)
+        parent = episode['span']
+        record = {
+            'agent': agent,
+            'duration_ms': round(duration * 1000, 1),
+            'location': episode['location'],
+            'at': wall_start,
+            'span': parent.name if parent is not None else None,
+            'job_id': parent.attributes.get('job_id') if parent is not None else None,
+            'student': parent.attributes.get('student') if parent is not None else None,
+            'stack': episode['stack'],
+        }
+        with self._lock:
+            self.offenders.append(record)
+            stats = self.by_agent.setdefault(agent, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            stats['count'] += 1
+            stats['total_ms'] = round(stats['total_ms'] + record['duration_ms'], 1)
+            stats['max_ms'] = max(stats['max_ms'], record['duration_ms'])
+        logger.warning(f"Event loop blocked for {record['duration_ms']:.0f} ms by {agent} at {record['location']}")
+        emit_span('loop.blocked', wall_start, wall_start + duration, parent=parent, spans=episode['spans'],
+                  blocked_agent=agent, location=episode['location'], stack='\n'.join(episode['stack'][-10:]))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'threshold_ms': self.threshold * 1000,
+                'interval_s': self.interval,
+                'by_agent': {agent: dict(stats) for agent, stats in self.by_agent.items()},
+                'recent': list(self.offenders),
+            }
+
+
+def blocking_summary(spans: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Per-agent totals of the ``loop.blocked`` spans in a trace, for job reports."""
+    summary: Dict[str, Dict[str, Any]] = {}
+    for s in spans:
+        if s['name'] != 'loop.blocked':
+            continue
+        agent = s['attributes'].get('blocked_agent', 'other')
+        entry = summary.setdefault(agent, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'locations': {}})
+        entry['count'] += 1
+        entry['total_ms'] = round(entry['total_ms'] + s['duration_ms'], 1)
+        entry['max_ms'] = max(entry['max_ms'], s['duration_ms'])
+        location = s['attributes'].get('location')
+        entry['locations'][location] = entry['locations'].get(location, 0) + 1
+    return summary
+
+
+_watchdogs = weakref.WeakKeyDictionary()
+_watchdogs_lock = threading.Lock()
+
+
+def watch_loop(loop: asyncio.AbstractEventLoop = None) -> Optional[LoopWatchdog]:
+    """Start (once) the watchdog for a loop; LOOP_WATCHDOG=0 disables it."""
+    if os.getenv("LOOP_WATCHDOG", "1") == '0':
+        return None
+    loop = loop or asyncio.get_running_loop()
+    with _watchdogs_lock:
+        watchdog = _watchdogs.get(loop)
+        if watchdog is None:
+            watchdog = _watchdogs[loop] = LoopWatchdog(loop)
+            watchdog.start()
+    return watchdog
+
+
+def get_watchdog(loop: asyncio.AbstractEventLoop) -> Optional[LoopWatchdog]:
+    return _watchdogs.get(loop)
@@ -0,0 +1,206 @@
+"""In-process metrics registry rendered in the Prometheus text format.
+
+Counters, gauges and histograms are labelled and thread-safe. Values that already
+live elsewhere (scheduler queues, provider health, task queue depth) are read at
+scrape time by collector callbacks instead of being mirrored into gauges.
+
+    STAGE_SECONDS.observe(1.2, stage='grading')
+    with timed(STAGE_SECONDS, stage='report'):
+        ...
+
+Each process keeps its own registry; with several web workers, scrape each one.
+"""
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Tuple
+import bisect
+import threading
+import time
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+# (name, labels, value) samples returned by collectors
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in sorted(labels.items())) + '}'
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in self._values.items()]
+
+
+class Gauge(Counter):
+    kind = 'gauge'
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> (per-bucket counts, sum, count)
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            index = bisect.bisect_left(self.buckets, value)
+            if index < len(self.buckets):
+                state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def samples(self) -> List[Sample]:
+        samples = []
+        with self._lock:
+            for key, (counts, total, count) in self._values.items():
+                labels = dict(zip(self.labelnames, key))
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    samples.append((f"{self.name}_bucket", {**labels, 'le': f"{bound:g}"}, cumulative))
+                samples.append((f"{self.name}_bucket", {**labels, 'le': '+Inf'}, count))
+                samples.append((f"{self.name}_sum", labels, total))
+                samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        # name -> (type, help, callback returning samples)
+        self._collectors: Dict[str, Tuple[str, str, Callable[[], List[Sample]]]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, name: str, kind: str, documentation: str,
+                           callback: Callable[[], List[Sample]]):
+        """Add a metric whose samples are produced by ``callback`` at scrape time."""
+        with self._lock:
+            self._collectors[name] = (kind, documentation, callback)
+
+    def render(self) -> str:
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(f"{name}{_format_labels(labels)} {value:g}" for name, labels, value in metric.samples())
+        for name, (kind, documentation, callback) in list(self._collectors.items()):
+            try:
+                samples = callback()
+            except Exception as e:
+                lines.append(f"# collector {name} failed: {e}")
+                continue
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(f"{sample}{_format_labels(labels)} {value:g}" for sample, labels, value in samples)
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+AGENT_SECONDS = REGISTRY.histogram(
+    'agent_process_seconds', 'Agent process() latency', ['agent', 'action', 'status'])
+AGENT_IN_FLIGHT = REGISTRY.gauge('agent_in_flight', 'Agent process() calls in progress', ['agent'])
+STAGE_SECONDS = REGISTRY.histogram('pipeline_stage_seconds', 'Assessment pipeline stage latency', ['stage'])
+LLM_REQUESTS = REGISTRY.counter('llm_requests_total', 'LLM chat completions by outcome', ['provider', 'outcome'])
+LLM_SECONDS = REGISTRY.histogram('llm_request_seconds', 'LLM chat completion latency', ['provider'])
+LLM_TOKENS = REGISTRY.counter('llm_tokens_total', 'LLM tokens used', ['provider', 'type'])
+LLM_COST = REGISTRY.counter('llm_cost_usd_total', 'Estimated LLM spend from token counts and LLM_PRICE_*', ['provider'])
+CACHE_REQUESTS = REGISTRY.counter('cache_requests_total', 'Cache lookups by result (hit/miss)', ['cache', 'result'])
+LOOP_LAG = REGISTRY.histogram('event_loop_lag_seconds', 'How late event-loop timers fire',
+                              buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5))
+LOOP_BLOCKED = REGISTRY.counter('event_loop_blocked_total', 'Event-loop stalls over the threshold', ['agent'])
+LOOP_BLOCKED_SECONDS = REGISTRY.counter('event_loop_blocked_seconds_total', 'Time the event loop was blocked',
+                                        ['agent'])
+AGENT_MESSAGES = REGISTRY.counter('agent_messages_total', 'Mailbox messages handled by agent actors', ['agent', 'outcome'])
+AGENT_MAILBOX_DEPTH = REGISTRY.gauge('agent_mailbox_depth', 'Messages waiting in agent mailboxes', ['agent'])
+AGENT_MAILBOX_WAIT = REGISTRY.histogram('agent_mailbox_wait_seconds', 'Time messages wait in a mailbox', ['agent'])
+AGENT_RESTARTS = REGISTRY.counter('agent_worker_restarts_total', 'Agent workers restarted after a crash', ['agent'])
+REPO_ARCHIVE_BYTES = REGISTRY.histogram('repo_archive_bytes', 'Size of downloaded repository archives',
+                                        buckets=(2**16, 2**18, 2**20, 2**22, 2**24, 2**26, 2**28))
+REPO_ARCHIVES_REJECTED = REGISTRY.counter('repo_archives_rejected_total',
+                                          'Repository downloads aborted by the size or time guards or cut off mid-body', ['reason'])
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
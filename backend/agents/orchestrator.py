@@ -1,17 +1,43 @@
 import asyncio
+import logging
+import os
+import pprint
+import uuid
+from contextlib import contextmanager
 from typing import Dict, Any, List
-from .csv_agent import CSVAgent
-from .repo_agent import RepoAgent
-from .grading_agent import GradingAgent
-from .ai_detection_agent import AIDetectionAgent
-from .report_agent import ReportAgent
-from .vector_agent import VectorAgent
-from .batch_agent import BatchAgent
-from .graph_rag_agent import GraphRAGAgent
-from .consistency_agent import ConsistencyAgent
+from .metrics import STAGE_SECONDS, timed
+from .tracing import span
+from .profiling import profile_stage
+from .roster import RepoGroups, fan_out_result
+
+logger = logging.getLogger(__name__)
+
+# 'batch': BatchAgent grading plus a batched AI screen
+# 'separate': GradingAgent and AIDetectionAgent per student (two LLM requests)
+# 'combined': one CombinedAssessmentAgent request per student
+ASSESSMENT_MODES = ('batch', 'separate', 'combined')
+
+@contextmanager
+def _stage(name: str):
+    with timed(STAGE_SECONDS, stage=name), span(f"stage.{name}"), profile_stage(name):
+        yield
 
 class AgentOrchestrator:
     def __init__(self):
+        # Agent modules pull in pandas, numpy, scipy, chromadb and openai; import them only
+        # when an orchestrator is actually built so the web app starts quickly
+        from .csv_agent import CSVAgent
+        from .repo_agent import RepoAgent
+        from .grading_agent import GradingAgent
+        from .ai_detection_agent import AIDetectionAgent
+        from .report_agent import ReportAgent
+        from .vector_agent import VectorAgent
+        from .batch_agent import BatchAgent
+        from .graph_rag_agent import GraphRAGAgent
+        from .consistency_agent import ConsistencyAgent
+        from .similarity_agent import SimilarityAgent
+        from .combined_assessment_agent import CombinedAssessmentAgent
+        
         self.csv_agent = CSVAgent()
         self.repo_agent = RepoAgent()
         self.grading_agent = GradingAgent()
@@ -21,89 +47,241 @@ class AgentOrchestrator:
         self.batch_agent = BatchAgent()
         self.graph_rag_agent = GraphRAGAgent()
         self.consistency_agent = ConsistencyAgent()
+        self.similarity_agent = SimilarityAgent()
+        self.combined_assessment_agent = CombinedAssessmentAgent()
+        self.assessment_mode = os.getenv("ASSESSMENT_MODE", "batch").lower()
+        self.assessment_concurrency = int(os.getenv("ASSESSMENT_CONCURRENCY", "5"))
+        self.consistency_concurrency = int(os.getenv("CONSISTENCY_CONCURRENCY", "5"))
+        # 0 checks every student
+        self.consistency_max_students = int(os.getenv("CONSISTENCY_MAX_STUDENTS", "0"))
         
-    async def process_assessment(self, csv_data: Dict[str, Any], rubric: str) -> Dict[str, Any]:
+    async def process_assessment(self, csv_data: Dict[str, Any], rubric: str,
+                                 assessment_mode: str = None) -> Dict[str, Any]:
+        run_id = uuid.uuid4().hex
+        mode = (assessment_mode or self.assessment_mode).lower()
+        with span('process_assessment', run_id=run_id, mode=mode):
+            return await self._process_assessment(csv_data, rubric, run_id, mode)
+    
+    async def _process_assessment(self, csv_data: Dict[str, Any], rubric: str, run_id: str,
+                                  mode: str) -> Dict[str, Any]:
         try:
-            # Step 1: Process CSV
-            csv_result = await self.csv_agent.process(csv_data)
-            if 'error' in csv_result:
-                return {'error': f"CSV processing failed: {csv_result['error']}"}
-            
-            students = csv_result['students']
+            if mode not in ASSESSMENT_MODES:
+                raise ValueError(f"Unknown assessment mode: {mode}")
             
-            # Step 2: Collect repository data
+            # Steps 1-2: Stream the roster and start each repository fetch as soon as the
+            # student is parsed. Students sharing a repository (same canonical URL) get one
+            # fetch and one grading; results are fanned back out to all of them at the end
+            groups = RepoGroups()
             repo_tasks = []
-            for student in students:
-                task = self.repo_agent.process({
-                    'repo_url': student.get('repo_url'),
-                    'student_name': student.get('name')
-                })
-                repo_tasks.append(task)
+            with _stage('roster'):
+                try:
+                    async for student in self.csv_agent.stream_students(csv_data):
+                        student = groups.add(student)
+                        if student is None:
+                            continue
+                        repo_tasks.append(asyncio.ensure_future(self.repo_agent.process({
+                            'repo_url': student.get('repo_url'),
+                            'student_name': student.get('name'),
+                            'ref': student.get('ref')
+                        })))
+                except Exception as e:
+                    for task in repo_tasks:
+                        task.cancel()
+                    return {'error': f"CSV processing failed: {str(e)}"}
             
-            repo_results = await asyncio.gather(*repo_tasks, return_exceptions=True)
-            print("=== DEBUG: repo_results ===")
-            import pprint
-            pprint.pprint(repo_results)
-            print("=== END DEBUG ===")
+            with _stage('repo_fetch'):
+                repo_results = await asyncio.gather(*repo_tasks, return_exceptions=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("repo_results:\n%s", pprint.pformat(repo_results))
             # Step 3: Build knowledge graph and store in vector DB
             valid_students = []
-            for result in repo_results:
-                if not isinstance(result, Exception) and result.get('code'):
-                    valid_students.append(result)
-                    # Store in vector database for context
-                    await self.vector_agent.process({
-                        'action': 'store',
-                        'student_name': result.get('student_name'),
-                        'code': result.get('code'),
-                        'metadata': {'repo_url': result.get('repo_url')}
+            # Oversized or stalled downloads are reported as flagged rows instead of vanishing
+            flagged = [r for r in repo_results if isinstance(r, dict) and r.get('flagged')]
+            with _stage('vector_store'):
+                for result in repo_results:
+                    if not isinstance(result, Exception) and result.get('code'):
+                        valid_students.append(result)
+                        # Store in vector database for context
+                        await self.vector_agent.process({
+                            'action': 'store',
+                            'student_name': result.get('student_name'),
+                            'code': result.get('code'),
+                            'metadata': {'repo_url': result.get('repo_url')}
+                        })
+                    else:
+                        error = result if isinstance(result, Exception) else result.get('error', 'no code found')
+                        logger.info(f"Skipping student due to missing code or error: {error}")
+            
+            # Build knowledge graph and run near-duplicate detection
+            similarity_report = await self._cohort_analysis(valid_students, csv_data.get('cohort'), run_id)
+            
+            if mode == 'batch':
+                # Step 4: Use batch processing for grading (50% token reduction)
+                with _stage('grading'):
+                    batch_result = await self.batch_agent.process({
+                        'students': valid_students,
+                        'rubric': rubric
+                    })
+                
+                # Step 4b: AI detection - local stylometric screen, LLM only for ambiguous submissions
+                with _stage('ai_detection'):
+                    ai_result = await self.ai_detection_agent.process({
+                        'action': 'screen_batch',
+                        'students': valid_students
                     })
-                else:
-                    print("Skipping student due to missing code or error:", result)
+                graded_results = batch_result.get('results', [])
+                for graded, detected in zip(graded_results, ai_result.get('results', [])):
+                    if graded.get('student_name') == detected.get('student_name'):
+                        graded['ai_percentage'] = detected['ai_percentage']
+                        graded['ai_confidence'] = detected['confidence']
+                        graded['ai_indicators'] = detected['indicators']
+            else:
+                # Step 4: Per-student assessment with the selected strategy
+                assessment_semaphore = asyncio.Semaphore(self.assessment_concurrency)
+                
+                async def assess(student):
+                    async with assessment_semaphore:
+                        return await self._assess_student(student, rubric, mode)
+                
+                with _stage('assessment'):
+                    graded_results = list(await asyncio.gather(*(assess(student) for student in valid_students)))
             
-            # Build knowledge graph
-            await self.graph_rag_agent.process({
-                'action': 'build_graph',
-                'students': valid_students
-            })
+            # Step 5: Run consistency checks across the cohort, bounded by a semaphore
+            consistency_semaphore = asyncio.Semaphore(self.consistency_concurrency)
             
-            # Step 4: Use batch processing for grading (50% token reduction)
-            batch_result = await self.batch_agent.process({
-                'students': valid_students,
-                'rubric': rubric,
-                'api_type': 'openai'
-            })
+            async def check_consistency(student):
+                async with consistency_semaphore:
+                    return await self.consistency_agent.process({
+                        'code': student.get('code'),
+                        'rubric': rubric,
+                        'student_name': student.get('student_name')
+                    })
             
-            # Step 5: Run consistency checks
-            consistency_tasks = []
-            for student in valid_students[:3]:  # Check first 3 for consistency
-                task = self.consistency_agent.process({
-                    'code': student.get('code'),
-                    'rubric': rubric,
-                    'student_name': student.get('student_name')
-                })
-                consistency_tasks.append(task)
+            consistency_students = valid_students[:self.consistency_max_students or None]
+            with _stage('consistency'):
+                consistency_results = await asyncio.gather(
+                    *(check_consistency(student) for student in consistency_students), return_exceptions=True
+                )
             
-            consistency_results = await asyncio.gather(*consistency_tasks, return_exceptions=True)
+            if groups.duplicates:
+                logger.info(f"{groups.duplicates} roster entries shared a repository with another student")
+            graded_results = groups.fan_out(list(graded_results) + flagged)
+            consistency_results = groups.fan_out(
+                consistency_results, [student.get('repo_url') for student in consistency_students]
+            )
             
             # Step 6: Generate enhanced report
+            return await self._build_report(run_id, mode, graded_results, consistency_results,
+                                            similarity_report, rubric)
+            
+        except Exception as e:
+            return {'error': f"Orchestration failed: {str(e)}"}
+    
+    async def _cohort_analysis(self, valid_students: List[Dict[str, Any]], cohort: str, run_id: str) -> Dict[str, Any]:
+        # Build knowledge graph
+        with _stage('knowledge_graph'):
+            await self.graph_rag_agent.process({
+                'action': 'build_graph',
+                'students': valid_students,
+                'cohort': cohort
+            })
+        
+        # Near-duplicate detection across this run and earlier submissions
+        with _stage('similarity'):
+            return await self.similarity_agent.process({
+                'action': 'detect',
+                'students': valid_students,
+                'run_id': run_id
+            })
+    
+    async def _build_report(self, run_id: str, mode: str, graded_results: List[Dict[str, Any]],
+                            consistency_results: List[Any], similarity_report: Dict[str, Any],
+                            rubric: str) -> Dict[str, Any]:
+        with _stage('report'):
             report_result = await self.report_agent.process({
-                'results': batch_result.get('results', []),
+                'results': graded_results,
                 'consistency_metrics': consistency_results,
+                'similarity_report': similarity_report,
                 'rubric': rubric
             })
-            
-            return {
-                'results': batch_result.get('results', []),
-                'report': report_result,
-                'consistency_metrics': consistency_results,
-                'summary': report_result.get('summary', {}),
-                'status': 'completed'
-            }
-            
+        
+        return {
+            'run_id': run_id,
+            'assessment_mode': mode,
+            'results': graded_results,
+            'report': report_result,
+            'consistency_metrics': consistency_results,
+            'similarity_report': similarity_report,
+            'summary': report_result.get('summary', {}),
+            'status': 'completed'
+        }
+    
+    # --- Distributed execution (see task_queue.py / worker.py) ---
+    # A job is split into one task per student, run by any worker, and a final
+    # cohort-level task that needs every student's code.
+    
+    async def assess_student_stage(self, student: Dict[str, Any], rubric: str, mode: str) -> Dict[str, Any]:
+        """Fetch, index, grade, AI-screen and consistency-check a single student."""
+        # Batch grading needs the whole cohort in one prompt; per-student tasks use the
+        # combined single-request assessment instead
+        mode = 'combined' if mode == 'batch' else mode
+        with span('student', student=student.get('name')):
+            return await self._assess_student_stage(student, rubric, mode)
+    
+    async def _assess_student_stage(self, student: Dict[str, Any], rubric: str, mode: str) -> Dict[str, Any]:
+        repo_result = await self.repo_agent.process({
+            'repo_url': student.get('repo_url'),
+            'student_name': student.get('name'),
+            'ref': student.get('ref')
+        })
+        if not repo_result.get('code'):
+            return {'repo': repo_result, 'result': None, 'consistency': None}
+        
+        await self.vector_agent.process({
+            'action': 'store',
+            'student_name': repo_result.get('student_name'),
+            'code': repo_result.get('code'),
+            'metadata': {'repo_url': repo_result.get('repo_url')}
+        })
+        final_result, consistency = await asyncio.gather(
+            self._assess_student(repo_result, rubric, mode),
+            self.consistency_agent.process({
+                'code': repo_result.get('code'),
+                'rubric': rubric,
+                'student_name': repo_result.get('student_name')
+            })
+        )
+        return {'repo': repo_result, 'result': final_result, 'consistency': consistency}
+    
+    async def finalize_assessment(self, run_id: str, mode: str, stage_results: List[Dict[str, Any]],
+                                  rubric: str, cohort: str = None) -> Dict[str, Any]:
+        """Cohort-level steps over the collected per-student results."""
+        with span('finalize_assessment', run_id=run_id, mode=mode):
+            return await self._finalize_assessment(run_id, mode, stage_results, rubric, cohort)
+    
+    async def _finalize_assessment(self, run_id: str, mode: str, stage_results: List[Dict[str, Any]],
+                                   rubric: str, cohort: str = None) -> Dict[str, Any]:
+        try:
+            valid_students = [r['repo'] for r in stage_results if r.get('result')]
+            graded_results = []
+            consistency_results = []
+            for r in stage_results:
+                # Tasks carry every student who submitted the repository (see run_prepare_task)
+                members = r.get('members') or []
+                row = r.get('result') or (r['repo'] if r.get('repo', {}).get('flagged') else None)
+                if row:
+                    graded_results.extend(fan_out_result(row, members) if members else [row])
+                if r.get('consistency'):
+                    consistency_results.extend(
+                        fan_out_result(r['consistency'], members) if members else [r['consistency']]
+                    )
+            similarity_report = await self._cohort_analysis(valid_students, cohort, run_id)
+            return await self._build_report(run_id, mode, graded_results, consistency_results,
+                                            similarity_report, rubric)
         except Exception as e:
             return {'error': f"Orchestration failed: {str(e)}"}
     
-    async def _process_student(self, student: Dict[str, Any], rubric: str) -> Dict[str, Any]:
+    async def _process_student(self, student: Dict[str, Any], rubric: str, mode: str = 'separate') -> Dict[str, Any]:
         student_name = student.get('name')
         repo_url = student.get('repo_url')
         
@@ -111,7 +289,8 @@ class AgentOrchestrator:
             # Step 1: Analyze repository
             repo_data = {
                 'repo_url': repo_url,
-                'student_name': student_name
+                'student_name': student_name,
+                'ref': student.get('ref')
             }
             repo_result = await self.repo_agent.process(repo_data)
             
@@ -123,44 +302,8 @@ class AgentOrchestrator:
                     'status': 'repo_error'
                 }
             
-            code = repo_result.get('code', '')
-            
-            # Step 2: Run grading and AI detection concurrently
-            grading_task = self.grading_agent.process({
-                'code': code,
-                'rubric': rubric,
-                'student_name': student_name
-            })
-            
-            ai_detection_task = self.ai_detection_agent.process({
-                'code': code,
-                'student_name': student_name
-            })
-            
-            grading_result, ai_result = await asyncio.gather(
-                grading_task, ai_detection_task, return_exceptions=True
-            )
-            
-            # Combine results
-            final_result = {
-                'student_name': student_name,
-                'repo_url': repo_url,
-                'status': 'completed'
-            }
-            
-            if isinstance(grading_result, Exception):
-                final_result['grading_error'] = str(grading_result)
-            else:
-                final_result['scores'] = grading_result.get('scores', {})
-            
-            if isinstance(ai_result, Exception):
-                final_result['ai_detection_error'] = str(ai_result)
-            else:
-                final_result['ai_percentage'] = ai_result.get('ai_percentage', 0)
-                final_result['ai_confidence'] = ai_result.get('confidence', 'low')
-                final_result['ai_indicators'] = ai_result.get('indicators', [])
-            
-            return final_result
+            # Step 2: Grade and detect AI with the selected strategy
+            return await self._assess_student(repo_result, rubric, mode)
             
         except Exception as e:
             return {
@@ -169,17 +312,79 @@ class AgentOrchestrator:
                 'error': str(e),
                 'status': 'processing_error'
             }
+    
+    async def _assess_student(self, repo_result: Dict[str, Any], rubric: str, mode: str) -> Dict[str, Any]:
+        with span('assess_student', student=repo_result.get('student_name'), mode=mode):
+            return await self._grade_and_screen(repo_result, rubric, mode)
+    
+    async def _grade_and_screen(self, repo_result: Dict[str, Any], rubric: str, mode: str) -> Dict[str, Any]:
+        student_name = repo_result.get('student_name')
+        code = repo_result.get('code', '')
+        
+        final_result = {
+            'student_name': student_name,
+            'repo_url': repo_result.get('repo_url'),
+            'status': 'completed'
+        }
+        
+        if mode == 'combined':
+            # One request returns both rubric scores and AI-detection fields
+            combined = await self.combined_assessment_agent.process({
+                'code': code,
+                'rubric': rubric,
+                'student_name': student_name
+            })
+            if combined.get('status') == 'error':
+                final_result['grading_error'] = combined.get('error')
+                final_result['status'] = 'error'
+            else:
+                final_result['scores'] = combined.get('scores', {})
+                final_result['ai_percentage'] = combined.get('ai_percentage', 0)
+                final_result['ai_confidence'] = combined.get('confidence', 'low')
+                final_result['ai_indicators'] = combined.get('indicators', [])
+            return final_result
+        
+        # Run grading and AI detection concurrently
+        grading_task = self.grading_agent.process({
+            'code': code,
+            'rubric': rubric,
+            'student_name': student_name
+        })
+        
+        ai_detection_task = self.ai_detection_agent.process({
+            'code': code,
+            'student_name': student_name
+        })
+        
+        grading_result, ai_result = await asyncio.gather(
+            grading_task, ai_detection_task, return_exceptions=True
+        )
+        
+        if isinstance(grading_result, Exception):
+            final_result['grading_error'] = str(grading_result)
+        else:
+            final_result['scores'] = grading_result.get('scores', {})
+        
+        if isinstance(ai_result, Exception):
+            final_result['ai_detection_error'] = str(ai_result)
+        else:
+            final_result['ai_percentage'] = ai_result.get('ai_percentage', 0)
+            final_result['ai_confidence'] = ai_result.get('confidence', 'low')
+            final_result['ai_indicators'] = ai_result.get('indicators', [])
+        
+        return final_result
 
 # === Double Agentic LLM Functions ===
 
-import os
-import openai
+from .llm_router import get_router
 
 def process_with_azure_openai(repo, prompt):
     """
     Call Azure OpenAI Chat Completion API with the given prompt and repo context.
     Returns a dict. If a content policy error is encountered, return {'error': 'content_policy'}
     """
+    import openai
+
     try:
         api_key = os.getenv("AZURE_OPENAI_API_KEY")
         api_base = os.getenv("OPENAI_API_BASE")
@@ -223,9 +428,32 @@ def process_with_azure_openai(repo, prompt):
 
 def process_with_openai(repo, prompt):
     """
-    Simulate processing with standard OpenAI.
-    Replace this stub with actual OpenAI API logic.
+    Call standard OpenAI (through the provider router) with the given prompt and repo context.
     Returns a dict.
     """
-    # TODO: Implement actual OpenAI call
-    return {"response": f"OpenAI processed repo: {repo} with prompt: {prompt}"}
+    return process_with_llm(repo, prompt, only=['openai'])
+
+def process_with_llm(repo, prompt, only=None):
+    """
+    Send the prompt to whichever provider the router picks (health, latency and
+    preference aware, with hedging). Returns a dict with the response and the provider used.
+    """
+    return asyncio.run(aprocess_with_llm(repo, prompt, only=only))
+
+async def aprocess_with_llm(repo, prompt, only=None):
+    """Coroutine form of process_with_llm, for callers that already run an event loop."""
+    messages = [
+        {"role": "system", "content": "You are an AI code assistant. Use the repo context to answer the prompt."},
+        {"role": "user", "content": f"Repo: {repo}\nPrompt: {prompt}"}
+    ]
+    import openai
+
+    try:
+        response, provider = await get_router().chat(messages, only=only)
+        return {"response": response.choices[0].message.content, "provider": provider}
+    except openai.BadRequestError as e:
+        if "content_filter" in str(e):
+            return {"error": "content_policy"}
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": str(e)}
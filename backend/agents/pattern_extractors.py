@@ -0,0 +1,214 @@
+"""Per-language extraction of normalized code symbols for the knowledge graph.
+
+Every extractor emits symbols of the form ``kind:name``:
+
+- ``function:name`` / ``method:Class.name``
+- ``class:Name``
+- ``import:module``
+- ``call:caller->callee`` (only for callees defined in the same submission)
+
+Python is parsed with ``ast``; JS/TS, Java and C use lightweight regex tokenizers.
+Additional languages can be plugged in with ``register_extractor``.
+"""
+from abc import ABC, abstractmethod
+from typing import List, Set, Iterable
+import ast
+import re
+
+
+class PatternExtractor(ABC):
+    language = None
+
+    def detect(self, code: str) -> bool:
+        return True
+
+    @abstractmethod
+    def extract(self, code: str) -> Set[str]:
+        ...
+
+
+class PythonExtractor(PatternExtractor):
+    language = 'python'
+
+    def extract(self, code: str) -> Set[str]:
+        symbols = set()
+        for tree in self._parse(code):
+            self._visit(tree, symbols)
+        return symbols
+
+    def _parse(self, code: str) -> Iterable[ast.AST]:
+        try:
+            yield ast.parse(code)
+            return
+        except (SyntaxError, ValueError):
+            pass
+        # Submissions are several files concatenated (and possibly truncated or mixed
+        # with other languages), so fall back to parsing each top-level block alone.
+        for block in self._top_level_blocks(code):
+            try:
+                yield ast.parse(block)
+            except (SyntaxError, ValueError):
+                continue
+
+    def _top_level_blocks(self, code: str) -> Iterable[str]:
+        block = []
+        for line in code.split('\n'):
+            starts_block = line[:1] not in ('', ' ', '\t', ')', ']', '}')
+            if starts_block and block and not block[-1].startswith('@'):
+                yield '\n'.join(block)
+                block = []
+            block.append(line)
+        if block:
+            yield '\n'.join(block)
+
+    def _visit(self, tree: ast.AST, symbols: Set[str]):
+        defined = set()
+        scopes = []
+        methods = set()
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                symbols.add(f"class:{node.name}")
+                defined.add(node.name)
+                for item in node.body:
+                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        symbols.add(f"method:{node.name}.{item.name}")
+                        methods.add(id(item))
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if id(node) not in methods:
+                    symbols.add(f"function:{node.name}")
+                defined.add(node.name)
+                scopes.append((node.name, node))
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    symbols.add(f"import:{alias.name}")
+            elif isinstance(node, ast.ImportFrom):
+                module = '.' * node.level + (node.module or '')
+                symbols.add(f"import:{module}")
+
+        for caller, scope in scopes:
+            for node in ast.walk(scope):
+                if not isinstance(node, ast.Call):
+                    continue
+                if isinstance(node.func, ast.Name):
+                    callee = node.func.id
+                elif isinstance(node.func, ast.Attribute):
+                    callee = node.func.attr
+                else:
+                    continue
+                if callee in defined and callee != caller:
+                    symbols.add(f"call:{caller}->{callee}")
+
+
+_C_LIKE_COMMENTS = re.compile(r'//[^\n]*|/\*[\s\S]*?\*/')
+_C_LIKE_STRINGS = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`')
+_CONTROL_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'return', 'function', 'else', 'do', 'sizeof', 'new'}
+_CALL = re.compile(r'\b([A-Za-z_$][\w$]*)\s*\(')
+
+
+class CLikeExtractor(PatternExtractor):
+    """Shared tokenizer logic for brace-delimited languages."""
+
+    function_patterns: List[re.Pattern] = []
+    class_patterns: List[re.Pattern] = []
+    import_patterns: List[re.Pattern] = []
+    detect_pattern: re.Pattern = None
+
+    def detect(self, code: str) -> bool:
+        return bool(self.detect_pattern.search(code))
+
+    def extract(self, code: str) -> Set[str]:
+        symbols = set()
+        # Imports are matched on the raw text since module paths live inside strings
+        for pattern in self.import_patterns:
+            for match in pattern.finditer(_C_LIKE_COMMENTS.sub('', code)):
+                symbols.add(f"import:{match.group(1).strip()}")
+
+        stripped = _C_LIKE_STRINGS.sub('""', _C_LIKE_COMMENTS.sub('', code))
+        for pattern in self.class_patterns:
+            for match in pattern.finditer(stripped):
+                symbols.add(f"class:{match.group(1)}")
+
+        functions = []
+        for pattern in self.function_patterns:
+            for match in pattern.finditer(stripped):
+                name = match.group(1)
+                if name in _CONTROL_KEYWORDS:
+                    continue
+                symbols.add(f"function:{name}")
+                functions.append((name, match.end()))
+
+        defined = {name for name, _ in functions}
+        for caller, start in functions:
+            body = self._body(stripped, start)
+            for callee in _CALL.findall(body):
+                if callee in defined and callee != caller:
+                    symbols.add(f"call:{caller}->{callee}")
+        return symbols
+
+    def _body(self, text: str, start: int) -> str:
+        open_pos = text.find('{', start - 1)
+        if open_pos == -1 or open_pos - start > 2:
+            return ''
+        depth = 0
+        for pos in range(open_pos, len(text)):
+            if text[pos] == '{':
+                depth += 1
+            elif text[pos] == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[open_pos + 1:pos]
+        return text[open_pos + 1:]
+
+
+class JavaScriptExtractor(CLikeExtractor):
+    language = 'javascript'
+    detect_pattern = re.compile(r'\b(?:const|let|var|function|require|export)\b|=>')
+    function_patterns = [
+        re.compile(r'\bfunction\s*\*?\s*([A-Za-z_$][\w$]*)\s*\([^)]*\)\s*\{'),
+        re.compile(r'\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*(?:async\s+)?(?:function\b[^{]*|\([^)]*\)\s*=>\s*|[A-Za-z_$][\w$]*\s*=>\s*)\{?'),
+        re.compile(r'^\s*(?:static\s+)?(?:async\s+)?([A-Za-z_$][\w$]*)\s*\([^)]*\)\s*\{', re.MULTILINE),
+    ]
+    class_patterns = [re.compile(r'\bclass\s+([A-Za-z_$][\w$]*)'), re.compile(r'\binterface\s+([A-Za-z_$][\w$]*)')]
+    import_patterns = [
+        re.compile(r'\bimport\s+[\w\s{},*$]*?\bfrom\s+[\'"]([^\'"]+)[\'"]'),
+        re.compile(r'\bimport\s+[\'"]([^\'"]+)[\'"]'),
+        re.compile(r'\brequire\(\s*[\'"]([^\'"]+)[\'"]\s*\)'),
+    ]
+
+
+class JavaExtractor(CLikeExtractor):
+    language = 'java'
+    detect_pattern = re.compile(r'\b(?:public|private|protected)\s+(?:static\s+)?(?:final\s+)?(?:class|interface|enum|[\w<>\[\]]+\s+\w+\s*\()')
+    function_patterns = [
+        re.compile(r'\b(?:(?:public|private|protected|static|final|synchronized|abstract)\s+)+(?:[\w<>\[\],]+\s+)?([A-Za-z_]\w*)\s*\([^)]*\)\s*(?:throws\s+[\w.,\s]+?)?\{'),
+    ]
+    class_patterns = [re.compile(r'\b(?:class|interface|enum|record)\s+([A-Za-z_]\w*)')]
+    import_patterns = [re.compile(r'^\s*import\s+(?:static\s+)?([\w.]+?)(?:\.\*)?\s*;', re.MULTILINE)]
+
+
+class CExtractor(CLikeExtractor):
+    language = 'c'
+    detect_pattern = re.compile(r'^\s*#\s*include\s*[<"]', re.MULTILINE)
+    function_patterns = [
+        re.compile(r'^[A-Za-z_][ \t\w\*&:<>,]*?\b([A-Za-z_]\w*)\s*\([^;{)]*\)\s*(?:const\s*)?\{', re.MULTILINE),
+    ]
+    class_patterns = [re.compile(r'\b(?:struct|class|union)\s+([A-Za-z_]\w*)\s*\{')]
+    import_patterns = [re.compile(r'^\s*#\s*include\s*[<"]([^>"]+)[>"]', re.MULTILINE)]
+
+
+EXTRACTORS: List[PatternExtractor] = [PythonExtractor(), JavaScriptExtractor(), JavaExtractor(), CExtractor()]
+
+
+def register_extractor(extractor: PatternExtractor):
+    EXTRACTORS.append(extractor)
+
+
+def extract_patterns(code: str) -> List[str]:
+    """Run every extractor that recognises the submission and return the union of
+    their symbols. Module-level so it can be shipped to a process pool."""
+    symbols = set()
+    for extractor in EXTRACTORS:
+        if extractor.detect(code):
+            symbols |= extractor.extract(code)
+    return sorted(symbols)
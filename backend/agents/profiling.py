@@ -0,0 +1,229 @@
+"""Per-run profiling for slow assessments.
+
+``RunProfiler`` is switched on for one job (``profile=1`` on the jobs API) and
+captures, for that run only:
+
+- a sampling CPU profile: every thread's stack is read from
+  ``sys._current_frames()`` every PROFILE_SAMPLE_INTERVAL seconds and written
+  as folded stacks (``cpu.folded``, loadable by flamegraph.pl or speedscope)
+- tracemalloc snapshots at the start and end, diffed by line (``allocations.txt``),
+  plus traced memory at every pipeline stage boundary
+- event-loop lag: how late a periodic timer on the loop fires
+
+``summary.json`` holds the top functions, loop-lag percentiles and stage timings.
+While profiling, CPU pool steps (response parsing, Excel building) run in a
+thread of this process instead, so they show up in the samples. Samples are
+process-wide: other runs in the same process appear in the profile too.
+"""
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+PROFILE_FILES = ('summary.json', 'cpu.folded', 'allocations.txt')
+
+# Leaf frames of threads that are waiting, not working
+_IDLE_LEAVES = {
+    ('selectors.py', 'select'), ('threading.py', 'wait'), ('threading.py', '_wait_for_tstate_lock'),
+    ('queue.py', 'get'), ('socketserver.py', 'serve_forever'), ('connection.py', '_poll'),
+    # Executor threads block in SimpleQueue.get (C code) between work items
+    ('thread.py', '_worker'),
+}
+
+_active: ContextVar[Optional['RunProfiler']] = ContextVar('active_profiler', default=None)
+
+_tracemalloc_users = 0
+_tracemalloc_lock = threading.Lock()
+
+
+def _frame_label(code) -> str:
+    parts = code.co_filename.replace('\\', '/').split('/')
+    return f"{code.co_name} ({'/'.join(parts[-2:])}:{code.co_firstlineno})"
+
+
+def _percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class RunProfiler:
+    def __init__(self, output_dir: str, sample_interval: float = None, lag_interval: float = None,
+                 tracemalloc_frames: int = None):
+        self.output_dir = output_dir
+        self.sample_interval = sample_interval or float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.01"))
+        self.lag_interval = lag_interval or float(os.getenv("PROFILE_LAG_INTERVAL", "0.05"))
+        self.tracemalloc_frames = tracemalloc_frames or int(os.getenv("PROFILE_TRACEMALLOC_FRAMES", "1"))
+        self.stacks: Dict[Tuple[str, ...], int] = {}
+        self.samples = 0
+        self.lags: List[Tuple[float, float]] = []
+        self.stages: List[Dict[str, Any]] = []
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        self._lag_task: Optional[asyncio.Task] = None
+        self._start_snapshot = None
+        self._started = 0.0
+        self._started_loop = 0.0
+
+    # --- CPU sampling ---
+
+    def _sample_loop(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.sample_interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                code = frame.f_code
+                leaf = (os.path.basename(code.co_filename), code.co_name)
+                if leaf in _IDLE_LEAVES:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                key = tuple(reversed(stack))
+                self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.samples += 1
+
+    # --- Event-loop lag ---
+
+    async def _measure_lag(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time()
+            await asyncio.sleep(self.lag_interval)
+            self.lags.append((scheduled - self._started_loop, max(loop.time() - scheduled - self.lag_interval, 0.0)))
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.time()
+        memory_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        try:
+            yield
+        finally:
+            entry = {'stage': name, 'offset_s': round(start - self._started, 3),
+                     'duration_s': round(time.time() - start, 3)}
+            if memory_before is not None:
+                current, peak = tracemalloc.get_traced_memory()
+                entry.update({'traced_mb_before': round(memory_before / 2**20, 2),
+                              'traced_mb_after': round(current / 2**20, 2),
+                              'traced_peak_mb': round(peak / 2**20, 2)})
+            self.stages.append(entry)
+
+    async def start(self):
+        global _tracemalloc_users
+        self._started = time.time()
+        with _tracemalloc_lock:
+            if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start(self.tracemalloc_frames)
+            _tracemalloc_users += 1
+        self._start_snapshot = tracemalloc.take_snapshot()
+        self._started_loop = asyncio.get_running_loop().time()
+        self._lag_task = asyncio.create_task(self._measure_lag())
+        self._sampler = threading.Thread(target=self._sample_loop, name='run-profiler', daemon=True)
+        self._sampler.start()
+
+    async def stop(self):
+        global _tracemalloc_users
+        self._stop.set()
+        self._lag_task.cancel()
+        await asyncio.to_thread(self._sampler.join)
+        end_snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        with _tracemalloc_lock:
+            _tracemalloc_users -= 1
+            if _tracemalloc_users == 0:
+                tracemalloc.stop()
+        # Writing and diffing is slow for big snapshots; keep it off the loop
+        await asyncio.to_thread(self._write, end_snapshot, peak, time.time() - self._started)
+
+    # --- Output ---
+
+    def _write(self, end_snapshot, peak_bytes: int, duration: float):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(os.path.join(self.output_dir, 'cpu.folded'), 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+                f.write(f"{';'.join(stack)} {count}\n")
+
+        ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        diff = end_snapshot.filter_traces(ignore).compare_to(self._start_snapshot.filter_traces(ignore), 'lineno')
+        with open(os.path.join(self.output_dir, 'allocations.txt'), 'w', encoding='utf-8') as f:
+            f.write(f"Net allocations during the run (top 50 by size), peak traced {peak_bytes / 2**20:.1f} MB\n\n")
+            for stat in diff[:50]:
+                f.write(f"{stat}\n")
+
+        lags = [lag for _, lag in self.lags]
+        summary = {
+            'duration_s': round(duration, 3),
+            'cpu': {
+                'sample_interval_s': self.sample_interval,
+                'samples': self.samples,
+                'top_self': self._top(leaf_only=True),
+                'top_total': self._top(leaf_only=False),
+            },
+            'event_loop_lag_ms': {
+                'interval_s': self.lag_interval,
+                'measurements': len(lags),
+                'p50': round(_percentile(lags, 0.5) * 1000, 2),
+                'p99': round(_percentile(lags, 0.99) * 1000, 2),
+                'max': round(max(lags, default=0.0) * 1000, 2),
+                'worst': [{'offset_s': round(at, 3), 'lag_ms': round(lag * 1000, 2)}
+                          for at, lag in sorted(self.lags, key=lambda item: -item[1])[:10]],
+            },
+            'memory': {'traced_peak_mb': round(peak_bytes / 2**20, 2)},
+            'stages': self.stages,
+            'files': list(PROFILE_FILES),
+        }
+        with open(os.path.join(self.output_dir, 'summary.json'), 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+    def _top(self, leaf_only: bool, limit: int = 25) -> List[Dict[str, Any]]:
+        counts: Dict[str, int] = {}
+        for stack, count in self.stacks.items():
+            frames = stack[-1:] if leaf_only else set(stack)
+            for label in frames:
+                counts[label] = counts.get(label, 0) + count
+        total = sum(self.stacks.values()) or 1
+        return [{'function': label, 'samples': count, 'percent': round(100 * count / total, 1)}
+                for label, count in sorted(counts.items(), key=lambda item: -item[1])[:limit]]
+
+
+@asynccontextmanager
+async def profile_run(output_dir: str):
+    """Profile everything run inside this block (and the tasks it starts)."""
+    from .cpu_pool import run_in_threads
+
+    profiler = RunProfiler(output_dir)
+    await profiler.start()
+    token = _active.set(profiler)
+    threads_token = run_in_threads.set(True)
+    try:
+        yield profiler
+    finally:
+        run_in_threads.reset(threads_token)
+        _active.reset(token)
+        try:
+            await profiler.stop()
+        except Exception as e:
+            logger.warning(f"Writing profile to {output_dir} failed: {e}")
+
+
+@contextmanager
+def profile_stage(name: str):
+    """Record a pipeline stage in the active profile, if any."""
+    profiler = _active.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.stage(name):
+        yield
@@ -0,0 +1,158 @@
+"""Default-branch and commit resolution for repository downloads.
+
+Rather than guessing ``main`` then ``master`` and downloading a whole archive per
+guess, the resolver reads git's smart-HTTP ref advertisement
+(``<repo>.git/info/refs?service=git-upload-pack``). Its first ref line is the
+commit HEAD points at, with ``symref=HEAD:refs/heads/<branch>`` among the
+capabilities, so the default branch costs one small request and the body is
+not read past that line. A branch or tag pinned in the roster is looked up in
+the same advertisement; only a full 40-character commit id needs no request, since
+an abbreviated one cannot be told apart from a branch named e.g. ``deadbeef``.
+
+Resolved refs are cached for REF_CACHE_TTL seconds. Hosts that do not serve the
+advertisement (plain archive mirrors) resolve to None and the caller falls back
+to guessing.
+"""
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+import logging
+import os
+import re
+import threading
+import time
+
+from .metrics import CACHE_REQUESTS
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+COMMIT_PATTERN = re.compile(r'^[0-9a-fA-F]{7,40}$')
+FULL_COMMIT_PATTERN = re.compile(r'^[0-9a-fA-F]{40}$')
+ADVERTISEMENT_TYPE = 'application/x-git-upload-pack-advertisement'
+
+
+class RepositoryUnavailable(Exception):
+    """The repository, or the ref pinned for it, does not exist (or is private)."""
+
+
+def advertised_refs(chunks: Iterable[bytes]) -> Iterator[Tuple[str, str, str]]:
+    """(commit, ref name, capabilities) per pkt-line of a ref advertisement, parsed
+    incrementally so the caller can stop reading early."""
+    buffer = b''
+    for chunk in chunks:
+        buffer += chunk
+        while len(buffer) >= 4:
+            size = int(buffer[:4], 16)
+            if size == 0:
+                # flush-pkt between the service header and the refs
+                buffer = buffer[4:]
+                continue
+            if size < 4:
+                raise ValueError(f"Invalid pkt-line length {size}")
+            if len(buffer) < size:
+                break
+            line, buffer = buffer[4:size].rstrip(b'\n'), buffer[size:]
+            if line.startswith(b'#'):
+                continue
+            ref, _, capabilities = line.partition(b'\0')
+            commit, _, name = ref.partition(b' ')
+            yield commit.decode('ascii'), name.decode('utf-8', errors='replace'), capabilities.decode('utf-8', errors='replace')
+
+
+def _symref_head(capabilities: str) -> Optional[str]:
+    for capability in capabilities.split():
+        if capability.startswith('symref=HEAD:refs/heads/'):
+            return capability[len('symref=HEAD:refs/heads/'):]
+    return None
+
+
+def _short_name(name: str) -> Optional[str]:
+    for prefix in ('refs/heads/', 'refs/tags/'):
+        if name.startswith(prefix):
+            return name[len(prefix):].removesuffix('^{}')
+    return None
+
+
+class RefResolver:
+    def __init__(self, session, base_url: str, ttl: float = None, max_entries: int = None):
+        self.session = session
+        self.base_url = base_url.rstrip('/')
+        self.ttl = ttl if ttl is not None else float(os.getenv("REF_CACHE_TTL", "600"))
+        self.max_entries = max_entries or int(os.getenv("REF_CACHE_SIZE", "10000"))
+        self.timeout = float(os.getenv("REF_RESOLVE_TIMEOUT", "10"))
+        self._cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, user_repo: str, ref: str = None) -> Optional[Dict[str, Any]]:
+        """``{'ref', 'commit'}`` for the default branch, or for ``ref`` (a branch, tag
+        or commit) when the student pinned one. Blocking; call it from a thread."""
+        if ref and FULL_COMMIT_PATTERN.match(ref):
+            return {'ref': None, 'commit': ref.lower()}
+        key = (user_repo.lower(), ref)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            CACHE_REQUESTS.inc(cache='repo_ref', result='hit')
+            return cached[1]
+        CACHE_REQUESTS.inc(cache='repo_ref', result='miss')
+
+        resolved = self._fetch(user_repo, ref)
+        if resolved is not None:
+            with self._lock:
+                if len(self._cache) >= self.max_entries:
+                    # Oldest insertion first; good enough for a cache of immutable-ish refs
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[key] = (time.monotonic() + self.ttl, resolved)
+        return resolved
+
+    def _fetch(self, user_repo: str, ref: Optional[str]) -> Optional[Dict[str, Any]]:
+        url = f"{self.base_url}/{user_repo}.git/info/refs?service=git-upload-pack"
+        with span('git.refs', url=url, ref=ref) as current:
+            try:
+                response = self.session.get(url, stream=True, timeout=self.timeout)
+            except Exception as e:
+                logger.info(f"Ref advertisement for {user_repo} unavailable: {e}")
+                return None
+            with response:
+                current.set_attribute('status_code', response.status_code)
+                # GitHub answers 401 (asking for credentials) for private and missing repositories
+                if response.status_code in (401, 404):
+                    raise RepositoryUnavailable(f"Repository {user_repo} not found or not public")
+                if response.status_code != 200 or \
+                        not response.headers.get('content-type', '').startswith(ADVERTISEMENT_TYPE):
+                    return None
+                try:
+                    return self._select(advertised_refs(response.iter_content(chunk_size=4096)), user_repo, ref)
+                except ValueError as e:
+                    logger.info(f"Unreadable ref advertisement for {user_repo}: {e}")
+                    return None
+
+    def _select(self, refs: Iterator[Tuple[str, str, str]], user_repo: str,
+                ref: Optional[str]) -> Dict[str, Any]:
+        if ref is None:
+            for commit, name, capabilities in refs:
+                if name == 'HEAD':
+                    return {'ref': _symref_head(capabilities), 'commit': commit}
+                break
+            raise RepositoryUnavailable(f"Repository {user_repo} is empty")
+
+        found = prefix = None
+        for commit, name, _ in refs:
+            if name == f"refs/heads/{ref}":
+                return {'ref': ref, 'commit': commit}
+            if name in (f"refs/tags/{ref}", f"refs/tags/{ref}^{{}}"):
+                # Annotated tags are followed by their peeled commit (^{}), which wins
+                found = {'ref': ref, 'commit': commit}
+            elif found is None:
+                # /tree/<branch>/<dir> links: the longest branch or tag the ref starts with
+                short = _short_name(name)
+                if short and ref.startswith(f"{short}/") and \
+                        (prefix is None or len(short) >= len(prefix['ref'])):
+                    prefix = {'ref': short, 'commit': commit}
+        if found is None:
+            found = prefix
+        if found is None and COMMIT_PATTERN.match(ref):
+            # Not a branch or tag: an abbreviated commit id, which the archive URL accepts
+            found = {'ref': None, 'commit': ref.lower()}
+        if found is None:
+            raise RepositoryUnavailable(f"Ref {ref} not found in {user_repo}")
+        return found
@@ -1,14 +1,159 @@
 from .base_agent import BaseAgent, AgentStatus
-from typing import Dict, Any
-import requests
+from .services import get_services
+from .scheduler import get_scheduler
+from .cpu_pool import run_cpu
+from .tracing import span
+from .ref_resolver import COMMIT_PATTERN, RefResolver
+from .metrics import REPO_ARCHIVE_BYTES, REPO_ARCHIVES_REJECTED
+from typing import Dict, Any, Tuple, Union
+import asyncio
+import io
+import logging
+import os
+import socket
 import tempfile
+import threading
+import time
 import zipfile
-import os
-import glob
+
+import requests
+import urllib3
+
+logger = logging.getLogger(__name__)
+
+CODE_EXTENSIONS = ['py', 'js', 'jsx', 'ts', 'tsx', 'java', 'cpp', 'c']
+MAX_CODE_CHARS = 10000
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def extract_code_from_zip(content: Union[bytes, str]) -> str:
+    """Concatenate source files from a repo archive (its bytes, or the path of a
+    spooled download), reading members without extracting to disk. Runs in the CPU pool."""
+    with zipfile.ZipFile(io.BytesIO(content) if isinstance(content, bytes) else content) as archive:
+        members = [
+            info for info in archive.infolist()
+            # Skip directories and hidden paths (e.g. .github/), as glob did
+            if not info.is_dir() and not any(part.startswith('.') for part in info.filename.split('/'))
+        ]
+        code = ""
+        for ext in CODE_EXTENSIONS:
+            for info in members:
+                if not info.filename.endswith(f'.{ext}'):
+                    continue
+                try:
+                    code += archive.read(info).decode('utf-8', errors='ignore') + '\n\n'
+                except Exception:
+                    continue
+                if len(code) >= MAX_CODE_CHARS:
+                    return code[:MAX_CODE_CHARS]
+    return code[:MAX_CODE_CHARS]
+
+
+class ArchiveRejected(Exception):
+    """A download aborted by a guard; the student is flagged instead of failing the run."""
+
+    def __init__(self, status: str, message: str, size: int = None):
+        super().__init__(message)
+        self.status = status
+        self.size = size
+
+
+def _abort_response(response):
+    """Unblock a read stuck on a trickling server from another thread: shut the socket
+    down (a plain close does not wake a blocked recv), then release the response."""
+    sock = getattr(getattr(response.raw, 'connection', None), 'sock', None)
+    if sock is None:
+        # http.client hands the socket of a closing connection to the body reader
+        reader = getattr(getattr(response.raw, '_fp', None), 'fp', None)
+        sock = getattr(getattr(reader, 'raw', None), '_sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    response.close()
+
+
+def download_archive(session, url: str, max_bytes: int, spool_bytes: int, timeout: Tuple[float, float],
+                     deadline: float) -> Tuple[int, Union[bytes, str, None], int]:
+    """Stream an archive: (status code, body, size). The body stays in memory up to
+    ``spool_bytes`` and is written to a temporary file beyond that, in which case the
+    file's path is returned and the caller deletes it. Blocking; run it in a thread."""
+    started = time.monotonic()
+    with session.get(url, stream=True, timeout=timeout) as r:
+        if r.status_code != 200:
+            return r.status_code, None, 0
+        declared = int(r.headers.get('content-length') or 0)
+        if declared > max_bytes:
+            # Abort before reading anything
+            raise ArchiveRejected('too_large', f"Archive is {declared} bytes, over the {max_bytes} byte limit",
+                                  declared)
+        # The read timeout only bounds the gap between bytes; a server trickling data
+        # holds a single read indefinitely, so the overall deadline is enforced from
+        # outside the read by a timer that aborts the connection
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            _abort_response(r)
+
+        timer = threading.Timer(max(deadline - (time.monotonic() - started), 0), expire)
+        timer.daemon = True
+        timer.start()
+        buffer = io.BytesIO()
+        spool = None
+        size = 0
+        try:
+            for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise ArchiveRejected('too_large', f"Archive exceeded the {max_bytes} byte limit", size)
+                if spool is None and size > spool_bytes:
+                    spool = tempfile.NamedTemporaryFile(prefix='repo-', suffix='.zip', delete=False,
+                                                        dir=os.getenv("REPO_SPOOL_DIR") or None)
+                    spool.write(buffer.getvalue())
+                    buffer = None
+                (spool or buffer).write(chunk)
+            if expired.is_set():
+                # Without a Content-Length an aborted body just ends early
+                raise ArchiveRejected('timeout', f"Archive download took over {deadline:.0f}s", size)
+        except BaseException as e:
+            if spool is not None:
+                spool.close()
+                os.unlink(spool.name)
+            if isinstance(e, ArchiveRejected):
+                raise
+            if expired.is_set():
+                raise ArchiveRejected('timeout', f"Archive download took over {deadline:.0f}s", size)
+            # requests reports a read timeout mid-body as a ConnectionError
+            if isinstance(e, requests.ConnectionError) and e.args and \
+                    isinstance(e.args[0], urllib3.exceptions.ReadTimeoutError):
+                raise ArchiveRejected('timeout', f"Archive download stalled for over {timeout[1]:.0f}s", size)
+            if isinstance(e, requests.RequestException):
+                # Connection reset or truncated body: flag the student rather than fail the run
+                raise ArchiveRejected('interrupted', f"Archive download interrupted after {size} bytes: {e}", size)
+            raise
+        finally:
+            timer.cancel()
+        if spool is not None:
+            spool.close()
+            return r.status_code, spool.name, size
+        return r.status_code, buffer.getvalue(), size
+
 
 class RepoAgent(BaseAgent):
-    def __init__(self):
+    def __init__(self, session=None):
         super().__init__("repo_agent")
+        # Keep-alive connections to GitHub are reused across students and requests
+        self.session = session or get_services().http_session
+        # Where archives are downloaded from; point at a mirror or a local fixture server
+        self.archive_base_url = os.getenv("REPO_ARCHIVE_BASE_URL", "https://github.com").rstrip('/')
+        self.ref_resolver = RefResolver(self.session, self.archive_base_url)
+        # Guards against repositories with committed datasets, videos, etc.
+        self.max_archive_bytes = int(os.getenv("REPO_MAX_ARCHIVE_BYTES", str(100 * 2**20)))
+        self.spool_bytes = int(os.getenv("REPO_SPOOL_THRESHOLD_BYTES", str(8 * 2**20)))
+        self.timeout = (float(os.getenv("REPO_CONNECT_TIMEOUT", "10")), float(os.getenv("REPO_READ_TIMEOUT", "30")))
+        self.download_deadline = float(os.getenv("REPO_DOWNLOAD_TIMEOUT", "300"))
         
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -18,15 +163,32 @@ class RepoAgent(BaseAgent):
             if not repo_url:
                 raise ValueError("Repository URL is required")
                 
-            code = await self._analyze_repo(repo_url)
+            async with get_scheduler().slot('repo_fetch'):
+                code, resolved = await self._analyze_repo(repo_url, data.get('ref'))
             
             return {
                 'student_name': student_name,
                 'repo_url': repo_url,
+                'ref': resolved.get('ref'),
+                'commit': resolved.get('commit'),
+                'archive_bytes': resolved.get('archive_bytes'),
                 'code': code,
                 'status': 'success' if code else 'no_code_found'
             }
             
+        except (ArchiveRejected, requests.Timeout) as e:
+            # An outlier repository, not an agent failure: flag it and let the run go on
+            status = e.status if isinstance(e, ArchiveRejected) else 'timeout'
+            REPO_ARCHIVES_REJECTED.inc(reason=status)
+            logger.warning(f"Skipping {data.get('repo_url')} for {data.get('student_name')}: {e}")
+            return {
+                'student_name': data.get('student_name'),
+                'repo_url': data.get('repo_url'),
+                'error': str(e),
+                'status': status,
+                'archive_bytes': getattr(e, 'size', None),
+                'flagged': True
+            }
         except Exception as e:
             self.status = AgentStatus.ERROR
             return {
@@ -36,43 +198,52 @@ class RepoAgent(BaseAgent):
                 'status': 'error'
             }
     
-    async def _analyze_repo(self, url: str) -> str:
+    async def _analyze_repo(self, url: str, ref: str = None) -> Tuple[str, Dict[str, Any]]:
         if url.endswith('/'):
             url = url[:-1]
+        if ref and url.endswith(f"/tree/{ref}"):
+            # Roster groups pinned to a ref are handed over as <repo>/tree/<ref> (see roster.py)
+            url = url[:-len(f"/tree/{ref}")]
         if url.endswith('.git'):
             url = url[:-4]
             
         user_repo = '/'.join(url.split('/')[-2:])
         
-        for branch in ['main', 'master']:
-            zip_url = f"https://github.com/{user_repo}/archive/refs/heads/{branch}.zip"
-            r = requests.get(zip_url)
+        # Resolve the default (or pinned) ref first so exactly one archive is downloaded
+        resolved = await asyncio.to_thread(self.ref_resolver.resolve, user_repo, ref)
+        if resolved is not None:
+            candidates = [(resolved['commit'], resolved)]
+        elif ref:
+            candidates = [(f"refs/heads/{ref}", {'ref': ref}), (f"refs/tags/{ref}", {'ref': ref})]
+            if COMMIT_PATTERN.match(ref):
+                candidates.append((ref, {'ref': None, 'commit': ref.lower()}))
+        else:
+            # Host without a ref advertisement: fall back to guessing the default branch
+            candidates = [(f"refs/heads/{branch}", {'ref': branch}) for branch in ('main', 'master')]
+        
+        for archive_ref, found in candidates:
+            zip_url = f"{self.archive_base_url}/{user_repo}/archive/{archive_ref}.zip"
+            with span('http.get', url=zip_url) as current:
+                # requests is synchronous: keep the download off the event loop
+                status_code, body, size = await asyncio.to_thread(
+                    download_archive, self.session, zip_url, self.max_archive_bytes, self.spool_bytes,
+                    self.timeout, self.download_deadline
+                )
+                current.set_attribute('status_code', status_code)
+                current.set_attribute('bytes', size)
+                current.set_attribute('spooled', isinstance(body, str))
             
-            if r.status_code == 404:
-                continue
-            elif r.status_code != 200:
+            if status_code != 200:
                 continue
+            REPO_ARCHIVE_BYTES.observe(size)
                 
-            with tempfile.TemporaryDirectory() as tmpdir:
-                zip_path = os.path.join(tmpdir, 'repo.zip')
-                with open(zip_path, 'wb') as f:
-                    f.write(r.content)
-                    
-                try:
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(tmpdir)
-                except zipfile.BadZipFile:
-                    continue
-                    
-                code = ""
-                for ext in ['py', 'js', 'jsx', 'ts', 'tsx', 'java', 'cpp', 'c']:
-                    for file in glob.glob(os.path.join(tmpdir, '**', f'*.{ext}'), recursive=True):
-                        try:
-                            with open(file, 'r', encoding='utf-8', errors='ignore') as f:
-                                code += f.read() + '\n\n'
-                        except Exception:
-                            continue
-
-                return code[:10000] if code else ""
+            try:
+                with span('repo.extract'):
+                    return await run_cpu(extract_code_from_zip, body), {**found, 'archive_bytes': size}
+            except zipfile.BadZipFile:
+                continue
+            finally:
+                if isinstance(body, str):
+                    os.unlink(body)
                 
         raise Exception(f"Could not access repository: {url}")
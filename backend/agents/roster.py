@@ -0,0 +1,140 @@
+"""Roster normalization: one fetch and one grading per unique repository.
+
+Rosters list the same repository several times (group projects, copy-paste
+errors) and in different shapes - ``.git`` suffixes, ``/tree/<branch>`` links,
+http vs https, ``git@`` remotes. ``RepoGroups`` groups students by canonical URL
+(and the branch, tag or commit they pinned, if any - a ref column or the branch of a
+``/tree/<branch>`` link, see ``linked_ref``) as the roster streams in; the pipeline works on one representative per group
+and ``fan_out`` copies each result back to every student who submitted that
+repository.
+"""
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+import re
+
+from .metrics import CACHE_REQUESTS
+
+# Hosts whose repositories live at /<owner>/<repo>; anything after that is a view of the repo
+_FORGE_HOSTS = ('github.com', 'bitbucket.org')
+_SCP_REMOTE = re.compile(r'^[\w.-]+@([\w.-]+):(.+)$')
+
+
+def canonical_repo_url(url: Optional[str]) -> Optional[str]:
+    """``https://<host>/<owner>/<repo>`` for any common spelling of a repository URL.
+    Input that does not parse as a URL is returned as is; None when there is nothing to fetch."""
+    original = url = (url or '').strip()
+    if not url:
+        return None
+    if any(c.isspace() for c in url):
+        return original
+    scp = _SCP_REMOTE.match(url)
+    if scp:
+        # git@github.com:owner/repo.git
+        url = f"https://{scp.group(1)}/{scp.group(2)}"
+    elif '://' not in url:
+        url = f"https://{url}"
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    segments = [s for s in parts.path.split('/') if s]
+    if not host or '.' not in host:
+        return original
+    if host in _FORGE_HOSTS and len(segments) >= 2:
+        # Owners and repository names are case-insensitive; drop /tree/<branch>, /blob/..., etc.
+        segments = [segments[0].lower(), segments[1].lower()]
+    elif host == 'gitlab.com' and '-' in segments:
+        # GitLab nests groups, so the repository path ends at the /-/ separator instead
+        segments = segments[:segments.index('-')]
+    if segments and segments[-1].lower().endswith('.git'):
+        segments[-1] = segments[-1][:-4]
+    return f"https://{host}/{'/'.join(segments)}"
+
+
+def linked_ref(url: Optional[str]) -> Optional[str]:
+    """The branch or tag in a ``/tree/<ref>`` link (GitHub, or GitLab's ``/-/tree/<ref>``),
+    None for a link to the repository itself. Everything after ``tree`` is returned, since
+    branch names may contain slashes; the resolver matches it against the advertised refs."""
+    url = (url or '').strip()
+    if not url or any(c.isspace() for c in url) or _SCP_REMOTE.match(url):
+        return None
+    parts = urlsplit(url if '://' in url else f"https://{url}")
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    segments = [s for s in parts.path.split('/') if s]
+    if host == 'github.com' and len(segments) > 3 and segments[2] == 'tree':
+        return unquote('/'.join(segments[3:]))
+    if host == 'gitlab.com' and '-' in segments:
+        tail = segments[segments.index('-') + 1:]
+        if len(tail) > 1 and tail[0] == 'tree':
+            return unquote('/'.join(tail[1:]))
+    return None
+
+
+def pinned_repo_url(canonical: str, ref: Optional[str]) -> str:
+    """``<canonical>/tree/<ref>`` for a pinned ref, the canonical URL otherwise. Results
+    carry it back, so one student's submissions of a repository at two refs stay apart."""
+    return f"{canonical}/tree/{ref}" if ref else canonical
+
+
+class RepoGroups:
+    """Students grouped by canonical repository URL (and pinned ref), in roster order."""
+
+    def __init__(self):
+        self.groups: Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]] = {}
+        # (representative name, URL handed to the pipeline) -> group, to route results back
+        self._by_representative: Dict[Tuple[Any, Optional[str]], List[Dict[str, Any]]] = {}
+
+    def add(self, student: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Record a student. Returns the student to process (with the canonical URL, see
+        pinned_repo_url) for the first submission of a repository, None for a repeat."""
+        canonical = canonical_repo_url(student.get('repo_url'))
+        # Students without a URL are not merged; each gets its own (failing) fetch
+        key = (canonical or f"#{len(self.groups)}", student.get('ref'))
+        members = self.groups.get(key)
+        if members is not None:
+            members.append(student)
+            CACHE_REQUESTS.inc(cache='roster_repo', result='hit')
+            return None
+        members = self.groups[key] = [student]
+        repo_url = pinned_repo_url(canonical, student.get('ref')) if canonical else student.get('repo_url')
+        self._by_representative[(student.get('name'), repo_url)] = members
+        CACHE_REQUESTS.inc(cache='roster_repo', result='miss')
+        return {**student, 'repo_url': repo_url}
+
+    @property
+    def duplicates(self) -> int:
+        return sum(len(members) - 1 for members in self.groups.values())
+
+    def members(self, student_name: Any, repo_url: Optional[str]) -> List[Dict[str, Any]]:
+        """The group a representative's result belongs to."""
+        return self._by_representative.get((student_name, repo_url)) or \
+            self._by_representative.get((student_name, canonical_repo_url(repo_url)), [])
+
+    def fan_out(self, results: List[Any], repo_urls: List[Optional[str]] = None) -> List[Any]:
+        """One copy of each representative's result per student in its group. ``repo_urls``
+        gives each result's repository when the results do not carry it themselves."""
+        expanded = []
+        for i, result in enumerate(results):
+            if not isinstance(result, dict):
+                expanded.append(result)
+                continue
+            members = self.members(result.get('student_name'),
+                                   repo_urls[i] if repo_urls is not None else result.get('repo_url'))
+            expanded.extend(fan_out_result(result, members) if members else [result])
+        return expanded
+
+
+def fan_out_result(result: Dict[str, Any], members: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    names = [member.get('name') for member in members]
+    expanded = []
+    for member in members:
+        copy = {**result, 'student_name': member.get('name')}
+        if 'repo_url' in result:
+            # Report the URL as the student submitted it
+            copy['repo_url'] = member.get('repo_url') or result['repo_url']
+        if len(members) > 1:
+            copy['shared_with'] = [name for name in names if name != member.get('name')]
+        expanded.append(copy)
+    return expanded
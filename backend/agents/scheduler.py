@@ -0,0 +1,197 @@
+"""In-process scheduler for shared resources.
+
+Every expensive step acquires a slot from a per-resource budget (``job``,
+``repo_fetch``, ``llm``, ``embedding``) so concurrent uploads share LLM quota and
+network instead of each running an unbounded pipeline. Waiters are ordered by
+priority first, then by start-time fair queuing across tenants, so one
+instructor's 500-student batch cannot starve another's, and interactive calls
+go ahead of batch work. When a resource's queue is full, new work is rejected
+with ``SchedulerSaturated`` instead of queueing without bound.
+
+Tenant and priority travel with the task through context variables::
+
+    async with scheduling_context(tenant='course-42', priority=PRIORITY_BATCH):
+        ...
+        async with get_scheduler().slot('llm'):
+            ...
+"""
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Tuple
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import threading
+import weakref
+
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+
+# resource: (env prefix, default concurrency, default max queue)
+RESOURCES = {
+    'job': ('SCHED_JOB', 4, 50),
+    'repo_fetch': ('SCHED_REPO_FETCH', 10, 5000),
+    'llm': ('SCHED_LLM', 16, 5000),
+    'embedding': ('SCHED_EMBEDDING', 4, 5000),
+}
+
+current_tenant: ContextVar[str] = ContextVar('current_tenant', default='default')
+current_priority: ContextVar[int] = ContextVar('current_priority', default=PRIORITY_BATCH)
+
+
+class SchedulerSaturated(Exception):
+    def __init__(self, resource: str, queued: int):
+        super().__init__(f"{resource} queue is full ({queued} waiting)")
+        self.resource = resource
+        self.queued = queued
+
+
+class ResourceQueue:
+    def __init__(self, name: str, concurrency: int, max_queue: int):
+        self.name = name
+        self.concurrency = concurrency
+        self.max_queue = max_queue
+        self.in_use = 0
+        # (priority, virtual start tag, seq, tenant, future)
+        self._waiting: List[Tuple[int, float, int, str, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._virtual_time = 0.0
+        self._tenant_tags: Dict[str, float] = {}
+        self.granted = 0
+        self.rejected = 0
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiting)
+
+    def saturated(self) -> bool:
+        return self.queued >= self.max_queue
+
+    async def acquire(self, tenant: str, priority: int):
+        if self.in_use < self.concurrency and not self._waiting:
+            self._grant()
+            return
+        if self.saturated():
+            self.rejected += 1
+            raise SchedulerSaturated(self.name, self.queued)
+
+        # Start-time fair queuing: each tenant's next request is tagged one unit after
+        # its previous one, but never behind the current virtual time
+        tag = max(self._virtual_time, self._tenant_tags.get(tenant, 0.0)) + 1
+        self._tenant_tags[tenant] = tag
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, tag, next(self._seq), tenant, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before cancellation: hand the slot on
+                self.release()
+            else:
+                # Drop the dead waiter now, so queued/saturated() only count live ones
+                self._discard(future)
+            raise
+
+    def _discard(self, future: asyncio.Future):
+        for idx, entry in enumerate(self._waiting):
+            if entry[4] is future:
+                self._waiting[idx] = self._waiting[-1]
+                self._waiting.pop()
+                heapq.heapify(self._waiting)
+                break
+        if not self._waiting:
+            self._tenant_tags.clear()
+
+    def _grant(self):
+        self.in_use += 1
+        self.granted += 1
+
+    def release(self):
+        self.in_use -= 1
+        while self._waiting and self.in_use < self.concurrency:
+            _, tag, _, tenant, future = heapq.heappop(self._waiting)
+            if future.cancelled():
+                continue
+            self._virtual_time = tag
+            self._grant()
+            future.set_result(None)
+        if not self._waiting:
+            self._tenant_tags.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        waiting_by_tenant: Dict[str, int] = {}
+        for _, _, _, tenant, _ in self._waiting:
+            waiting_by_tenant[tenant] = waiting_by_tenant.get(tenant, 0) + 1
+        return {
+            'concurrency': self.concurrency,
+            'in_use': self.in_use,
+            'queued': self.queued,
+            'max_queue': self.max_queue,
+            'granted': self.granted,
+            'rejected': self.rejected,
+            'queued_by_tenant': waiting_by_tenant,
+        }
+
+
+class Scheduler:
+    def __init__(self, resources: Dict[str, Tuple[int, int]] = None):
+        if resources is None:
+            resources = {
+                name: (int(os.getenv(f"{prefix}_CONCURRENCY", str(concurrency))),
+                       int(os.getenv(f"{prefix}_MAX_QUEUE", str(max_queue))))
+                for name, (prefix, concurrency, max_queue) in RESOURCES.items()
+            }
+        self.queues = {name: ResourceQueue(name, *limits) for name, limits in resources.items()}
+
+    @asynccontextmanager
+    async def slot(self, resource: str):
+        queue = self.queues[resource]
+        with span(f"queue_wait.{resource}", queued=queue.queued):
+            await queue.acquire(current_tenant.get(), current_priority.get())
+        try:
+            yield
+        finally:
+            queue.release()
+
+    def admit(self, resource: str):
+        """Raise SchedulerSaturated if new work for this resource would be rejected."""
+        queue = self.queues[resource]
+        if queue.saturated():
+            queue.rejected += 1
+            raise SchedulerSaturated(resource, queue.queued)
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: queue.stats() for name, queue in self.queues.items()}
+
+
+@asynccontextmanager
+async def scheduling_context(tenant: str = None, priority: int = None):
+    """Set tenant and priority for the current task and any tasks it spawns."""
+    tenant_token = current_tenant.set(tenant or 'default')
+    priority_token = current_priority.set(PRIORITY_BATCH if priority is None else priority)
+    try:
+        yield
+    finally:
+        current_priority.reset(priority_token)
+        current_tenant.reset(tenant_token)
+
+
+_schedulers = weakref.WeakKeyDictionary()
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(loop: asyncio.AbstractEventLoop = None) -> Scheduler:
+    """Scheduler for the given (default: running) event loop. Waiters are loop-bound
+    futures, so each loop - normally just the shared runtime loop - gets its own."""
+    loop = loop or asyncio.get_running_loop()
+    with _schedulers_lock:
+        scheduler = _schedulers.get(loop)
+        if scheduler is None:
+            scheduler = _schedulers[loop] = Scheduler()
+    return scheduler
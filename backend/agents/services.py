@@ -0,0 +1,88 @@
+"""Application-scoped services.
+
+Expensive objects - the orchestrator and its agents, the LLM router and its
+client pools, the Chroma persistent client and the HTTP session used for repo
+downloads - are built once per process on first use and shared by every
+request, instead of being rebuilt per request.
+"""
+from typing import Any, Callable, Dict
+import asyncio
+import os
+import threading
+
+
+class ServiceContainer:
+    def __init__(self):
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = factory()
+                    self._instances[name] = instance
+        return instance
+
+    @property
+    def router(self):
+        from .llm_router import get_router
+        return self._get('router', get_router)
+
+    @property
+    def chroma_client(self):
+        def build():
+            import chromadb
+            return chromadb.PersistentClient(path=os.getenv("CHROMA_DB_PATH", "./chroma_db"))
+        return self._get('chroma_client', build)
+
+    @property
+    def http_session(self):
+        def build():
+            import requests
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=int(os.getenv("HTTP_POOL_SIZE", "20"))
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            return session
+        return self._get('http_session', build)
+
+    @property
+    def orchestrator(self):
+        def build():
+            from .orchestrator import AgentOrchestrator
+            return AgentOrchestrator()
+        return self._get('orchestrator', build)
+
+    @property
+    def report_agent(self):
+        # The orchestrator's own instance, so both share one set of agents
+        return self._get('report_agent', lambda: self.orchestrator.report_agent)
+
+
+_services = None
+_services_lock = threading.Lock()
+
+
+def get_services() -> ServiceContainer:
+    """Process-wide service container."""
+    global _services
+    if _services is None:
+        with _services_lock:
+            if _services is None:
+                _services = ServiceContainer()
+    return _services
+
+
+async def get_orchestrator():
+    """The shared orchestrator, built in a thread on first use: importing and
+    constructing the agents and LLM clients takes long enough to stall the loop."""
+    services = get_services()
+    if 'orchestrator' in services._instances:
+        return services.orchestrator
+    return await asyncio.to_thread(lambda: services.orchestrator)
@@ -0,0 +1,348 @@
+from .base_agent import BaseAgent, AgentStatus
+from .cpu_pool import run_cpu
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+import numpy as np
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import struct
+import time
+
+logger = logging.getLogger(__name__)
+
+# Strings and comments are matched first so that '#' or '//' inside a string literal
+# is not mistaken for a comment.
+_TOKEN_PATTERN = re.compile(
+    r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\''
+    r'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`'
+    r'|#[^\n]*|//[^\n]*|/\*[\s\S]*?\*/'
+    r'|[A-Za-z_$][\w$]*|\d[\w.]*|\S'
+)
+
+_KEYWORDS = {
+    # Python
+    'and', 'as', 'assert', 'async', 'await', 'break', 'class', 'continue', 'def', 'del',
+    'elif', 'else', 'except', 'finally', 'for', 'from', 'global', 'if', 'import', 'in',
+    'is', 'lambda', 'nonlocal', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while',
+    'with', 'yield', 'None', 'True', 'False', 'self',
+    # JS / TS / Java / C
+    'function', 'var', 'let', 'const', 'new', 'this', 'switch', 'case', 'default', 'do',
+    'typeof', 'instanceof', 'export', 'extends', 'implements', 'interface', 'public',
+    'private', 'protected', 'static', 'void', 'int', 'float', 'double', 'char', 'long',
+    'struct', 'include', 'null', 'true', 'false', 'throw', 'throws', 'catch', 'package',
+}
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+# Submissions signed per CPU-pool task
+SIGNATURE_CHUNK = 16
+
+
+def normalize_tokens(code: str) -> List[str]:
+    """Tokenize code with comments dropped and identifiers/literals abstracted,
+    so renaming variables or rewording comments does not hide copying."""
+    tokens = []
+    for token in _TOKEN_PATTERN.findall(code):
+        first = token[0]
+        if first == '#' or token.startswith('//') or token.startswith('/*'):
+            continue
+        if first in '"\'`':
+            tokens.append('S')
+        elif first.isdigit():
+            tokens.append('N')
+        elif first.isalpha() or first in '_$':
+            tokens.append(token if token in _KEYWORDS else 'I')
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def shingle_hashes(tokens: List[str], k: int) -> np.ndarray:
+    if len(tokens) < k:
+        k = len(tokens)
+    if k == 0:
+        return np.empty(0, dtype=np.uint64)
+    shingles = {' '.join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)}
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+class MinHasher:
+    # Permutations are seeded so that signatures stay comparable across runs and can
+    # be matched against historical submissions.
+    def __init__(self, num_perm: int = 128, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        # a, b < 2**32 and hashes < 2**32 keep a * x + b inside uint64 without overflow
+        self.a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+
+    def signature(self, hashes: np.ndarray) -> np.ndarray:
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _MERSENNE_PRIME
+        return (permuted & _MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+def band_keys(signature: np.ndarray, bands: int) -> List[int]:
+    rows = len(signature) // bands
+    keys = []
+    for band in range(bands):
+        digest = hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest()
+        keys.append(struct.unpack('<q', digest)[0])
+    return keys
+
+
+@functools.lru_cache(maxsize=4)
+def _hasher(num_perm: int) -> MinHasher:
+    return MinHasher(num_perm)
+
+
+def submission_signatures(codes: List[str], shingle_size: int, num_perm: int,
+                          bands: int) -> List[Optional[Dict[str, Any]]]:
+    """Code hash, MinHash signature and LSH band keys per submission (None for code
+    without tokens). Pure function of its inputs, run in the CPU pool."""
+    signed = []
+    for code in codes:
+        hashes = shingle_hashes(normalize_tokens(code), shingle_size)
+        if hashes.size == 0:
+            signed.append(None)
+            continue
+        signature = _hasher(num_perm).signature(hashes)
+        signed.append({
+            'code_hash': hashlib.sha1(code.encode('utf-8')).hexdigest(),
+            'signature': signature,
+            'bands': band_keys(signature, bands)
+        })
+    return signed
+
+
+class SimilarityAgent(BaseAgent):
+    """Near-duplicate detection using MinHash signatures and LSH banding.
+
+    Signatures are kept in SQLite so that each run is also compared against
+    submissions from earlier runs and cohorts. Each stored signature records the
+    num_perm, bands and shingle size it was made with; history made with other
+    settings is not comparable and is skipped.
+    """
+
+    def __init__(self, db_path: str = None):
+        super().__init__("similarity_agent")
+        self.num_perm = int(os.getenv("SIMILARITY_NUM_PERM", "128"))
+        self.bands = int(os.getenv("SIMILARITY_BANDS", "32"))
+        self.shingle_size = int(os.getenv("SIMILARITY_SHINGLE_SIZE", "7"))
+        self.threshold = float(os.getenv("SIMILARITY_THRESHOLD", "0.5"))
+        if self.num_perm % self.bands:
+            raise ValueError("SIMILARITY_NUM_PERM must be divisible by SIMILARITY_BANDS")
+        self.db_path = db_path or os.getenv("SIMILARITY_DB_PATH", "./similarity_db/signatures.sqlite3")
+        self._init_db()
+
+    @property
+    def _config(self) -> Tuple[int, int, int]:
+        return self.num_perm, self.bands, self.shingle_size
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # sqlite3's own context manager commits or rolls back but never closes
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS submissions (
+                    id INTEGER PRIMARY KEY,
+                    student_name TEXT,
+                    repo_url TEXT,
+                    run_id TEXT,
+                    code_hash TEXT,
+                    num_perm INTEGER,
+                    bands INTEGER,
+                    shingle_size INTEGER,
+                    signature BLOB,
+                    created_at REAL,
+                    UNIQUE (student_name, code_hash)
+                );
+                CREATE TABLE IF NOT EXISTS lsh_buckets (
+                    band INTEGER,
+                    bucket INTEGER,
+                    submission_id INTEGER
+                );
+                CREATE INDEX IF NOT EXISTS idx_lsh_buckets ON lsh_buckets (band, bucket);
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(submissions)")}
+            for column in ('bands', 'shingle_size'):
+                if column not in columns:
+                    # Databases from before the settings were recorded: their rows stay NULL
+                    # and are never matched
+                    conn.execute(f"ALTER TABLE submissions ADD COLUMN {column} INTEGER")
+
+    async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            action = data.get('action', 'detect')
+
+            if action == 'detect':
+                return await self._detect(data)
+            else:
+                raise ValueError("Invalid action")
+
+        except Exception as e:
+            self.status = AgentStatus.ERROR
+            return {'error': str(e)}
+
+    async def _detect(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        students = [s for s in data.get('students', []) if s.get('code')]
+        run_id = data.get('run_id')
+        include_history = data.get('include_history', True)
+
+        # Shingling and signatures in the CPU pool; candidate pairs and SQLite in a thread,
+        # so a large cohort does not hold up the other pipelines on the event loop
+        chunks = [students[i:i + SIGNATURE_CHUNK] for i in range(0, len(students), SIGNATURE_CHUNK)]
+        signed = await asyncio.gather(*(
+            run_cpu(submission_signatures, [student['code'] for student in chunk],
+                    self.shingle_size, self.num_perm, self.bands)
+            for chunk in chunks
+        ))
+        entries = [
+            {'student_name': student.get('student_name'), 'repo_url': student.get('repo_url', ''), **entry}
+            for chunk, chunk_signed in zip(chunks, signed)
+            for student, entry in zip(chunk, chunk_signed) if entry is not None
+        ]
+
+        pairs = await asyncio.to_thread(self._current_pairs, entries)
+        if include_history:
+            pairs.extend(await asyncio.to_thread(self._historical_pairs, entries, run_id))
+            await asyncio.to_thread(self._store, entries, run_id)
+
+        pairs.sort(key=lambda p: p['similarity'], reverse=True)
+        flagged = set()
+        for pair in pairs:
+            flagged.add(pair['student_a'])
+            if pair['scope'] == 'current':
+                flagged.add(pair['student_b'])
+
+        return {
+            'pairs': pairs,
+            'flagged_students': sorted(flagged),
+            'threshold': self.threshold,
+            'compared': len(entries),
+            'status': 'completed'
+        }
+
+    def _estimate(self, sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        return float(np.count_nonzero(sig_a == sig_b)) / self.num_perm
+
+    def _current_pairs(self, entries: List[Dict]) -> List[Dict]:
+        buckets: Dict[Tuple[int, int], List[int]] = {}
+        for idx, entry in enumerate(entries):
+            for band, key in enumerate(entry['bands']):
+                buckets.setdefault((band, key), []).append(idx)
+
+        candidates = set()
+        for members in buckets.values():
+            for i in range(len(members)):
+                for j in range(i + 1, len(members)):
+                    candidates.add((members[i], members[j]))
+
+        pairs = []
+        for i, j in candidates:
+            a, b = entries[i], entries[j]
+            similarity = self._estimate(a['signature'], b['signature'])
+            if similarity >= self.threshold:
+                pairs.append({
+                    'student_a': a['student_name'],
+                    'student_b': b['student_name'],
+                    'repo_url_a': a['repo_url'],
+                    'repo_url_b': b['repo_url'],
+                    'similarity': round(similarity, 3),
+                    'scope': 'current'
+                })
+        return pairs
+
+    def _historical_pairs(self, entries: List[Dict], run_id: str = None) -> List[Dict]:
+        if not entries:
+            return []
+        pairs = []
+        current_submissions = {(entry['student_name'], entry['code_hash']) for entry in entries}
+        with self._connect() as conn:
+            conn.execute("CREATE TEMP TABLE probe (idx INTEGER, band INTEGER, bucket INTEGER)")
+            conn.executemany(
+                "INSERT INTO probe VALUES (?, ?, ?)",
+                [(idx, band, key) for idx, entry in enumerate(entries) for band, key in enumerate(entry['bands'])]
+            )
+            rows = conn.execute("""
+                SELECT DISTINCT p.idx, s.id, s.student_name, s.repo_url, s.run_id, s.code_hash, s.signature
+                FROM probe p
+                JOIN lsh_buckets b ON b.band = p.band AND b.bucket = p.bucket
+                JOIN submissions s ON s.id = b.submission_id
+                WHERE s.num_perm = ? AND s.bands = ? AND s.shingle_size = ?
+            """, self._config).fetchall()
+            conn.execute("DROP TABLE probe")
+
+        for idx, _, name, repo_url, past_run_id, code_hash, blob in rows:
+            entry = entries[idx]
+            # Resubmissions by the same student are not copying, and submissions that are
+            # also part of this run were already compared above. Another student's identical
+            # code from an earlier run is exactly what this lookup is for.
+            if name == entry['student_name'] or (run_id is not None and past_run_id == run_id) \
+                    or (name, code_hash) in current_submissions:
+                continue
+            similarity = self._estimate(entry['signature'], np.frombuffer(blob, dtype=np.uint32))
+            if similarity >= self.threshold:
+                pairs.append({
+                    'student_a': entry['student_name'],
+                    'student_b': name,
+                    'repo_url_a': entry['repo_url'],
+                    'repo_url_b': repo_url,
+                    'similarity': round(similarity, 3),
+                    'scope': 'historical',
+                    'historical_run_id': past_run_id
+                })
+        return pairs
+
+    def _store(self, entries: List[Dict], run_id: str):
+        now = time.time()
+        with self._connect() as conn:
+            for entry in entries:
+                existing = conn.execute(
+                    "SELECT id, num_perm, bands, shingle_size FROM submissions "
+                    "WHERE student_name = ? AND code_hash = ?",
+                    (entry['student_name'], entry['code_hash'])
+                ).fetchone()
+                if existing is not None and tuple(existing[1:]) == self._config:
+                    continue
+                values = (entry['repo_url'], run_id, *self._config, entry['signature'].tobytes(), now)
+                if existing is None:
+                    submission_id = conn.execute(
+                        "INSERT INTO submissions (student_name, code_hash, repo_url, run_id, num_perm, bands, "
+                        "shingle_size, signature, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (entry['student_name'], entry['code_hash'], *values)
+                    ).lastrowid
+                else:
+                    # Signed with other settings: re-sign it under these, replacing its buckets
+                    submission_id = existing[0]
+                    conn.execute("DELETE FROM lsh_buckets WHERE submission_id = ?", (submission_id,))
+                    conn.execute(
+                        "UPDATE submissions SET repo_url = ?, run_id = ?, num_perm = ?, bands = ?, "
+                        "shingle_size = ?, signature = ?, created_at = ? WHERE id = ?",
+                        (*values, submission_id)
+                    )
+                conn.executemany(
+                    "INSERT INTO lsh_buckets VALUES (?, ?, ?)",
+                    [(band, key, submission_id) for band, key in enumerate(entry['bands'])]
+                )
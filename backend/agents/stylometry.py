@@ -0,0 +1,171 @@
+"""Local stylometric features for AI-generated code screening.
+
+Features are computed for a whole batch of submissions at once: per-line
+statistics are flattened into numpy arrays and aggregated per submission with
+``np.bincount``, then scored with a logistic model. The weights and the
+ambiguous band (scores that still go to the LLM) are fitted by
+``calibration/fit_stylometry.py`` and shipped in ``stylometry_weights.json``.
+"""
+from typing import Dict, Any, List
+import json
+import os
+import re
+import numpy as np
+
+FEATURES = [
+    'comment_density',
+    'docstring_density',
+    'generic_identifier_ratio',
+    'indent_uniformity',
+    'line_length_uniformity',
+    'trailing_whitespace_ratio',
+    'blank_line_ratio',
+    'docstring_coverage',
+]
+
+_IDENTIFIER = re.compile(r'\b[A-Za-z_][A-Za-z0-9_]*\b')
+_COMMENT_LINE = re.compile(r'^\s*(?:#|//|/\*|\*(?!\*))')
+_DOCSTRING_LINE = re.compile(r'^\s*(?:[rRuU]?"""|[rRuU]?\'\'\'|/\*\*)')
+_DEFINITION_LINE = re.compile(r'^\s*(?:async\s+def|def|class|function)\s')
+# Placeholder names that generated code reaches for. Loop counters and coordinates
+# (i, j, x, y), ``data``, ``count`` and the like are ordinary in human code too.
+_GENERIC_IDENTIFIERS = {
+    'result', 'results', 'input_data', 'output_data', 'process_data', 'handle_data',
+    'my_list', 'my_dict', 'my_function', 'example', 'sample', 'helper', 'element', 'elements',
+}
+
+DEFAULT_WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stylometry_weights.json')
+
+
+def extract_features(codes: List[str]) -> np.ndarray:
+    """Return an (n_submissions, len(FEATURES)) feature matrix."""
+    n = len(codes)
+    segment, length, blank, comment, docstring, definition, trailing, indent_ok = [], [], [], [], [], [], [], []
+    generic = np.zeros(n)
+    identifiers = np.zeros(n)
+
+    for idx, code in enumerate(codes):
+        for line in code.split('\n'):
+            stripped = line.strip()
+            segment.append(idx)
+            length.append(len(line))
+            blank.append(not stripped)
+            comment.append(bool(_COMMENT_LINE.match(line)))
+            docstring.append(bool(_DOCSTRING_LINE.match(line)))
+            definition.append(bool(_DEFINITION_LINE.match(line)))
+            trailing.append(bool(stripped) and line != line.rstrip())
+            indent = len(line) - len(line.lstrip(' '))
+            indent_ok.append(bool(stripped) and indent % 4 == 0 and '\t' not in line[:indent + 1])
+        names = _IDENTIFIER.findall(code)
+        identifiers[idx] = len(names)
+        generic[idx] = sum(1 for name in names if name.lower() in _GENERIC_IDENTIFIERS)
+
+    segment = np.asarray(segment, dtype=np.int64)
+    length = np.asarray(length, dtype=np.float64)
+    blank = np.asarray(blank, dtype=np.float64)
+
+    lines = np.bincount(segment, minlength=n).astype(np.float64)
+    non_blank = np.maximum(lines - np.bincount(segment, weights=blank, minlength=n), 1)
+
+    def per_submission(values) -> np.ndarray:
+        return np.bincount(segment, weights=np.asarray(values, dtype=np.float64), minlength=n)
+
+    filled = 1 - blank
+    mean_length = per_submission(length * filled) / non_blank
+    sq_length = per_submission(length ** 2 * filled) / non_blank
+    length_cv = np.sqrt(np.maximum(sq_length - mean_length ** 2, 0)) / np.maximum(mean_length, 1)
+
+    features = np.column_stack([
+        per_submission(comment) / non_blank,
+        per_submission(docstring) / non_blank,
+        generic / np.maximum(identifiers, 1),
+        per_submission(indent_ok) / non_blank,
+        1 / (1 + length_cv),
+        per_submission(trailing) / non_blank,
+        per_submission(blank) / np.maximum(lines, 1),
+        # Docstring openers per def/class: close to 1 when every function is documented
+        per_submission(docstring) / np.maximum(per_submission(definition), 1),
+    ])
+    return np.clip(features, 0, 1)
+
+
+class StylometricScorer:
+    def __init__(self, weights: Dict[str, float] = None, weights_path: str = None):
+        """Weights from ``weights``, else from STYLOMETRY_WEIGHTS_PATH, else the fitted
+        weights shipped with this module. The files are fit_stylometry.py output; a
+        flat ``{feature: weight}`` mapping (calibrate() output) is accepted too."""
+        self.ambiguous_band = None
+        if weights is None:
+            path = weights_path or os.getenv("STYLOMETRY_WEIGHTS_PATH") or DEFAULT_WEIGHTS_PATH
+            with open(path, 'r', encoding='utf-8') as f:
+                fitted = json.load(f)
+            weights = fitted.get('weights', fitted)
+            if 'ambiguous_low' in fitted:
+                self.ambiguous_band = (fitted['ambiguous_low'], fitted['ambiguous_high'])
+        missing = [name for name in ['bias', *FEATURES] if name not in weights]
+        if missing:
+            raise ValueError(f"Stylometry weights missing {', '.join(missing)}")
+        self.weights = dict(weights)
+
+    def _vector(self) -> np.ndarray:
+        return np.array([self.weights[name] for name in FEATURES])
+
+    def score(self, features: np.ndarray) -> np.ndarray:
+        """Probability (0-1) that each submission is AI-generated."""
+        logits = features @ self._vector() + self.weights['bias']
+        return 1 / (1 + np.exp(-logits))
+
+    def calibrate(self, features: np.ndarray, labels: np.ndarray, epochs: int = 2000,
+                  learning_rate: float = 0.5, l2: float = 0.01,
+                  sample_weight: np.ndarray = None, signs: Dict[str, int] = None) -> Dict[str, float]:
+        """Fit the logistic weights on labelled submissions (1 = AI-generated).
+        ``sample_weight`` rebalances classes of very different sizes. ``signs`` fixes
+        the direction of features whose effect is known (+1 towards AI, -1 away): a
+        weight that would cross zero is held at zero, so a quirk of the corpus cannot
+        flip it."""
+        w = self._vector()
+        b = self.weights['bias']
+        labels = np.asarray(labels, dtype=np.float64)
+        sample_weight = np.ones(len(labels)) if sample_weight is None else np.asarray(sample_weight, dtype=np.float64)
+        sample_weight = sample_weight / sample_weight.sum()
+        direction = np.array([(signs or {}).get(name, 0) for name in FEATURES])
+        for _ in range(epochs):
+            p = 1 / (1 + np.exp(-(features @ w + b)))
+            error = (p - labels) * sample_weight
+            w -= learning_rate * (features.T @ error + l2 * w)
+            w[direction * w < 0] = 0.0
+            b -= learning_rate * error.sum()
+        self.weights = {'bias': float(b), **{name: float(v) for name, v in zip(FEATURES, w)}}
+        return self.weights
+
+    def indicators(self, row: np.ndarray) -> List[str]:
+        descriptions = {
+            'comment_density': (0.25, 'High comment density'),
+            'docstring_density': (0.05, 'Frequent docstrings'),
+            'generic_identifier_ratio': (0.15, 'Generic identifier names'),
+            'line_length_uniformity': (0.7, 'Uniform line lengths'),
+            'blank_line_ratio': (0.25, 'Many blank lines'),
+            'docstring_coverage': (0.8, 'Docstring on nearly every definition'),
+        }
+        found = []
+        for name, value in zip(FEATURES, row):
+            # Only features the fitted model counts towards AI-generated code
+            if name in descriptions and self.weights[name] > 0 and value >= descriptions[name][0]:
+                found.append(f"{descriptions[name][1]} ({value:.0%})")
+        return found
+
+
+def screen(codes: List[str], scorer: StylometricScorer = None) -> List[Dict[str, Any]]:
+    scorer = scorer or StylometricScorer()
+    if not codes:
+        return []
+    features = extract_features(codes)
+    probabilities = scorer.score(features)
+    return [
+        {
+            'percentage': int(round(p * 100)),
+            'features': dict(zip(FEATURES, (round(float(v), 3) for v in row))),
+            'indicators': scorer.indicators(row)
+        }
+        for p, row in zip(probabilities, features)
+    ]
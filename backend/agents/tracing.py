@@ -0,0 +1,280 @@
+"""Lightweight tracing for the assessment pipeline.
+
+Spans nest through a context variable, so child tasks started with
+``asyncio.gather``/``create_task`` inherit their parent span. The run, job,
+student and agent set on a span are copied onto every span below it, which lets
+one slow student be followed from the repository download through the vector
+store, the LLM queue wait and the LLM call itself.
+
+    with span('repo.download', url=zip_url):
+        ...
+
+Finished spans go to the exporters named in TRACE_EXPORT (comma-separated):
+
+- ``file``: one JSON object per line in TRACE_FILE
+- ``otlp``: batched OTLP/HTTP JSON to OTEL_EXPORTER_OTLP_ENDPOINT (``/v1/traces``)
+
+``collect_spans()`` additionally gathers the spans of one unit of work in memory,
+which the job runner uses to keep a per-job trace next to its results.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Tuple
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Attributes copied from a span onto its children
+INHERITED_ATTRIBUTES = ('run_id', 'job_id', 'student', 'agent')
+
+
+class Span:
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'start', 'end', 'attributes', 'status', 'error')
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start = time.time()
+        self.end: Optional[float] = None
+        self.attributes = attributes
+        self.status = 'ok'
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.time()) - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start': self.start,
+            'end': self.end,
+            'duration_ms': round(self.duration * 1000, 3),
+            'attributes': self.attributes,
+            'status': self.status,
+            'error': self.error,
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+_collector: ContextVar[Optional[List[Dict[str, Any]]]] = ContextVar('span_collector', default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, trace_id: str = None, **attributes):
+    """Time a block as a child of the current span, or as a new trace root.
+    ``trace_id`` only applies to roots (e.g. a job id, to group a job's spans)."""
+    parent = _current_span.get()
+    if parent is not None:
+        inherited = {key: parent.attributes[key] for key in INHERITED_ATTRIBUTES if key in parent.attributes}
+        current = Span(name, parent.trace_id, parent.span_id, {**inherited, **attributes})
+    else:
+        current = Span(name, trace_id or uuid.uuid4().hex, None, attributes)
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = 'error'
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end = time.time()
+        _current_span.reset(token)
+        _finish(current)
+
+
+@contextmanager
+def collect_spans():
+    """Collect the spans finished inside this block (including child tasks)."""
+    spans: List[Dict[str, Any]] = []
+    token = _collector.set(spans)
+    try:
+        yield spans
+    finally:
+        _collector.reset(token)
+
+
+def context_span(ctx) -> Tuple[Optional[Span], Optional[List[Dict[str, Any]]]]:
+    """The current span and span collector of another task's ``contextvars.Context``."""
+    return ctx.get(_current_span), ctx.get(_collector)
+
+
+def emit_span(name: str, start: float, end: float, parent: Optional[Span] = None,
+              spans: Optional[List[Dict[str, Any]]] = None, error: str = None, **attributes):
+    """Record an already-finished span, e.g. one observed from another thread."""
+    if parent is not None:
+        inherited = {key: parent.attributes[key] for key in INHERITED_ATTRIBUTES if key in parent.attributes}
+        finished = Span(name, parent.trace_id, parent.span_id, {**inherited, **attributes})
+    else:
+        finished = Span(name, uuid.uuid4().hex, None, attributes)
+    finished.start = start
+    finished.end = end
+    if error:
+        finished.status = 'error'
+        finished.error = error
+    _finish(finished, spans)
+
+
+def _finish(finished: Span, spans: Optional[List[Dict[str, Any]]] = None):
+    record = finished.to_dict()
+    if spans is None:
+        spans = _collector.get()
+    if spans is not None:
+        spans.append(record)
+    for exporter in get_exporters():
+        try:
+            exporter.export(record)
+        except Exception as e:
+            logger.warning(f"Span export to {type(exporter).__name__} failed: {e}")
+
+
+def waterfall(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Order spans as a waterfall: start offsets relative to the earliest span and
+    nesting depth, plus total time per span name."""
+    if not spans:
+        return {'spans': [], 'duration_ms': 0, 'by_name': {}}
+    by_id = {s['span_id']: s for s in spans}
+    origin = min(s['start'] for s in spans)
+    finish = max(s['end'] or s['start'] for s in spans)
+
+    def depth(s):
+        level = 0
+        while s.get('parent_id') in by_id and level < 64:
+            s = by_id[s['parent_id']]
+            level += 1
+        return level
+
+    rows = []
+    by_name: Dict[str, Dict[str, float]] = {}
+    for s in sorted(spans, key=lambda s: s['start']):
+        rows.append({
+            'name': s['name'],
+            'span_id': s['span_id'],
+            'parent_id': s['parent_id'],
+            'depth': depth(s),
+            'offset_ms': round((s['start'] - origin) * 1000, 3),
+            'duration_ms': s['duration_ms'],
+            'status': s['status'],
+            'error': s.get('error'),
+            'attributes': s['attributes'],
+        })
+        totals = by_name.setdefault(s['name'], {'count': 0, 'total_ms': 0.0})
+        totals['count'] += 1
+        totals['total_ms'] = round(totals['total_ms'] + s['duration_ms'], 3)
+    return {'spans': rows, 'duration_ms': round((finish - origin) * 1000, 3), 'by_name': by_name}
+
+
+class JsonlExporter:
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, record: Dict[str, Any]):
+        line = json.dumps(record, default=str) + '\n'
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(line)
+
+
+class OtlpHttpExporter:
+    """Sends spans to an OpenTelemetry collector as OTLP/HTTP JSON from a background thread."""
+
+    def __init__(self, endpoint: str, service_name: str = 'lms-assessment', batch_size: int = 256,
+                 flush_interval: float = 2.0):
+        self.url = endpoint.rstrip('/') + '/v1/traces'
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=10000)
+        threading.Thread(target=self._run, name='otlp-exporter', daemon=True).start()
+
+    def export(self, record: Dict[str, Any]):
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            pass  # Dropping spans beats blocking the pipeline
+
+    def _run(self):
+        import requests
+
+        session = requests.Session()
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            try:
+                session.post(self.url, json=self._encode(batch), timeout=10)
+            except Exception as e:
+                logger.warning(f"OTLP export of {len(batch)} spans failed: {e}")
+
+    def _encode(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        def attribute(key, value):
+            if isinstance(value, bool):
+                return {'key': key, 'value': {'boolValue': value}}
+            if isinstance(value, int):
+                return {'key': key, 'value': {'intValue': str(value)}}
+            if isinstance(value, float):
+                return {'key': key, 'value': {'doubleValue': value}}
+            return {'key': key, 'value': {'stringValue': str(value)}}
+
+        return {'resourceSpans': [{
+            'resource': {'attributes': [attribute('service.name', self.service_name)]},
+            'scopeSpans': [{
+                'scope': {'name': __name__},
+                'spans': [{
+                    'traceId': s['trace_id'],
+                    'spanId': s['span_id'],
+                    'parentSpanId': s['parent_id'] or '',
+                    'name': s['name'],
+                    'kind': 1,
+                    'startTimeUnixNano': str(int(s['start'] * 1e9)),
+                    'endTimeUnixNano': str(int((s['end'] or s['start']) * 1e9)),
+                    'attributes': [attribute(k, v) for k, v in s['attributes'].items() if v is not None],
+                    'status': {'code': 2, 'message': s['error']} if s['status'] == 'error' else {'code': 1},
+                } for s in batch]
+            }]
+        }]}
+
+
+_exporters = None
+_exporters_lock = threading.Lock()
+
+
+def get_exporters() -> list:
+    global _exporters
+    if _exporters is None:
+        with _exporters_lock:
+            if _exporters is None:
+                exporters = []
+                names = [n.strip() for n in os.getenv("TRACE_EXPORT", "").lower().split(',') if n.strip()]
+                if 'file' in names:
+                    exporters.append(JsonlExporter(os.getenv("TRACE_FILE", "./traces/spans.jsonl")))
+                if 'otlp' in names:
+                    exporters.append(OtlpHttpExporter(
+                        os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318"),
+                        os.getenv("OTEL_SERVICE_NAME", "lms-assessment")
+                    ))
+                _exporters = exporters
+    return _exporters
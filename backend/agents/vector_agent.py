@@ -1,24 +1,29 @@
 from .base_agent import BaseAgent, AgentStatus
+from .services import get_services
+from .scheduler import get_scheduler
 from typing import Dict, Any, List
-import chromadb
+import asyncio
 import os
 
 class VectorAgent(BaseAgent):
-    def __init__(self):
+    def __init__(self, client=None):
         super().__init__("vector_agent")
-        self.client = chromadb.PersistentClient(path="./chroma_db")
+        # Shared persistent client: opening it loads SQLite and the HNSW index
+        self.client = client or get_services().chroma_client
         self.collection = self.client.get_or_create_collection("code_context")
         
     async def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
         try:
             action = data.get('action')
             
-            if action == 'store':
-                return await self._store_context(data)
-            elif action == 'retrieve':
-                return await self._retrieve_context(data)
-            else:
+            if action not in ('store', 'retrieve'):
                 raise ValueError("Invalid action")
+            
+            # Chroma computes embeddings inline; share the embedding budget across jobs
+            async with get_scheduler().slot('embedding'):
+                if action == 'store':
+                    return await self._store_context(data)
+                return await self._retrieve_context(data)
                 
         except Exception as e:
             self.status = AgentStatus.ERROR
@@ -29,7 +34,9 @@ class VectorAgent(BaseAgent):
         code = data.get('code')
         metadata = data.get('metadata', {})
         
-        self.collection.add(
+        # Embedding and the index write are synchronous; run them in a thread
+        await asyncio.to_thread(
+            self.collection.add,
             documents=[code],
             metadatas=[{**metadata, 'student': student_name}],
             ids=[f"{student_name}_{hash(code)}"]
@@ -41,7 +48,8 @@ class VectorAgent(BaseAgent):
         query = data.get('query')
         n_results = data.get('n_results', 3)
         
-        results = self.collection.query(
+        results = await asyncio.to_thread(
+            self.collection.query,
             query_texts=[query],
             n_results=n_results
         )
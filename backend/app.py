@@ -1,3 +1,4 @@
+import logging
 import os
 from flask import Flask
 from routes.agentic_routes import agentic_routes
@@ -10,10 +11,17 @@ except ImportError:
     pass
 
 def create_app():
+    # LOG_LEVEL=DEBUG enables the full result/response dumps
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
     app = Flask(__name__)
     app.register_blueprint(agentic_routes)
     return app
 
 if __name__ == "__main__":
     app = create_app()
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    # Development server; use asgi.py for production serving
+    app.run(
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "5000")),
+        debug=os.getenv("FLASK_DEBUG", "false").lower() == "true"
+    )
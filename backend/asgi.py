@@ -0,0 +1,56 @@
+"""Production entrypoint.
+
+Serves the Flask app through an ASGI adapter under uvicorn. Agent pipelines run on
+one persistent event loop per worker process (see ``runtime``). Requests to
+/api/agentic/jobs return as soon as the assessment is queued. The synchronous
+/api/agentic/upload_csv still holds its request thread until the workbook is
+ready, so long or large assessments belong on the jobs endpoints.
+
+    python asgi.py
+    uvicorn asgi:app --workers 4 --host 0.0.0.0 --port 5000
+"""
+import os
+import threading
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import create_app
+from agents.cpu_pool import warm_cpu_pool
+
+
+class _ServingProcess:
+    """The Flask app, plus a lifespan handler that warms the CPU pool once the server
+    starts serving in this process. Nothing runs at import: under ``--workers`` the
+    supervisor imports this module without serving, and the pool's spawned workers
+    re-import it as ``__mp_main__`` - neither must start a pool of its own."""
+
+    def __init__(self, wsgi_app):
+        self.app = WsgiToAsgi(wsgi_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'lifespan':
+            await self.app(scope, receive, send)
+            return
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # In the background, so the first upload does not pay for starting the workers
+                threading.Thread(target=warm_cpu_pool, name='cpu-pool-warmup', daemon=True).start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+app = _ServingProcess(create_app())
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "asgi:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "5000")),
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        log_level=os.getenv("LOG_LEVEL", "info").lower()
+    )
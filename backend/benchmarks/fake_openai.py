@@ -0,0 +1,198 @@
+"""Local OpenAI-compatible chat completions server for offline benchmarks.
+
+Answers ``POST /v1/chat/completions`` (and the Azure deployment path) with a
+response in the format each agent asks for, after a delay of ``latency_ms`` plus
+the time to "generate" the completion at ``tokens_per_second``. A fraction of
+requests can be rejected with 429 to exercise the router's throttling path.
+
+    python benchmarks/fake_openai.py --port 8090 --latency-ms 300 --tps 80 --rate-limit 0.05
+
+then point the app at it with STANDARD_OPENAI_API_KEY=bench and
+STANDARD_OPENAI_API_BASE=http://127.0.0.1:8090/v1.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+
+CRITERIA = ['Correctness', 'Code Quality', 'Documentation']
+
+
+def _tokens(text: str) -> int:
+    return max(len(text) // 4, 1)
+
+
+def classify(body: Dict[str, Any]) -> str:
+    """Which agent sent the request, from its response format and system prompt."""
+    if (body.get('response_format') or {}).get('type') == 'json_object':
+        return 'combined'
+    system = next((m['content'] for m in body.get('messages', []) if m.get('role') == 'system'), '')
+    if 'batch code assessor' in system:
+        return 'batch'
+    if 'AI code detection expert' in system:
+        return 'ai_detection'
+    if 'consistent code assessor' in system:
+        return 'consistency'
+    if 'code assessor' in system:
+        return 'grading'
+    return 'other'
+
+
+def completion_text(kind: str, body: Dict[str, Any], rng: random.Random) -> str:
+    user = next((m['content'] for m in reversed(body.get('messages', [])) if m.get('role') == 'user'), '')
+    if kind == 'combined':
+        return json.dumps({
+            'scores': {c: {'mark': rng.randint(4, 10), 'justification': f'{c} is adequate.'} for c in CRITERIA},
+            'ai_detection': {'percentage': rng.randint(0, 90), 'confidence': 'medium',
+                             'indicators': ['generic variable names']}
+        })
+    if kind == 'batch':
+        sections = []
+        for number, name in re.findall(r"\nStudent (\d+) \((.*?)\):\nCode:", user):
+            lines = [f"Student {number} ({name}):"]
+            for c in CRITERIA:
+                lines.append(f"- {c}: {rng.randint(4, 10)}\n  - {c} is adequate.")
+            sections.append('\n'.join(lines))
+        return '\n\n'.join(sections)
+    if kind == 'ai_detection':
+        return f"Percentage: {rng.randint(0, 90)}\nConfidence: medium\nIndicators: generic names, boilerplate"
+    if kind == 'consistency':
+        return '\n'.join(f"{c}: {rng.randint(4, 10)}" for c in CRITERIA)
+    if kind == 'grading':
+        return '\n\n'.join(f"Criterion: {c}\nMark: {rng.randint(4, 10)}\nJustification: {c} is adequate."
+                           for c in CRITERIA)
+    return 'OK'
+
+
+class FakeOpenAIServer:
+    def __init__(self, latency_ms: float = 200, tokens_per_second: float = 100, rate_limit_ratio: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0, seed: int = 0):
+        self.latency = latency_ms / 1000
+        self.tokens_per_second = tokens_per_second
+        self.rate_limit_ratio = rate_limit_ratio
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'throttled': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'by_kind': {}}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FakeOpenAIServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fake-openai', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return json.loads(json.dumps(self.stats))
+
+    def _respond(self, body: Dict[str, Any]):
+        """(status, headers, payload, delay) for one request."""
+        kind = classify(body)
+        with self._lock:
+            self.stats['requests'] += 1
+            throttled = self._rng.random() < self.rate_limit_ratio
+            seed = self._rng.random()
+            if throttled:
+                self.stats['throttled'] += 1
+                return 429, {'retry-after': '1'}, {
+                    'error': {'message': 'Rate limit reached', 'type': 'rate_limit_error', 'code': '429'}
+                }, 0.0
+
+        rng = random.Random(seed)
+        n = int(body.get('n') or 1)
+        texts = [completion_text(kind, body, rng) for _ in range(n)]
+        prompt_tokens = sum(_tokens(m.get('content') or '') for m in body.get('messages', []))
+        completion_tokens = sum(_tokens(t) for t in texts)
+        with self._lock:
+            self.stats['prompt_tokens'] += prompt_tokens
+            self.stats['completion_tokens'] += completion_tokens
+            self.stats['by_kind'][kind] = self.stats['by_kind'].get(kind, 0) + 1
+
+        payload = {
+            'id': f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'fake'),
+            'choices': [
+                {'index': i, 'message': {'role': 'assistant', 'content': text}, 'finish_reason': 'stop'}
+                for i, text in enumerate(texts)
+            ],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                      'total_tokens': prompt_tokens + completion_tokens},
+        }
+        delay = self.latency + completion_tokens / max(self.tokens_per_second, 1e-6)
+        return 200, {}, payload, delay
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):
+                if not self.path.split('?')[0].endswith('/chat/completions'):
+                    self._send(404, {}, {'error': {'message': 'Not found'}})
+                    return
+                length = int(self.headers.get('content-length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except ValueError:
+                    self._send(400, {}, {'error': {'message': 'Invalid JSON'}})
+                    return
+                status, headers, payload, delay = server._respond(body)
+                if delay:
+                    time.sleep(delay)
+                self._send(status, headers, payload)
+
+            def _send(self, status: int, headers: Dict[str, str], payload: Dict[str, Any]):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('content-type', 'application/json')
+                self.send_header('content-length', str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--latency-ms', type=float, default=200)
+    parser.add_argument('--tps', type=float, default=100, help="Completion tokens generated per second")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Fraction of requests answered with 429")
+    args = parser.parse_args()
+
+    server = FakeOpenAIServer(args.latency_ms, args.tps, args.rate_limit, args.host, args.port).start()
+    print(f"Fake OpenAI listening on {server.url}/v1")
+    try:
+        while True:
+            time.sleep(60)
+            print(json.dumps(server.snapshot()))
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""Synthetic student repositories served like GitHub archive downloads.
+
+``GET /<owner>/<repo>/archive/refs/heads/main.zip`` (or ``archive/<commit>.zip``
+with the repo's commit) returns a generated zip whose size follows the size
+class in the repo name (``s0001-small``, ``s0002-medium``, ``s0003-large``);
+other branches return 404, as for a repo without a ``master`` branch.
+``GET /<owner>/<repo>.git/info/refs?service=git-upload-pack`` advertises ``main``
+as the default branch, like GitHub's smart-HTTP endpoint. Content is
+deterministic per repo name, and varies between repos so similarity detection
+does not see one giant duplicate cluster.
+
+Point the app at it with REPO_ARCHIVE_BASE_URL=http://127.0.0.1:<port>.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+import hashlib
+import io
+import random
+import re
+import threading
+import zipfile
+
+# size class: (source files, functions per file)
+SIZE_CLASSES = {
+    'small': (2, 4),
+    'medium': (8, 8),
+    'large': (30, 12),
+}
+# Roster mix: out of every 10 students
+SIZE_MIX = ['small'] * 6 + ['medium'] * 3 + ['large']
+
+_ARCHIVE_PATH = re.compile(r'^/([^/]+)/([^/]+)/archive/(?:refs/heads/)?([^/]+)\.zip$')
+_REFS_PATH = re.compile(r'^/([^/]+)/([^/]+)\.git/info/refs$')
+
+_NAMES = ['total', 'items', 'value', 'count', 'result', 'data', 'index', 'score', 'record', 'buffer']
+_BODIES = [
+    "    {a} = 0\n    for {b} in {arg}:\n        {a} += {b}\n    return {a}\n",
+    "    if not {arg}:\n        return None\n    {a} = sorted({arg})\n    return {a}[len({a}) // 2]\n",
+    "    {a} = {{}}\n    for {b} in {arg}:\n        {a}[{b}] = {a}.get({b}, 0) + 1\n    return {a}\n",
+    "    {a} = []\n    while {arg}:\n        {b} = {arg}.pop()\n        if {b} % 2:\n            {a}.append({b})\n    return {a}\n",
+    "    try:\n        {a} = int({arg})\n    except ValueError:\n        {a} = -1\n    return {a} * 2\n",
+]
+
+
+def size_class(repo: str) -> str:
+    return next((name for name in SIZE_CLASSES if repo.endswith(name)), 'small')
+
+
+def commit_of(owner: str, repo: str) -> str:
+    return hashlib.sha1(f"{owner}/{repo}".encode()).hexdigest()
+
+
+def _pkt_line(data: bytes) -> bytes:
+    return f"{len(data) + 4:04x}".encode() + data
+
+
+def ref_advertisement(owner: str, repo: str) -> bytes:
+    commit = commit_of(owner, repo).encode()
+    return (_pkt_line(b"# service=git-upload-pack\n") + b"0000"
+            + _pkt_line(commit + b" HEAD\0multi_ack symref=HEAD:refs/heads/main agent=git/fixture\n")
+            + _pkt_line(commit + b" refs/heads/main\n") + b"0000")
+
+
+def build_archive(owner: str, repo: str) -> bytes:
+    rng = random.Random(f"{owner}/{repo}")
+    files, functions = SIZE_CLASSES[size_class(repo)]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(f"{repo}-main/README.md", f"# {repo}\n")
+        archive.writestr(f"{repo}-main/.github/workflows/ci.yml", "on: push\n")
+        for f in range(files):
+            source = []
+            for i in range(functions):
+                a, b, arg = rng.sample(_NAMES, 3)
+                body = rng.choice(_BODIES).format(a=a, b=b, arg=arg)
+                source.append(f"def {rng.choice(_NAMES)}_{f}_{i}({arg}):\n{body}")
+            archive.writestr(f"{repo}-main/src/module_{f}.py", '\n\n'.join(source))
+    return buffer.getvalue()
+
+
+def make_roster(students: int, owner: str = 'bench') -> Tuple[str, List[str]]:
+    """CSV roster text and the student names, cycling through SIZE_MIX."""
+    names = [f"Student {i:05d}" for i in range(students)]
+    rows = ['name,repo_url']
+    for i, name in enumerate(names):
+        rows.append(f"{name},https://github.com/{owner}/s{i:05d}-{SIZE_MIX[i % len(SIZE_MIX)]}")
+    return '\n'.join(rows) + '\n', names
+
+
+class FixtureArchiveServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self._archives: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'not_found': 0, 'bytes': 0, 'ref_requests': 0}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'FixtureArchiveServer':
+        threading.Thread(target=self._server.serve_forever, name='fixture-repos', daemon=True).start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def archive(self, owner: str, repo: str) -> bytes:
+        key = f"{owner}/{repo}"
+        with self._lock:
+            data = self._archives.get(key)
+        if data is None:
+            data = build_archive(owner, repo)
+            with self._lock:
+                self._archives[key] = data
+        return data
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                refs = _REFS_PATH.match(path)
+                if refs:
+                    with server._lock:
+                        server.stats['ref_requests'] += 1
+                    self._send(200, ref_advertisement(refs.group(1), refs.group(2)),
+                               'application/x-git-upload-pack-advertisement')
+                    return
+                match = _ARCHIVE_PATH.match(path)
+                with server._lock:
+                    server.stats['requests'] += 1
+                # Like GitHub, an abbreviated commit (7+ characters) works too
+                if not match or not (match.group(3) == 'main' or (
+                        len(match.group(3)) >= 7 and commit_of(match.group(1), match.group(2)).startswith(match.group(3)))):
+                    with server._lock:
+                        server.stats['not_found'] += 1
+                    self._send(404, b'Not Found', 'text/plain')
+                    return
+                data = server.archive(match.group(1), match.group(2))
+                with server._lock:
+                    server.stats['bytes'] += len(data)
+                self._send(200, data, 'application/zip')
+
+            def _send(self, status: int, data: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header('content-type', content_type)
+                self.send_header('content-length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,72 @@
+"""Import-time breakdown for application startup.
+
+Runs ``python -X importtime -c "import app"`` in a fresh interpreter, prints the
+slowest top-level imports, and fails if a heavy dependency is loaded at startup
+or the total exceeds the budget.
+
+    python benchmarks/import_time.py [--module app] [--top 15] [--budget-ms 1500]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Must only be imported by the code paths that use them
+HEAVY_MODULES = ['pandas', 'openpyxl', 'chromadb', 'networkx', 'openai', 'numpy', 'scipy']
+
+
+def measure(module: str):
+    """Return [(module, self_us, cumulative_us, depth)] in import order."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--module', default='app')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "1500")))
+    args = parser.parse_args()
+
+    rows = measure(args.module)
+    target = next((row for row in reversed(rows) if row[0] == args.module), None)
+    total_ms = target[2] / 1000 if target else sum(row[1] for row in rows) / 1000
+
+    # Direct children of the root import are the actionable entries
+    top_level = sorted((row for row in rows if row[3] <= 1), key=lambda row: row[2], reverse=True)
+    print(f"import {args.module}: {total_ms:.1f} ms, {len(rows)} modules")
+    print(f"{'cumulative ms':>14}  {'self ms':>8}  module")
+    for name, self_us, cumulative_us, _ in top_level[:args.top]:
+        print(f"{cumulative_us / 1000:>14.1f}  {self_us / 1000:>8.1f}  {name}")
+
+    loaded = {row[0].split('.')[0] for row in rows}
+    eager = [name for name in HEAVY_MODULES if name in loaded]
+    failed = False
+    if eager:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(eager)}")
+        failed = True
+    if total_ms > args.budget_ms:
+        print(f"FAIL: startup import time {total_ms:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        failed = True
+    if not failed:
+        print("OK")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,238 @@
+"""Offline end-to-end benchmark of the assessment pipeline.
+
+Starts a fake OpenAI server (``fake_openai``) and a fixture archive server
+(``fixture_repos``), then runs each scenario in a fresh interpreter pointed at
+them, through ``AgentOrchestrator.process_assessment`` and/or the
+``/api/agentic/upload_csv`` endpoint. Reports throughput, p50/p99 per-student
+and LLM-call latency (from trace spans), peak RSS and LLM call counts.
+
+    python benchmarks/run_benchmark.py --students 10,100,1000 --output baseline.json
+    python benchmarks/run_benchmark.py --students 100 --baseline baseline.json
+
+With --baseline, exits non-zero if a scenario regresses beyond --tolerance:
+lower throughput, higher p99 student latency or peak RSS, or more LLM calls.
+"""
+from typing import Dict, Any, List
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+RUBRIC = """Correctness (10): The code solves the problem and handles edge cases.
+Code Quality (10): Clear structure, naming and idiomatic use of the language.
+Documentation (10): Docstrings, comments and a README explain the work.
+"""
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def _read_spans(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run_scenario(students: int, mode: str, via: str) -> Dict[str, Any]:
+    """Runs inside the child interpreter; the environment already points at the fake servers."""
+    import resource
+    sys.path.insert(0, BACKEND_DIR)
+    sys.path.insert(0, BENCH_DIR)
+    from fixture_repos import make_roster
+    from agents.cpu_pool import warm_cpu_pool
+    from agents.services import get_services
+    import runtime
+
+    roster, _ = make_roster(students)
+    if os.path.exists(os.environ['TRACE_FILE']):
+        os.remove(os.environ['TRACE_FILE'])
+    # Start-up is measured by import_time.py; keep it out of the timed section
+    warm_cpu_pool()
+    orchestrator = get_services().orchestrator
+    client = None
+    if via == 'upload':
+        from app import create_app
+        client = create_app().test_client()
+
+    start = time.perf_counter()
+    if via == 'orchestrator':
+        result = runtime.run(orchestrator.process_assessment(
+            {'file_content': roster, 'filename': 'roster.csv'}, RUBRIC, assessment_mode=mode
+        ))
+        error = result.get('error')
+        graded = len(result.get('results', []))
+    else:
+        import io
+        response = client.post('/api/agentic/upload_csv', data={
+            'file': (io.BytesIO(roster.encode()), 'roster.csv'),
+            'rubric': (io.BytesIO(RUBRIC.encode()), 'rubric.txt'),
+            'assessment_mode': mode,
+        }, content_type='multipart/form-data')
+        error = None if response.status_code == 200 else f"HTTP {response.status_code}"
+        graded = students if error is None else 0
+    wall = time.perf_counter() - start
+
+    spans = _read_spans(os.environ['TRACE_FILE'])
+    by_student: Dict[str, List[float]] = {}
+    for s in spans:
+        student = s['attributes'].get('student')
+        if student:
+            window = by_student.setdefault(student, [s['start'], s['end']])
+            window[0] = min(window[0], s['start'])
+            window[1] = max(window[1], s['end'])
+    student_ms = [(end - begin) * 1000 for begin, end in by_student.values()]
+    llm_ms = [s['duration_ms'] for s in spans if s['name'] == 'llm.call' and s['status'] == 'ok']
+    agent_errors: Dict[str, int] = {}
+    for s in spans:
+        if s['status'] == 'error' and 'agent' in s['attributes']:
+            agent_errors[s['name']] = agent_errors.get(s['name'], 0) + 1
+
+    return {
+        'students': students,
+        'mode': mode,
+        'via': via,
+        'error': error,
+        'graded': graded,
+        'wall_seconds': round(wall, 3),
+        'throughput_students_per_s': round(students / wall, 3) if wall else 0,
+        'student_p50_ms': round(percentile(student_ms, 0.50), 1),
+        'student_p99_ms': round(percentile(student_ms, 0.99), 1),
+        'llm_p50_ms': round(percentile(llm_ms, 0.50), 1),
+        'llm_p99_ms': round(percentile(llm_ms, 0.99), 1),
+        # ru_maxrss is in KiB on Linux; children are the CPU pool workers (largest one)
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'peak_rss_pool_worker_mb': round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024, 1),
+        'agent_errors': agent_errors,
+    }
+
+
+def _child_env(workdir: str, llm_url: str, archive_url: str) -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items()
+           if not k.startswith(('AZURE_OPENAI', 'OPENAI_', 'STANDARD_OPENAI', 'LLM_DEPLOYMENTS'))}
+    env.update({
+        'STANDARD_OPENAI_API_KEY': 'bench',
+        'STANDARD_OPENAI_API_BASE': f"{llm_url}/v1",
+        'STANDARD_OPENAI_MODEL': 'bench',
+        'REPO_ARCHIVE_BASE_URL': archive_url,
+        'CHROMA_DB_PATH': os.path.join(workdir, 'chroma_db'),
+        'SIMILARITY_DB_PATH': os.path.join(workdir, 'similarity.sqlite3'),
+        'GRAPH_DB_PATH': os.path.join(workdir, 'graph.sqlite3'),
+        'JOB_RESULTS_DIR': os.path.join(workdir, 'job_results'),
+        'TASK_QUEUE_PATH': os.path.join(workdir, 'tasks.sqlite3'),
+        'TRACE_EXPORT': 'file',
+        'TRACE_FILE': os.path.join(workdir, 'spans.jsonl'),
+        'JOB_EXECUTION': 'local',
+        'LOG_LEVEL': os.getenv('LOG_LEVEL', 'WARNING'),
+    })
+    return env
+
+
+def _answered_calls(result: Dict[str, Any]) -> int:
+    return result['llm_calls'] - result.get('llm_throttled', 0)
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float) -> List[str]:
+    previous = {(r['students'], r['mode'], r['via']): r for r in baseline}
+    regressions = []
+    for r in results:
+        old = previous.get((r['students'], r['mode'], r['via']))
+        if old is None:
+            continue
+        label = f"{r['via']}/{r['mode']}/{r['students']}"
+        if r['throughput_students_per_s'] < old['throughput_students_per_s'] * (1 - tolerance):
+            regressions.append(f"{label}: throughput {old['throughput_students_per_s']} -> {r['throughput_students_per_s']}")
+        if r['student_p99_ms'] > old['student_p99_ms'] * (1 + tolerance):
+            regressions.append(f"{label}: student p99 {old['student_p99_ms']} -> {r['student_p99_ms']} ms")
+        if r['peak_rss_mb'] > old['peak_rss_mb'] * (1 + tolerance):
+            regressions.append(f"{label}: peak RSS {old['peak_rss_mb']} -> {r['peak_rss_mb']} MB")
+        # Injected 429s and their retries vary run to run; only answered calls must not grow
+        if _answered_calls(r) > _answered_calls(old):
+            regressions.append(f"{label}: answered LLM calls {_answered_calls(old)} -> {_answered_calls(r)}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', default='10,100,1000', help="Comma-separated cohort sizes")
+    parser.add_argument('--mode', default='batch', choices=['batch', 'separate', 'combined'])
+    parser.add_argument('--via', default='orchestrator,upload', help="orchestrator and/or upload")
+    parser.add_argument('--latency-ms', type=float, default=200, help="Fake LLM time to first token")
+    parser.add_argument('--tps', type=float, default=400, help="Fake LLM completion tokens per second")
+    parser.add_argument('--rate-limit', type=float, default=0.02, help="Fraction of LLM requests answered with 429")
+    parser.add_argument('--output', help="Write results as JSON (use as a later --baseline)")
+    parser.add_argument('--baseline', help="Compare against an earlier --output file")
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--scenario', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scenario:
+        print(json.dumps(run_scenario(int(args.students), args.mode, args.via)))
+        return
+
+    sys.path.insert(0, BENCH_DIR)
+    from fake_openai import FakeOpenAIServer
+    from fixture_repos import FixtureArchiveServer
+
+    llm = FakeOpenAIServer(args.latency_ms, args.tps, args.rate_limit).start()
+    archives = FixtureArchiveServer().start()
+    results = []
+    try:
+        for via in [v.strip() for v in args.via.split(',') if v.strip()]:
+            for students in [int(n) for n in args.students.split(',')]:
+                before = llm.snapshot()
+                with tempfile.TemporaryDirectory(prefix='lms-bench-') as workdir:
+                    proc = subprocess.run(
+                        [sys.executable, os.path.abspath(__file__), '--scenario', '--students', str(students),
+                         '--mode', args.mode, '--via', via],
+                        cwd=workdir, env=_child_env(workdir, llm.url, archives.url),
+                        capture_output=True, text=True
+                    )
+                if proc.returncode != 0:
+                    raise SystemExit(f"{via}/{students} failed:\n{proc.stderr[-4000:]}")
+                result = json.loads(proc.stdout.strip().splitlines()[-1])
+                after = llm.snapshot()
+                result['llm_calls'] = after['requests'] - before['requests']
+                result['llm_throttled'] = after['throttled'] - before['throttled']
+                result['llm_calls_by_kind'] = {
+                    kind: count - before['by_kind'].get(kind, 0) for kind, count in after['by_kind'].items()
+                    if count - before['by_kind'].get(kind, 0)
+                }
+                results.append(result)
+                print(f"{via:>12} {args.mode:>8} {students:>5} students: "
+                      f"{result['throughput_students_per_s']:>7.2f}/s  "
+                      f"student p50/p99 {result['student_p50_ms']:.0f}/{result['student_p99_ms']:.0f} ms  "
+                      f"llm p50/p99 {result['llm_p50_ms']:.0f}/{result['llm_p99_ms']:.0f} ms  "
+                      f"rss {result['peak_rss_mb']:.0f} MB  llm calls {result['llm_calls']}"
+                      + (f"  ERROR {result['error']}" if result['error'] else ''))
+    finally:
+        llm.stop()
+        archives.stop()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'settings': {k: v for k, v in vars(args).items() if k not in ('scenario', 'output')},
+                       'results': results}, f, indent=2)
+
+    failed = any(r['error'] for r in results)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions = compare(results, json.load(f)['results'], args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        failed = failed or bool(regressions)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
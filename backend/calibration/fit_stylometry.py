@@ -0,0 +1,229 @@
+"""Fit the stylometric AI-code screen and its ambiguous band.
+
+Labelled corpus:
+
+- human: CPython's own standard library (top-level modules, ``test/test_*.py``
+  and ``turtledemo``) from the interpreter running this script. The 3.11 sources
+  predate code-generating LLMs.
+- ai: ``stylometry_corpus/ai/``, solutions to typical course assignments
+  generated by an LLM, kept as produced.
+
+``--human DIR`` / ``--ai DIR`` add labelled submissions (one file, or one
+directory of files, per submission); real course submissions are the better
+human class, since library code is documented differently from coursework.
+
+Features go to ``stylometry_features.csv`` (one row per sample, with its source
+and sha1). The weights are fitted on that file with class-balanced logistic
+regression (each class carries half the loss, whatever its size), with every
+weight held to the direction in SIGNS. The band is derived from 5-fold
+out-of-fold scores: below ``ambiguous_low`` at most MISS_RATE of AI samples
+score; above ``ambiguous_high`` at most MISS_RATE of human samples score. Both
+go to ``agents/stylometry_weights.json`` together with the held-out precision
+and recall of the two screened-out ranges, which skip the LLM review. A range
+whose held-out precision is below MIN_PRECISION is closed.
+
+    python calibration/fit_stylometry.py [--extract] [--human DIR] [--ai DIR]
+"""
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import os
+import sys
+import sysconfig
+
+import numpy as np
+
+CALIBRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(CALIBRATION_DIR)
+FEATURES_PATH = os.path.join(CALIBRATION_DIR, 'stylometry_features.csv')
+AI_CORPUS = os.path.join(CALIBRATION_DIR, 'stylometry_corpus', 'ai')
+STDLIB_GROUPS = ['*.py', os.path.join('test', 'test_*.py'), os.path.join('turtledemo', '*.py')]
+# Share of each class the local verdict may get wrong outside the ambiguous band. Kept
+# strict while the AI class is a few dozen samples: the band stays wide
+MISS_RATE = 0.02
+# Held-out precision (classes equally common) a screened-out range needs to stay open;
+# a range short of it is closed (-1 or 101) and those submissions go to the LLM
+MIN_PRECISION = 0.9
+FOLDS = 5
+# Direction each feature may push the score (+1 towards AI-generated, -1 away). Library
+# code is commented and line-wrapped unlike coursework, so unconstrained fits can turn
+# these around
+SIGNS = {
+    'comment_density': 1,
+    'docstring_density': 1,
+    'generic_identifier_ratio': 1,
+    'indent_uniformity': 1,
+    'line_length_uniformity': 1,
+    'trailing_whitespace_ratio': -1,
+    'blank_line_ratio': 1,
+    'docstring_coverage': 1,
+}
+
+
+def _read(path: str) -> str:
+    if os.path.isdir(path):
+        parts = []
+        for root, _, files in sorted(os.walk(path)):
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    with open(os.path.join(root, name), 'r', encoding='utf-8', errors='ignore') as f:
+                        parts.append(f.read())
+        return '\n\n'.join(parts)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return f.read()
+
+
+def _submissions(directory: str):
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+            if name.endswith('.py') or os.path.isdir(os.path.join(directory, name))]
+
+
+def extract(extra_human, extra_ai):
+    from agents.stylometry import FEATURES, extract_features
+
+    stdlib = sysconfig.get_paths()['stdlib']
+    samples = []  # (source, label, path)
+    for pattern in STDLIB_GROUPS:
+        for path in sorted(glob.glob(os.path.join(stdlib, pattern))):
+            samples.append((f"stdlib-{sys.version_info[0]}.{sys.version_info[1]}/"
+                            f"{os.path.relpath(path, stdlib)}", 0, path))
+    for path in _submissions(AI_CORPUS):
+        samples.append((os.path.relpath(path, CALIBRATION_DIR), 1, path))
+    for label, directories in ((0, extra_human), (1, extra_ai)):
+        for directory in directories:
+            for path in _submissions(directory):
+                samples.append((os.path.abspath(path), label, path))
+
+    codes = [_read(path) for _, _, path in samples]
+    features = extract_features(codes)
+    with open(FEATURES_PATH, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['source', 'sha1', 'label', *FEATURES])
+        for (source, label, _), code, row in zip(samples, codes, features):
+            writer.writerow([source, hashlib.sha1(code.encode('utf-8')).hexdigest(), label,
+                             *(f"{v:.6f}" for v in row)])
+    print(f"Wrote {len(samples)} samples to {os.path.relpath(FEATURES_PATH, BACKEND_DIR)}")
+
+
+def load():
+    from agents.stylometry import FEATURES
+
+    with open(FEATURES_PATH, 'r', newline='', encoding='utf-8') as f:
+        rows = list(csv.DictReader(f))
+    features = np.array([[float(row[name]) for name in FEATURES] for row in rows])
+    labels = np.array([int(row['label']) for row in rows])
+    return features, labels
+
+
+def fit(features, labels):
+    from agents.stylometry import FEATURES, StylometricScorer
+
+    # Each class carries half the loss, however many samples it has
+    sample_weight = np.where(labels == 1, 0.5 / labels.sum(), 0.5 / (len(labels) - labels.sum()))
+    scorer = StylometricScorer(weights={'bias': 0.0, **{name: 0.0 for name in FEATURES}})
+    scorer.calibrate(features, labels, epochs=20000, learning_rate=2.0, l2=0.001, sample_weight=sample_weight,
+                     signs=SIGNS)
+    return scorer
+
+
+def out_of_fold_scores(features, labels):
+    # Deterministic stratified folds: every FOLDS-th sample of each class
+    fold = np.zeros(len(labels), dtype=int)
+    for label in (0, 1):
+        members = np.flatnonzero(labels == label)
+        fold[members] = np.arange(len(members)) % FOLDS
+    scores = np.zeros(len(labels))
+    for k in range(FOLDS):
+        test = fold == k
+        scores[test] = fit(features[~test], labels[~test]).score(features[test])
+    return scores
+
+
+def screened(scores, labels, low: int, high: int):
+    """Held-out precision and recall of the two ranges decided without the LLM. Precision
+    is given at the corpus mix and with both classes equally common."""
+    percent = scores * 100
+    ranges = {'likely_ai': (percent >= high, 1), 'likely_human': (percent <= low, 0)}
+    report = {}
+    for name, (selected, label) in ranges.items():
+        hits = int((selected & (labels == label)).sum())
+        misses = int((selected & (labels != label)).sum())
+        # Recall of the class, and the other class's share that lands here
+        recall = hits / max(int((labels == label).sum()), 1)
+        leak = misses / max(int((labels != label).sum()), 1)
+        report[name] = {
+            'samples': hits + misses,
+            'precision': round(hits / max(hits + misses, 1), 4),
+            'precision_balanced': round(recall / max(recall + leak, 1e-9), 4),
+            'recall': round(recall, 4),
+        }
+    return report
+
+
+def auc(scores, labels) -> float:
+    positive, negative = scores[labels == 1], scores[labels == 0]
+    wins = (positive[:, None] > negative[None, :]).sum() + 0.5 * (positive[:, None] == negative[None, :]).sum()
+    return float(wins / (len(positive) * len(negative)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--extract', action='store_true', help="Rebuild the feature file from the corpus")
+    parser.add_argument('--human', action='append', default=[], help="Directory of human submissions")
+    parser.add_argument('--ai', action='append', default=[], help="Directory of AI-generated submissions")
+    parser.add_argument('--output', default=os.path.join(BACKEND_DIR, 'agents', 'stylometry_weights.json'))
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    if args.extract or args.human or args.ai or not os.path.exists(FEATURES_PATH):
+        extract(args.human, args.ai)
+    features, labels = load()
+
+    scores = out_of_fold_scores(features, labels)
+    human, ai = scores[labels == 0] * 100, scores[labels == 1] * 100
+    low = int(np.floor(np.quantile(ai, MISS_RATE)))
+    high = int(np.ceil(np.quantile(human, 1 - MISS_RATE)))
+    if low > high:
+        # The classes separate: no band, split halfway between the two quantiles
+        low = high = (low + high) // 2
+    report = screened(scores, labels, low, high)
+    if report['likely_human']['precision_balanced'] < MIN_PRECISION:
+        low = -1
+    if report['likely_ai']['precision_balanced'] < MIN_PRECISION:
+        high = 101
+    ambiguous = float(np.mean((scores * 100 > low) & (scores * 100 < high)))
+
+    scorer = fit(features, labels)
+    result = {
+        'weights': {name: round(value, 4) for name, value in scorer.weights.items()},
+        'ambiguous_low': low,
+        'ambiguous_high': high,
+        'calibration': {
+            'samples': {'human': int((labels == 0).sum()), 'ai': int(labels.sum())},
+            'features_file': os.path.relpath(FEATURES_PATH, BACKEND_DIR),
+            'class_weighting': 'balanced',
+            'signs': SIGNS,
+            'miss_rate': MISS_RATE,
+            'min_precision': MIN_PRECISION,
+            'screened_out': screened(scores, labels, low, high),
+            'cross_validated': {
+                'folds': FOLDS,
+                'auc': round(auc(scores, labels), 4),
+                'human_median_score': round(float(np.median(human)), 1),
+                'ai_median_score': round(float(np.median(ai)), 1),
+                'human_flagged_above_band': round(float(np.mean(human >= high)), 4),
+                'ai_cleared_below_band': round(float(np.mean(ai <= low)), 4),
+                'ambiguous_share': round(ambiguous, 4),
+            },
+        },
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+        f.write('\n')
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
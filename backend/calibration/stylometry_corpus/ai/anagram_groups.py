@@ -0,0 +1,40 @@
+from collections import defaultdict
+
+
+def group_anagrams(words):
+    # Use the sorted letters of each word as the key
+    groups = defaultdict(list)
+    for word in words:
+        key = "".join(sorted(word.lower()))
+        groups[key].append(word)
+    # Return only the groups, preserving insertion order
+    return list(groups.values())
+
+
+def are_anagrams(first, second):
+    # Ignore spaces and case when comparing
+    first = first.replace(" ", "").lower()
+    second = second.replace(" ", "").lower()
+    return sorted(first) == sorted(second)
+
+
+def main():
+    # Example list of words to group
+    words = ["listen", "silent", "enlist", "google", "gooegl", "cat", "act", "tac", "dog"]
+
+    # Group the words and print each group
+    print("Anagram groups:")
+    for group in group_anagrams(words):
+        print("  ", ", ".join(group))
+
+    # Check a pair of phrases entered by the user
+    first = input("\nEnter the first word or phrase: ")
+    second = input("Enter the second word or phrase: ")
+    if are_anagrams(first, second):
+        print("These are anagrams!")
+    else:
+        print("These are not anagrams.")
+
+
+if __name__ == "__main__":
+    main()
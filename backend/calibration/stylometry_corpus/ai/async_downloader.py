@@ -0,0 +1,89 @@
+"""
+Asynchronous file downloader using aiohttp.
+
+Downloads multiple files concurrently while limiting the number of
+simultaneous connections.
+"""
+
+import asyncio
+import os
+from urllib.parse import urlparse
+
+import aiohttp
+
+# Maximum number of concurrent downloads
+MAX_CONCURRENT_DOWNLOADS = 5
+DOWNLOAD_DIR = "downloads"
+
+
+async def download_file(session, url, semaphore):
+    """
+    Download a single file and save it to the download directory.
+
+    Args:
+        session (aiohttp.ClientSession): The HTTP session.
+        url (str): The URL of the file to download.
+        semaphore (asyncio.Semaphore): Limits concurrent downloads.
+
+    Returns:
+        tuple: (url, success, message)
+    """
+    filename = os.path.basename(urlparse(url).path) or "index.html"
+    file_path = os.path.join(DOWNLOAD_DIR, filename)
+
+    async with semaphore:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status != 200:
+                    return url, False, f"HTTP {response.status}"
+
+                # Stream the response to a file in chunks
+                with open(file_path, "wb") as file:
+                    async for chunk in response.content.iter_chunked(8192):
+                        file.write(chunk)
+
+            return url, True, f"Saved to {file_path}"
+        except asyncio.TimeoutError:
+            return url, False, "Request timed out"
+        except aiohttp.ClientError as error:
+            return url, False, str(error)
+
+
+async def download_all(urls):
+    """
+    Download all files concurrently.
+
+    Args:
+        urls (list): A list of URLs to download.
+
+    Returns:
+        list: The results of each download.
+    """
+    os.makedirs(DOWNLOAD_DIR, exist_ok=True)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+
+    async with aiohttp.ClientSession() as session:
+        tasks = [download_file(session, url, semaphore) for url in urls]
+        return await asyncio.gather(*tasks)
+
+
+def main():
+    """Entry point of the script."""
+    urls = [
+        "https://example.com/files/report.pdf",
+        "https://example.com/files/image.png",
+        "https://example.com/files/data.csv",
+    ]
+
+    results = asyncio.run(download_all(urls))
+
+    # Print a summary of the downloads
+    successful = sum(1 for _, success, _ in results if success)
+    for url, success, message in results:
+        status = "✔" if success else "✘"
+        print(f"{status} {url}: {message}")
+    print(f"\n{successful}/{len(results)} downloads completed successfully.")
+
+
+if __name__ == "__main__":
+    main()
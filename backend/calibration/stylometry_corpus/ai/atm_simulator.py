@@ -0,0 +1,141 @@
+"""
+ATM Simulator
+
+A console-based ATM that supports PIN verification, balance inquiry,
+deposits, withdrawals, and a transaction history.
+"""
+
+from datetime import datetime
+
+
+class Account:
+    """Represents a bank account with a PIN and transaction history."""
+
+    def __init__(self, account_number: str, pin: str, balance: float = 0.0):
+        """
+        Initialize a new account.
+
+        Args:
+            account_number: The unique account number.
+            pin: The 4-digit PIN for the account.
+            balance: The starting balance.
+        """
+        self.account_number = account_number
+        self._pin = pin
+        self.balance = balance
+        self.transactions = []
+
+    def verify_pin(self, pin: str) -> bool:
+        """Check whether the given PIN matches the account PIN."""
+        return pin == self._pin
+
+    def deposit(self, amount: float) -> None:
+        """
+        Deposit money into the account.
+
+        Args:
+            amount: The amount to deposit.
+
+        Raises:
+            ValueError: If the amount is not positive.
+        """
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive.")
+        self.balance += amount
+        self._record("Deposit", amount)
+
+    def withdraw(self, amount: float) -> None:
+        """
+        Withdraw money from the account.
+
+        Args:
+            amount: The amount to withdraw.
+
+        Raises:
+            ValueError: If the amount is invalid or exceeds the balance.
+        """
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive.")
+        if amount > self.balance:
+            raise ValueError("Insufficient funds.")
+        self.balance -= amount
+        self._record("Withdrawal", amount)
+
+    def _record(self, kind: str, amount: float) -> None:
+        """Add an entry to the transaction history."""
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.transactions.append((timestamp, kind, amount, self.balance))
+
+
+class ATM:
+    """Handles user interaction with an account."""
+
+    MAX_ATTEMPTS = 3
+
+    def __init__(self, accounts: dict):
+        """
+        Initialize the ATM.
+
+        Args:
+            accounts: A dictionary mapping account numbers to Account objects.
+        """
+        self.accounts = accounts
+
+    def login(self):
+        """
+        Prompt for an account number and PIN.
+
+        Returns:
+            The authenticated Account, or None if login fails.
+        """
+        account_number = input("Enter account number: ").strip()
+        account = self.accounts.get(account_number)
+        if account is None:
+            print("Account not found.")
+            return None
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            pin = input("Enter PIN: ").strip()
+            if account.verify_pin(pin):
+                print("Login successful!\n")
+                return account
+            print(f"Incorrect PIN. Attempts remaining: {self.MAX_ATTEMPTS - attempt}")
+
+        print("Too many failed attempts. Card retained.")
+        return None
+
+    def run(self) -> None:
+        """Start the ATM session."""
+        print("=== Welcome to the ATM ===")
+        account = self.login()
+        if account is None:
+            return
+
+        while True:
+            print("1. Check balance\n2. Deposit\n3. Withdraw\n4. Transaction history\n5. Exit")
+            choice = input("Select an option: ").strip()
+            try:
+                if choice == "1":
+                    print(f"Your balance is ${account.balance:.2f}\n")
+                elif choice == "2":
+                    account.deposit(float(input("Amount to deposit: ")))
+                    print("Deposit successful.\n")
+                elif choice == "3":
+                    account.withdraw(float(input("Amount to withdraw: ")))
+                    print("Please take your cash.\n")
+                elif choice == "4":
+                    for timestamp, kind, amount, balance in account.transactions:
+                        print(f"{timestamp} | {kind:<10} | ${amount:>8.2f} | Balance: ${balance:.2f}")
+                    print()
+                elif choice == "5":
+                    print("Thank you for using the ATM. Goodbye!")
+                    break
+                else:
+                    print("Invalid option. Please try again.\n")
+            except ValueError as error:
+                print(f"Error: {error}\n")
+
+
+if __name__ == "__main__":
+    demo_accounts = {"123456": Account("123456", "1234", 500.0)}
+    ATM(demo_accounts).run()
@@ -0,0 +1,119 @@
+class InsufficientFundsError(Exception):
+    """Exception raised when a withdrawal exceeds the available balance."""
+    pass
+
+
+class BankAccount:
+    """
+    A class to represent a bank account.
+
+    Attributes:
+        account_holder (str): The name of the account holder.
+        balance (float): The current balance of the account.
+        transactions (list): A history of all transactions.
+    """
+
+    def __init__(self, account_holder, initial_balance=0.0):
+        """
+        Initialize a new bank account.
+
+        Args:
+            account_holder (str): The name of the account holder.
+            initial_balance (float): The starting balance. Defaults to 0.0.
+        """
+        if initial_balance < 0:
+            raise ValueError("Initial balance cannot be negative.")
+        self.account_holder = account_holder
+        self.balance = initial_balance
+        self.transactions = []
+
+    def deposit(self, amount):
+        """
+        Deposit money into the account.
+
+        Args:
+            amount (float): The amount to deposit.
+
+        Raises:
+            ValueError: If the amount is not positive.
+        """
+        if amount <= 0:
+            raise ValueError("Deposit amount must be positive.")
+        self.balance += amount
+        self.transactions.append(("deposit", amount))
+        print(f"Deposited ${amount:.2f}. New balance: ${self.balance:.2f}")
+
+    def withdraw(self, amount):
+        """
+        Withdraw money from the account.
+
+        Args:
+            amount (float): The amount to withdraw.
+
+        Raises:
+            ValueError: If the amount is not positive.
+            InsufficientFundsError: If the balance is too low.
+        """
+        if amount <= 0:
+            raise ValueError("Withdrawal amount must be positive.")
+        if amount > self.balance:
+            raise InsufficientFundsError(
+                f"Cannot withdraw ${amount:.2f}. Available balance: ${self.balance:.2f}"
+            )
+        self.balance -= amount
+        self.transactions.append(("withdrawal", amount))
+        print(f"Withdrew ${amount:.2f}. New balance: ${self.balance:.2f}")
+
+    def get_balance(self):
+        """
+        Get the current balance.
+
+        Returns:
+            float: The current balance.
+        """
+        return self.balance
+
+    def print_statement(self):
+        """Print a statement of all transactions."""
+        print(f"\nAccount Statement for {self.account_holder}")
+        print("=" * 40)
+        for transaction_type, amount in self.transactions:
+            print(f"{transaction_type.capitalize():<15} ${amount:>10.2f}")
+        print("=" * 40)
+        print(f"{'Current Balance':<15} ${self.balance:>10.2f}\n")
+
+
+class SavingsAccount(BankAccount):
+    """A savings account that earns interest."""
+
+    def __init__(self, account_holder, initial_balance=0.0, interest_rate=0.02):
+        """
+        Initialize a new savings account.
+
+        Args:
+            account_holder (str): The name of the account holder.
+            initial_balance (float): The starting balance.
+            interest_rate (float): The annual interest rate (e.g. 0.02 for 2%).
+        """
+        super().__init__(account_holder, initial_balance)
+        self.interest_rate = interest_rate
+
+    def apply_interest(self):
+        """Apply interest to the current balance."""
+        interest = self.balance * self.interest_rate
+        self.balance += interest
+        self.transactions.append(("interest", interest))
+        print(f"Applied interest of ${interest:.2f}. New balance: ${self.balance:.2f}")
+
+
+# Example usage
+if __name__ == "__main__":
+    account = SavingsAccount("Alice", 1000, interest_rate=0.05)
+    account.deposit(500)
+    try:
+        account.withdraw(2000)
+    except InsufficientFundsError as e:
+        print(f"Error: {e}")
+    account.withdraw(200)
+    account.apply_interest()
+    account.print_statement()
@@ -0,0 +1,45 @@
+import random
+from collections import deque
+
+
+class Customer:
+    def __init__(self, customer_id, arrival_time, service_time):
+        self.customer_id = customer_id
+        self.arrival_time = arrival_time
+        self.service_time = service_time
+
+
+def simulate(num_tellers=2, minutes=120, arrival_prob=0.4, seed=42):
+    random.seed(seed)
+    queue = deque()
+    tellers = [0] * num_tellers
+    wait_times = []
+    next_id = 1
+
+    for minute in range(minutes):
+        if random.random() < arrival_prob:
+            queue.append(Customer(next_id, minute, random.randint(2, 6)))
+            next_id += 1
+
+        for i in range(num_tellers):
+            if tellers[i] > 0:
+                tellers[i] -= 1
+            if tellers[i] == 0 and queue:
+                customer = queue.popleft()
+                wait_times.append(minute - customer.arrival_time)
+                tellers[i] = customer.service_time
+
+    served = len(wait_times)
+    average = sum(wait_times) / served if served else 0
+    return {
+        "served": served,
+        "still_waiting": len(queue),
+        "average_wait": round(average, 2),
+        "max_wait": max(wait_times) if wait_times else 0,
+    }
+
+
+if __name__ == "__main__":
+    for tellers in range(1, 5):
+        stats = simulate(num_tellers=tellers)
+        print(f"Tellers: {tellers} -> {stats}")
@@ -0,0 +1,77 @@
+def binary_search(arr, target):
+    """
+    Perform binary search on a sorted list.
+
+    Args:
+        arr (list): A sorted list of elements.
+        target: The element to search for.
+
+    Returns:
+        int: The index of the target if found, otherwise -1.
+    """
+    left, right = 0, len(arr) - 1
+
+    while left <= right:
+        # Calculate the middle index
+        mid = (left + right) // 2
+
+        # Check if the target is at the middle
+        if arr[mid] == target:
+            return mid
+        # If the target is greater, ignore the left half
+        elif arr[mid] < target:
+            left = mid + 1
+        # If the target is smaller, ignore the right half
+        else:
+            right = mid - 1
+
+    # Target was not found in the list
+    return -1
+
+
+def binary_search_recursive(arr, target, left=0, right=None):
+    """
+    Perform binary search recursively.
+
+    Args:
+        arr (list): A sorted list of elements.
+        target: The element to search for.
+        left (int): The left boundary of the search range.
+        right (int): The right boundary of the search range.
+
+    Returns:
+        int: The index of the target if found, otherwise -1.
+    """
+    if right is None:
+        right = len(arr) - 1
+
+    # Base case: the search range is empty
+    if left > right:
+        return -1
+
+    mid = (left + right) // 2
+
+    if arr[mid] == target:
+        return mid
+    elif arr[mid] < target:
+        return binary_search_recursive(arr, target, mid + 1, right)
+    else:
+        return binary_search_recursive(arr, target, left, mid - 1)
+
+
+# Test the binary search functions
+if __name__ == "__main__":
+    numbers = [2, 5, 8, 12, 16, 23, 38, 56, 72, 91]
+    test_values = [23, 2, 91, 100, -5]
+
+    for value in test_values:
+        iterative_result = binary_search(numbers, value)
+        recursive_result = binary_search_recursive(numbers, value)
+
+        if iterative_result != -1:
+            print(f"Element {value} found at index {iterative_result}")
+        else:
+            print(f"Element {value} not found in the list")
+
+        # Both implementations should return the same result
+        assert iterative_result == recursive_result
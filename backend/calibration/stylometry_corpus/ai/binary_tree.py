@@ -0,0 +1,172 @@
+"""
+Binary Search Tree
+
+Implementation of a binary search tree with insertion, search, deletion,
+and the three depth-first traversal orders.
+"""
+
+from typing import List, Optional
+
+
+class TreeNode:
+    """A single node of the binary search tree."""
+
+    def __init__(self, value: int):
+        self.value = value
+        self.left: Optional["TreeNode"] = None
+        self.right: Optional["TreeNode"] = None
+
+
+class BinarySearchTree:
+    """A binary search tree storing unique integer values."""
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self.root: Optional[TreeNode] = None
+        self.size = 0
+
+    def insert(self, value: int) -> None:
+        """
+        Insert a value into the tree.
+
+        Duplicate values are ignored.
+
+        Args:
+            value: The value to insert.
+        """
+        if self.root is None:
+            self.root = TreeNode(value)
+            self.size += 1
+            return
+
+        current = self.root
+        while True:
+            if value < current.value:
+                if current.left is None:
+                    current.left = TreeNode(value)
+                    self.size += 1
+                    return
+                current = current.left
+            elif value > current.value:
+                if current.right is None:
+                    current.right = TreeNode(value)
+                    self.size += 1
+                    return
+                current = current.right
+            else:
+                # Value already exists in the tree
+                return
+
+    def search(self, value: int) -> bool:
+        """
+        Check whether a value exists in the tree.
+
+        Args:
+            value: The value to look for.
+
+        Returns:
+            True if the value is found, False otherwise.
+        """
+        current = self.root
+        while current is not None:
+            if value == current.value:
+                return True
+            current = current.left if value < current.value else current.right
+        return False
+
+    def delete(self, value: int) -> None:
+        """
+        Remove a value from the tree if it exists.
+
+        Args:
+            value: The value to remove.
+        """
+        self.root = self._delete(self.root, value)
+
+    def _delete(self, node: Optional[TreeNode], value: int) -> Optional[TreeNode]:
+        """Recursively delete a value and return the new subtree root."""
+        if node is None:
+            return None
+        if value < node.value:
+            node.left = self._delete(node.left, value)
+        elif value > node.value:
+            node.right = self._delete(node.right, value)
+        else:
+            self.size -= 1
+            # Node with zero or one child
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Node with two children: use the in-order successor
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value = successor.value
+            self.size += 1  # The recursive call below decrements it again
+            node.right = self._delete(node.right, successor.value)
+        return node
+
+    def inorder(self) -> List[int]:
+        """Return the values in sorted (in-order) order."""
+        result: List[int] = []
+        self._inorder(self.root, result)
+        return result
+
+    def _inorder(self, node: Optional[TreeNode], result: List[int]) -> None:
+        """Helper for in-order traversal."""
+        if node:
+            self._inorder(node.left, result)
+            result.append(node.value)
+            self._inorder(node.right, result)
+
+    def preorder(self) -> List[int]:
+        """Return the values in pre-order."""
+        result: List[int] = []
+
+        def visit(node: Optional[TreeNode]) -> None:
+            if node:
+                result.append(node.value)
+                visit(node.left)
+                visit(node.right)
+
+        visit(self.root)
+        return result
+
+    def postorder(self) -> List[int]:
+        """Return the values in post-order."""
+        result: List[int] = []
+
+        def visit(node: Optional[TreeNode]) -> None:
+            if node:
+                visit(node.left)
+                visit(node.right)
+                result.append(node.value)
+
+        visit(self.root)
+        return result
+
+    def height(self) -> int:
+        """Return the height of the tree (0 for an empty tree)."""
+
+        def node_height(node: Optional[TreeNode]) -> int:
+            if node is None:
+                return 0
+            return 1 + max(node_height(node.left), node_height(node.right))
+
+        return node_height(self.root)
+
+
+if __name__ == "__main__":
+    tree = BinarySearchTree()
+    for number in [50, 30, 70, 20, 40, 60, 80]:
+        tree.insert(number)
+
+    print("In-order:", tree.inorder())
+    print("Pre-order:", tree.preorder())
+    print("Post-order:", tree.postorder())
+    print("Height:", tree.height())
+    print("Search 60:", tree.search(60))
+
+    tree.delete(30)
+    print("After deleting 30:", tree.inorder())
@@ -0,0 +1,86 @@
+"""
+BMI Calculator
+
+A simple program that calculates Body Mass Index (BMI) from a user's
+height and weight and reports the corresponding weight category.
+"""
+
+
+def calculate_bmi(weight_kg: float, height_m: float) -> float:
+    """
+    Calculate the Body Mass Index.
+
+    Args:
+        weight_kg: Weight in kilograms.
+        height_m: Height in meters.
+
+    Returns:
+        The BMI value rounded to one decimal place.
+
+    Raises:
+        ValueError: If height or weight is not positive.
+    """
+    if weight_kg <= 0 or height_m <= 0:
+        raise ValueError("Weight and height must be positive numbers.")
+    return round(weight_kg / (height_m ** 2), 1)
+
+
+def get_bmi_category(bmi: float) -> str:
+    """
+    Determine the BMI category for a given BMI value.
+
+    Args:
+        bmi: The calculated BMI.
+
+    Returns:
+        A string describing the weight category.
+    """
+    if bmi < 18.5:
+        return "Underweight"
+    elif bmi < 25:
+        return "Normal weight"
+    elif bmi < 30:
+        return "Overweight"
+    else:
+        return "Obese"
+
+
+def get_positive_float(prompt: str) -> float:
+    """
+    Prompt the user until they enter a positive number.
+
+    Args:
+        prompt: The message to display to the user.
+
+    Returns:
+        The positive float entered by the user.
+    """
+    while True:
+        try:
+            value = float(input(prompt))
+            if value > 0:
+                return value
+            print("Please enter a number greater than zero.")
+        except ValueError:
+            print("Invalid input. Please enter a numeric value.")
+
+
+def main():
+    """Main function to run the BMI calculator."""
+    print("=== BMI Calculator ===")
+
+    weight = get_positive_float("Enter your weight in kg: ")
+    height_cm = get_positive_float("Enter your height in cm: ")
+
+    # Convert height from centimeters to meters
+    height_m = height_cm / 100
+
+    bmi = calculate_bmi(weight, height_m)
+    category = get_bmi_category(bmi)
+
+    print(f"\nYour BMI is: {bmi}")
+    print(f"Category: {category}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import string
+
+
+def caesar_encrypt(text: str, shift: int) -> str:
+    """
+    Encrypt text using the Caesar cipher.
+
+    Each letter is shifted by a fixed number of positions in the alphabet.
+    Non-alphabetic characters remain unchanged.
+
+    Args:
+        text: The plaintext message.
+        shift: The number of positions to shift.
+
+    Returns:
+        The encrypted message.
+    """
+    result = []
+    shift = shift % 26  # Normalize the shift value
+
+    for char in text:
+        if char.isupper():
+            # Shift uppercase letters
+            result.append(chr((ord(char) - ord("A") + shift) % 26 + ord("A")))
+        elif char.islower():
+            # Shift lowercase letters
+            result.append(chr((ord(char) - ord("a") + shift) % 26 + ord("a")))
+        else:
+            # Keep non-alphabetic characters as they are
+            result.append(char)
+
+    return "".join(result)
+
+
+def caesar_decrypt(text: str, shift: int) -> str:
+    """
+    Decrypt text that was encrypted with the Caesar cipher.
+
+    Args:
+        text: The encrypted message.
+        shift: The shift that was used for encryption.
+
+    Returns:
+        The decrypted message.
+    """
+    return caesar_encrypt(text, -shift)
+
+
+def brute_force_decrypt(text: str) -> list:
+    """
+    Try all possible shifts to decrypt a message.
+
+    Args:
+        text: The encrypted message.
+
+    Returns:
+        A list of (shift, decrypted_text) tuples.
+    """
+    return [(shift, caesar_decrypt(text, shift)) for shift in range(1, 26)]
+
+
+def frequency_analysis(text: str) -> int:
+    """
+    Guess the shift using letter frequency analysis.
+
+    Assumes that the most common letter in the plaintext is 'e'.
+
+    Args:
+        text: The encrypted message.
+
+    Returns:
+        The most likely shift value.
+    """
+    letters = [char.lower() for char in text if char in string.ascii_letters]
+    if not letters:
+        return 0
+    most_common = max(set(letters), key=letters.count)
+    return (ord(most_common) - ord("e")) % 26
+
+
+if __name__ == "__main__":
+    message = "Hello, World! This is a secret message."
+    shift_value = 3
+
+    encrypted = caesar_encrypt(message, shift_value)
+    decrypted = caesar_decrypt(encrypted, shift_value)
+
+    print(f"Original:  {message}")
+    print(f"Encrypted: {encrypted}")
+    print(f"Decrypted: {decrypted}")
+
+    guessed_shift = frequency_analysis(encrypted)
+    print(f"\nGuessed shift using frequency analysis: {guessed_shift}")
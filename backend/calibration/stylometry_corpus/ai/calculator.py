@@ -0,0 +1,81 @@
+# Simple Calculator Program
+# This program performs basic arithmetic operations based on user input.
+
+
+def add(a, b):
+    """Return the sum of two numbers."""
+    return a + b
+
+
+def subtract(a, b):
+    """Return the difference of two numbers."""
+    return a - b
+
+
+def multiply(a, b):
+    """Return the product of two numbers."""
+    return a * b
+
+
+def divide(a, b):
+    """Return the quotient of two numbers. Raises an error if dividing by zero."""
+    if b == 0:
+        raise ZeroDivisionError("Cannot divide by zero!")
+    return a / b
+
+
+def get_number(prompt):
+    """Prompt the user until a valid number is entered."""
+    while True:
+        try:
+            return float(input(prompt))
+        except ValueError:
+            print("Invalid input. Please enter a valid number.")
+
+
+def display_menu():
+    """Display the calculator menu."""
+    print("\n===== Simple Calculator =====")
+    print("1. Add")
+    print("2. Subtract")
+    print("3. Multiply")
+    print("4. Divide")
+    print("5. Exit")
+
+
+def main():
+    # Map menu choices to their corresponding functions
+    operations = {
+        "1": ("+", add),
+        "2": ("-", subtract),
+        "3": ("*", multiply),
+        "4": ("/", divide),
+    }
+
+    while True:
+        display_menu()
+        choice = input("Enter your choice (1-5): ").strip()
+
+        # Exit the program
+        if choice == "5":
+            print("Thank you for using the calculator. Goodbye!")
+            break
+
+        # Validate the user's choice
+        if choice not in operations:
+            print("Invalid choice. Please select a valid option.")
+            continue
+
+        num1 = get_number("Enter the first number: ")
+        num2 = get_number("Enter the second number: ")
+
+        symbol, operation = operations[choice]
+        try:
+            result = operation(num1, num2)
+            print(f"Result: {num1} {symbol} {num2} = {result}")
+        except ZeroDivisionError as error:
+            print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+DEFAULT_CONFIG: Dict[str, Any] = {
+    "app_name": "MyApp",
+    "debug": False,
+    "database": {
+        "host": "localhost",
+        "port": 5432,
+        "name": "app_db",
+    },
+    "logging": {
+        "level": "INFO",
+        "file": "app.log",
+    },
+}
+
+
+class ConfigError(Exception):
+    """Raised when the configuration is invalid."""
+
+
+def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recursively merge two dictionaries.
+
+    Values from `override` take precedence over values in `base`.
+    """
+    merged = base.copy()
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_config_file(path: str) -> Dict[str, Any]:
+    """Load configuration values from a JSON file."""
+    config_path = Path(path)
+    if not config_path.exists():
+        return {}
+    try:
+        with config_path.open("r", encoding="utf-8") as file:
+            return json.load(file)
+    except json.JSONDecodeError as error:
+        raise ConfigError(f"Invalid JSON in config file: {error}") from error
+
+
+def apply_env_overrides(config: Dict[str, Any], prefix: str = "APP_") -> Dict[str, Any]:
+    """
+    Override configuration values using environment variables.
+
+    For example, APP_DATABASE__PORT=5433 overrides config["database"]["port"].
+    """
+    for env_key, env_value in os.environ.items():
+        if not env_key.startswith(prefix):
+            continue
+
+        # Convert the environment variable name into a key path
+        key_path = env_key[len(prefix):].lower().split("__")
+        target = config
+        for key in key_path[:-1]:
+            target = target.setdefault(key, {})
+
+        # Try to parse the value as JSON so numbers and booleans work
+        try:
+            target[key_path[-1]] = json.loads(env_value)
+        except json.JSONDecodeError:
+            target[key_path[-1]] = env_value
+    return config
+
+
+def validate_config(config: Dict[str, Any]) -> None:
+    """Validate required configuration values."""
+    port = config.get("database", {}).get("port")
+    if not isinstance(port, int) or not (1 <= port <= 65535):
+        raise ConfigError("database.port must be an integer between 1 and 65535.")
+
+    level = config.get("logging", {}).get("level")
+    if level not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+        raise ConfigError(f"Invalid logging level: {level}")
+
+
+def load_config(path: str = "config.json") -> Dict[str, Any]:
+    """Load the full configuration from defaults, file, and environment."""
+    config = deep_merge(DEFAULT_CONFIG, load_config_file(path))
+    config = apply_env_overrides(config)
+    validate_config(config)
+    return config
+
+
+if __name__ == "__main__":
+    try:
+        settings = load_config()
+        print(json.dumps(settings, indent=2))
+    except ConfigError as error:
+        print(f"Configuration error: {error}")
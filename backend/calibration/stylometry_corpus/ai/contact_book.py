@@ -0,0 +1,103 @@
+import sqlite3
+from contextlib import closing
+
+DATABASE_NAME = "contacts.db"
+
+
+class ContactBook:
+    """A simple contact book backed by an SQLite database."""
+
+    def __init__(self, db_name=DATABASE_NAME):
+        """Initialize the database connection and create the table if needed."""
+        self.connection = sqlite3.connect(db_name)
+        self.connection.row_factory = sqlite3.Row
+        self._create_table()
+
+    def _create_table(self):
+        """Create the contacts table if it does not exist."""
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS contacts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    phone TEXT NOT NULL,
+                    email TEXT
+                )
+                """
+            )
+
+    def add_contact(self, name, phone, email=None):
+        """Add a new contact to the database."""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO contacts (name, phone, email) VALUES (?, ?, ?)",
+                (name, phone, email),
+            )
+        print(f"Contact '{name}' added with ID {cursor.lastrowid}.")
+        return cursor.lastrowid
+
+    def search_contacts(self, keyword):
+        """Search for contacts by name, phone, or email."""
+        pattern = f"%{keyword}%"
+        with closing(self.connection.cursor()) as cursor:
+            cursor.execute(
+                "SELECT * FROM contacts WHERE name LIKE ? OR phone LIKE ? OR email LIKE ?",
+                (pattern, pattern, pattern),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def update_contact(self, contact_id, name=None, phone=None, email=None):
+        """Update the details of an existing contact."""
+        fields = {"name": name, "phone": phone, "email": email}
+        # Only update the fields that were provided
+        updates = {key: value for key, value in fields.items() if value is not None}
+        if not updates:
+            print("No fields to update.")
+            return False
+
+        set_clause = ", ".join(f"{key} = ?" for key in updates)
+        with self.connection:
+            cursor = self.connection.execute(
+                f"UPDATE contacts SET {set_clause} WHERE id = ?",
+                (*updates.values(), contact_id),
+            )
+        return cursor.rowcount > 0
+
+    def delete_contact(self, contact_id):
+        """Delete a contact by ID."""
+        with self.connection:
+            cursor = self.connection.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+        return cursor.rowcount > 0
+
+    def list_contacts(self):
+        """Return all contacts sorted by name."""
+        cursor = self.connection.execute("SELECT * FROM contacts ORDER BY name")
+        return [dict(row) for row in cursor.fetchall()]
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+
+def display_contacts(contacts):
+    """Print a list of contacts in a table format."""
+    if not contacts:
+        print("No contacts found.")
+        return
+    print(f"{'ID':<5}{'Name':<20}{'Phone':<15}{'Email':<25}")
+    print("-" * 65)
+    for contact in contacts:
+        print(f"{contact['id']:<5}{contact['name']:<20}{contact['phone']:<15}{contact['email'] or '':<25}")
+
+
+if __name__ == "__main__":
+    book = ContactBook(":memory:")
+    book.add_contact("Alice Smith", "555-1234", "alice@example.com")
+    book.add_contact("Bob Johnson", "555-5678")
+    display_contacts(book.list_contacts())
+
+    book.update_contact(2, email="bob@example.com")
+    print("\nSearch results for 'bob':")
+    display_contacts(book.search_contacts("bob"))
+    book.close()
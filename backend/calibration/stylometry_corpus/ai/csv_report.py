@@ -0,0 +1,43 @@
+import csv
+import statistics
+import sys
+from collections import defaultdict
+
+
+def load_sales(path):
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        return [
+            {"region": row["region"], "product": row["product"], "amount": float(row["amount"])}
+            for row in reader
+        ]
+
+
+def summarize(rows, key):
+    groups = defaultdict(list)
+    for row in rows:
+        groups[row[key]].append(row["amount"])
+    summary = []
+    for name, amounts in groups.items():
+        summary.append({
+            key: name,
+            "total": sum(amounts),
+            "average": statistics.mean(amounts),
+            "count": len(amounts),
+        })
+    return sorted(summary, key=lambda s: s["total"], reverse=True)
+
+
+def print_table(summary, key):
+    print(f"{key.title():<15}{'Total':>12}{'Average':>12}{'Count':>8}")
+    print("-" * 47)
+    for item in summary:
+        print(f"{item[key]:<15}{item['total']:>12.2f}{item['average']:>12.2f}{item['count']:>8}")
+    print()
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "sales.csv"
+    rows = load_sales(path)
+    print_table(summarize(rows, "region"), "region")
+    print_table(summarize(rows, "product"), "product")
@@ -0,0 +1,31 @@
+import random
+import re
+import sys
+
+PATTERN = re.compile(r"^(\d*)d(\d+)([+-]\d+)?$")
+
+
+def roll(expression):
+    match = PATTERN.match(expression.replace(" ", "").lower())
+    if not match:
+        raise ValueError(f"Invalid dice expression: {expression}")
+    count = int(match.group(1) or 1)
+    sides = int(match.group(2))
+    modifier = int(match.group(3) or 0)
+    rolls = [random.randint(1, sides) for _ in range(count)]
+    return rolls, sum(rolls) + modifier
+
+
+def main():
+    args = sys.argv[1:] or ["2d6"]
+    for expression in args:
+        try:
+            rolls, total = roll(expression)
+        except ValueError as e:
+            print(e)
+            continue
+        print(f"{expression}: {rolls} = {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import heapq
+
+
+def dijkstra(graph, start):
+    distances = {node: float("inf") for node in graph}
+    distances[start] = 0
+    previous = {node: None for node in graph}
+    heap = [(0, start)]
+    visited = set()
+
+    while heap:
+        dist, node = heapq.heappop(heap)
+        if node in visited:
+            continue
+        visited.add(node)
+        for neighbor, weight in graph[node].items():
+            new_dist = dist + weight
+            if new_dist < distances[neighbor]:
+                distances[neighbor] = new_dist
+                previous[neighbor] = node
+                heapq.heappush(heap, (new_dist, neighbor))
+    return distances, previous
+
+
+def shortest_path(previous, target):
+    path = []
+    while target is not None:
+        path.append(target)
+        target = previous[target]
+    return path[::-1]
+
+
+if __name__ == "__main__":
+    graph = {
+        "A": {"B": 4, "C": 2},
+        "B": {"C": 5, "D": 10},
+        "C": {"E": 3},
+        "D": {"F": 11},
+        "E": {"D": 4},
+        "F": {},
+    }
+    distances, previous = dijkstra(graph, "A")
+    for node in graph:
+        print(f"A -> {node}: {distances[node]} via {' -> '.join(shortest_path(previous, node))}")
@@ -0,0 +1,86 @@
+import re
+
+# Regular expression pattern for validating email addresses
+EMAIL_PATTERN = re.compile(
+    r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+)
+
+
+def is_valid_email(email: str) -> bool:
+    """
+    Validate an email address using a regular expression.
+
+    Args:
+        email (str): The email address to validate.
+
+    Returns:
+        bool: True if the email is valid, False otherwise.
+    """
+    if not isinstance(email, str):
+        return False
+
+    email = email.strip()
+
+    # Check the overall length constraints
+    if len(email) > 254:
+        return False
+
+    if not EMAIL_PATTERN.match(email):
+        return False
+
+    local_part, domain = email.rsplit("@", 1)
+
+    # The local part cannot exceed 64 characters
+    if len(local_part) > 64:
+        return False
+
+    # Consecutive dots are not allowed
+    if ".." in email:
+        return False
+
+    # The local part cannot start or end with a dot
+    if local_part.startswith(".") or local_part.endswith("."):
+        return False
+
+    return True
+
+
+def validate_emails(emails: list) -> dict:
+    """
+    Validate a list of email addresses.
+
+    Args:
+        emails (list): A list of email addresses.
+
+    Returns:
+        dict: A dictionary with 'valid' and 'invalid' lists.
+    """
+    results = {"valid": [], "invalid": []}
+    for email in emails:
+        if is_valid_email(email):
+            results["valid"].append(email)
+        else:
+            results["invalid"].append(email)
+    return results
+
+
+if __name__ == "__main__":
+    test_emails = [
+        "user@example.com",
+        "john.doe@company.co.uk",
+        "invalid.email@",
+        "@missing-local.com",
+        "no-at-symbol.com",
+        "double..dot@example.com",
+        "valid_user+tag@sub.domain.org",
+    ]
+
+    results = validate_emails(test_emails)
+
+    print("Valid emails:")
+    for email in results["valid"]:
+        print(f"  ✔ {email}")
+
+    print("\nInvalid emails:")
+    for email in results["invalid"]:
+        print(f"  ✘ {email}")
@@ -0,0 +1,92 @@
+from abc import ABC, abstractmethod
+
+
+class Employee(ABC):
+    """Abstract base class for all employees."""
+
+    def __init__(self, employee_id: int, name: str):
+        self.employee_id = employee_id
+        self.name = name
+
+    @abstractmethod
+    def calculate_salary(self) -> float:
+        """Calculate the employee's monthly salary."""
+        pass
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}(id={self.employee_id}, name={self.name})"
+
+
+class FullTimeEmployee(Employee):
+    """An employee with a fixed monthly salary."""
+
+    def __init__(self, employee_id: int, name: str, monthly_salary: float):
+        super().__init__(employee_id, name)
+        self.monthly_salary = monthly_salary
+
+    def calculate_salary(self) -> float:
+        return self.monthly_salary
+
+
+class PartTimeEmployee(Employee):
+    """An employee paid by the hour."""
+
+    def __init__(self, employee_id: int, name: str, hours_worked: float, hourly_rate: float):
+        super().__init__(employee_id, name)
+        self.hours_worked = hours_worked
+        self.hourly_rate = hourly_rate
+
+    def calculate_salary(self) -> float:
+        return self.hours_worked * self.hourly_rate
+
+
+class Manager(FullTimeEmployee):
+    """A full-time employee who manages a team and receives a bonus."""
+
+    def __init__(self, employee_id: int, name: str, monthly_salary: float, bonus: float):
+        super().__init__(employee_id, name, monthly_salary)
+        self.bonus = bonus
+        self.team = []
+
+    def add_team_member(self, employee: Employee) -> None:
+        """Add an employee to the manager's team."""
+        self.team.append(employee)
+
+    def calculate_salary(self) -> float:
+        return self.monthly_salary + self.bonus
+
+
+class PayrollSystem:
+    """Handles payroll processing for a list of employees."""
+
+    def __init__(self):
+        self.employees = []
+
+    def add_employee(self, employee: Employee) -> None:
+        self.employees.append(employee)
+
+    def calculate_payroll(self) -> None:
+        """Print the salary for each employee and the total payroll."""
+        print("Calculating Payroll")
+        print("=" * 40)
+        total = 0.0
+        for employee in self.employees:
+            salary = employee.calculate_salary()
+            total += salary
+            print(f"{employee.name:<20} ${salary:>12,.2f}")
+        print("=" * 40)
+        print(f"{'Total payroll':<20} ${total:>12,.2f}")
+
+
+if __name__ == "__main__":
+    manager = Manager(1, "Sarah Connor", 6000, 1500)
+    developer = FullTimeEmployee(2, "John Smith", 4500)
+    intern = PartTimeEmployee(3, "Emily Davis", 80, 20)
+
+    manager.add_team_member(developer)
+    manager.add_team_member(intern)
+
+    payroll = PayrollSystem()
+    for emp in (manager, developer, intern):
+        payroll.add_employee(emp)
+    payroll.calculate_payroll()
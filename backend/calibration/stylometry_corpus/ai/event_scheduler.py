@@ -0,0 +1,113 @@
+"""
+Event Scheduler
+
+A simple calendar application that lets users add events, detect
+scheduling conflicts, and list upcoming events for a given day.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List
+
+
+@dataclass(order=True)
+class Event:
+    """Represents a calendar event."""
+
+    start: datetime
+    end: datetime
+    title: str = field(compare=False)
+    location: str = field(default="", compare=False)
+
+    def overlaps(self, other: "Event") -> bool:
+        """
+        Check whether this event overlaps with another event.
+
+        Args:
+            other: The event to compare with.
+
+        Returns:
+            True if the two events overlap in time.
+        """
+        return self.start < other.end and other.start < self.end
+
+    def duration(self) -> timedelta:
+        """Return the duration of the event."""
+        return self.end - self.start
+
+
+class Scheduler:
+    """Manages a collection of events."""
+
+    def __init__(self):
+        """Initialize an empty scheduler."""
+        self.events: List[Event] = []
+
+    def add_event(self, event: Event, allow_conflicts: bool = False) -> bool:
+        """
+        Add an event to the schedule.
+
+        Args:
+            event: The event to add.
+            allow_conflicts: Whether overlapping events are permitted.
+
+        Returns:
+            True if the event was added, False if it conflicts with another event.
+        """
+        if event.end <= event.start:
+            raise ValueError("Event end time must be after its start time.")
+
+        conflicts = self.find_conflicts(event)
+        if conflicts and not allow_conflicts:
+            print(f"Cannot add '{event.title}': conflicts with {[e.title for e in conflicts]}")
+            return False
+
+        self.events.append(event)
+        self.events.sort()
+        return True
+
+    def find_conflicts(self, event: Event) -> List[Event]:
+        """
+        Find all events that overlap with the given event.
+
+        Args:
+            event: The event to check.
+
+        Returns:
+            A list of conflicting events.
+        """
+        return [existing for existing in self.events if existing.overlaps(event)]
+
+    def events_on(self, day: datetime) -> List[Event]:
+        """
+        Get all events that start on the given day.
+
+        Args:
+            day: The day to look up.
+
+        Returns:
+            A sorted list of events on that day.
+        """
+        return [event for event in self.events if event.start.date() == day.date()]
+
+    def print_day(self, day: datetime) -> None:
+        """Print a formatted agenda for the given day."""
+        events = self.events_on(day)
+        print(f"\nAgenda for {day.strftime('%A, %B %d, %Y')}:")
+        if not events:
+            print("  No events scheduled.")
+            return
+        for event in events:
+            location = f" @ {event.location}" if event.location else ""
+            print(f"  {event.start:%H:%M}-{event.end:%H:%M}  {event.title}{location}")
+
+
+if __name__ == "__main__":
+    scheduler = Scheduler()
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    scheduler.add_event(Event(today + timedelta(hours=9), today + timedelta(hours=10), "Team meeting", "Room A"))
+    scheduler.add_event(Event(today + timedelta(hours=12), today + timedelta(hours=13), "Lunch"))
+    scheduler.add_event(Event(today + timedelta(hours=9, minutes=30), today + timedelta(hours=11), "Code review"))
+
+    scheduler.print_day(today)
@@ -0,0 +1,96 @@
+import csv
+import os
+from collections import defaultdict
+from datetime import date
+
+EXPENSES_FILE = "expenses.csv"
+CATEGORIES = ["Food", "Transport", "Entertainment", "Utilities", "Shopping", "Other"]
+
+
+def initialize_file():
+    """Create the expenses file with a header row if it does not exist."""
+    if not os.path.exists(EXPENSES_FILE):
+        with open(EXPENSES_FILE, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["date", "category", "description", "amount"])
+
+
+def add_expense():
+    """Prompt the user for expense details and save them to the file."""
+    print("\nCategories:")
+    for index, category in enumerate(CATEGORIES, start=1):
+        print(f"  {index}. {category}")
+
+    try:
+        category_index = int(input("Select a category (1-6): ")) - 1
+        if category_index not in range(len(CATEGORIES)):
+            raise ValueError
+        description = input("Enter a description: ").strip()
+        amount = float(input("Enter the amount: $"))
+        if amount <= 0:
+            raise ValueError
+    except ValueError:
+        print("Invalid input. Expense not added.")
+        return
+
+    with open(EXPENSES_FILE, "a", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow([date.today().isoformat(), CATEGORIES[category_index], description, f"{amount:.2f}"])
+    print("Expense added successfully!")
+
+
+def load_expenses():
+    """Load all expenses from the file."""
+    with open(EXPENSES_FILE, newline="") as file:
+        reader = csv.DictReader(file)
+        return [
+            {**row, "amount": float(row["amount"])}
+            for row in reader
+        ]
+
+
+def view_summary():
+    """Display a summary of expenses grouped by category."""
+    expenses = load_expenses()
+    if not expenses:
+        print("No expenses recorded yet.")
+        return
+
+    totals = defaultdict(float)
+    for expense in expenses:
+        totals[expense["category"]] += expense["amount"]
+
+    grand_total = sum(totals.values())
+    print("\nExpense Summary by Category")
+    print("-" * 35)
+    for category, total in sorted(totals.items(), key=lambda item: item[1], reverse=True):
+        percentage = (total / grand_total) * 100
+        print(f"{category:<15} ${total:>9.2f} ({percentage:5.1f}%)")
+    print("-" * 35)
+    print(f"{'Total':<15} ${grand_total:>9.2f}")
+
+
+def main():
+    """Main menu loop for the expense tracker."""
+    initialize_file()
+    menu = {"1": add_expense, "2": view_summary}
+
+    while True:
+        print("\n=== Expense Tracker ===")
+        print("1. Add expense")
+        print("2. View summary")
+        print("3. Exit")
+        choice = input("Choose an option: ").strip()
+
+        if choice == "3":
+            print("Goodbye!")
+            break
+        action = menu.get(choice)
+        if action:
+            action()
+        else:
+            print("Invalid option. Please try again.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, status
+from pydantic import BaseModel, Field
+
+app = FastAPI(title="Task Manager API", version="1.0.0")
+
+
+class TaskCreate(BaseModel):
+    title: str = Field(..., min_length=1, max_length=100)
+    description: Optional[str] = None
+    priority: int = Field(default=1, ge=1, le=5)
+
+
+class TaskUpdate(BaseModel):
+    title: Optional[str] = Field(None, min_length=1, max_length=100)
+    description: Optional[str] = None
+    priority: Optional[int] = Field(None, ge=1, le=5)
+    completed: Optional[bool] = None
+
+
+class Task(TaskCreate):
+    id: int
+    completed: bool = False
+    created_at: datetime
+
+
+# In-memory storage
+tasks_db: dict[int, Task] = {}
+next_id = 1
+
+
+@app.get("/tasks", response_model=List[Task])
+def list_tasks(completed: Optional[bool] = None):
+    """List all tasks, optionally filtered by completion status."""
+    tasks = list(tasks_db.values())
+    if completed is not None:
+        tasks = [task for task in tasks if task.completed == completed]
+    return sorted(tasks, key=lambda task: task.priority, reverse=True)
+
+
+@app.get("/tasks/{task_id}", response_model=Task)
+def get_task(task_id: int):
+    """Get a single task by its ID."""
+    if task_id not in tasks_db:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    return tasks_db[task_id]
+
+
+@app.post("/tasks", response_model=Task, status_code=status.HTTP_201_CREATED)
+def create_task(task_in: TaskCreate):
+    """Create a new task."""
+    global next_id
+    task = Task(id=next_id, created_at=datetime.utcnow(), **task_in.dict())
+    tasks_db[next_id] = task
+    next_id += 1
+    return task
+
+
+@app.patch("/tasks/{task_id}", response_model=Task)
+def update_task(task_id: int, task_update: TaskUpdate):
+    """Partially update an existing task."""
+    if task_id not in tasks_db:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+
+    stored_task = tasks_db[task_id]
+    update_data = task_update.dict(exclude_unset=True)
+    updated_task = stored_task.copy(update=update_data)
+    tasks_db[task_id] = updated_task
+    return updated_task
+
+
+@app.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_task(task_id: int):
+    """Delete a task."""
+    if task_id not in tasks_db:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    del tasks_db[task_id]
@@ -0,0 +1,109 @@
+"""
+Fibonacci Sequence Generator
+
+This module demonstrates three different approaches to computing
+Fibonacci numbers: recursive, iterative, and memoized.
+"""
+
+import time
+from functools import lru_cache
+
+
+def fibonacci_recursive(n: int) -> int:
+    """
+    Calculate the nth Fibonacci number using simple recursion.
+
+    Note: This approach has exponential time complexity O(2^n).
+
+    Args:
+        n: The position in the Fibonacci sequence.
+
+    Returns:
+        The nth Fibonacci number.
+    """
+    if n <= 1:
+        return n
+    return fibonacci_recursive(n - 1) + fibonacci_recursive(n - 2)
+
+
+def fibonacci_iterative(n: int) -> int:
+    """
+    Calculate the nth Fibonacci number using iteration.
+
+    This approach has linear time complexity O(n).
+
+    Args:
+        n: The position in the Fibonacci sequence.
+
+    Returns:
+        The nth Fibonacci number.
+    """
+    if n <= 1:
+        return n
+    previous, current = 0, 1
+    for _ in range(2, n + 1):
+        previous, current = current, previous + current
+    return current
+
+
+@lru_cache(maxsize=None)
+def fibonacci_memoized(n: int) -> int:
+    """
+    Calculate the nth Fibonacci number using memoization.
+
+    Results are cached so each value is only computed once.
+
+    Args:
+        n: The position in the Fibonacci sequence.
+
+    Returns:
+        The nth Fibonacci number.
+    """
+    if n <= 1:
+        return n
+    return fibonacci_memoized(n - 1) + fibonacci_memoized(n - 2)
+
+
+def generate_sequence(length: int) -> list:
+    """
+    Generate a list containing the first `length` Fibonacci numbers.
+
+    Args:
+        length: The number of Fibonacci numbers to generate.
+
+    Returns:
+        A list of Fibonacci numbers.
+    """
+    return [fibonacci_iterative(i) for i in range(length)]
+
+
+def measure_time(func, n: int) -> float:
+    """
+    Measure the execution time of a Fibonacci function.
+
+    Args:
+        func: The function to time.
+        n: The input value.
+
+    Returns:
+        The elapsed time in seconds.
+    """
+    start_time = time.perf_counter()
+    func(n)
+    end_time = time.perf_counter()
+    return end_time - start_time
+
+
+if __name__ == "__main__":
+    n = 30
+    print(f"First 15 Fibonacci numbers: {generate_sequence(15)}")
+    print()
+
+    # Compare the performance of each approach
+    for name, func in [
+        ("Recursive", fibonacci_recursive),
+        ("Iterative", fibonacci_iterative),
+        ("Memoized", fibonacci_memoized),
+    ]:
+        elapsed = measure_time(func, n)
+        print(f"{name:<10} fib({n}) = {func(n):<10} Time: {elapsed:.6f} seconds")
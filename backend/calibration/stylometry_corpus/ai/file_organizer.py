@@ -0,0 +1,106 @@
+"""
+File Organizer Script
+
+Organizes files in a directory into subfolders based on their file type.
+For example, images are moved to 'Images', documents to 'Documents', etc.
+"""
+
+import logging
+import shutil
+from pathlib import Path
+
+# Configure logging to display informative messages
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+# Mapping of folder names to the file extensions they contain
+FILE_CATEGORIES = {
+    "Images": [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".svg"],
+    "Documents": [".pdf", ".docx", ".doc", ".txt", ".xlsx", ".pptx", ".csv"],
+    "Audio": [".mp3", ".wav", ".aac", ".flac"],
+    "Videos": [".mp4", ".mkv", ".avi", ".mov"],
+    "Archives": [".zip", ".rar", ".tar", ".gz", ".7z"],
+    "Code": [".py", ".js", ".html", ".css", ".java", ".cpp"],
+}
+
+
+def get_category(file_extension: str) -> str:
+    """
+    Determine the category of a file based on its extension.
+
+    Args:
+        file_extension: The file extension (including the dot).
+
+    Returns:
+        The name of the category folder.
+    """
+    for category, extensions in FILE_CATEGORIES.items():
+        if file_extension.lower() in extensions:
+            return category
+    return "Others"
+
+
+def get_unique_path(destination: Path) -> Path:
+    """
+    Generate a unique file path to avoid overwriting existing files.
+
+    Args:
+        destination: The desired destination path.
+
+    Returns:
+        A path that does not yet exist.
+    """
+    counter = 1
+    unique_path = destination
+    while unique_path.exists():
+        unique_path = destination.with_name(f"{destination.stem}_{counter}{destination.suffix}")
+        counter += 1
+    return unique_path
+
+
+def organize_directory(directory: str, dry_run: bool = False) -> dict:
+    """
+    Organize all files in the given directory into category folders.
+
+    Args:
+        directory: The path of the directory to organize.
+        dry_run: If True, only log the actions without moving files.
+
+    Returns:
+        A dictionary with the number of files moved per category.
+    """
+    source_dir = Path(directory)
+    if not source_dir.is_dir():
+        raise NotADirectoryError(f"'{directory}' is not a valid directory.")
+
+    summary = {}
+    for item in source_dir.iterdir():
+        # Skip directories and hidden files
+        if item.is_dir() or item.name.startswith("."):
+            continue
+
+        category = get_category(item.suffix)
+        target_dir = source_dir / category
+        target_path = get_unique_path(target_dir / item.name)
+
+        if dry_run:
+            logger.info(f"[DRY RUN] Would move {item.name} -> {category}/")
+        else:
+            target_dir.mkdir(exist_ok=True)
+            shutil.move(str(item), str(target_path))
+            logger.info(f"Moved {item.name} -> {category}/")
+
+        summary[category] = summary.get(category, 0) + 1
+
+    return summary
+
+
+if __name__ == "__main__":
+    folder = input("Enter the directory to organize: ").strip()
+    try:
+        results = organize_directory(folder)
+        print("\nSummary:")
+        for category, count in results.items():
+            print(f"  {category}: {count} file(s)")
+    except NotADirectoryError as error:
+        logger.error(error)
@@ -0,0 +1,104 @@
+"""
+Flashcard Quiz
+
+A command-line flashcard program that loads question/answer pairs from a
+JSON file, quizzes the user in random order, and tracks their score.
+"""
+
+import json
+import os
+import random
+
+DECK_FILE = "flashcards.json"
+
+# Sample deck used when no deck file exists
+DEFAULT_DECK = [
+    {"question": "What is the capital of France?", "answer": "Paris"},
+    {"question": "What is 7 x 8?", "answer": "56"},
+    {"question": "Which planet is known as the Red Planet?", "answer": "Mars"},
+    {"question": "What is the chemical symbol for gold?", "answer": "Au"},
+]
+
+
+def load_deck(path: str = DECK_FILE) -> list:
+    """
+    Load flashcards from a JSON file.
+
+    Args:
+        path: Path to the deck file.
+
+    Returns:
+        A list of flashcard dictionaries.
+    """
+    if not os.path.exists(path):
+        return list(DEFAULT_DECK)
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save_deck(deck: list, path: str = DECK_FILE) -> None:
+    """
+    Save flashcards to a JSON file.
+
+    Args:
+        deck: The list of flashcards.
+        path: Path to the deck file.
+    """
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(deck, file, indent=4)
+
+
+def add_card(deck: list) -> None:
+    """Prompt the user for a new flashcard and add it to the deck."""
+    question = input("Question: ").strip()
+    answer = input("Answer: ").strip()
+    if question and answer:
+        deck.append({"question": question, "answer": answer})
+        save_deck(deck)
+        print("Card added!")
+    else:
+        print("Both question and answer are required.")
+
+
+def quiz(deck: list) -> None:
+    """
+    Quiz the user on every card in the deck.
+
+    Args:
+        deck: The list of flashcards.
+    """
+    cards = deck[:]
+    random.shuffle(cards)
+    score = 0
+
+    for number, card in enumerate(cards, start=1):
+        response = input(f"\n({number}/{len(cards)}) {card['question']} ")
+        if response.strip().lower() == card["answer"].lower():
+            print("Correct!")
+            score += 1
+        else:
+            print(f"Wrong. The answer is: {card['answer']}")
+
+    percentage = score / len(cards) * 100 if cards else 0
+    print(f"\nYou scored {score}/{len(cards)} ({percentage:.0f}%)")
+
+
+def main() -> None:
+    """Display the main menu and handle user choices."""
+    deck = load_deck()
+    while True:
+        print("\n1. Start quiz\n2. Add card\n3. Exit")
+        choice = input("Choose an option: ").strip()
+        if choice == "1":
+            quiz(deck)
+        elif choice == "2":
+            add_card(deck)
+        elif choice == "3":
+            print("Goodbye!")
+            break
+        else:
+            print("Invalid choice, please try again.")
+
+
+if __name__ == "__main__":
+    main()
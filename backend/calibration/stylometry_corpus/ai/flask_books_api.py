@@ -0,0 +1,91 @@
+from flask import Flask, jsonify, request
+
+app = Flask(__name__)
+
+# In-memory database for storing books
+books = [
+    {"id": 1, "title": "To Kill a Mockingbird", "author": "Harper Lee", "year": 1960},
+    {"id": 2, "title": "1984", "author": "George Orwell", "year": 1949},
+]
+
+
+def find_book(book_id):
+    """Helper function to find a book by its ID."""
+    return next((book for book in books if book["id"] == book_id), None)
+
+
+@app.route("/api/books", methods=["GET"])
+def get_books():
+    """Retrieve all books."""
+    return jsonify(books), 200
+
+
+@app.route("/api/books/<int:book_id>", methods=["GET"])
+def get_book(book_id):
+    """Retrieve a single book by ID."""
+    book = find_book(book_id)
+    if book is None:
+        return jsonify({"error": "Book not found"}), 404
+    return jsonify(book), 200
+
+
+@app.route("/api/books", methods=["POST"])
+def create_book():
+    """Create a new book."""
+    data = request.get_json()
+
+    # Validate required fields
+    if not data or not all(key in data for key in ("title", "author", "year")):
+        return jsonify({"error": "Missing required fields: title, author, year"}), 400
+
+    new_book = {
+        "id": max((book["id"] for book in books), default=0) + 1,
+        "title": data["title"],
+        "author": data["author"],
+        "year": data["year"],
+    }
+    books.append(new_book)
+    return jsonify(new_book), 201
+
+
+@app.route("/api/books/<int:book_id>", methods=["PUT"])
+def update_book(book_id):
+    """Update an existing book."""
+    book = find_book(book_id)
+    if book is None:
+        return jsonify({"error": "Book not found"}), 404
+
+    data = request.get_json()
+    if not data:
+        return jsonify({"error": "No data provided"}), 400
+
+    # Update only the fields that were provided
+    book.update({key: value for key, value in data.items() if key in ("title", "author", "year")})
+    return jsonify(book), 200
+
+
+@app.route("/api/books/<int:book_id>", methods=["DELETE"])
+def delete_book(book_id):
+    """Delete a book by ID."""
+    book = find_book(book_id)
+    if book is None:
+        return jsonify({"error": "Book not found"}), 404
+
+    books.remove(book)
+    return jsonify({"message": "Book deleted successfully"}), 200
+
+
+@app.errorhandler(404)
+def not_found(error):
+    """Handle 404 errors."""
+    return jsonify({"error": "Resource not found"}), 404
+
+
+@app.errorhandler(500)
+def internal_error(error):
+    """Handle 500 errors."""
+    return jsonify({"error": "Internal server error"}), 500
+
+
+if __name__ == "__main__":
+    app.run(debug=True)
@@ -0,0 +1,50 @@
+import requests
+
+
+class GitHubClient:
+    BASE_URL = "https://api.github.com"
+
+    def __init__(self, token=None):
+        self.session = requests.Session()
+        self.session.headers.update({"Accept": "application/vnd.github+json"})
+        if token:
+            self.session.headers["Authorization"] = f"Bearer {token}"
+
+    def _get(self, path, params=None):
+        response = self.session.get(f"{self.BASE_URL}{path}", params=params, timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def get_user(self, username):
+        return self._get(f"/users/{username}")
+
+    def list_repos(self, username, sort="updated"):
+        repos = []
+        page = 1
+        while True:
+            batch = self._get(f"/users/{username}/repos", {"per_page": 100, "page": page, "sort": sort})
+            if not batch:
+                break
+            repos.extend(batch)
+            page += 1
+        return repos
+
+    def top_languages(self, username):
+        counts = {}
+        for repo in self.list_repos(username):
+            language = repo.get("language")
+            if language:
+                counts[language] = counts.get(language, 0) + 1
+        return sorted(counts.items(), key=lambda item: item[1], reverse=True)
+
+
+if __name__ == "__main__":
+    client = GitHubClient()
+    name = input("GitHub username: ").strip()
+    try:
+        user = client.get_user(name)
+        print(f"{user['name'] or name} - {user['public_repos']} public repos, {user['followers']} followers")
+        for language, count in client.top_languages(name)[:5]:
+            print(f"  {language}: {count}")
+    except requests.HTTPError as e:
+        print(f"Request failed: {e}")
@@ -0,0 +1,98 @@
+from collections import deque
+from typing import Dict, List, Optional, Set
+
+
+class Graph:
+    """An undirected graph represented with an adjacency list."""
+
+    def __init__(self) -> None:
+        self.adjacency_list: Dict[str, List[str]] = {}
+
+    def add_vertex(self, vertex: str) -> None:
+        if vertex not in self.adjacency_list:
+            self.adjacency_list[vertex] = []
+
+    def add_edge(self, vertex1: str, vertex2: str) -> None:
+        self.add_vertex(vertex1)
+        self.add_vertex(vertex2)
+        self.adjacency_list[vertex1].append(vertex2)
+        self.adjacency_list[vertex2].append(vertex1)
+
+    def bfs(self, start: str) -> List[str]:
+        """Breadth-first traversal starting from the given vertex."""
+        visited: Set[str] = {start}
+        queue = deque([start])
+        order = []
+
+        while queue:
+            vertex = queue.popleft()
+            order.append(vertex)
+            for neighbor in self.adjacency_list[vertex]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+
+        return order
+
+    def dfs(self, start: str, visited: Optional[Set[str]] = None) -> List[str]:
+        """Depth-first traversal starting from the given vertex."""
+        if visited is None:
+            visited = set()
+        visited.add(start)
+        order = [start]
+
+        for neighbor in self.adjacency_list[start]:
+            if neighbor not in visited:
+                order.extend(self.dfs(neighbor, visited))
+
+        return order
+
+    def shortest_path(self, start: str, end: str) -> Optional[List[str]]:
+        """Find the shortest path between two vertices using BFS."""
+        if start not in self.adjacency_list or end not in self.adjacency_list:
+            return None
+
+        queue = deque([[start]])
+        visited = {start}
+
+        while queue:
+            path = queue.popleft()
+            vertex = path[-1]
+
+            if vertex == end:
+                return path
+
+            for neighbor in self.adjacency_list[vertex]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(path + [neighbor])
+
+        return None
+
+    def has_cycle(self) -> bool:
+        """Check whether the graph contains a cycle."""
+        visited: Set[str] = set()
+
+        def visit(vertex: str, parent: Optional[str]) -> bool:
+            visited.add(vertex)
+            for neighbor in self.adjacency_list[vertex]:
+                if neighbor not in visited:
+                    if visit(neighbor, vertex):
+                        return True
+                elif neighbor != parent:
+                    return True
+            return False
+
+        return any(visit(v, None) for v in self.adjacency_list if v not in visited)
+
+
+if __name__ == "__main__":
+    graph = Graph()
+    edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("D", "F"), ("E", "F")]
+    for u, v in edges:
+        graph.add_edge(u, v)
+
+    print("BFS from A:", graph.bfs("A"))
+    print("DFS from A:", graph.dfs("A"))
+    print("Shortest path A -> F:", graph.shortest_path("A", "F"))
+    print("Contains cycle:", graph.has_cycle())
@@ -0,0 +1,116 @@
+import random
+
+WORDS = ["python", "developer", "keyboard", "algorithm", "function", "variable", "computer"]
+
+HANGMAN_STAGES = [
+    """
+       -----
+       |   |
+           |
+           |
+           |
+           |
+    =========""",
+    """
+       -----
+       |   |
+       O   |
+           |
+           |
+           |
+    =========""",
+    """
+       -----
+       |   |
+       O   |
+       |   |
+           |
+           |
+    =========""",
+    """
+       -----
+       |   |
+       O   |
+      /|   |
+           |
+           |
+    =========""",
+    """
+       -----
+       |   |
+       O   |
+      /|\\  |
+           |
+           |
+    =========""",
+    """
+       -----
+       |   |
+       O   |
+      /|\\  |
+      /    |
+           |
+    =========""",
+    """
+       -----
+       |   |
+       O   |
+      /|\\  |
+      / \\  |
+           |
+    =========""",
+]
+
+
+def display_state(word, guessed_letters, wrong_guesses):
+    """Display the hangman drawing and the current progress of the word."""
+    print(HANGMAN_STAGES[wrong_guesses])
+    # Show guessed letters and underscores for the remaining ones
+    progress = " ".join(letter if letter in guessed_letters else "_" for letter in word)
+    print(f"\nWord: {progress}")
+    print(f"Guessed letters: {', '.join(sorted(guessed_letters)) or 'None'}")
+
+
+def get_guess(guessed_letters):
+    """Prompt the user for a single new letter."""
+    while True:
+        guess = input("Guess a letter: ").lower().strip()
+        if len(guess) != 1 or not guess.isalpha():
+            print("Please enter a single letter.")
+        elif guess in guessed_letters:
+            print("You already guessed that letter.")
+        else:
+            return guess
+
+
+def play_hangman():
+    """Play a game of hangman."""
+    word = random.choice(WORDS)
+    guessed_letters = set()
+    wrong_guesses = 0
+    max_wrong_guesses = len(HANGMAN_STAGES) - 1
+
+    print("Let's play Hangman!")
+
+    while wrong_guesses < max_wrong_guesses:
+        display_state(word, guessed_letters, wrong_guesses)
+        guess = get_guess(guessed_letters)
+        guessed_letters.add(guess)
+
+        if guess in word:
+            print(f"Good job! '{guess}' is in the word.")
+            # Check if all letters have been guessed
+            if all(letter in guessed_letters for letter in word):
+                print(f"\n🎉 You won! The word was '{word}'.")
+                return True
+        else:
+            wrong_guesses += 1
+            print(f"Sorry, '{guess}' is not in the word.")
+
+    display_state(word, guessed_letters, wrong_guesses)
+    print(f"\nGame over! The word was '{word}'.")
+    return False
+
+
+if __name__ == "__main__":
+    play_hangman()
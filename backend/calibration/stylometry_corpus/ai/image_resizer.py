@@ -0,0 +1,89 @@
+"""
+Batch Image Resizer
+
+Resizes all images in a folder to a maximum width and height while
+keeping their aspect ratio. Requires the Pillow library:
+
+    pip install Pillow
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+from PIL import Image
+
+# File extensions that will be processed
+SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp"}
+
+
+def resize_image(source: Path, destination: Path, max_size: tuple) -> bool:
+    """
+    Resize a single image so it fits within max_size.
+
+    Args:
+        source: Path to the original image.
+        destination: Path where the resized image will be saved.
+        max_size: A (width, height) tuple with the maximum dimensions.
+
+    Returns:
+        True if the image was resized successfully, False otherwise.
+    """
+    try:
+        with Image.open(source) as image:
+            original_size = image.size
+            # thumbnail() keeps the aspect ratio and never enlarges the image
+            image.thumbnail(max_size)
+            image.save(destination)
+            print(f"Resized {source.name}: {original_size} -> {image.size}")
+            return True
+    except (OSError, ValueError) as error:
+        print(f"Could not process {source.name}: {error}")
+        return False
+
+
+def process_folder(input_dir: str, output_dir: str, width: int, height: int) -> None:
+    """
+    Resize every supported image in a folder.
+
+    Args:
+        input_dir: Folder containing the original images.
+        output_dir: Folder where resized images are written.
+        width: Maximum width in pixels.
+        height: Maximum height in pixels.
+    """
+    source_folder = Path(input_dir)
+    target_folder = Path(output_dir)
+    target_folder.mkdir(parents=True, exist_ok=True)
+
+    images = [p for p in source_folder.iterdir() if p.suffix.lower() in SUPPORTED_EXTENSIONS]
+    if not images:
+        print("No images found in the input folder.")
+        return
+
+    success_count = 0
+    for image_path in images:
+        if resize_image(image_path, target_folder / image_path.name, (width, height)):
+            success_count += 1
+
+    print(f"\nDone! {success_count} of {len(images)} images resized.")
+
+
+def main() -> None:
+    """Parse command-line arguments and start the resizing process."""
+    parser = argparse.ArgumentParser(description="Batch resize images.")
+    parser.add_argument("input_dir", help="Folder with images to resize")
+    parser.add_argument("output_dir", help="Folder to save resized images")
+    parser.add_argument("--width", type=int, default=800, help="Maximum width (default: 800)")
+    parser.add_argument("--height", type=int, default=600, help="Maximum height (default: 600)")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.input_dir):
+        print(f"Error: {args.input_dir} is not a directory.")
+        return
+
+    process_folder(args.input_dir, args.output_dir, args.width, args.height)
+
+
+if __name__ == "__main__":
+    main()
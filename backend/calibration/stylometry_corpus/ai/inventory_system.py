@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class Product:
+    """Represents a product in the inventory."""
+
+    product_id: str
+    name: str
+    price: float
+    quantity: int = 0
+    category: str = "General"
+
+    @property
+    def total_value(self) -> float:
+        """Calculate the total value of this product in stock."""
+        return self.price * self.quantity
+
+
+@dataclass
+class Inventory:
+    """Manages a collection of products."""
+
+    products: Dict[str, Product] = field(default_factory=dict)
+    low_stock_threshold: int = 5
+
+    def add_product(self, product: Product) -> None:
+        """Add a new product to the inventory."""
+        if product.product_id in self.products:
+            raise ValueError(f"Product with ID {product.product_id} already exists.")
+        self.products[product.product_id] = product
+
+    def remove_product(self, product_id: str) -> None:
+        """Remove a product from the inventory."""
+        if product_id not in self.products:
+            raise KeyError(f"Product with ID {product_id} not found.")
+        del self.products[product_id]
+
+    def update_stock(self, product_id: str, quantity_change: int) -> None:
+        """
+        Update the stock quantity of a product.
+
+        A positive value adds stock, a negative value removes stock.
+        """
+        product = self.get_product(product_id)
+        if product is None:
+            raise KeyError(f"Product with ID {product_id} not found.")
+
+        new_quantity = product.quantity + quantity_change
+        if new_quantity < 0:
+            raise ValueError("Insufficient stock for this operation.")
+        product.quantity = new_quantity
+
+    def get_product(self, product_id: str) -> Optional[Product]:
+        """Retrieve a product by its ID."""
+        return self.products.get(product_id)
+
+    def get_low_stock_products(self) -> List[Product]:
+        """Return a list of products that are below the low stock threshold."""
+        return [p for p in self.products.values() if p.quantity < self.low_stock_threshold]
+
+    def get_products_by_category(self, category: str) -> List[Product]:
+        """Return all products in the given category."""
+        return [p for p in self.products.values() if p.category.lower() == category.lower()]
+
+    def total_inventory_value(self) -> float:
+        """Calculate the total value of all products in the inventory."""
+        return sum(product.total_value for product in self.products.values())
+
+    def generate_report(self) -> str:
+        """Generate a formatted inventory report."""
+        lines = [
+            f"{'ID':<8}{'Name':<20}{'Category':<15}{'Qty':>6}{'Price':>10}{'Value':>12}",
+            "-" * 71,
+        ]
+        for product in sorted(self.products.values(), key=lambda p: p.name):
+            lines.append(
+                f"{product.product_id:<8}{product.name:<20}{product.category:<15}"
+                f"{product.quantity:>6}{product.price:>10.2f}{product.total_value:>12.2f}"
+            )
+        lines.append("-" * 71)
+        lines.append(f"{'Total inventory value:':<59}{self.total_inventory_value():>12.2f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    inventory = Inventory()
+    inventory.add_product(Product("P001", "Laptop", 999.99, 10, "Electronics"))
+    inventory.add_product(Product("P002", "Mouse", 19.99, 3, "Electronics"))
+    inventory.add_product(Product("P003", "Desk Chair", 149.50, 7, "Furniture"))
+
+    inventory.update_stock("P002", 20)
+    inventory.update_stock("P003", -5)
+
+    print(inventory.generate_report())
+
+    low_stock = inventory.get_low_stock_products()
+    if low_stock:
+        print("\nLow stock alert:")
+        for product in low_stock:
+            print(f"  - {product.name}: only {product.quantity} left")
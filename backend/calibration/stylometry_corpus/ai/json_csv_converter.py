@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+JSON to CSV Converter
+
+Converts a JSON file containing a list of objects into a CSV file, and
+vice versa. Nested objects are flattened using dot notation.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from typing import Any, Dict, List
+
+
+def flatten(data: Dict[str, Any], parent_key: str = "", separator: str = ".") -> Dict[str, Any]:
+    """
+    Flatten a nested dictionary.
+
+    Args:
+        data: The dictionary to flatten.
+        parent_key: The prefix for the keys (used in recursion).
+        separator: The string used to join nested keys.
+
+    Returns:
+        A flat dictionary with dot-separated keys.
+    """
+    items = {}
+    for key, value in data.items():
+        new_key = f"{parent_key}{separator}{key}" if parent_key else key
+        if isinstance(value, dict):
+            items.update(flatten(value, new_key, separator))
+        else:
+            items[new_key] = value
+    return items
+
+
+def json_to_csv(input_path: str, output_path: str) -> int:
+    """
+    Convert a JSON file to CSV.
+
+    Args:
+        input_path: Path to the input JSON file.
+        output_path: Path to the output CSV file.
+
+    Returns:
+        The number of rows written.
+    """
+    with open(input_path, "r", encoding="utf-8") as file:
+        records = json.load(file)
+
+    if not isinstance(records, list):
+        raise ValueError("The JSON file must contain a list of objects.")
+
+    rows = [flatten(record) for record in records]
+
+    # Collect all column names while preserving their first-seen order
+    fieldnames: List[str] = []
+    for row in rows:
+        for key in row:
+            if key not in fieldnames:
+                fieldnames.append(key)
+
+    with open(output_path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    return len(rows)
+
+
+def csv_to_json(input_path: str, output_path: str) -> int:
+    """
+    Convert a CSV file to JSON.
+
+    Args:
+        input_path: Path to the input CSV file.
+        output_path: Path to the output JSON file.
+
+    Returns:
+        The number of records written.
+    """
+    with open(input_path, "r", newline="", encoding="utf-8") as file:
+        records = list(csv.DictReader(file))
+
+    with open(output_path, "w", encoding="utf-8") as file:
+        json.dump(records, file, indent=2)
+
+    return len(records)
+
+
+def main() -> None:
+    """Parse command-line arguments and perform the conversion."""
+    parser = argparse.ArgumentParser(description="Convert between JSON and CSV files.")
+    parser.add_argument("input", help="Path to the input file")
+    parser.add_argument("output", help="Path to the output file")
+    args = parser.parse_args()
+
+    try:
+        if args.input.endswith(".json"):
+            count = json_to_csv(args.input, args.output)
+        elif args.input.endswith(".csv"):
+            count = csv_to_json(args.input, args.output)
+        else:
+            print("Error: Input file must be .json or .csv")
+            sys.exit(1)
+        print(f"Successfully converted {count} records to {args.output}")
+    except (OSError, ValueError, json.JSONDecodeError) as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
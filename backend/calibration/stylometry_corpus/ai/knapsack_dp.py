@@ -0,0 +1,33 @@
+def knapsack(weights, values, capacity):
+    # dp[i][w] is the best value using the first i items with capacity w
+    n = len(weights)
+    dp = [[0] * (capacity + 1) for _ in range(n + 1)]
+
+    for i in range(1, n + 1):
+        for w in range(capacity + 1):
+            # Option 1: skip the current item
+            dp[i][w] = dp[i - 1][w]
+            # Option 2: take the current item if it fits
+            if weights[i - 1] <= w:
+                dp[i][w] = max(dp[i][w], dp[i - 1][w - weights[i - 1]] + values[i - 1])
+
+    # Backtrack to find which items were chosen
+    chosen = []
+    w = capacity
+    for i in range(n, 0, -1):
+        if dp[i][w] != dp[i - 1][w]:
+            chosen.append(i - 1)
+            w -= weights[i - 1]
+
+    return dp[n][capacity], sorted(chosen)
+
+
+if __name__ == "__main__":
+    # Example items: (weight, value)
+    weights = [1, 3, 4, 5]
+    values = [1, 4, 5, 7]
+    capacity = 7
+
+    best, items = knapsack(weights, values, capacity)
+    print(f"Maximum value: {best}")
+    print(f"Items chosen (0-indexed): {items}")
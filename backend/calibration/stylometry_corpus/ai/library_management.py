@@ -0,0 +1,126 @@
+"""
+Library Management System
+
+A simple object-oriented library system that allows members to
+borrow and return books.
+"""
+
+from datetime import datetime, timedelta
+
+
+class Book:
+    """Represents a book in the library."""
+
+    def __init__(self, isbn, title, author):
+        self.isbn = isbn
+        self.title = title
+        self.author = author
+        self.is_available = True
+
+    def __str__(self):
+        status = "Available" if self.is_available else "Borrowed"
+        return f"{self.title} by {self.author} (ISBN: {self.isbn}) - {status}"
+
+
+class Member:
+    """Represents a library member."""
+
+    MAX_BOOKS = 3
+
+    def __init__(self, member_id, name):
+        self.member_id = member_id
+        self.name = name
+        self.borrowed_books = {}
+
+    def can_borrow(self):
+        """Check whether the member can borrow more books."""
+        return len(self.borrowed_books) < self.MAX_BOOKS
+
+    def __str__(self):
+        return f"Member {self.member_id}: {self.name} ({len(self.borrowed_books)} books borrowed)"
+
+
+class Library:
+    """Manages the collection of books and members."""
+
+    LOAN_PERIOD_DAYS = 14
+    FINE_PER_DAY = 0.50
+
+    def __init__(self):
+        self.books = {}
+        self.members = {}
+
+    def add_book(self, book):
+        """Add a new book to the library."""
+        self.books[book.isbn] = book
+        print(f"Added book: {book.title}")
+
+    def register_member(self, member):
+        """Register a new library member."""
+        self.members[member.member_id] = member
+        print(f"Registered member: {member.name}")
+
+    def borrow_book(self, member_id, isbn):
+        """Allow a member to borrow a book."""
+        member = self.members.get(member_id)
+        book = self.books.get(isbn)
+
+        # Validate the member and the book
+        if member is None:
+            print("Error: Member not found.")
+            return False
+        if book is None:
+            print("Error: Book not found.")
+            return False
+        if not book.is_available:
+            print(f"Sorry, '{book.title}' is currently not available.")
+            return False
+        if not member.can_borrow():
+            print(f"{member.name} has reached the maximum number of borrowed books.")
+            return False
+
+        # Record the loan with a due date
+        due_date = datetime.now() + timedelta(days=self.LOAN_PERIOD_DAYS)
+        member.borrowed_books[isbn] = due_date
+        book.is_available = False
+        print(f"{member.name} borrowed '{book.title}'. Due date: {due_date:%Y-%m-%d}")
+        return True
+
+    def return_book(self, member_id, isbn, return_date=None):
+        """Process the return of a borrowed book and calculate any fines."""
+        member = self.members.get(member_id)
+        if member is None or isbn not in member.borrowed_books:
+            print("Error: No record of this loan.")
+            return 0.0
+
+        return_date = return_date or datetime.now()
+        due_date = member.borrowed_books.pop(isbn)
+        self.books[isbn].is_available = True
+
+        # Calculate the late fee if the book is overdue
+        days_late = (return_date - due_date).days
+        fine = max(0, days_late) * self.FINE_PER_DAY
+        if fine > 0:
+            print(f"Book returned {days_late} days late. Fine: ${fine:.2f}")
+        else:
+            print("Book returned on time. Thank you!")
+        return fine
+
+    def list_available_books(self):
+        """Display all books that are currently available."""
+        print("\nAvailable books:")
+        for book in self.books.values():
+            if book.is_available:
+                print(f"  - {book}")
+
+
+if __name__ == "__main__":
+    library = Library()
+    library.add_book(Book("978-0451524935", "1984", "George Orwell"))
+    library.add_book(Book("978-0061120084", "To Kill a Mockingbird", "Harper Lee"))
+    library.add_book(Book("978-0743273565", "The Great Gatsby", "F. Scott Fitzgerald"))
+
+    library.register_member(Member(1, "John Doe"))
+    library.borrow_book(1, "978-0451524935")
+    library.list_available_books()
+    library.return_book(1, "978-0451524935", datetime.now() + timedelta(days=20))
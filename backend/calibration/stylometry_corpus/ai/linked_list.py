@@ -0,0 +1,116 @@
+class Node:
+    """A node in a singly linked list."""
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class LinkedList:
+    """A singly linked list implementation."""
+
+    def __init__(self):
+        self.head = None
+        self.size = 0
+
+    def is_empty(self):
+        """Return True if the list is empty."""
+        return self.head is None
+
+    def append(self, data):
+        """Add a new node with the given data to the end of the list."""
+        new_node = Node(data)
+        if self.is_empty():
+            self.head = new_node
+        else:
+            # Traverse to the last node
+            current = self.head
+            while current.next:
+                current = current.next
+            current.next = new_node
+        self.size += 1
+
+    def prepend(self, data):
+        """Add a new node with the given data to the beginning of the list."""
+        new_node = Node(data)
+        new_node.next = self.head
+        self.head = new_node
+        self.size += 1
+
+    def delete(self, data):
+        """Delete the first node containing the given data."""
+        if self.is_empty():
+            raise ValueError("Cannot delete from an empty list.")
+
+        # Special case: the head node holds the data
+        if self.head.data == data:
+            self.head = self.head.next
+            self.size -= 1
+            return
+
+        # Search for the node to delete
+        current = self.head
+        while current.next and current.next.data != data:
+            current = current.next
+
+        if current.next is None:
+            raise ValueError(f"{data} not found in the list.")
+
+        # Unlink the node
+        current.next = current.next.next
+        self.size -= 1
+
+    def find(self, data):
+        """Return the index of the first node containing the data, or -1."""
+        current = self.head
+        index = 0
+        while current:
+            if current.data == data:
+                return index
+            current = current.next
+            index += 1
+        return -1
+
+    def reverse(self):
+        """Reverse the linked list in place."""
+        previous = None
+        current = self.head
+        while current:
+            next_node = current.next
+            current.next = previous
+            previous = current
+            current = next_node
+        self.head = previous
+
+    def to_list(self):
+        """Convert the linked list to a Python list."""
+        result = []
+        current = self.head
+        while current:
+            result.append(current.data)
+            current = current.next
+        return result
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return " -> ".join(str(item) for item in self.to_list()) or "Empty list"
+
+
+# Example usage
+if __name__ == "__main__":
+    linked_list = LinkedList()
+    for value in [10, 20, 30, 40]:
+        linked_list.append(value)
+    linked_list.prepend(5)
+
+    print("Original list:", linked_list)
+    print("Length:", len(linked_list))
+    print("Index of 30:", linked_list.find(30))
+
+    linked_list.delete(20)
+    print("After deleting 20:", linked_list)
+
+    linked_list.reverse()
+    print("Reversed list:", linked_list)
@@ -0,0 +1,118 @@
+"""
+Log File Analyzer
+
+Parses web server access logs in the Common Log Format and produces a
+summary report with request counts, status codes, and top IP addresses.
+"""
+
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+# Regular expression for the Common Log Format
+LOG_PATTERN = re.compile(
+    r'(?P<ip>\S+) \S+ \S+ \[(?P<timestamp>[^\]]+)\] '
+    r'"(?P<method>\S+) (?P<path>\S+) \S+" (?P<status>\d{3}) (?P<size>\S+)'
+)
+
+
+@dataclass
+class LogEntry:
+    """A single parsed log line."""
+
+    ip: str
+    timestamp: str
+    method: str
+    path: str
+    status: int
+    size: int
+
+
+def parse_line(line: str) -> Optional[LogEntry]:
+    """
+    Parse a single log line.
+
+    Args:
+        line: A line from the log file.
+
+    Returns:
+        A LogEntry if the line matches the expected format, otherwise None.
+    """
+    match = LOG_PATTERN.match(line)
+    if not match:
+        return None
+    size = match.group("size")
+    return LogEntry(
+        ip=match.group("ip"),
+        timestamp=match.group("timestamp"),
+        method=match.group("method"),
+        path=match.group("path"),
+        status=int(match.group("status")),
+        size=int(size) if size.isdigit() else 0,
+    )
+
+
+def read_entries(path: str) -> Iterator[LogEntry]:
+    """
+    Read and parse all valid entries from a log file.
+
+    Args:
+        path: Path to the log file.
+
+    Yields:
+        Parsed LogEntry objects.
+    """
+    with open(path, "r", encoding="utf-8", errors="replace") as file:
+        for line in file:
+            entry = parse_line(line)
+            if entry is not None:
+                yield entry
+
+
+def generate_report(path: str, top_n: int = 5) -> None:
+    """
+    Print a summary report for the given log file.
+
+    Args:
+        path: Path to the log file.
+        top_n: Number of top items to show in each section.
+    """
+    ip_counter = Counter()
+    status_counter = Counter()
+    path_counter = Counter()
+    total_bytes = 0
+    total_requests = 0
+
+    for entry in read_entries(path):
+        total_requests += 1
+        total_bytes += entry.size
+        ip_counter[entry.ip] += 1
+        status_counter[entry.status] += 1
+        path_counter[entry.path] += 1
+
+    print("=" * 40)
+    print("Log Analysis Report")
+    print("=" * 40)
+    print(f"Total requests: {total_requests}")
+    print(f"Total data transferred: {total_bytes / 1024:.1f} KB")
+
+    print(f"\nTop {top_n} IP addresses:")
+    for ip, count in ip_counter.most_common(top_n):
+        print(f"  {ip:<15} {count}")
+
+    print("\nStatus codes:")
+    for status, count in sorted(status_counter.items()):
+        print(f"  {status}: {count}")
+
+    print(f"\nTop {top_n} requested paths:")
+    for request_path, count in path_counter.most_common(top_n):
+        print(f"  {request_path:<30} {count}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python log_parser.py <access.log>")
+        sys.exit(1)
+    generate_report(sys.argv[1])
@@ -0,0 +1,117 @@
+"""
+LRU Cache Implementation
+
+This module implements a Least Recently Used (LRU) cache using a
+doubly linked list and a hash map, giving O(1) get and put operations.
+"""
+
+
+class Node:
+    """A node in the doubly linked list."""
+
+    def __init__(self, key: int = 0, value: int = 0):
+        """
+        Initialize a node.
+
+        Args:
+            key: The key stored in the node.
+            value: The value stored in the node.
+        """
+        self.key = key
+        self.value = value
+        self.prev = None
+        self.next = None
+
+
+class LRUCache:
+    """
+    A fixed-capacity cache that evicts the least recently used item.
+
+    Attributes:
+        capacity: Maximum number of items the cache can hold.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the LRU cache.
+
+        Args:
+            capacity: The maximum number of items to store.
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be a positive integer.")
+        self.capacity = capacity
+        self.cache = {}
+
+        # Dummy head and tail nodes simplify insertion and removal
+        self.head = Node()
+        self.tail = Node()
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _remove(self, node: Node) -> None:
+        """Remove a node from the linked list."""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+    def _add_to_front(self, node: Node) -> None:
+        """Insert a node right after the head (most recently used)."""
+        node.next = self.head.next
+        node.prev = self.head
+        self.head.next.prev = node
+        self.head.next = node
+
+    def get(self, key: int) -> int:
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            The value if present, otherwise -1.
+        """
+        if key not in self.cache:
+            return -1
+        node = self.cache[key]
+        # Move the accessed node to the front
+        self._remove(node)
+        self._add_to_front(node)
+        return node.value
+
+    def put(self, key: int, value: int) -> None:
+        """
+        Insert or update a value in the cache.
+
+        Args:
+            key: The key to store.
+            value: The value to associate with the key.
+        """
+        if key in self.cache:
+            self._remove(self.cache[key])
+        node = Node(key, value)
+        self._add_to_front(node)
+        self.cache[key] = node
+
+        # Evict the least recently used item if over capacity
+        if len(self.cache) > self.capacity:
+            lru = self.tail.prev
+            self._remove(lru)
+            del self.cache[lru.key]
+
+    def __len__(self) -> int:
+        """Return the number of items in the cache."""
+        return len(self.cache)
+
+
+if __name__ == "__main__":
+    cache = LRUCache(2)
+    cache.put(1, 1)
+    cache.put(2, 2)
+    print(cache.get(1))  # Output: 1
+    cache.put(3, 3)      # Evicts key 2
+    print(cache.get(2))  # Output: -1
+    cache.put(4, 4)      # Evicts key 1
+    print(cache.get(1))  # Output: -1
+    print(cache.get(3))  # Output: 3
+    print(cache.get(4))  # Output: 4
@@ -0,0 +1,40 @@
+def determinant(matrix):
+    n = len(matrix)
+    if n == 1:
+        return matrix[0][0]
+    if n == 2:
+        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
+    total = 0
+    for col in range(n):
+        minor = [row[:col] + row[col + 1:] for row in matrix[1:]]
+        total += (-1) ** col * matrix[0][col] * determinant(minor)
+    return total
+
+
+def transpose(matrix):
+    return [list(row) for row in zip(*matrix)]
+
+
+def inverse(matrix):
+    det = determinant(matrix)
+    if det == 0:
+        raise ValueError("Matrix is singular")
+    n = len(matrix)
+    if n == 2:
+        return [[matrix[1][1] / det, -matrix[0][1] / det], [-matrix[1][0] / det, matrix[0][0] / det]]
+    cofactors = []
+    for r in range(n):
+        row = []
+        for c in range(n):
+            minor = [m[:c] + m[c + 1:] for i, m in enumerate(matrix) if i != r]
+            row.append((-1) ** (r + c) * determinant(minor))
+        cofactors.append(row)
+    adjugate = transpose(cofactors)
+    return [[value / det for value in row] for row in adjugate]
+
+
+if __name__ == "__main__":
+    a = [[2, -3, 1], [2, 0, -1], [1, 4, 5]]
+    print("Determinant:", determinant(a))
+    for row in inverse(a):
+        print(["%.3f" % v for v in row])
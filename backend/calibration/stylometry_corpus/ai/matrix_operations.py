@@ -0,0 +1,83 @@
+from typing import List
+
+Matrix = List[List[float]]
+
+
+def validate_matrix(matrix: Matrix) -> None:
+    """Ensure the matrix is non-empty and all rows have the same length."""
+    if not matrix or not matrix[0]:
+        raise ValueError("Matrix cannot be empty.")
+    row_length = len(matrix[0])
+    if any(len(row) != row_length for row in matrix):
+        raise ValueError("All rows must have the same number of columns.")
+
+
+def add_matrices(a: Matrix, b: Matrix) -> Matrix:
+    """Add two matrices of the same dimensions."""
+    validate_matrix(a)
+    validate_matrix(b)
+    if len(a) != len(b) or len(a[0]) != len(b[0]):
+        raise ValueError("Matrices must have the same dimensions to be added.")
+    return [[a[i][j] + b[i][j] for j in range(len(a[0]))] for i in range(len(a))]
+
+
+def multiply_matrices(a: Matrix, b: Matrix) -> Matrix:
+    """Multiply two matrices using the standard algorithm."""
+    validate_matrix(a)
+    validate_matrix(b)
+    # The number of columns in A must equal the number of rows in B
+    if len(a[0]) != len(b):
+        raise ValueError("Number of columns in A must equal number of rows in B.")
+
+    result = [[0.0 for _ in range(len(b[0]))] for _ in range(len(a))]
+    for i in range(len(a)):
+        for j in range(len(b[0])):
+            for k in range(len(b)):
+                result[i][j] += a[i][k] * b[k][j]
+    return result
+
+
+def transpose(matrix: Matrix) -> Matrix:
+    """Return the transpose of a matrix."""
+    validate_matrix(matrix)
+    return [list(row) for row in zip(*matrix)]
+
+
+def determinant(matrix: Matrix) -> float:
+    """Calculate the determinant of a square matrix using recursion."""
+    validate_matrix(matrix)
+    n = len(matrix)
+    if n != len(matrix[0]):
+        raise ValueError("Determinant is only defined for square matrices.")
+
+    # Base cases for 1x1 and 2x2 matrices
+    if n == 1:
+        return matrix[0][0]
+    if n == 2:
+        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
+
+    # Recursive case: cofactor expansion along the first row
+    det = 0.0
+    for col in range(n):
+        minor = [row[:col] + row[col + 1:] for row in matrix[1:]]
+        det += ((-1) ** col) * matrix[0][col] * determinant(minor)
+    return det
+
+
+def print_matrix(matrix: Matrix, title: str = "") -> None:
+    """Print a matrix in a readable format."""
+    if title:
+        print(title)
+    for row in matrix:
+        print("  ".join(f"{value:8.2f}" for value in row))
+    print()
+
+
+if __name__ == "__main__":
+    matrix_a = [[1, 2, 3], [4, 5, 6], [7, 8, 10]]
+    matrix_b = [[9, 8, 7], [6, 5, 4], [3, 2, 1]]
+
+    print_matrix(add_matrices(matrix_a, matrix_b), "A + B:")
+    print_matrix(multiply_matrices(matrix_a, matrix_b), "A x B:")
+    print_matrix(transpose(matrix_a), "Transpose of A:")
+    print(f"Determinant of A: {determinant(matrix_a):.2f}")
@@ -0,0 +1,33 @@
+def merge_intervals(intervals):
+    if not intervals:
+        return []
+    intervals.sort(key=lambda x: x[0])
+    merged = [intervals[0]]
+    for start, end in intervals[1:]:
+        last_end = merged[-1][1]
+        if start <= last_end:
+            merged[-1][1] = max(last_end, end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def insert_interval(intervals, new_interval):
+    result = []
+    i = 0
+    n = len(intervals)
+    while i < n and intervals[i][1] < new_interval[0]:
+        result.append(intervals[i])
+        i += 1
+    while i < n and intervals[i][0] <= new_interval[1]:
+        new_interval = [min(new_interval[0], intervals[i][0]), max(new_interval[1], intervals[i][1])]
+        i += 1
+    result.append(new_interval)
+    result.extend(intervals[i:])
+    return result
+
+
+if __name__ == "__main__":
+    print(merge_intervals([[1, 3], [2, 6], [8, 10], [15, 18]]))
+    print(merge_intervals([[1, 4], [4, 5]]))
+    print(insert_interval([[1, 2], [3, 5], [6, 7], [8, 10], [12, 16]], [4, 8]))
@@ -0,0 +1,38 @@
+def solve_n_queens(n):
+    solutions = []
+    cols, diag1, diag2 = set(), set(), set()
+    board = [-1] * n
+
+    def place(row):
+        if row == n:
+            solutions.append(board[:])
+            return
+        for col in range(n):
+            if col in cols or row - col in diag1 or row + col in diag2:
+                continue
+            board[row] = col
+            cols.add(col)
+            diag1.add(row - col)
+            diag2.add(row + col)
+            place(row + 1)
+            cols.remove(col)
+            diag1.remove(row - col)
+            diag2.remove(row + col)
+
+    place(0)
+    return solutions
+
+
+def print_board(solution):
+    n = len(solution)
+    for col in solution:
+        print(" ".join("Q" if c == col else "." for c in range(n)))
+    print()
+
+
+if __name__ == "__main__":
+    n = int(input("Board size: "))
+    solutions = solve_n_queens(n)
+    print(f"Found {len(solutions)} solutions for {n} queens")
+    if solutions:
+        print_board(solutions[0])
@@ -0,0 +1,82 @@
+import random
+
+# Difficulty levels with their number ranges and maximum attempts
+DIFFICULTY_LEVELS = {
+    "easy": (1, 50, 10),
+    "medium": (1, 100, 7),
+    "hard": (1, 500, 9),
+}
+
+
+def choose_difficulty():
+    """Ask the player to choose a difficulty level."""
+    print("Choose a difficulty level: easy, medium, or hard")
+    while True:
+        choice = input("Difficulty: ").strip().lower()
+        if choice in DIFFICULTY_LEVELS:
+            return choice
+        print("Invalid choice. Please enter easy, medium, or hard.")
+
+
+def get_guess(low, high):
+    """Prompt the player for a valid guess within the range."""
+    while True:
+        try:
+            guess = int(input(f"Enter your guess ({low}-{high}): "))
+            if low <= guess <= high:
+                return guess
+            print(f"Please enter a number between {low} and {high}.")
+        except ValueError:
+            print("That's not a valid number. Try again.")
+
+
+def play_round():
+    """Play a single round of the number guessing game."""
+    difficulty = choose_difficulty()
+    low, high, max_attempts = DIFFICULTY_LEVELS[difficulty]
+    secret_number = random.randint(low, high)
+
+    print(f"\nI'm thinking of a number between {low} and {high}.")
+    print(f"You have {max_attempts} attempts to guess it.\n")
+
+    for attempt in range(1, max_attempts + 1):
+        guess = get_guess(low, high)
+
+        if guess == secret_number:
+            print(f"🎉 Congratulations! You guessed the number in {attempt} attempt(s)!")
+            return True
+        elif guess < secret_number:
+            print("Too low!")
+        else:
+            print("Too high!")
+
+        # Let the player know how many attempts are left
+        remaining = max_attempts - attempt
+        if remaining > 0:
+            print(f"Attempts remaining: {remaining}")
+
+    print(f"\nGame over! The number was {secret_number}.")
+    return False
+
+
+def main():
+    """Main game loop that tracks wins and losses."""
+    wins = 0
+    losses = 0
+
+    print("Welcome to the Number Guessing Game!")
+    while True:
+        if play_round():
+            wins += 1
+        else:
+            losses += 1
+
+        print(f"\nScore - Wins: {wins}, Losses: {losses}")
+        again = input("Play again? (y/n): ").strip().lower()
+        if again != "y":
+            print("Thanks for playing! Goodbye.")
+            break
+
+
+if __name__ == "__main__":
+    main()
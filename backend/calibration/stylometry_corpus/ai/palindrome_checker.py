@@ -0,0 +1,28 @@
+import re
+
+
+def is_palindrome(text):
+    cleaned = re.sub(r"[^a-z0-9]", "", text.lower())
+    return cleaned == cleaned[::-1]
+
+
+def longest_palindromic_substring(s):
+    if not s:
+        return ""
+    start, end = 0, 0
+    for i in range(len(s)):
+        for left, right in ((i, i), (i, i + 1)):
+            while left >= 0 and right < len(s) and s[left] == s[right]:
+                left -= 1
+                right += 1
+            if right - left - 1 > end - start:
+                start, end = left + 1, right - 1
+    return s[start:end + 1]
+
+
+if __name__ == "__main__":
+    tests = ["racecar", "A man, a plan, a canal: Panama", "hello", "Was it a car or a cat I saw?"]
+    for t in tests:
+        print(f"{t!r}: {is_palindrome(t)}")
+    word = input("Enter a string: ")
+    print("Longest palindromic substring:", longest_palindromic_substring(word))
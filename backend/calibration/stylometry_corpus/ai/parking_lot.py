@@ -0,0 +1,92 @@
+from datetime import datetime
+from enum import Enum
+
+
+class VehicleType(Enum):
+    MOTORCYCLE = 1
+    CAR = 2
+    TRUCK = 3
+
+
+class Vehicle:
+    def __init__(self, license_plate: str, vehicle_type: VehicleType):
+        self.license_plate = license_plate
+        self.vehicle_type = vehicle_type
+
+
+class ParkingSpot:
+    def __init__(self, spot_id: int, size: VehicleType):
+        self.spot_id = spot_id
+        self.size = size
+        self.vehicle = None
+
+    def is_available(self) -> bool:
+        return self.vehicle is None
+
+    def can_fit(self, vehicle: Vehicle) -> bool:
+        # A vehicle can park in a spot of the same size or larger
+        return self.is_available() and vehicle.vehicle_type.value <= self.size.value
+
+
+class ParkingLot:
+    HOURLY_RATES = {
+        VehicleType.MOTORCYCLE: 1.0,
+        VehicleType.CAR: 2.5,
+        VehicleType.TRUCK: 5.0,
+    }
+
+    def __init__(self, spots_per_size: dict):
+        self.spots = []
+        self.tickets = {}
+        spot_id = 1
+        for size, count in spots_per_size.items():
+            for _ in range(count):
+                self.spots.append(ParkingSpot(spot_id, size))
+                spot_id += 1
+
+    def park(self, vehicle: Vehicle):
+        """Park a vehicle in the smallest available spot that fits."""
+        candidates = sorted(
+            (spot for spot in self.spots if spot.can_fit(vehicle)),
+            key=lambda spot: spot.size.value,
+        )
+        if not candidates:
+            print(f"No available spot for {vehicle.license_plate}.")
+            return None
+
+        spot = candidates[0]
+        spot.vehicle = vehicle
+        self.tickets[vehicle.license_plate] = (spot, datetime.now())
+        print(f"Vehicle {vehicle.license_plate} parked at spot {spot.spot_id}.")
+        return spot.spot_id
+
+    def leave(self, license_plate: str, exit_time: datetime = None) -> float:
+        """Remove a vehicle from the lot and return the parking fee."""
+        if license_plate not in self.tickets:
+            raise ValueError(f"No vehicle with license plate {license_plate} found.")
+
+        spot, entry_time = self.tickets.pop(license_plate)
+        exit_time = exit_time or datetime.now()
+        hours = max(1, int((exit_time - entry_time).total_seconds() // 3600) + 1)
+        fee = hours * self.HOURLY_RATES[spot.vehicle.vehicle_type]
+        spot.vehicle = None
+        print(f"Vehicle {license_plate} left spot {spot.spot_id}. Fee: ${fee:.2f}")
+        return fee
+
+    def available_spots(self) -> dict:
+        """Return the number of available spots for each size."""
+        counts = {size: 0 for size in VehicleType}
+        for spot in self.spots:
+            if spot.is_available():
+                counts[spot.size] += 1
+        return counts
+
+
+if __name__ == "__main__":
+    lot = ParkingLot({VehicleType.MOTORCYCLE: 2, VehicleType.CAR: 3, VehicleType.TRUCK: 1})
+    lot.park(Vehicle("MOTO-1", VehicleType.MOTORCYCLE))
+    lot.park(Vehicle("CAR-1", VehicleType.CAR))
+    lot.park(Vehicle("TRUCK-1", VehicleType.TRUCK))
+    lot.park(Vehicle("TRUCK-2", VehicleType.TRUCK))
+    print("Available spots:", {size.name: count for size, count in lot.available_spots().items()})
+    lot.leave("CAR-1")
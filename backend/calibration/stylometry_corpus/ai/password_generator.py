@@ -0,0 +1,94 @@
+import secrets
+import string
+
+
+def generate_password(length=12, use_uppercase=True, use_digits=True, use_symbols=True):
+    """
+    Generate a secure random password.
+
+    Args:
+        length (int): Length of the password. Must be at least 4.
+        use_uppercase (bool): Include uppercase letters.
+        use_digits (bool): Include digits.
+        use_symbols (bool): Include special characters.
+
+    Returns:
+        str: The generated password.
+    """
+    if length < 4:
+        raise ValueError("Password length must be at least 4 characters.")
+
+    # Start with lowercase letters as the base character set
+    character_pool = string.ascii_lowercase
+    required_characters = [secrets.choice(string.ascii_lowercase)]
+
+    # Add optional character sets and ensure at least one of each is included
+    if use_uppercase:
+        character_pool += string.ascii_uppercase
+        required_characters.append(secrets.choice(string.ascii_uppercase))
+    if use_digits:
+        character_pool += string.digits
+        required_characters.append(secrets.choice(string.digits))
+    if use_symbols:
+        character_pool += string.punctuation
+        required_characters.append(secrets.choice(string.punctuation))
+
+    # Fill the rest of the password with random characters from the pool
+    remaining_length = length - len(required_characters)
+    password_characters = required_characters + [
+        secrets.choice(character_pool) for _ in range(remaining_length)
+    ]
+
+    # Shuffle to avoid predictable positions
+    secrets.SystemRandom().shuffle(password_characters)
+    return "".join(password_characters)
+
+
+def check_password_strength(password):
+    """
+    Evaluate the strength of a password.
+
+    Args:
+        password (str): The password to evaluate.
+
+    Returns:
+        str: "Weak", "Medium", or "Strong".
+    """
+    score = 0
+    if len(password) >= 8:
+        score += 1
+    if len(password) >= 12:
+        score += 1
+    if any(char.isupper() for char in password):
+        score += 1
+    if any(char.isdigit() for char in password):
+        score += 1
+    if any(char in string.punctuation for char in password):
+        score += 1
+
+    if score <= 2:
+        return "Weak"
+    elif score <= 4:
+        return "Medium"
+    return "Strong"
+
+
+def get_yes_no(prompt):
+    """Ask the user a yes/no question and return a boolean."""
+    return input(prompt).strip().lower() in ("y", "yes")
+
+
+if __name__ == "__main__":
+    print("=== Secure Password Generator ===")
+    try:
+        length = int(input("Enter password length (default 12): ") or 12)
+        password = generate_password(
+            length=length,
+            use_uppercase=get_yes_no("Include uppercase letters? (y/n): "),
+            use_digits=get_yes_no("Include digits? (y/n): "),
+            use_symbols=get_yes_no("Include symbols? (y/n): "),
+        )
+        print(f"\nGenerated password: {password}")
+        print(f"Password strength: {check_password_strength(password)}")
+    except ValueError as e:
+        print(f"Error: {e}")
@@ -0,0 +1,46 @@
+import time
+
+
+# Default durations in minutes
+WORK_MINUTES = 25
+SHORT_BREAK_MINUTES = 5
+LONG_BREAK_MINUTES = 15
+SESSIONS_BEFORE_LONG_BREAK = 4
+
+
+def countdown(minutes, label):
+    # Convert minutes to seconds for the countdown
+    total_seconds = int(minutes * 60)
+    try:
+        while total_seconds > 0:
+            mins, secs = divmod(total_seconds, 60)
+            # Print the remaining time on the same line
+            print(f"\r{label}: {mins:02d}:{secs:02d}", end="", flush=True)
+            time.sleep(1)
+            total_seconds -= 1
+        print(f"\r{label}: 00:00 - Done!      ")
+    except KeyboardInterrupt:
+        # Allow the user to skip the current timer
+        print(f"\n{label} skipped.")
+
+
+def run_pomodoro(cycles):
+    for session in range(1, cycles + 1):
+        print(f"\n--- Session {session} of {cycles} ---")
+        countdown(WORK_MINUTES, "Work")
+
+        # Take a long break after every few sessions, otherwise a short one
+        if session % SESSIONS_BEFORE_LONG_BREAK == 0:
+            countdown(LONG_BREAK_MINUTES, "Long break")
+        elif session != cycles:
+            countdown(SHORT_BREAK_MINUTES, "Short break")
+
+    print("\nGreat job! All sessions completed.")
+
+
+if __name__ == "__main__":
+    try:
+        cycles = int(input("How many Pomodoro sessions? "))
+        run_pomodoro(cycles)
+    except ValueError:
+        print("Please enter a whole number.")
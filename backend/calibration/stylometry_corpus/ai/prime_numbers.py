@@ -0,0 +1,88 @@
+import math
+
+
+def is_prime(n):
+    """
+    Check whether a number is prime.
+
+    Args:
+        n (int): The number to check.
+
+    Returns:
+        bool: True if n is prime, False otherwise.
+    """
+    if n < 2:
+        return False
+    if n in (2, 3):
+        return True
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+
+    # Check divisibility using the 6k ± 1 optimization
+    for i in range(5, int(math.sqrt(n)) + 1, 6):
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+    return True
+
+
+def sieve_of_eratosthenes(limit):
+    """
+    Generate all prime numbers up to a given limit using the Sieve of Eratosthenes.
+
+    Args:
+        limit (int): The upper bound (inclusive).
+
+    Returns:
+        list: A list of prime numbers up to the limit.
+    """
+    if limit < 2:
+        return []
+
+    # Initialize a boolean list where True means the index is prime
+    is_prime_list = [True] * (limit + 1)
+    is_prime_list[0] = is_prime_list[1] = False
+
+    for number in range(2, int(math.sqrt(limit)) + 1):
+        if is_prime_list[number]:
+            # Mark all multiples of this number as not prime
+            for multiple in range(number * number, limit + 1, number):
+                is_prime_list[multiple] = False
+
+    return [index for index, prime in enumerate(is_prime_list) if prime]
+
+
+def prime_factorization(n):
+    """
+    Find the prime factors of a number.
+
+    Args:
+        n (int): The number to factorize.
+
+    Returns:
+        list: A list of prime factors (with repetition).
+    """
+    factors = []
+    # Divide out all factors of 2 first
+    while n % 2 == 0:
+        factors.append(2)
+        n //= 2
+
+    # Check odd factors from 3 upwards
+    factor = 3
+    while factor * factor <= n:
+        while n % factor == 0:
+            factors.append(factor)
+            n //= factor
+        factor += 2
+
+    # If n is still greater than 1, it is a prime factor
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+if __name__ == "__main__":
+    print("Primes up to 50:", sieve_of_eratosthenes(50))
+    for number in [17, 20, 97, 100]:
+        print(f"Is {number} prime? {is_prime(number)}")
+    print("Prime factors of 360:", prime_factorization(360))
@@ -0,0 +1,81 @@
+import random
+
+# List of quiz questions with options and the correct answer
+QUESTIONS = [
+    {
+        "question": "What is the capital of France?",
+        "options": ["A) Berlin", "B) Madrid", "C) Paris", "D) Rome"],
+        "answer": "C",
+    },
+    {
+        "question": "Which planet is known as the Red Planet?",
+        "options": ["A) Earth", "B) Mars", "C) Jupiter", "D) Venus"],
+        "answer": "B",
+    },
+    {
+        "question": "What is the largest ocean on Earth?",
+        "options": ["A) Atlantic", "B) Indian", "C) Arctic", "D) Pacific"],
+        "answer": "D",
+    },
+    {
+        "question": "Who wrote 'Romeo and Juliet'?",
+        "options": ["A) Charles Dickens", "B) William Shakespeare", "C) Mark Twain", "D) Jane Austen"],
+        "answer": "B",
+    },
+    {
+        "question": "What is the chemical symbol for gold?",
+        "options": ["A) Au", "B) Ag", "C) Gd", "D) Go"],
+        "answer": "A",
+    },
+]
+
+
+def ask_question(question_data, question_number):
+    """
+    Display a question and get the user's answer.
+
+    Returns:
+        bool: True if the answer is correct, False otherwise.
+    """
+    print(f"\nQuestion {question_number}: {question_data['question']}")
+    for option in question_data["options"]:
+        print(f"  {option}")
+
+    # Keep asking until a valid option is entered
+    while True:
+        answer = input("Your answer (A/B/C/D): ").strip().upper()
+        if answer in ("A", "B", "C", "D"):
+            break
+        print("Invalid input. Please enter A, B, C, or D.")
+
+    if answer == question_data["answer"]:
+        print("✅ Correct!")
+        return True
+    print(f"❌ Wrong! The correct answer was {question_data['answer']}.")
+    return False
+
+
+def run_quiz():
+    """Run the quiz and display the final score."""
+    print("🧠 Welcome to the General Knowledge Quiz!")
+    questions = random.sample(QUESTIONS, len(QUESTIONS))
+    score = 0
+
+    for index, question in enumerate(questions, start=1):
+        if ask_question(question, index):
+            score += 1
+
+    # Calculate the percentage score
+    percentage = (score / len(questions)) * 100
+    print(f"\nQuiz complete! You scored {score}/{len(questions)} ({percentage:.0f}%).")
+
+    if percentage == 100:
+        print("Perfect score! Excellent work! 🎉")
+    elif percentage >= 60:
+        print("Good job! Keep learning!")
+    else:
+        print("Better luck next time!")
+
+
+if __name__ == "__main__":
+    run_quiz()
@@ -0,0 +1,56 @@
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.last_refill = now
+
+    def allow(self, tokens=1):
+        with self.lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def wait(self, tokens=1):
+        while not self.allow(tokens):
+            time.sleep(tokens / self.rate / 2)
+
+
+class SlidingWindowLimiter:
+    def __init__(self, limit, window):
+        self.limit = limit
+        self.window = window
+        self.requests = {}
+
+    def allow(self, client_id):
+        now = time.time()
+        timestamps = [t for t in self.requests.get(client_id, []) if now - t < self.window]
+        if len(timestamps) >= self.limit:
+            self.requests[client_id] = timestamps
+            return False
+        timestamps.append(now)
+        self.requests[client_id] = timestamps
+        return True
+
+
+if __name__ == "__main__":
+    bucket = TokenBucket(rate=5, capacity=5)
+    allowed = sum(bucket.allow() for _ in range(20))
+    print(f"Token bucket allowed {allowed} of 20 burst requests")
+
+    limiter = SlidingWindowLimiter(limit=3, window=1.0)
+    for i in range(5):
+        print(f"Request {i + 1}: {'allowed' if limiter.allow('user1') else 'blocked'}")
@@ -0,0 +1,67 @@
+import functools
+import logging
+import random
+import time
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def retry(max_attempts=3, delay=1.0, backoff=2.0, exceptions=(Exception,)):
+    """
+    Decorator that retries a function call with exponential backoff.
+
+    Args:
+        max_attempts (int): Maximum number of attempts before giving up.
+        delay (float): Initial delay between attempts in seconds.
+        backoff (float): Multiplier applied to the delay after each failure.
+        exceptions (tuple): Exception types that trigger a retry.
+
+    Returns:
+        function: The decorated function.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            current_delay = delay
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    if attempt == max_attempts:
+                        logger.error(f"{func.__name__} failed after {max_attempts} attempts: {e}")
+                        raise
+                    logger.warning(
+                        f"Attempt {attempt} of {func.__name__} failed: {e}. Retrying in {current_delay:.1f}s..."
+                    )
+                    time.sleep(current_delay)
+                    current_delay *= backoff
+
+        return wrapper
+
+    return decorator
+
+
+@retry(max_attempts=5, delay=0.5, exceptions=(ConnectionError,))
+def unreliable_network_call():
+    """
+    Simulate a network call that fails randomly.
+
+    Returns:
+        str: A success message.
+
+    Raises:
+        ConnectionError: When the simulated call fails.
+    """
+    if random.random() < 0.7:
+        raise ConnectionError("Network is unreachable")
+    return "Data received successfully"
+
+
+if __name__ == "__main__":
+    try:
+        result = unreliable_network_call()
+        print(result)
+    except ConnectionError:
+        print("The operation could not be completed.")
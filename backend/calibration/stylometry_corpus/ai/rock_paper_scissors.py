@@ -0,0 +1,78 @@
+import random
+
+CHOICES = ["rock", "paper", "scissors"]
+
+# Define which choice beats which
+WINNING_RULES = {
+    "rock": "scissors",
+    "paper": "rock",
+    "scissors": "paper",
+}
+
+
+def get_user_choice():
+    """Get and validate the user's choice."""
+    while True:
+        user_input = input("Enter rock, paper, or scissors (or 'quit' to exit): ").lower().strip()
+        if user_input in CHOICES or user_input == "quit":
+            return user_input
+        print("Invalid choice. Please try again.")
+
+
+def get_computer_choice():
+    """Randomly select the computer's choice."""
+    return random.choice(CHOICES)
+
+
+def determine_winner(user_choice, computer_choice):
+    """
+    Determine the winner of a round.
+
+    Returns:
+        str: 'user', 'computer', or 'tie'.
+    """
+    if user_choice == computer_choice:
+        return "tie"
+    elif WINNING_RULES[user_choice] == computer_choice:
+        return "user"
+    else:
+        return "computer"
+
+
+def play_game():
+    """Main game loop."""
+    scores = {"user": 0, "computer": 0, "tie": 0}
+
+    print("Welcome to Rock, Paper, Scissors!")
+    print("-" * 35)
+
+    while True:
+        user_choice = get_user_choice()
+        if user_choice == "quit":
+            break
+
+        computer_choice = get_computer_choice()
+        print(f"\nYou chose: {user_choice}")
+        print(f"Computer chose: {computer_choice}")
+
+        winner = determine_winner(user_choice, computer_choice)
+        scores[winner] += 1
+
+        # Display the result of the round
+        if winner == "tie":
+            print("It's a tie!")
+        elif winner == "user":
+            print("You win this round!")
+        else:
+            print("Computer wins this round!")
+
+        print(f"Score - You: {scores['user']} | Computer: {scores['computer']} | Ties: {scores['tie']}\n")
+
+    # Display the final results
+    print("\nFinal Score:")
+    print(f"You: {scores['user']} | Computer: {scores['computer']} | Ties: {scores['tie']}")
+    print("Thanks for playing!")
+
+
+if __name__ == "__main__":
+    play_game()
@@ -0,0 +1,92 @@
+"""
+Roman Numeral Converter
+
+Converts integers to Roman numerals and back again.
+Supports values from 1 to 3999.
+"""
+
+# Mapping of integer values to Roman numeral symbols, ordered from largest to smallest
+ROMAN_MAP = [
+    (1000, "M"), (900, "CM"), (500, "D"), (400, "CD"),
+    (100, "C"), (90, "XC"), (50, "L"), (40, "XL"),
+    (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I"),
+]
+
+
+def int_to_roman(number: int) -> str:
+    """
+    Convert an integer to a Roman numeral.
+
+    Args:
+        number: An integer between 1 and 3999.
+
+    Returns:
+        The Roman numeral representation as a string.
+
+    Raises:
+        ValueError: If the number is outside the supported range.
+    """
+    if not 1 <= number <= 3999:
+        raise ValueError("Number must be between 1 and 3999.")
+
+    result = []
+    for value, symbol in ROMAN_MAP:
+        # Append the symbol as many times as it fits into the remaining number
+        count, number = divmod(number, value)
+        result.append(symbol * count)
+    return "".join(result)
+
+
+def roman_to_int(roman: str) -> int:
+    """
+    Convert a Roman numeral to an integer.
+
+    Args:
+        roman: A valid Roman numeral string.
+
+    Returns:
+        The integer value of the Roman numeral.
+
+    Raises:
+        ValueError: If the string contains invalid characters.
+    """
+    values = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+    roman = roman.upper()
+    total = 0
+    previous = 0
+
+    # Process the numeral from right to left
+    for char in reversed(roman):
+        if char not in values:
+            raise ValueError(f"Invalid Roman numeral character: {char}")
+        current = values[char]
+        if current < previous:
+            # Subtractive notation, e.g. IV = 4
+            total -= current
+        else:
+            total += current
+            previous = current
+    return total
+
+
+def main():
+    """Run an interactive Roman numeral converter."""
+    print("Roman Numeral Converter")
+    print("Enter a number or a Roman numeral (or 'q' to quit).")
+
+    while True:
+        user_input = input("\n> ").strip()
+        if user_input.lower() == "q":
+            print("Goodbye!")
+            break
+        try:
+            if user_input.isdigit():
+                print(f"{user_input} = {int_to_roman(int(user_input))}")
+            else:
+                print(f"{user_input.upper()} = {roman_to_int(user_input)}")
+        except ValueError as error:
+            print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
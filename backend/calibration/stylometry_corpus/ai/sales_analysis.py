@@ -0,0 +1,94 @@
+"""
+Sales Data Analysis
+
+This script loads sales data from a CSV file, cleans it, and produces
+summary statistics and visualizations.
+"""
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+
+def load_data(file_path):
+    """Load the sales data from a CSV file into a DataFrame."""
+    df = pd.read_csv(file_path, parse_dates=["order_date"])
+    print(f"Loaded {len(df)} rows and {len(df.columns)} columns.")
+    return df
+
+
+def clean_data(df):
+    """Clean the dataset by handling missing values and duplicates."""
+    # Remove duplicate rows
+    df = df.drop_duplicates()
+
+    # Drop rows with missing critical values
+    df = df.dropna(subset=["order_id", "product", "quantity", "price"])
+
+    # Fill missing regions with 'Unknown'
+    df["region"] = df["region"].fillna("Unknown")
+
+    # Ensure numeric columns have the correct data types
+    df["quantity"] = pd.to_numeric(df["quantity"], errors="coerce")
+    df["price"] = pd.to_numeric(df["price"], errors="coerce")
+
+    # Calculate the total revenue for each order
+    df["revenue"] = df["quantity"] * df["price"]
+    return df
+
+
+def summarize_sales(df):
+    """Print key summary statistics of the sales data."""
+    print("\n===== Sales Summary =====")
+    print(f"Total revenue: ${df['revenue'].sum():,.2f}")
+    print(f"Average order value: ${df['revenue'].mean():,.2f}")
+    print(f"Number of orders: {df['order_id'].nunique()}")
+
+    # Top 5 products by revenue
+    top_products = df.groupby("product")["revenue"].sum().sort_values(ascending=False).head(5)
+    print("\nTop 5 products by revenue:")
+    print(top_products.to_string())
+
+    # Revenue by region
+    region_sales = df.groupby("region")["revenue"].sum().sort_values(ascending=False)
+    print("\nRevenue by region:")
+    print(region_sales.to_string())
+
+
+def plot_monthly_revenue(df):
+    """Plot the total revenue for each month."""
+    monthly_revenue = df.set_index("order_date").resample("M")["revenue"].sum()
+
+    plt.figure(figsize=(10, 6))
+    plt.plot(monthly_revenue.index, monthly_revenue.values, marker="o", linestyle="-")
+    plt.title("Monthly Revenue")
+    plt.xlabel("Month")
+    plt.ylabel("Revenue ($)")
+    plt.grid(True)
+    plt.tight_layout()
+    plt.savefig("monthly_revenue.png")
+    plt.show()
+
+
+def plot_category_distribution(df):
+    """Plot a pie chart of revenue by product category."""
+    category_revenue = df.groupby("category")["revenue"].sum()
+
+    plt.figure(figsize=(8, 8))
+    plt.pie(category_revenue, labels=category_revenue.index, autopct="%1.1f%%", startangle=140)
+    plt.title("Revenue Distribution by Category")
+    plt.tight_layout()
+    plt.savefig("category_distribution.png")
+    plt.show()
+
+
+def main():
+    """Run the full analysis pipeline."""
+    df = load_data("sales_data.csv")
+    df = clean_data(df)
+    summarize_sales(df)
+    plot_monthly_revenue(df)
+    plot_category_distribution(df)
+
+
+if __name__ == "__main__":
+    main()
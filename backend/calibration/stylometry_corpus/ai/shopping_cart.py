@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+
+
+@dataclass
+class Item:
+    name: str
+    price: Decimal
+    quantity: int = 1
+
+    def subtotal(self) -> Decimal:
+        return self.price * self.quantity
+
+
+class ShoppingCart:
+    """Shopping cart that supports discounts and tax calculation."""
+
+    TAX_RATE = Decimal("0.08")
+
+    def __init__(self) -> None:
+        self.items: dict[str, Item] = {}
+        self.discount_code: str | None = None
+
+    def add_item(self, name: str, price: float, quantity: int = 1) -> None:
+        """Add an item to the cart, or increase its quantity if it already exists."""
+        if quantity <= 0:
+            raise ValueError("Quantity must be greater than zero.")
+        if name in self.items:
+            self.items[name].quantity += quantity
+        else:
+            self.items[name] = Item(name, Decimal(str(price)), quantity)
+
+    def remove_item(self, name: str) -> None:
+        """Remove an item from the cart."""
+        if name not in self.items:
+            raise KeyError(f"'{name}' is not in the cart.")
+        del self.items[name]
+
+    def apply_discount(self, code: str) -> None:
+        """Apply a discount code to the cart."""
+        valid_codes = {"SAVE10": Decimal("0.10"), "SAVE20": Decimal("0.20")}
+        if code not in valid_codes:
+            raise ValueError("Invalid discount code.")
+        self.discount_code = code
+
+    def _discount_rate(self) -> Decimal:
+        rates = {"SAVE10": Decimal("0.10"), "SAVE20": Decimal("0.20")}
+        return rates.get(self.discount_code, Decimal("0"))
+
+    def subtotal(self) -> Decimal:
+        """Calculate the subtotal before discounts and tax."""
+        return sum((item.subtotal() for item in self.items.values()), Decimal("0"))
+
+    def total(self) -> Decimal:
+        """Calculate the final total including discount and tax."""
+        discounted = self.subtotal() * (1 - self._discount_rate())
+        total = discounted * (1 + self.TAX_RATE)
+        # Round to two decimal places
+        return total.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+    def summary(self) -> str:
+        """Return a formatted summary of the cart."""
+        lines = ["Shopping Cart Summary", "=" * 30]
+        for item in self.items.values():
+            lines.append(f"{item.name:<15} x{item.quantity:<3} ${item.subtotal():>8.2f}")
+        lines.append("-" * 30)
+        lines.append(f"{'Subtotal:':<20}${self.subtotal():>8.2f}")
+        if self.discount_code:
+            lines.append(f"{'Discount (' + self.discount_code + '):':<20}-{self._discount_rate():.0%}")
+        lines.append(f"{'Total (incl. tax):':<20}${self.total():>8.2f}")
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    cart = ShoppingCart()
+    cart.add_item("Apple", 0.99, 6)
+    cart.add_item("Bread", 2.49)
+    cart.add_item("Milk", 3.19, 2)
+    cart.apply_discount("SAVE10")
+    print(cart.summary())
@@ -0,0 +1,134 @@
+"""
+Implementation of common sorting algorithms in Python.
+
+Includes:
+    - Bubble Sort
+    - Selection Sort
+    - Insertion Sort
+    - Merge Sort
+    - Quick Sort
+"""
+
+import random
+import time
+from typing import Callable, List
+
+
+def bubble_sort(arr: List[int]) -> List[int]:
+    """Sort a list using the bubble sort algorithm."""
+    arr = arr.copy()
+    n = len(arr)
+    for i in range(n):
+        swapped = False
+        for j in range(0, n - i - 1):
+            # Swap if the element is greater than the next one
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                swapped = True
+        # Stop early if no swaps were made
+        if not swapped:
+            break
+    return arr
+
+
+def selection_sort(arr: List[int]) -> List[int]:
+    """Sort a list using the selection sort algorithm."""
+    arr = arr.copy()
+    n = len(arr)
+    for i in range(n):
+        # Find the minimum element in the unsorted portion
+        min_index = i
+        for j in range(i + 1, n):
+            if arr[j] < arr[min_index]:
+                min_index = j
+        # Swap the found minimum element with the first element
+        arr[i], arr[min_index] = arr[min_index], arr[i]
+    return arr
+
+
+def insertion_sort(arr: List[int]) -> List[int]:
+    """Sort a list using the insertion sort algorithm."""
+    arr = arr.copy()
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        # Move elements that are greater than key one position ahead
+        while j >= 0 and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+    return arr
+
+
+def merge_sort(arr: List[int]) -> List[int]:
+    """Sort a list using the merge sort algorithm."""
+    if len(arr) <= 1:
+        return arr
+
+    # Divide the list into two halves
+    mid = len(arr) // 2
+    left_half = merge_sort(arr[:mid])
+    right_half = merge_sort(arr[mid:])
+
+    # Merge the sorted halves
+    return merge(left_half, right_half)
+
+
+def merge(left: List[int], right: List[int]) -> List[int]:
+    """Merge two sorted lists into a single sorted list."""
+    result = []
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+
+    # Append any remaining elements
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def quick_sort(arr: List[int]) -> List[int]:
+    """Sort a list using the quick sort algorithm."""
+    if len(arr) <= 1:
+        return arr
+
+    # Choose the middle element as the pivot
+    pivot = arr[len(arr) // 2]
+    left = [x for x in arr if x < pivot]
+    middle = [x for x in arr if x == pivot]
+    right = [x for x in arr if x > pivot]
+
+    return quick_sort(left) + middle + quick_sort(right)
+
+
+def benchmark(sort_function: Callable, data: List[int]) -> float:
+    """Measure how long a sorting function takes to sort the data."""
+    start = time.time()
+    sort_function(data)
+    return time.time() - start
+
+
+if __name__ == "__main__":
+    # Generate a random list of integers
+    sample_data = [random.randint(1, 1000) for _ in range(1000)]
+
+    algorithms = {
+        "Bubble Sort": bubble_sort,
+        "Selection Sort": selection_sort,
+        "Insertion Sort": insertion_sort,
+        "Merge Sort": merge_sort,
+        "Quick Sort": quick_sort,
+    }
+
+    print("Sorting 1000 random integers:\n")
+    for name, algorithm in algorithms.items():
+        elapsed_time = benchmark(algorithm, sample_data)
+        # Verify that the result is correctly sorted
+        assert algorithm(sample_data) == sorted(sample_data)
+        print(f"{name:<16}: {elapsed_time:.4f} seconds")
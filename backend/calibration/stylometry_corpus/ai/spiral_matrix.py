@@ -0,0 +1,53 @@
+def spiral_order(matrix):
+    result = []
+    if not matrix:
+        return result
+    top, bottom = 0, len(matrix) - 1
+    left, right = 0, len(matrix[0]) - 1
+    while top <= bottom and left <= right:
+        for c in range(left, right + 1):
+            result.append(matrix[top][c])
+        top += 1
+        for r in range(top, bottom + 1):
+            result.append(matrix[r][right])
+        right -= 1
+        if top <= bottom:
+            for c in range(right, left - 1, -1):
+                result.append(matrix[bottom][c])
+            bottom -= 1
+        if left <= right:
+            for r in range(bottom, top - 1, -1):
+                result.append(matrix[r][left])
+            left += 1
+    return result
+
+
+def generate_spiral(n):
+    matrix = [[0] * n for _ in range(n)]
+    value = 1
+    top, bottom, left, right = 0, n - 1, 0, n - 1
+    while value <= n * n:
+        for c in range(left, right + 1):
+            matrix[top][c] = value
+            value += 1
+        top += 1
+        for r in range(top, bottom + 1):
+            matrix[r][right] = value
+            value += 1
+        right -= 1
+        for c in range(right, left - 1, -1):
+            matrix[bottom][c] = value
+            value += 1
+        bottom -= 1
+        for r in range(bottom, top - 1, -1):
+            matrix[r][left] = value
+            value += 1
+        left += 1
+    return matrix
+
+
+if __name__ == "__main__":
+    m = [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12]]
+    print(spiral_order(m))
+    for row in generate_spiral(4):
+        print(" ".join(f"{x:2}" for x in row))
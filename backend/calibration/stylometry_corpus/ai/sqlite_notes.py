@@ -0,0 +1,86 @@
+import sqlite3
+from datetime import datetime
+
+DB_NAME = "notes.db"
+
+
+def get_connection():
+    conn = sqlite3.connect(DB_NAME)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def init_db():
+    with get_connection() as conn:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS notes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                body TEXT,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+
+
+def add_note(title, body):
+    with get_connection() as conn:
+        cursor = conn.execute(
+            "INSERT INTO notes (title, body, created_at) VALUES (?, ?, ?)",
+            (title, body, datetime.now().isoformat(timespec="seconds")),
+        )
+        return cursor.lastrowid
+
+
+def list_notes():
+    with get_connection() as conn:
+        return conn.execute("SELECT * FROM notes ORDER BY created_at DESC").fetchall()
+
+
+def search_notes(term):
+    pattern = f"%{term}%"
+    with get_connection() as conn:
+        return conn.execute(
+            "SELECT * FROM notes WHERE title LIKE ? OR body LIKE ?", (pattern, pattern)
+        ).fetchall()
+
+
+def delete_note(note_id):
+    with get_connection() as conn:
+        return conn.execute("DELETE FROM notes WHERE id = ?", (note_id,)).rowcount > 0
+
+
+def show(notes):
+    if not notes:
+        print("No notes found.")
+    for note in notes:
+        print(f"[{note['id']}] {note['title']} ({note['created_at']})")
+        if note["body"]:
+            print(f"    {note['body']}")
+
+
+def main():
+    init_db()
+    actions = {
+        "1": lambda: print(f"Saved note #{add_note(input('Title: '), input('Body: '))}"),
+        "2": lambda: show(list_notes()),
+        "3": lambda: show(search_notes(input("Search for: "))),
+        "4": lambda: print("Deleted." if delete_note(int(input("Note id: "))) else "No such note."),
+    }
+    while True:
+        choice = input("\n1) Add  2) List  3) Search  4) Delete  5) Quit\n> ").strip()
+        if choice == "5":
+            break
+        action = actions.get(choice)
+        if action is None:
+            print("Unknown option.")
+            continue
+        try:
+            action()
+        except ValueError:
+            print("Invalid input.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+from collections import deque
+
+
+class Stack:
+    """A simple stack implementation using a Python list (LIFO)."""
+
+    def __init__(self):
+        self._items = []
+
+    def push(self, item):
+        """Push an item onto the top of the stack."""
+        self._items.append(item)
+
+    def pop(self):
+        """Remove and return the top item of the stack."""
+        if self.is_empty():
+            raise IndexError("pop from an empty stack")
+        return self._items.pop()
+
+    def peek(self):
+        """Return the top item without removing it."""
+        if self.is_empty():
+            raise IndexError("peek from an empty stack")
+        return self._items[-1]
+
+    def is_empty(self):
+        """Check if the stack is empty."""
+        return len(self._items) == 0
+
+    def size(self):
+        """Return the number of items in the stack."""
+        return len(self._items)
+
+
+class Queue:
+    """A simple queue implementation using collections.deque (FIFO)."""
+
+    def __init__(self):
+        self._items = deque()
+
+    def enqueue(self, item):
+        """Add an item to the end of the queue."""
+        self._items.append(item)
+
+    def dequeue(self):
+        """Remove and return the item at the front of the queue."""
+        if self.is_empty():
+            raise IndexError("dequeue from an empty queue")
+        return self._items.popleft()
+
+    def front(self):
+        """Return the front item without removing it."""
+        if self.is_empty():
+            raise IndexError("front from an empty queue")
+        return self._items[0]
+
+    def is_empty(self):
+        """Check if the queue is empty."""
+        return len(self._items) == 0
+
+    def size(self):
+        """Return the number of items in the queue."""
+        return len(self._items)
+
+
+def is_balanced(expression):
+    """
+    Check if the brackets in an expression are balanced using a stack.
+
+    Args:
+        expression (str): The expression to check.
+
+    Returns:
+        bool: True if balanced, False otherwise.
+    """
+    stack = Stack()
+    pairs = {")": "(", "]": "[", "}": "{"}
+
+    for char in expression:
+        if char in "([{":
+            stack.push(char)
+        elif char in ")]}":
+            # A closing bracket must match the most recent opening bracket
+            if stack.is_empty() or stack.pop() != pairs[char]:
+                return False
+
+    return stack.is_empty()
+
+
+if __name__ == "__main__":
+    # Test the stack
+    stack = Stack()
+    for number in range(1, 4):
+        stack.push(number)
+    print("Stack top:", stack.peek())
+    print("Popped:", stack.pop())
+    print("Stack size:", stack.size())
+
+    # Test the queue
+    queue = Queue()
+    for letter in "ABC":
+        queue.enqueue(letter)
+    print("Queue front:", queue.front())
+    print("Dequeued:", queue.dequeue())
+    print("Queue size:", queue.size())
+
+    # Test balanced brackets
+    for expr in ["(a + b) * [c - d]", "{[()]}", "([)]", "((())"]:
+        print(f"{expr!r} is balanced: {is_balanced(expr)}")
@@ -0,0 +1,46 @@
+def compress(text):
+    # Return the original string if it is empty
+    if not text:
+        return text
+
+    compressed = []
+    count = 1
+
+    # Walk through the string and count consecutive characters
+    for i in range(1, len(text)):
+        if text[i] == text[i - 1]:
+            count += 1
+        else:
+            compressed.append(text[i - 1] + str(count))
+            count = 1
+
+    # Add the last group of characters
+    compressed.append(text[-1] + str(count))
+    result = "".join(compressed)
+
+    # Only return the compressed version if it is actually shorter
+    return result if len(result) < len(text) else text
+
+
+def decompress(text):
+    result = []
+    i = 0
+    # Each group is a character followed by one or more digits
+    while i < len(text):
+        char = text[i]
+        i += 1
+        digits = ""
+        while i < len(text) and text[i].isdigit():
+            digits += text[i]
+            i += 1
+        result.append(char * int(digits or 1))
+    return "".join(result)
+
+
+if __name__ == "__main__":
+    # Test the functions with a few examples
+    examples = ["aabcccccaaa", "abc", "aaaaaaaaaaaabbb", ""]
+    for example in examples:
+        packed = compress(example)
+        print(f"{example!r} -> {packed!r}")
+    print(decompress("a2b1c5a3"))
@@ -0,0 +1,109 @@
+import csv
+from statistics import mean
+
+
+def read_student_data(file_path):
+    """
+    Read student names and scores from a CSV file.
+
+    The CSV file is expected to have a header row with the columns:
+    name, math, science, english
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        list: A list of dictionaries containing student data.
+    """
+    students = []
+    try:
+        with open(file_path, newline="") as csv_file:
+            reader = csv.DictReader(csv_file)
+            for row in reader:
+                # Convert score columns to integers
+                scores = {
+                    subject: int(score)
+                    for subject, score in row.items()
+                    if subject != "name"
+                }
+                students.append({"name": row["name"], "scores": scores})
+    except FileNotFoundError:
+        print(f"Error: The file '{file_path}' was not found.")
+    except ValueError as e:
+        print(f"Error: Invalid score in file - {e}")
+    return students
+
+
+def calculate_average(scores):
+    """
+    Calculate the average of a student's scores.
+
+    Args:
+        scores (dict): A dictionary of subject scores.
+
+    Returns:
+        float: The average score rounded to two decimal places.
+    """
+    return round(mean(scores.values()), 2)
+
+
+def get_letter_grade(average):
+    """
+    Convert a numeric average into a letter grade.
+
+    Args:
+        average (float): The numeric average.
+
+    Returns:
+        str: The corresponding letter grade.
+    """
+    if average >= 90:
+        return "A"
+    elif average >= 80:
+        return "B"
+    elif average >= 70:
+        return "C"
+    elif average >= 60:
+        return "D"
+    else:
+        return "F"
+
+
+def generate_report(students):
+    """
+    Print a formatted grade report for all students.
+
+    Args:
+        students (list): The list of student dictionaries.
+    """
+    print(f"{'Name':<15}{'Average':>10}{'Grade':>8}")
+    print("-" * 33)
+
+    class_averages = []
+    for student in students:
+        average = calculate_average(student["scores"])
+        grade = get_letter_grade(average)
+        class_averages.append(average)
+        print(f"{student['name']:<15}{average:>10.2f}{grade:>8}")
+
+    # Print overall class statistics
+    if class_averages:
+        print("-" * 33)
+        print(f"Class average: {mean(class_averages):.2f}")
+        print(f"Highest average: {max(class_averages):.2f}")
+        print(f"Lowest average: {min(class_averages):.2f}")
+
+
+def main():
+    """Main entry point of the program."""
+    file_path = input("Enter the path to the student CSV file: ")
+    students = read_student_data(file_path)
+
+    if students:
+        generate_report(students)
+    else:
+        print("No student data to display.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Sudoku Solver
+
+Solves a 9x9 Sudoku puzzle using backtracking.
+Empty cells are represented by 0.
+"""
+
+from typing import List, Optional, Tuple
+
+Grid = List[List[int]]
+
+
+def find_empty(grid: Grid) -> Optional[Tuple[int, int]]:
+    """
+    Find the next empty cell in the grid.
+
+    Args:
+        grid: The Sudoku grid.
+
+    Returns:
+        A (row, col) tuple of an empty cell, or None if the grid is full.
+    """
+    for row in range(9):
+        for col in range(9):
+            if grid[row][col] == 0:
+                return row, col
+    return None
+
+
+def is_valid(grid: Grid, row: int, col: int, number: int) -> bool:
+    """
+    Check whether a number can be placed in the given cell.
+
+    Args:
+        grid: The Sudoku grid.
+        row: The row index.
+        col: The column index.
+        number: The number to place (1-9).
+
+    Returns:
+        True if the placement does not violate Sudoku rules.
+    """
+    # Check the row
+    if number in grid[row]:
+        return False
+
+    # Check the column
+    if any(grid[r][col] == number for r in range(9)):
+        return False
+
+    # Check the 3x3 box
+    box_row, box_col = 3 * (row // 3), 3 * (col // 3)
+    for r in range(box_row, box_row + 3):
+        for c in range(box_col, box_col + 3):
+            if grid[r][c] == number:
+                return False
+
+    return True
+
+
+def solve(grid: Grid) -> bool:
+    """
+    Solve the Sudoku puzzle in place using backtracking.
+
+    Args:
+        grid: The Sudoku grid to solve.
+
+    Returns:
+        True if the puzzle was solved, False if it has no solution.
+    """
+    empty = find_empty(grid)
+    if empty is None:
+        return True  # Puzzle solved
+
+    row, col = empty
+    for number in range(1, 10):
+        if is_valid(grid, row, col, number):
+            grid[row][col] = number
+            if solve(grid):
+                return True
+            # Undo the move and try the next number
+            grid[row][col] = 0
+
+    return False
+
+
+def print_grid(grid: Grid) -> None:
+    """Print the grid with separators between the 3x3 boxes."""
+    for i, row in enumerate(grid):
+        if i % 3 == 0 and i != 0:
+            print("-" * 21)
+        cells = []
+        for j, value in enumerate(row):
+            if j % 3 == 0 and j != 0:
+                cells.append("|")
+            cells.append(str(value) if value else ".")
+        print(" ".join(cells))
+
+
+if __name__ == "__main__":
+    puzzle = [
+        [5, 3, 0, 0, 7, 0, 0, 0, 0],
+        [6, 0, 0, 1, 9, 5, 0, 0, 0],
+        [0, 9, 8, 0, 0, 0, 0, 6, 0],
+        [8, 0, 0, 0, 6, 0, 0, 0, 3],
+        [4, 0, 0, 8, 0, 3, 0, 0, 1],
+        [7, 0, 0, 0, 2, 0, 0, 0, 6],
+        [0, 6, 0, 0, 0, 0, 2, 8, 0],
+        [0, 0, 0, 4, 1, 9, 0, 0, 5],
+        [0, 0, 0, 0, 8, 0, 0, 7, 9],
+    ]
+
+    print("Puzzle:")
+    print_grid(puzzle)
+
+    if solve(puzzle):
+        print("\nSolution:")
+        print_grid(puzzle)
+    else:
+        print("\nNo solution exists.")
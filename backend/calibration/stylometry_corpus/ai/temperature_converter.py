@@ -0,0 +1,82 @@
+"""Temperature converter supporting Celsius, Fahrenheit, and Kelvin."""
+
+
+def celsius_to_fahrenheit(celsius: float) -> float:
+    """Convert Celsius to Fahrenheit."""
+    return (celsius * 9 / 5) + 32
+
+
+def fahrenheit_to_celsius(fahrenheit: float) -> float:
+    """Convert Fahrenheit to Celsius."""
+    return (fahrenheit - 32) * 5 / 9
+
+
+def celsius_to_kelvin(celsius: float) -> float:
+    """Convert Celsius to Kelvin."""
+    return celsius + 273.15
+
+
+def kelvin_to_celsius(kelvin: float) -> float:
+    """Convert Kelvin to Celsius."""
+    if kelvin < 0:
+        raise ValueError("Temperature in Kelvin cannot be negative.")
+    return kelvin - 273.15
+
+
+def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convert a temperature value between units.
+
+    Args:
+        value: The temperature value to convert.
+        from_unit: The unit to convert from ('C', 'F', or 'K').
+        to_unit: The unit to convert to ('C', 'F', or 'K').
+
+    Returns:
+        The converted temperature value.
+    """
+    from_unit = from_unit.upper()
+    to_unit = to_unit.upper()
+    valid_units = {"C", "F", "K"}
+
+    if from_unit not in valid_units or to_unit not in valid_units:
+        raise ValueError("Units must be 'C', 'F', or 'K'.")
+
+    # If the units are the same, no conversion is needed
+    if from_unit == to_unit:
+        return value
+
+    # First convert the input to Celsius
+    if from_unit == "F":
+        celsius = fahrenheit_to_celsius(value)
+    elif from_unit == "K":
+        celsius = kelvin_to_celsius(value)
+    else:
+        celsius = value
+
+    # Then convert from Celsius to the target unit
+    if to_unit == "F":
+        return celsius_to_fahrenheit(celsius)
+    elif to_unit == "K":
+        return celsius_to_kelvin(celsius)
+    return celsius
+
+
+def main():
+    """Run the interactive temperature converter."""
+    print("Temperature Converter")
+    print("Units: C (Celsius), F (Fahrenheit), K (Kelvin)")
+
+    try:
+        value = float(input("Enter the temperature value: "))
+        from_unit = input("Convert from (C/F/K): ").strip()
+        to_unit = input("Convert to (C/F/K): ").strip()
+
+        result = convert_temperature(value, from_unit, to_unit)
+        print(f"{value}°{from_unit.upper()} = {result:.2f}°{to_unit.upper()}")
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
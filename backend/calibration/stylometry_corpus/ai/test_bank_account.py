@@ -0,0 +1,44 @@
+import unittest
+
+from bank_account import BankAccount
+
+
+class TestBankAccount(unittest.TestCase):
+    """Unit tests for the BankAccount class."""
+
+    def setUp(self):
+        """Create a fresh account before each test."""
+        self.account = BankAccount("Alice", 100.0)
+
+    def test_initial_balance(self):
+        """The account should start with the given balance."""
+        self.assertEqual(self.account.balance, 100.0)
+
+    def test_deposit_increases_balance(self):
+        """Depositing money should increase the balance."""
+        self.account.deposit(50.0)
+        self.assertEqual(self.account.balance, 150.0)
+
+    def test_withdraw_decreases_balance(self):
+        """Withdrawing money should decrease the balance."""
+        self.account.withdraw(30.0)
+        self.assertEqual(self.account.balance, 70.0)
+
+    def test_withdraw_more_than_balance_raises(self):
+        """Withdrawing more than the balance should raise a ValueError."""
+        with self.assertRaises(ValueError):
+            self.account.withdraw(500.0)
+
+    def test_negative_deposit_raises(self):
+        """Depositing a negative amount should raise a ValueError."""
+        with self.assertRaises(ValueError):
+            self.account.deposit(-10.0)
+
+    def test_zero_withdraw_raises(self):
+        """Withdrawing zero should raise a ValueError."""
+        with self.assertRaises(ValueError):
+            self.account.withdraw(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import pytest
+
+from calculator import add, divide, multiply, subtract
+
+
+class TestCalculator:
+    """Unit tests for the calculator functions."""
+
+    def test_add_positive_numbers(self):
+        assert add(2, 3) == 5
+
+    def test_add_negative_numbers(self):
+        assert add(-2, -3) == -5
+
+    def test_add_floats(self):
+        assert add(0.1, 0.2) == pytest.approx(0.3)
+
+    def test_subtract(self):
+        assert subtract(10, 4) == 6
+
+    def test_subtract_resulting_in_negative(self):
+        assert subtract(4, 10) == -6
+
+    def test_multiply(self):
+        assert multiply(3, 4) == 12
+
+    def test_multiply_by_zero(self):
+        assert multiply(5, 0) == 0
+
+    def test_divide(self):
+        assert divide(10, 2) == 5
+
+    def test_divide_returns_float(self):
+        assert divide(7, 2) == 3.5
+
+    def test_divide_by_zero_raises_error(self):
+        with pytest.raises(ZeroDivisionError):
+            divide(10, 0)
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [
+        (1, 1, 2),
+        (0, 0, 0),
+        (-1, 1, 0),
+        (100, 200, 300),
+    ],
+)
+def test_add_parametrized(a, b, expected):
+    """Test the add function with multiple inputs."""
+    assert add(a, b) == expected
@@ -0,0 +1,73 @@
+import re
+from collections import Counter
+
+
+def count_sentences(text):
+    # Split on sentence-ending punctuation
+    sentences = re.split(r"[.!?]+", text)
+    return len([s for s in sentences if s.strip()])
+
+
+def count_syllables(word):
+    word = word.lower()
+    vowels = "aeiouy"
+    count = 0
+    previous_was_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        # Count a new syllable at the start of each vowel group
+        if is_vowel and not previous_was_vowel:
+            count += 1
+        previous_was_vowel = is_vowel
+
+    # Remove a silent 'e' at the end of the word
+    if word.endswith("e") and count > 1:
+        count -= 1
+    return max(count, 1)
+
+
+def flesch_reading_ease(text):
+    words = re.findall(r"[a-zA-Z']+", text)
+    sentence_count = count_sentences(text)
+    if not words or sentence_count == 0:
+        return 0.0
+
+    syllable_count = sum(count_syllables(word) for word in words)
+    words_per_sentence = len(words) / sentence_count
+    syllables_per_word = syllable_count / len(words)
+
+    # Flesch reading ease formula
+    return 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+
+
+def analyze_text(text):
+    words = re.findall(r"[a-zA-Z']+", text.lower())
+    word_lengths = [len(word) for word in words]
+
+    return {
+        "characters": len(text),
+        "characters_no_spaces": len(text.replace(" ", "")),
+        "words": len(words),
+        "sentences": count_sentences(text),
+        "average_word_length": round(sum(word_lengths) / len(word_lengths), 2) if words else 0,
+        "most_common_words": Counter(words).most_common(5),
+        "reading_ease": round(flesch_reading_ease(text), 2),
+    }
+
+
+def print_report(stats):
+    print("Text Analysis Report")
+    print("=" * 30)
+    for key, value in stats.items():
+        label = key.replace("_", " ").capitalize()
+        print(f"{label}: {value}")
+
+
+if __name__ == "__main__":
+    sample_text = (
+        "Python is a powerful programming language. It is easy to learn and fun to use! "
+        "Many developers choose Python for data science, web development, and automation. "
+        "Do you enjoy programming in Python?"
+    )
+    print_report(analyze_text(sample_text))
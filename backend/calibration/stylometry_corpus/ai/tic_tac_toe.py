@@ -0,0 +1,86 @@
+# Tic-Tac-Toe Game
+# Two players take turns marking spaces on a 3x3 grid.
+
+
+def print_board(board):
+    """Print the current state of the board."""
+    print()
+    for row in range(3):
+        print(" " + " | ".join(board[row * 3:(row + 1) * 3]))
+        if row < 2:
+            print("---+---+---")
+    print()
+
+
+def check_winner(board, player):
+    """Check if the given player has won the game."""
+    winning_combinations = [
+        [0, 1, 2], [3, 4, 5], [6, 7, 8],  # Rows
+        [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Columns
+        [0, 4, 8], [2, 4, 6],             # Diagonals
+    ]
+    return any(all(board[i] == player for i in combo) for combo in winning_combinations)
+
+
+def is_board_full(board):
+    """Check if the board is full (no empty spaces left)."""
+    return all(cell != " " for cell in board)
+
+
+def get_player_move(board, player):
+    """Prompt the current player to choose a position."""
+    while True:
+        try:
+            move = int(input(f"Player {player}, enter your move (1-9): ")) - 1
+            # Validate the move
+            if move < 0 or move > 8:
+                print("Invalid position. Please choose a number between 1 and 9.")
+            elif board[move] != " ":
+                print("That position is already taken. Try again.")
+            else:
+                return move
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+
+
+def play_game():
+    """Main game loop."""
+    board = [" "] * 9
+    current_player = "X"
+
+    print("Welcome to Tic-Tac-Toe!")
+    print("Positions are numbered 1-9, left to right, top to bottom.")
+
+    while True:
+        print_board(board)
+        move = get_player_move(board, current_player)
+        board[move] = current_player
+
+        # Check for a winner
+        if check_winner(board, current_player):
+            print_board(board)
+            print(f"Congratulations! Player {current_player} wins!")
+            break
+
+        # Check for a tie
+        if is_board_full(board):
+            print_board(board)
+            print("It's a tie!")
+            break
+
+        # Switch players
+        current_player = "O" if current_player == "X" else "X"
+
+
+def main():
+    """Run the game and ask the players if they want to play again."""
+    while True:
+        play_game()
+        play_again = input("Do you want to play again? (yes/no): ").strip().lower()
+        if play_again not in ("yes", "y"):
+            print("Thanks for playing!")
+            break
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import tkinter as tk
+
+
+class CounterApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Click Counter")
+        self.count = 0
+
+        self.label = tk.Label(root, text="0", font=("Arial", 48))
+        self.label.pack(pady=20)
+
+        buttons = tk.Frame(root)
+        buttons.pack()
+        tk.Button(buttons, text="-", width=5, command=self.decrement).grid(row=0, column=0, padx=5)
+        tk.Button(buttons, text="Reset", width=8, command=self.reset).grid(row=0, column=1, padx=5)
+        tk.Button(buttons, text="+", width=5, command=self.increment).grid(row=0, column=2, padx=5)
+
+        root.bind("<Up>", lambda event: self.increment())
+        root.bind("<Down>", lambda event: self.decrement())
+
+    def update(self):
+        self.label.config(text=str(self.count), fg="red" if self.count < 0 else "black")
+
+    def increment(self):
+        self.count += 1
+        self.update()
+
+    def decrement(self):
+        self.count -= 1
+        self.update()
+
+    def reset(self):
+        self.count = 0
+        self.update()
+
+
+if __name__ == "__main__":
+    root = tk.Tk()
+    CounterApp(root)
+    root.mainloop()
@@ -0,0 +1,154 @@
+"""
+Simple command-line To-Do List application.
+
+This program allows users to add, list, complete, and delete tasks.
+Tasks are stored in a JSON file so they persist between sessions.
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime
+
+# File where tasks will be stored
+TASKS_FILE = "tasks.json"
+
+
+def load_tasks():
+    """
+    Load tasks from the JSON file.
+
+    Returns:
+        list: A list of task dictionaries.
+    """
+    if not os.path.exists(TASKS_FILE):
+        return []
+    with open(TASKS_FILE, "r") as file:
+        try:
+            return json.load(file)
+        except json.JSONDecodeError:
+            # Return an empty list if the file is corrupted
+            return []
+
+
+def save_tasks(tasks):
+    """
+    Save the list of tasks to the JSON file.
+
+    Args:
+        tasks (list): The list of tasks to save.
+    """
+    with open(TASKS_FILE, "w") as file:
+        json.dump(tasks, file, indent=4)
+
+
+def add_task(description):
+    """
+    Add a new task to the list.
+
+    Args:
+        description (str): The description of the task.
+    """
+    tasks = load_tasks()
+    task = {
+        "id": len(tasks) + 1,
+        "description": description,
+        "completed": False,
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    tasks.append(task)
+    save_tasks(tasks)
+    print(f"Task added successfully: {description}")
+
+
+def list_tasks():
+    """Display all tasks with their status."""
+    tasks = load_tasks()
+    if not tasks:
+        print("No tasks found.")
+        return
+
+    print("\nYour To-Do List:")
+    print("-" * 40)
+    for task in tasks:
+        # Show a checkmark for completed tasks
+        status = "✓" if task["completed"] else "✗"
+        print(f"{task['id']}. [{status}] {task['description']}")
+    print("-" * 40)
+
+
+def complete_task(task_id):
+    """
+    Mark a task as completed.
+
+    Args:
+        task_id (int): The ID of the task to complete.
+    """
+    tasks = load_tasks()
+    for task in tasks:
+        if task["id"] == task_id:
+            task["completed"] = True
+            save_tasks(tasks)
+            print(f"Task {task_id} marked as completed.")
+            return
+    print(f"Task with ID {task_id} not found.")
+
+
+def delete_task(task_id):
+    """
+    Delete a task from the list.
+
+    Args:
+        task_id (int): The ID of the task to delete.
+    """
+    tasks = load_tasks()
+    updated_tasks = [task for task in tasks if task["id"] != task_id]
+
+    if len(updated_tasks) == len(tasks):
+        print(f"Task with ID {task_id} not found.")
+        return
+
+    # Re-number the remaining tasks
+    for index, task in enumerate(updated_tasks, start=1):
+        task["id"] = index
+
+    save_tasks(updated_tasks)
+    print(f"Task {task_id} deleted successfully.")
+
+
+def main():
+    """Main function to parse arguments and execute commands."""
+    parser = argparse.ArgumentParser(description="Simple To-Do List CLI")
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Add command
+    add_parser = subparsers.add_parser("add", help="Add a new task")
+    add_parser.add_argument("description", type=str, help="Task description")
+
+    # List command
+    subparsers.add_parser("list", help="List all tasks")
+
+    # Complete command
+    complete_parser = subparsers.add_parser("complete", help="Mark a task as completed")
+    complete_parser.add_argument("id", type=int, help="Task ID")
+
+    # Delete command
+    delete_parser = subparsers.add_parser("delete", help="Delete a task")
+    delete_parser.add_argument("id", type=int, help="Task ID")
+
+    args = parser.parse_args()
+
+    if args.command == "add":
+        add_task(args.description)
+    elif args.command == "list":
+        list_tasks()
+    elif args.command == "complete":
+        complete_task(args.id)
+    elif args.command == "delete":
+        delete_task(args.id)
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""A command-line unit converter for length, weight, and volume."""
+
+# Conversion factors relative to the base unit of each category
+CONVERSION_FACTORS = {
+    "length": {
+        "base": "meter",
+        "units": {
+            "millimeter": 0.001,
+            "centimeter": 0.01,
+            "meter": 1.0,
+            "kilometer": 1000.0,
+            "inch": 0.0254,
+            "foot": 0.3048,
+            "yard": 0.9144,
+            "mile": 1609.344,
+        },
+    },
+    "weight": {
+        "base": "kilogram",
+        "units": {
+            "gram": 0.001,
+            "kilogram": 1.0,
+            "ounce": 0.0283495,
+            "pound": 0.453592,
+            "ton": 1000.0,
+        },
+    },
+    "volume": {
+        "base": "liter",
+        "units": {
+            "milliliter": 0.001,
+            "liter": 1.0,
+            "gallon": 3.78541,
+            "quart": 0.946353,
+            "cup": 0.236588,
+        },
+    },
+}
+
+
+def convert(value: float, from_unit: str, to_unit: str, category: str) -> float:
+    """
+    Convert a value from one unit to another within the same category.
+
+    Args:
+        value: The numeric value to convert.
+        from_unit: The unit of the input value.
+        to_unit: The desired output unit.
+        category: The measurement category (length, weight, or volume).
+
+    Returns:
+        The converted value.
+    """
+    units = CONVERSION_FACTORS[category]["units"]
+    if from_unit not in units or to_unit not in units:
+        raise ValueError(f"Unsupported unit for {category}.")
+
+    # Convert to the base unit first, then to the target unit
+    value_in_base = value * units[from_unit]
+    return value_in_base / units[to_unit]
+
+
+def choose_option(prompt: str, options: list) -> str:
+    """Display a numbered list of options and return the user's choice."""
+    print(prompt)
+    for index, option in enumerate(options, start=1):
+        print(f"  {index}. {option}")
+    while True:
+        try:
+            choice = int(input("Enter your choice: "))
+            if 1 <= choice <= len(options):
+                return options[choice - 1]
+        except ValueError:
+            pass
+        print("Invalid choice. Please try again.")
+
+
+def main():
+    """Run the interactive unit converter."""
+    print("=== Unit Converter ===")
+    category = choose_option("Select a category:", list(CONVERSION_FACTORS))
+    units = list(CONVERSION_FACTORS[category]["units"])
+
+    from_unit = choose_option("Convert from:", units)
+    to_unit = choose_option("Convert to:", units)
+
+    try:
+        value = float(input(f"Enter the value in {from_unit}s: "))
+        result = convert(value, from_unit, to_unit, category)
+        print(f"\n{value} {from_unit}(s) = {result:.4f} {to_unit}(s)")
+    except ValueError as error:
+        print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+URL Shortener Service
+
+A minimal URL shortener built with Flask and SQLite.
+"""
+
+import hashlib
+import sqlite3
+from urllib.parse import urlparse
+
+from flask import Flask, g, jsonify, redirect, request
+
+app = Flask(__name__)
+DATABASE = "urls.db"
+BASE_URL = "http://localhost:5000/"
+
+
+def get_db():
+    """Get a database connection for the current request."""
+    if "db" not in g:
+        g.db = sqlite3.connect(DATABASE)
+        g.db.row_factory = sqlite3.Row
+    return g.db
+
+
+@app.teardown_appcontext
+def close_db(exception=None):
+    """Close the database connection at the end of the request."""
+    db = g.pop("db", None)
+    if db is not None:
+        db.close()
+
+
+def init_db():
+    """Initialize the database schema."""
+    with app.app_context():
+        db = get_db()
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS urls (
+                short_code TEXT PRIMARY KEY,
+                original_url TEXT NOT NULL,
+                clicks INTEGER DEFAULT 0
+            )
+            """
+        )
+        db.commit()
+
+
+def is_valid_url(url):
+    """Check whether the given string is a valid HTTP or HTTPS URL."""
+    parsed = urlparse(url)
+    return parsed.scheme in ("http", "https") and bool(parsed.netloc)
+
+
+def generate_short_code(url, length=6):
+    """Generate a short code by hashing the original URL."""
+    return hashlib.sha256(url.encode()).hexdigest()[:length]
+
+
+@app.route("/shorten", methods=["POST"])
+def shorten_url():
+    """Create a short URL for the given original URL."""
+    data = request.get_json(silent=True) or {}
+    original_url = data.get("url", "").strip()
+
+    # Validate the input URL
+    if not is_valid_url(original_url):
+        return jsonify({"error": "Please provide a valid URL."}), 400
+
+    short_code = generate_short_code(original_url)
+    db = get_db()
+    db.execute(
+        "INSERT OR IGNORE INTO urls (short_code, original_url) VALUES (?, ?)",
+        (short_code, original_url),
+    )
+    db.commit()
+
+    return jsonify({"short_url": BASE_URL + short_code, "original_url": original_url}), 201
+
+
+@app.route("/<short_code>")
+def redirect_to_url(short_code):
+    """Redirect the user to the original URL."""
+    db = get_db()
+    row = db.execute("SELECT original_url FROM urls WHERE short_code = ?", (short_code,)).fetchone()
+
+    if row is None:
+        return jsonify({"error": "Short URL not found."}), 404
+
+    # Increment the click counter
+    db.execute("UPDATE urls SET clicks = clicks + 1 WHERE short_code = ?", (short_code,))
+    db.commit()
+    return redirect(row["original_url"])
+
+
+@app.route("/stats/<short_code>")
+def url_stats(short_code):
+    """Return statistics for a short URL."""
+    row = get_db().execute("SELECT * FROM urls WHERE short_code = ?", (short_code,)).fetchone()
+    if row is None:
+        return jsonify({"error": "Short URL not found."}), 404
+    return jsonify(dict(row))
+
+
+if __name__ == "__main__":
+    init_db()
+    app.run(debug=True)
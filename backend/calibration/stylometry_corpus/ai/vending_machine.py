@@ -0,0 +1,77 @@
+class VendingMachine:
+    def __init__(self):
+        # Products available in the machine: code -> (name, price, quantity)
+        self.products = {
+            "A1": ["Chips", 1.50, 5],
+            "A2": ["Chocolate", 1.25, 3],
+            "B1": ["Soda", 2.00, 4],
+            "B2": ["Water", 1.00, 6],
+        }
+        # Money inserted by the current customer
+        self.balance = 0.0
+
+    def display_products(self):
+        # Show all products with their codes, prices and stock
+        print("\nAvailable products:")
+        for code, (name, price, quantity) in self.products.items():
+            status = "SOLD OUT" if quantity == 0 else f"{quantity} left"
+            print(f"  {code}: {name:<10} ${price:.2f} ({status})")
+
+    def insert_money(self, amount):
+        # Only accept common coin and bill values
+        accepted = [0.25, 0.50, 1.00, 2.00, 5.00]
+        if amount not in accepted:
+            print(f"Sorry, ${amount:.2f} is not accepted.")
+            return
+        self.balance += amount
+        print(f"Balance: ${self.balance:.2f}")
+
+    def select_product(self, code):
+        # Check that the product exists
+        if code not in self.products:
+            print("Invalid product code.")
+            return
+        name, price, quantity = self.products[code]
+        # Check stock and balance before dispensing
+        if quantity == 0:
+            print(f"{name} is sold out.")
+        elif self.balance < price:
+            print(f"Insufficient funds. {name} costs ${price:.2f}.")
+        else:
+            self.products[code][2] -= 1
+            self.balance -= price
+            print(f"Dispensing {name}...")
+            self.return_change()
+
+    def return_change(self):
+        # Give back whatever balance is left
+        if self.balance > 0:
+            print(f"Returning change: ${self.balance:.2f}")
+        self.balance = 0.0
+
+
+def main():
+    machine = VendingMachine()
+    while True:
+        machine.display_products()
+        print("\nOptions: 1) Insert money  2) Select product  3) Cancel  4) Exit")
+        choice = input("Choose an option: ").strip()
+        if choice == "1":
+            try:
+                machine.insert_money(float(input("Amount: $")))
+            except ValueError:
+                print("Please enter a valid amount.")
+        elif choice == "2":
+            machine.select_product(input("Product code: ").strip().upper())
+        elif choice == "3":
+            machine.return_change()
+        elif choice == "4":
+            machine.return_change()
+            print("Thank you!")
+            break
+        else:
+            print("Invalid option.")
+
+
+if __name__ == "__main__":
+    main()
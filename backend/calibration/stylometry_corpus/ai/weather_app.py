@@ -0,0 +1,101 @@
+"""
+Weather App
+
+Fetches the current weather for a given city using the OpenWeatherMap API.
+Make sure to set your API key in the OPENWEATHER_API_KEY environment variable.
+"""
+
+import os
+import sys
+
+import requests
+
+API_KEY = os.getenv("OPENWEATHER_API_KEY")
+BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+
+def get_weather(city: str, units: str = "metric") -> dict:
+    """
+    Fetch weather data for a specific city.
+
+    Args:
+        city: Name of the city.
+        units: Unit system ("metric" or "imperial").
+
+    Returns:
+        A dictionary containing the weather data.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    params = {
+        "q": city,
+        "appid": API_KEY,
+        "units": units,
+    }
+    response = requests.get(BASE_URL, params=params, timeout=10)
+    # Raise an exception for HTTP errors
+    response.raise_for_status()
+    return response.json()
+
+
+def format_weather(data: dict, units: str = "metric") -> str:
+    """
+    Format the weather data into a readable string.
+
+    Args:
+        data: The weather data returned by the API.
+        units: Unit system used for the request.
+
+    Returns:
+        A formatted string describing the weather.
+    """
+    temperature_unit = "°C" if units == "metric" else "°F"
+    speed_unit = "m/s" if units == "metric" else "mph"
+
+    city = data["name"]
+    country = data["sys"]["country"]
+    description = data["weather"][0]["description"].capitalize()
+    temperature = data["main"]["temp"]
+    feels_like = data["main"]["feels_like"]
+    humidity = data["main"]["humidity"]
+    wind_speed = data["wind"]["speed"]
+
+    return (
+        f"\nWeather in {city}, {country}:\n"
+        f"  Condition:   {description}\n"
+        f"  Temperature: {temperature}{temperature_unit} (feels like {feels_like}{temperature_unit})\n"
+        f"  Humidity:    {humidity}%\n"
+        f"  Wind Speed:  {wind_speed} {speed_unit}\n"
+    )
+
+
+def main():
+    """Main function to get user input and display the weather."""
+    if not API_KEY:
+        print("Error: Please set the OPENWEATHER_API_KEY environment variable.")
+        sys.exit(1)
+
+    city = input("Enter a city name: ").strip()
+    if not city:
+        print("City name cannot be empty.")
+        return
+
+    try:
+        weather_data = get_weather(city)
+        print(format_weather(weather_data))
+    except requests.exceptions.HTTPError as http_err:
+        if http_err.response is not None and http_err.response.status_code == 404:
+            print(f"City '{city}' not found. Please check the spelling.")
+        else:
+            print(f"HTTP error occurred: {http_err}")
+    except requests.exceptions.ConnectionError:
+        print("Network error. Please check your internet connection.")
+    except requests.exceptions.Timeout:
+        print("The request timed out. Please try again later.")
+    except KeyError:
+        print("Unexpected response format from the weather service.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Simple web scraper that collects article titles and links from a news page.
+"""
+
+import csv
+import time
+
+import requests
+from bs4 import BeautifulSoup
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+
+def fetch_page(url, retries=3, delay=2):
+    """
+    Fetch the HTML content of a web page with retry logic.
+
+    Args:
+        url (str): The URL of the page to fetch.
+        retries (int): The number of retry attempts.
+        delay (int): Seconds to wait between retries.
+
+    Returns:
+        str or None: The HTML content, or None if all attempts fail.
+    """
+    for attempt in range(1, retries + 1):
+        try:
+            response = requests.get(url, headers=HEADERS, timeout=10)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as error:
+            print(f"Attempt {attempt} failed: {error}")
+            if attempt < retries:
+                time.sleep(delay)
+    return None
+
+
+def parse_articles(html):
+    """
+    Extract article titles and links from the HTML.
+
+    Args:
+        html (str): The HTML content of the page.
+
+    Returns:
+        list: A list of dictionaries with 'title' and 'link' keys.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    articles = []
+
+    # Find all article headings that contain links
+    for heading in soup.find_all(["h2", "h3"]):
+        link_tag = heading.find("a", href=True)
+        if link_tag:
+            title = link_tag.get_text(strip=True)
+            if title:
+                articles.append({"title": title, "link": link_tag["href"]})
+
+    return articles
+
+
+def save_to_csv(articles, filename="articles.csv"):
+    """
+    Save the scraped articles to a CSV file.
+
+    Args:
+        articles (list): The list of article dictionaries.
+        filename (str): The name of the output CSV file.
+    """
+    with open(filename, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=["title", "link"])
+        writer.writeheader()
+        writer.writerows(articles)
+    print(f"Saved {len(articles)} articles to {filename}")
+
+
+def main():
+    """Main function to run the scraper."""
+    url = "https://example-news-site.com"
+    html = fetch_page(url)
+
+    if html is None:
+        print("Failed to retrieve the page.")
+        return
+
+    articles = parse_articles(html)
+    if articles:
+        for article in articles[:10]:
+            print(f"- {article['title']}")
+        save_to_csv(articles)
+    else:
+        print("No articles found.")
+
+
+if __name__ == "__main__":
+    main()
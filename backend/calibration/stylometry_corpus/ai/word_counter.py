@@ -0,0 +1,92 @@
+import re
+import string
+from collections import Counter
+from pathlib import Path
+
+
+def read_file(file_path: str) -> str:
+    """
+    Read the contents of a text file.
+
+    Args:
+        file_path: The path to the text file.
+
+    Returns:
+        The contents of the file as a string.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"The file '{file_path}' does not exist.")
+    return path.read_text(encoding="utf-8")
+
+
+def clean_text(text: str) -> list[str]:
+    """
+    Convert text to lowercase, remove punctuation, and split into words.
+
+    Args:
+        text: The raw input text.
+
+    Returns:
+        A list of cleaned words.
+    """
+    # Convert to lowercase
+    text = text.lower()
+    # Remove punctuation
+    text = text.translate(str.maketrans("", "", string.punctuation))
+    # Split into words, ignoring extra whitespace
+    return re.findall(r"\b[a-z']+\b", text)
+
+
+def count_words(words: list[str], stop_words: set[str] | None = None) -> Counter:
+    """
+    Count the frequency of each word.
+
+    Args:
+        words: A list of words.
+        stop_words: Optional set of words to exclude from the count.
+
+    Returns:
+        A Counter object mapping words to their frequency.
+    """
+    if stop_words:
+        words = [word for word in words if word not in stop_words]
+    return Counter(words)
+
+
+def display_results(word_counts: Counter, top_n: int = 10) -> None:
+    """
+    Display the most common words and their frequencies.
+
+    Args:
+        word_counts: The Counter of word frequencies.
+        top_n: The number of top words to display.
+    """
+    print(f"\nTop {top_n} most common words:")
+    print("-" * 30)
+    for rank, (word, count) in enumerate(word_counts.most_common(top_n), start=1):
+        print(f"{rank:>2}. {word:<15} {count:>5}")
+    print("-" * 30)
+    print(f"Total words: {sum(word_counts.values())}")
+    print(f"Unique words: {len(word_counts)}")
+
+
+def main() -> None:
+    """Main function to run the word counter."""
+    stop_words = {"the", "a", "an", "and", "or", "of", "to", "in", "is", "it"}
+
+    file_path = input("Enter the path to a text file: ").strip()
+    try:
+        text = read_file(file_path)
+        words = clean_text(text)
+        word_counts = count_words(words, stop_words)
+        display_results(word_counts)
+    except FileNotFoundError as error:
+        print(f"Error: {error}")
+
+
+if __name__ == "__main__":
+    main()
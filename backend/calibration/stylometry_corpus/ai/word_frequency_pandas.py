@@ -0,0 +1,38 @@
+import re
+import sys
+
+import matplotlib.pyplot as plt
+import pandas as pd
+
+# Common words that should not be counted
+STOP_WORDS = {"the", "a", "an", "and", "or", "of", "to", "in", "is", "it", "that", "for", "on", "with", "as"}
+
+
+def word_counts(text):
+    # Lowercase the text and split it into words
+    words = re.findall(r"[a-z']+", text.lower())
+    # Remove stop words and very short words
+    words = [w for w in words if w not in STOP_WORDS and len(w) > 2]
+    # Count each word with pandas
+    return pd.Series(words).value_counts()
+
+
+def plot_top_words(counts, top_n=10):
+    # Draw a horizontal bar chart of the most frequent words
+    top = counts.head(top_n).sort_values()
+    top.plot(kind="barh", color="steelblue")
+    plt.title(f"Top {top_n} words")
+    plt.xlabel("Frequency")
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    # Read the file given on the command line
+    if len(sys.argv) < 2:
+        print("Usage: python word_frequency_pandas.py <file.txt>")
+        sys.exit(1)
+    with open(sys.argv[1], encoding="utf-8") as f:
+        counts = word_counts(f.read())
+    print(counts.head(20).to_string())
+    plot_top_words(counts)
@@ -0,0 +1,381 @@
+"""Background assessment jobs.
+
+An upload is stored under ``JOB_RESULTS_DIR/<job_id>/`` and the assessment runs
+on the shared event loop (see ``runtime``), so the request returns immediately
+and no thread is held per in-flight assessment. Job metadata and results live
+on disk, which lets any web worker process answer status and result requests.
+"""
+from typing import Dict, Any, BinaryIO, List, Optional, Union
+import contextlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: the in-process lock is all there is
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+
+RESULT_FILENAME = 'result.xlsx'
+TRACE_FILENAME = 'trace.jsonl'
+PROFILE_DIRNAME = 'profile'
+
+
+class JobStore:
+    def __init__(self, root: str = None):
+        self.root = root or os.getenv("JOB_RESULTS_DIR", "./job_results")
+        os.makedirs(self.root, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def path(self, job_id: str, filename: str = '') -> str:
+        if not job_id.isalnum():
+            raise ValueError("Invalid job id")
+        return os.path.join(self.root, job_id, filename)
+
+    def create(self, roster: Union[bytes, BinaryIO], roster_filename: str, rubric: str, **meta) -> str:
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.path(job_id))
+        # Keep the original extension, the CSV agent dispatches on it
+        roster_name = 'roster' + os.path.splitext(roster_filename or '')[1].lower()
+        with open(self.path(job_id, roster_name), 'wb') as f:
+            if isinstance(roster, bytes):
+                f.write(roster)
+            else:
+                shutil.copyfileobj(roster, f)
+        with open(self.path(job_id, 'rubric.txt'), 'w', encoding='utf-8') as f:
+            f.write(rubric)
+        self._write(job_id, {
+            'job_id': job_id,
+            'status': STATUS_QUEUED,
+            'roster_file': roster_name,
+            'roster_filename': roster_filename,
+            'created_at': time.time(),
+            **meta
+        })
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path(job_id, 'job.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def update(self, job_id: str, **fields) -> Dict[str, Any]:
+        with self._locked(job_id):
+            meta = {**(self.get(job_id) or {}), **fields}
+            self._write(job_id, meta)
+        return meta
+
+    @contextlib.contextmanager
+    def _locked(self, job_id: str):
+        """Serialize read-modify-write of job.json across threads and, through a lock
+        file next to it, across the API and worker processes sharing JOB_RESULTS_DIR."""
+        with self._lock, open(self.path(job_id, 'job.lock'), 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def append_trace(self, job_id: str, spans: List[Dict[str, Any]]):
+        """Add finished spans to the job's trace; each worker appends its own part."""
+        if not spans:
+            return
+        data = ''.join(json.dumps(s, default=str) + '\n' for s in spans)
+        with open(self.path(job_id, TRACE_FILENAME), 'a', encoding='utf-8') as f:
+            f.write(data)
+
+    def trace(self, job_id: str) -> List[Dict[str, Any]]:
+        spans = []
+        try:
+            with open(self.path(job_id, TRACE_FILENAME), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        spans.append(json.loads(line))
+                    except ValueError:
+                        continue  # Partial line from a writer that is still appending
+        except FileNotFoundError:
+            pass
+        return spans
+
+    def profiles(self, job_id: str) -> Dict[str, Any]:
+        """Summaries of the job's profiles (one per run, or per task in queue mode)."""
+        root = self.path(job_id, PROFILE_DIRNAME)
+        profiles = {}
+        for name in sorted(os.listdir(root)) if os.path.isdir(root) else []:
+            try:
+                with open(os.path.join(root, name, 'summary.json'), 'r', encoding='utf-8') as f:
+                    profiles[name] = json.load(f)
+            except (FileNotFoundError, ValueError):
+                profiles[name] = None  # Still running
+        return profiles
+
+    def _write(self, job_id: str, meta: Dict[str, Any]):
+        # Write-then-rename so readers in other workers never see a partial file
+        tmp_path = self.path(job_id, f'job.json.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, default=str)
+        os.replace(tmp_path, self.path(job_id, 'job.json'))
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = JobStore()
+    return _store
+
+
+def profiled(store: JobStore, job_id: str, meta: Dict[str, Any], name: str):
+    """Profile the block into <job>/profile/<name>/ if the job was created with profile=1."""
+    if not meta.get('profile'):
+        return contextlib.nullcontext()
+    from agents.profiling import profile_run
+
+    return profile_run(store.path(job_id, os.path.join(PROFILE_DIRNAME, name)))
+
+
+async def run_assessment_job(job_id: str) -> Dict[str, Any]:
+    """Run one stored upload through the orchestrator and write its Excel report.
+    The job's spans are kept in its trace file (trace id = job id)."""
+    from agents.loop_watchdog import blocking_summary
+    from agents.tracing import collect_spans, span
+
+    store = get_job_store()
+    meta = store.get(job_id) or {}
+    tenant = meta.get('tenant')
+    with collect_spans() as spans:
+        try:
+            with span('job', trace_id=job_id, job_id=job_id, tenant=tenant):
+                async with profiled(store, job_id, meta, 'run'):
+                    fields = await _run_assessment_job(store, job_id, tenant)
+        except Exception as e:
+            # Profiling or tracing itself failed; the job must still end in a final state
+            logger.exception(f"Assessment job {job_id} failed")
+            fields = {'status': STATUS_FAILED, 'error': str(e)}
+        finally:
+            store.append_trace(job_id, spans)
+    blocking = blocking_summary(spans)
+    if blocking:
+        fields['blocking_calls'] = blocking
+    # Only now, with the trace and profile written, is the job reported as finished
+    return store.update(job_id, finished_at=time.time(), **fields)
+
+
+async def _run_assessment_job(store: JobStore, job_id: str, tenant: Optional[str]) -> Dict[str, Any]:
+    """Run the assessment and return the job's final status fields."""
+    from agents.services import get_orchestrator
+    from agents.scheduler import get_scheduler, scheduling_context, SchedulerSaturated, PRIORITY_BATCH
+
+    try:
+        # Batch priority: jobs run within the scheduler's 'job' budget and their LLM and
+        # fetch calls queue behind interactive requests, fairly across tenants
+        async with scheduling_context(tenant, PRIORITY_BATCH), get_scheduler().slot('job'):
+            meta = store.update(job_id, status=STATUS_RUNNING, started_at=time.time())
+            roster_path = store.path(job_id, meta['roster_file'])
+            with open(store.path(job_id, 'rubric.txt'), 'r', encoding='utf-8') as f:
+                rubric = f.read()
+            # The CSV agent streams the stored roster from disk
+            csv_data = {
+                'file_storage': roster_path,
+                'filename': meta['roster_file'],
+                'cohort': meta.get('cohort')
+            }
+
+            orchestrator = await get_orchestrator()
+            result = await orchestrator.process_assessment(
+                csv_data, rubric, assessment_mode=meta.get('assessment_mode')
+            )
+            if 'error' in result:
+                return {'status': STATUS_FAILED, 'error': result['error']}
+
+            fields = {
+                'status': STATUS_COMPLETED,
+                'run_id': result.get('run_id'),
+                'summary': result.get('summary', {}),
+                'student_count': len(result.get('results', [])),
+            }
+            if result.get('results'):
+                excel_bytes = await orchestrator.report_agent._generate_excel_report(
+                    result['results'], similarity_report=result.get('similarity_report')
+                )
+                with open(store.path(job_id, RESULT_FILENAME), 'wb') as f:
+                    f.write(excel_bytes.getbuffer())
+                fields['result_file'] = RESULT_FILENAME
+            return fields
+
+    except SchedulerSaturated as e:
+        # A burst got past the route's admission check; the job never started
+        logger.warning(f"Assessment job {job_id} rejected: {e}")
+        return {'status': STATUS_FAILED, 'error': f"Rejected, server busy: {e}", 'rejected': True}
+    except Exception as e:
+        logger.exception(f"Assessment job {job_id} failed")
+        return {'status': STATUS_FAILED, 'error': str(e)}
+
+
+# --- Queue execution (JOB_EXECUTION=queue) ---
+# The API process only enqueues a 'prepare' task; worker processes (worker.py) parse
+# the roster, fan out one 'student' task per student, and the worker that finishes the
+# last one enqueues the cohort-level 'finalize' task.
+
+def queue_execution_enabled() -> bool:
+    return os.getenv("JOB_EXECUTION", "local").lower() == 'queue'
+
+
+def enqueue_assessment_job(job_id: str):
+    """Hand a job to the workers. Create it with ``execution='queue'``: once the prepare
+    task is in the queue, a worker may already be updating the job."""
+    from task_queue import get_task_queue
+
+    get_task_queue().enqueue(job_id, 'prepare', {'job_id': job_id}, dedupe_key=f"{job_id}:prepare")
+
+
+def job_progress(job_id: str) -> Dict[str, int]:
+    from task_queue import get_task_queue
+
+    return get_task_queue().progress(job_id, 'student')
+
+
+def _job_inputs(store: JobStore, job_id: str):
+    meta = store.get(job_id)
+    if meta is None:
+        raise ValueError(f"Unknown job {job_id}")
+    with open(store.path(job_id, 'rubric.txt'), 'r', encoding='utf-8') as f:
+        rubric = f.read()
+    return meta, rubric
+
+
+async def run_prepare_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from agents.roster import RepoGroups
+    from agents.services import get_orchestrator
+    from task_queue import FollowUp, TaskResult
+
+    job_id = payload['job_id']
+    store = get_job_store()
+    meta = store.get(job_id)
+    roster_path = store.path(job_id, meta['roster_file'])
+    csv_data = {'file_storage': roster_path, 'filename': meta['roster_file']}
+
+    csv_result = await (await get_orchestrator()).csv_agent.process(csv_data)
+    if 'error' in csv_result:
+        raise ValueError(f"CSV processing failed: {csv_result['error']}")
+
+    # One task per unique repository; the finalize task fans results out to every member
+    groups = RepoGroups()
+    representatives = [s for s in (groups.add(student) for student in csv_result['students']) if s is not None]
+    members = list(groups.groups.values())
+    # A retried prepare keeps the run id of the attempt that may already have fanned out
+    store.update(job_id, status=STATUS_RUNNING, started_at=meta.get('started_at') or time.time(),
+                 run_id=meta.get('run_id') or uuid.uuid4().hex,
+                 student_total=len(csv_result['students']), repo_total=len(representatives))
+    # The worker enqueues these only as it completes this task, in the same transaction, and
+    # the keys make a retry after a lost lease re-enqueue nothing
+    if representatives:
+        follow_up = FollowUp(job_id, 'student', [
+            {'job_id': job_id, 'index': idx, 'student': student, 'members': group}
+            for idx, (student, group) in enumerate(zip(representatives, members))
+        ], [f"{job_id}:student:{idx}" for idx in range(len(representatives))])
+    else:
+        follow_up = FollowUp(job_id, 'finalize', [{'job_id': job_id}], [f"{job_id}:finalize"])
+    return TaskResult({'students': len(csv_result['students']), 'repos': len(representatives)}, [follow_up])
+
+
+async def run_student_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from agents.services import get_orchestrator
+
+    meta, rubric = _job_inputs(get_job_store(), payload['job_id'])
+    orchestrator = await get_orchestrator()
+    mode = meta.get('assessment_mode') or orchestrator.assessment_mode
+    return await orchestrator.assess_student_stage(payload['student'], rubric, mode)
+
+
+def maybe_enqueue_finalize(job_id: str):
+    """Enqueue the cohort-level task once no student task is pending. Safe to call from
+    several workers at once: the dedupe key makes the enqueue idempotent."""
+    from task_queue import get_task_queue, QUEUED, LEASED
+
+    queue = get_task_queue()
+    progress = queue.progress(job_id, 'student')
+    if progress[QUEUED] == 0 and progress[LEASED] == 0:
+        queue.enqueue(job_id, 'finalize', {'job_id': job_id}, dedupe_key=f"{job_id}:finalize")
+
+
+async def run_finalize_task(payload: Dict[str, Any]) -> Dict[str, Any]:
+    from agents.loop_watchdog import blocking_summary
+    from agents.services import get_orchestrator
+    from task_queue import get_task_queue, DONE
+
+    job_id = payload['job_id']
+    store = get_job_store()
+    meta, rubric = _job_inputs(store, job_id)
+    orchestrator = await get_orchestrator()
+    mode = meta.get('assessment_mode') or orchestrator.assessment_mode
+
+    stage_results = []
+    failed_students = []
+    for task in get_task_queue().results(job_id, 'student'):
+        members = task['payload'].get('members') or [task['payload']['student']]
+        if task['status'] == DONE and task['result']:
+            stage_results.append({**task['result'], 'members': members})
+        else:
+            failed_students.extend({'student_name': member.get('name'), 'error': task['error']}
+                                   for member in members)
+
+    result = await orchestrator.finalize_assessment(
+        meta.get('run_id') or uuid.uuid4().hex, mode, stage_results, rubric, cohort=meta.get('cohort')
+    )
+    if 'error' in result:
+        store.update(job_id, status=STATUS_FAILED, error=result['error'], finished_at=time.time())
+        return {'error': result['error']}
+
+    fields = {
+        'status': STATUS_COMPLETED,
+        'summary': result.get('summary', {}),
+        'student_count': len(result.get('results', [])),
+        'failed_students': failed_students,
+    }
+    blocking = blocking_summary(store.trace(job_id))
+    if blocking:
+        fields['blocking_calls'] = blocking
+    if result.get('results'):
+        excel_bytes = await orchestrator.report_agent._generate_excel_report(
+            result['results'], similarity_report=result.get('similarity_report')
+        )
+        with open(store.path(job_id, RESULT_FILENAME), 'wb') as f:
+            f.write(excel_bytes.getbuffer())
+        fields['result_file'] = RESULT_FILENAME
+    store.update(job_id, finished_at=time.time(), **fields)
+    return {'student_count': fields['student_count']}
+
+
+def on_task_failed(task: Dict[str, Any], error: str):
+    """Called once a task has failed for good (attempts exhausted)."""
+    job_id = task['job_id']
+    if task['kind'] == 'student':
+        # A failed student is reported in the job, not fatal to it
+        maybe_enqueue_finalize(job_id)
+    else:
+        get_job_store().update(job_id, status=STATUS_FAILED, error=f"{task['kind']} failed: {error}",
+                               finished_at=time.time())
+
+
+TASK_HANDLERS = {
+    'prepare': run_prepare_task,
+    'student': run_student_task,
+    'finalize': run_finalize_task,
+}
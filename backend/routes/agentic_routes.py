@@ -1,46 +1,120 @@
 agentic_routes = None  # placeholder to allow search/replace to work
 
-from flask import Blueprint, request, jsonify
-from agents.orchestrator import process_with_azure_openai, process_with_openai, AgentOrchestrator
+from flask import Blueprint, request, jsonify, Response
+from agents.orchestrator import aprocess_with_llm
+from agents.services import get_services
+from agents.metrics import REGISTRY
+from agents.tracing import waterfall
+from agents.loop_watchdog import get_watchdog
+from agents.scheduler import (
+    get_scheduler, scheduling_context, SchedulerSaturated, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+)
+from jobs import (
+    get_job_store, run_assessment_job, enqueue_assessment_job, queue_execution_enabled, job_progress,
+    STATUS_COMPLETED, PROFILE_DIRNAME
+)
+from agents.profiling import PROFILE_FILES
+import runtime
 import csv
 import io
-import asyncio
+import os
 
 agentic_routes = Blueprint('agentic_routes', __name__)
 
+def _scheduler_samples(field):
+    def collect():
+        stats = get_scheduler(runtime.get_loop()).stats()
+        return [(f'scheduler_{field}', {'resource': resource}, values[field]) for resource, values in stats.items()]
+    return collect
+
+def _task_queue_samples():
+    if not queue_execution_enabled():
+        return []
+    from task_queue import get_task_queue
+    return [('task_queue_tasks', {'kind': kind, 'status': status}, count)
+            for kind, statuses in get_task_queue().depth().items() for status, count in statuses.items()]
+
+REGISTRY.register_collector('scheduler_in_use', 'gauge', 'Scheduler slots in use per resource',
+                            _scheduler_samples('in_use'))
+REGISTRY.register_collector('scheduler_queued', 'gauge', 'Scheduler waiters per resource',
+                            _scheduler_samples('queued'))
+REGISTRY.register_collector('task_queue_tasks', 'gauge', 'Durable queue tasks by kind and status',
+                            _task_queue_samples)
+
+def _tenant():
+    """Fair-queuing key: an explicit tenant (course/instructor), else the client address."""
+    return request.headers.get('X-Tenant-ID') or request.form.get('tenant') or request.remote_addr
+
+async def _scheduled(coro, tenant, priority, resource=None):
+    async with scheduling_context(tenant, priority):
+        try:
+            if resource is None:
+                return await coro
+            async with get_scheduler().slot(resource):
+                return await coro
+        finally:
+            # No-op once awaited; avoids a never-awaited warning when the slot is refused
+            coro.close()
+
+def _saturated(e: SchedulerSaturated):
+    return jsonify({
+        "success": False,
+        "error": f"Server is busy: {e}",
+        "resource": e.resource
+    }), 429, {"Retry-After": "30"}
+
 @agentic_routes.route('/api/agentic/process', methods=['POST'])
 def agentic_process():
     """
     Endpoint to process a repo/code using the double agentic system.
-    Tries Azure OpenAI first; if a content policy error is encountered, falls back to OpenAI.
+    The provider router picks Azure OpenAI or OpenAI by health and latency, hedges
+    slow requests to the other provider, and falls back to it on errors
+    (including content policy rejections).
     Expects JSON: { "repo": ..., "prompt": ... }
     """
     data = request.get_json()
     repo = data.get('repo')
     prompt = data.get('prompt')
 
-    # Try Azure OpenAI (primary)
+    # Interactive priority: single-repo calls go ahead of queued batch work
     try:
-        result = process_with_azure_openai(repo, prompt)
-        if result.get('error') == 'content_policy':
-            # Fallback to OpenAI (secondary)
-            fallback_result = process_with_openai(repo, prompt)
-            return jsonify({
-                "llm_used": "openai",
-                "result": fallback_result
-            })
+        get_scheduler(runtime.get_loop()).admit('llm')
+    except SchedulerSaturated as e:
+        return _saturated(e)
+    result = runtime.run(_scheduled(aprocess_with_llm(repo, prompt), _tenant(), PRIORITY_INTERACTIVE))
+    if 'error' in result:
         return jsonify({
-            "llm_used": "azure_openai",
-            "result": result
-        })
-    except Exception as e:
-        # Fallback to OpenAI on any error
-        fallback_result = process_with_openai(repo, prompt)
-        return jsonify({
-            "llm_used": "openai",
-            "result": fallback_result,
-            "error": str(e)
-        })
+            "llm_used": None,
+            "result": result,
+            "error": result['error']
+        }), 502
+    return jsonify({
+        "llm_used": result.pop('provider'),
+        "result": result
+    })
+
+@agentic_routes.route('/api/agentic/providers', methods=['GET'])
+def agentic_providers():
+    """Per-provider health: circuit state, error rate and latency percentiles."""
+    return jsonify(get_services().router.stats())
+
+@agentic_routes.route('/api/agentic/loop', methods=['GET'])
+def agentic_loop_watchdog():
+    """Event-loop stalls per agent and the most recent offenders with their stacks."""
+    watchdog = get_watchdog(runtime.get_loop())
+    if watchdog is None:
+        return jsonify({"error": "Loop watchdog is disabled (LOOP_WATCHDOG=0)"}), 404
+    return jsonify(watchdog.stats())
+
+@agentic_routes.route('/api/agentic/scheduler', methods=['GET'])
+def agentic_scheduler():
+    """Per-resource budgets: slots in use, queue depth per tenant, granted and rejected counts."""
+    return jsonify(get_scheduler(runtime.get_loop()).stats())
+
+@agentic_routes.route('/metrics', methods=['GET'])
+def metrics():
+    """Prometheus text exposition: stage/agent/LLM latency, tokens, cost, cache hits, queue depths."""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
 
 from flask import send_file
 import io
@@ -52,7 +126,10 @@ def agentic_upload_csv():
     Accepts multipart/form-data with:
       - file: CSV file with columns 'name' and 'repo_url'
       - rubric: rubric file (text or JSON)
+      - assessment_mode (optional): 'batch', 'separate' or 'combined'
     Returns an Excel file with results for each student.
+    The request thread is held until the whole assessment is done; use /api/agentic/jobs
+    for rosters that take longer than a client will wait.
     """
     if 'file' not in request.files or 'rubric' not in request.files:
         return jsonify({"success": False, "error": "CSV file and rubric file are required."}), 400
@@ -63,27 +140,35 @@ def agentic_upload_csv():
     # Read rubric content
     rubric_content = rubric_file.read().decode('utf-8')
 
-    # Read CSV content as string
-    csv_content = csv_file.read().decode('utf-8')
+    # The roster is parsed straight from the upload stream (CSV or Excel), not read whole
     csv_data = {
-        'file_content': csv_content,
+        'file_storage': csv_file,
         'filename': csv_file.filename
     }
 
-    # Use AgentOrchestrator for real assessment
-    orchestrator = AgentOrchestrator()
-    result = asyncio.run(orchestrator.process_assessment(csv_data, rubric_content))
+    # Shared AgentOrchestrator: agents, LLM clients and the vector store are built once per process
+    orchestrator = get_services().orchestrator
+    try:
+        get_scheduler(runtime.get_loop()).admit('job')
+        result = runtime.run(_scheduled(
+            orchestrator.process_assessment(
+                csv_data, rubric_content, assessment_mode=request.form.get('assessment_mode')
+            ),
+            _tenant(), PRIORITY_BATCH, resource='job'
+        ))
+    except SchedulerSaturated as e:
+        return _saturated(e)
 
     # Generate Excel file from results
     # The report_agent already generates the Excel file in _generate_excel_report
     # We'll call it directly here for download
     if 'results' in result and result['results']:
-        from agents.report_agent import ReportAgent
-        report_agent = ReportAgent()
-        excel_bytes = asyncio.run(report_agent._generate_excel_report(result['results']))
+        report_agent = get_services().report_agent
+        excel_bytes = runtime.run(report_agent._generate_excel_report(
+            result['results'], similarity_report=result.get('similarity_report')
+        ))
         excel_bytes.seek(0)
         # Save to backend/result.xlsx
-        import os
         os.makedirs("backend", exist_ok=True)
         with open("backend/result.xlsx", "wb") as f:
             f.write(excel_bytes.getbuffer())
@@ -97,3 +182,124 @@ def agentic_upload_csv():
         )
     else:
         return jsonify(result)
+
+@agentic_routes.route('/api/agentic/jobs', methods=['POST'])
+def agentic_create_job():
+    """
+    Queue an assessment and return immediately with a job id (202).
+    Accepts the same multipart/form-data as /api/agentic/upload_csv, plus optional
+    'cohort' and 'profile' (1 to capture a CPU/allocation/loop-lag profile of the run).
+    Poll /api/agentic/jobs/<job_id> and download /api/agentic/jobs/<job_id>/result.
+    """
+    if 'file' not in request.files or 'rubric' not in request.files:
+        return jsonify({"success": False, "error": "CSV file and rubric file are required."}), 400
+
+    try:
+        get_scheduler(runtime.get_loop()).admit('job')
+    except SchedulerSaturated as e:
+        return _saturated(e)
+
+    roster_file = request.files['file']
+    store = get_job_store()
+    queued = queue_execution_enabled()
+    job_id = store.create(
+        roster_file.stream,
+        roster_file.filename,
+        request.files['rubric'].read().decode('utf-8'),
+        assessment_mode=request.form.get('assessment_mode'),
+        cohort=request.form.get('cohort'),
+        tenant=_tenant(),
+        profile=request.form.get('profile', '').lower() in ('1', 'true', 'yes'),
+        execution='queue' if queued else 'local'
+    )
+    if queued:
+        # Workers (worker.py) pick the job up from the durable queue
+        enqueue_assessment_job(job_id)
+    else:
+        runtime.submit(run_assessment_job(job_id))
+
+    return jsonify({
+        "job_id": job_id,
+        "status": store.get(job_id)['status'],
+        "status_url": f"/api/agentic/jobs/{job_id}",
+        "result_url": f"/api/agentic/jobs/{job_id}/result"
+    }), 202
+
+@agentic_routes.route('/api/agentic/jobs/<job_id>', methods=['GET'])
+def agentic_job_status(job_id):
+    """Job status, timings and, once completed, the assessment summary."""
+    try:
+        meta = get_job_store().get(job_id)
+    except ValueError:
+        meta = None
+    if meta is None:
+        return jsonify({"error": "Job not found"}), 404
+    if meta.get('execution') == 'queue':
+        meta['progress'] = job_progress(job_id)
+    return jsonify(meta)
+
+@agentic_routes.route('/api/agentic/jobs/<job_id>/trace', methods=['GET'])
+def agentic_job_trace(job_id):
+    """Waterfall of the job's trace spans. ?student=<name> keeps only that student's spans."""
+    store = get_job_store()
+    try:
+        meta = store.get(job_id)
+    except ValueError:
+        meta = None
+    if meta is None:
+        return jsonify({"error": "Job not found"}), 404
+    spans = store.trace(job_id)
+    student = request.args.get('student')
+    if student:
+        spans = [s for s in spans if s['attributes'].get('student') == student]
+    return jsonify({'job_id': job_id, 'status': meta['status'], **waterfall(spans)})
+
+@agentic_routes.route('/api/agentic/jobs/<job_id>/profile', methods=['GET'])
+def agentic_job_profiles(job_id):
+    """Summaries of a profiled job's runs; download files from .../profile/<name>/<file>."""
+    store = get_job_store()
+    try:
+        meta = store.get(job_id)
+    except ValueError:
+        meta = None
+    if meta is None:
+        return jsonify({"error": "Job not found"}), 404
+    if not meta.get('profile'):
+        return jsonify({"error": "Job was not created with profile=1"}), 404
+    return jsonify({'job_id': job_id, 'status': meta['status'], 'files': list(PROFILE_FILES),
+                    'profiles': store.profiles(job_id)})
+
+@agentic_routes.route('/api/agentic/jobs/<job_id>/profile/<name>/<filename>', methods=['GET'])
+def agentic_job_profile_file(job_id, name, filename):
+    store = get_job_store()
+    try:
+        meta = store.get(job_id)
+    except ValueError:
+        meta = None
+    if meta is None or filename not in PROFILE_FILES or not name.replace('-', '').isalnum():
+        return jsonify({"error": "Profile not found"}), 404
+    path = os.path.abspath(store.path(job_id, os.path.join(PROFILE_DIRNAME, name, filename)))
+    if not os.path.exists(path):
+        return jsonify({"error": "Profile not found"}), 404
+    return send_file(path, as_attachment=True, download_name=f"{job_id}-{name}-{filename}")
+
+@agentic_routes.route('/api/agentic/jobs/<job_id>/result', methods=['GET'])
+def agentic_job_result(job_id):
+    """The job's Excel report; 409 while the job has not completed."""
+    store = get_job_store()
+    try:
+        meta = store.get(job_id)
+    except ValueError:
+        meta = None
+    if meta is None:
+        return jsonify({"error": "Job not found"}), 404
+    if meta['status'] != STATUS_COMPLETED:
+        return jsonify({"error": "Job has not completed", "status": meta['status']}), 409
+    if not meta.get('result_file'):
+        return jsonify({"error": "Job produced no results", "summary": meta.get('summary', {})}), 404
+    return send_file(
+        os.path.abspath(store.path(job_id, meta['result_file'])),
+        mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        as_attachment=True,
+        download_name='assessment_results.xlsx'
+    )
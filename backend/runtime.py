@@ -0,0 +1,39 @@
+"""Persistent asyncio event loop for the web process.
+
+Flask views are synchronous, so instead of calling ``asyncio.run()`` per request
+(a new loop, and new loop-bound state, every time) they hand coroutines to one
+long-lived loop running in a background thread. Long assessments are submitted
+without blocking the request thread at all; short calls wait on the result.
+"""
+from concurrent.futures import Future
+from typing import Any, Coroutine
+import asyncio
+import threading
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """The process-wide event loop, started on first use."""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name='agent-event-loop', daemon=True)
+                thread.start()
+                from agents.loop_watchdog import watch_loop
+                watch_loop(loop)
+                _loop = loop
+    return _loop
+
+
+def submit(coro: Coroutine) -> Future:
+    """Schedule a coroutine on the shared loop and return immediately."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run(coro: Coroutine, timeout: float = None) -> Any:
+    """Run a coroutine on the shared loop and wait for its result."""
+    return submit(coro).result(timeout)
@@ -0,0 +1,255 @@
+"""Durable task queue on SQLite.
+
+Tasks are leased rather than popped: a worker that leases a task owns it until
+its lease expires, and must heartbeat to keep it. If the worker dies, the task
+becomes visible again after the visibility timeout and another worker picks it
+up. Each lease counts as an attempt; tasks that exhaust ``max_attempts`` are
+marked failed.
+
+The database can live on a shared volume so workers on several machines pull
+from the same queue (see ``worker.py``).
+"""
+from contextlib import contextmanager
+from typing import Dict, Any, List, NamedTuple, Optional
+import json
+import os
+import sqlite3
+import threading
+import time
+
+QUEUED = 'queued'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class FollowUp(NamedTuple):
+    """Tasks to enqueue when the task that produced them completes (see ``TaskQueue.complete``)."""
+    job_id: str
+    kind: str
+    payloads: List[Dict[str, Any]]
+    dedupe_keys: List[str]
+    priority: int = 10
+
+
+class TaskResult(NamedTuple):
+    """What a task handler returns when it fans out: its own result plus the follow-ups."""
+    result: Any
+    follow_ups: List[FollowUp]
+
+
+class TaskQueue:
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("TASK_QUEUE_PATH", "./task_queue/tasks.sqlite3")
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.default_lease = float(os.getenv("TASK_LEASE_SECONDS", "120"))
+        self.max_attempts = int(os.getenv("TASK_MAX_ATTEMPTS", "3"))
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    priority INTEGER NOT NULL DEFAULT 10,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    dedupe_key TEXT UNIQUE,
+                    result TEXT,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks (status, priority, id);
+                CREATE INDEX IF NOT EXISTS idx_tasks_job ON tasks (job_id, kind, status);
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; isolation_level=None so transactions are explicit
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        # IMMEDIATE takes the write lock up front so two workers cannot lease the same row
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def enqueue(self, job_id: str, kind: str, payload: Dict[str, Any], priority: int = 10,
+                dedupe_key: str = None, max_attempts: int = None) -> Optional[int]:
+        """Add a task; with a dedupe_key, a second enqueue of the same key is a no-op."""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO tasks (job_id, kind, payload, priority, max_attempts, dedupe_key,"
+                " created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, json.dumps(payload), priority, max_attempts or self.max_attempts,
+                 dedupe_key, now, now)
+            )
+            return cursor.lastrowid if cursor.rowcount else None
+
+    def enqueue_many(self, job_id: str, kind: str, payloads: List[Dict[str, Any]], priority: int = 10,
+                     dedupe_keys: List[str] = None) -> int:
+        """Add several tasks at once; keyed tasks already in the queue are skipped.
+        Returns how many were added."""
+        with self._transaction() as conn:
+            return self._insert_many(conn, job_id, kind, payloads, priority, dedupe_keys)
+
+    def _insert_many(self, conn: sqlite3.Connection, job_id: str, kind: str, payloads: List[Dict[str, Any]],
+                     priority: int = 10, dedupe_keys: List[Optional[str]] = None) -> int:
+        now = time.time()
+        keys = dedupe_keys if dedupe_keys is not None else [None] * len(payloads)
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO tasks (job_id, kind, payload, priority, max_attempts, dedupe_key,"
+            " created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(job_id, kind, json.dumps(p), priority, self.max_attempts, key, now, now)
+             for p, key in zip(payloads, keys)]
+        )
+        return conn.total_changes - before
+
+    def lease(self, worker_id: str, kinds: List[str] = None, lease_seconds: float = None) -> Optional[Dict[str, Any]]:
+        """Claim the next ready task (queued, or leased with an expired lease)."""
+        now = time.time()
+        kind_filter = ''
+        params: List[Any] = [QUEUED, LEASED, now]
+        if kinds:
+            kind_filter = f" AND kind IN ({','.join('?' * len(kinds))})"
+            params.extend(kinds)
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM tasks WHERE (status = ? OR (status = ? AND lease_expires < ?))"
+                " AND attempts < max_attempts" + kind_filter + " ORDER BY priority, id LIMIT 1",
+                params
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1,"
+                " updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + (lease_seconds or self.default_lease), now, row['id'])
+            )
+        task = dict(row)
+        task['payload'] = json.loads(task['payload'])
+        task['attempts'] += 1
+        return task
+
+    def expire_exhausted(self) -> List[Dict[str, Any]]:
+        """Fail tasks whose last allowed lease expired without completion (the worker died)."""
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, job_id, kind, payload FROM tasks"
+                " WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts",
+                (LEASED, now)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE tasks SET status = ?, error = COALESCE(error, 'lease expired'), lease_owner = NULL,"
+                " updated_at = ? WHERE id = ?",
+                [(FAILED, now, row['id']) for row in rows]
+            )
+        return [{**dict(row), 'payload': json.loads(row['payload'])} for row in rows]
+
+    def heartbeat(self, task_id: int, worker_id: str, lease_seconds: float = None) -> bool:
+        """Extend a lease; False if the lease was lost to another worker."""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ?, updated_at = ? WHERE id = ? AND status = ? AND lease_owner = ?",
+                (now + (lease_seconds or self.default_lease), now, task_id, LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, task_id: int, worker_id: str, result: Any, follow_ups: List[FollowUp] = None) -> bool:
+        """Mark a leased task done and enqueue its follow-up tasks in the same transaction,
+        so a task retried after a lost lease can neither drop nor duplicate its fan-out."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, result = ?, lease_owner = NULL, updated_at = ?"
+                " WHERE id = ? AND status = ? AND lease_owner = ?",
+                (DONE, json.dumps(result, default=str), time.time(), task_id, LEASED, worker_id)
+            )
+            if cursor.rowcount != 1:
+                return False
+            for follow_up in follow_ups or []:
+                self._insert_many(conn, follow_up.job_id, follow_up.kind, follow_up.payloads,
+                                  follow_up.priority, follow_up.dedupe_keys)
+            return True
+
+    def fail(self, task_id: int, worker_id: str, error: str) -> bool:
+        """Record a failed attempt: requeue, or mark failed once attempts are exhausted."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END,"
+                " error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ?"
+                " WHERE id = ? AND status = ? AND lease_owner = ?",
+                (FAILED, QUEUED, error, time.time(), task_id, LEASED, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def progress(self, job_id: str, kind: str = None) -> Dict[str, int]:
+        query = "SELECT status, COUNT(*) FROM tasks WHERE job_id = ?"
+        params: List[Any] = [job_id]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        counts = {QUEUED: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for status, count in self._connect().execute(query + " GROUP BY status", params):
+            counts[status] = count
+        counts['total'] = sum(counts.values())
+        return counts
+
+    def results(self, job_id: str, kind: str) -> List[Dict[str, Any]]:
+        rows = self._connect().execute(
+            "SELECT id, status, payload, result, error FROM tasks WHERE job_id = ? AND kind = ? ORDER BY id",
+            (job_id, kind)
+        ).fetchall()
+        return [
+            {
+                'id': row['id'],
+                'status': row['status'],
+                'payload': json.loads(row['payload']),
+                'result': json.loads(row['result']) if row['result'] else None,
+                'error': row['error']
+            }
+            for row in rows
+        ]
+
+    def depth(self) -> Dict[str, Dict[str, int]]:
+        """Task counts by kind and status across all jobs."""
+        depth: Dict[str, Dict[str, int]] = {}
+        for kind, status, count in self._connect().execute(
+            "SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status"
+        ):
+            depth.setdefault(kind, {})[status] = count
+        return depth
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_task_queue() -> TaskQueue:
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = TaskQueue()
+    return _queue
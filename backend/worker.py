@@ -0,0 +1,138 @@
+"""Assessment worker.
+
+Pulls tasks from the durable queue (``task_queue``) and runs them with the shared
+agent services. Start as many as needed, on one or more machines that share
+TASK_QUEUE_PATH and JOB_RESULTS_DIR; set JOB_EXECUTION=queue on the API so it only
+enqueues work.
+
+    python worker.py --concurrency 8
+"""
+from typing import Dict, Any
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+
+from agents.cpu_pool import warm_cpu_pool
+from agents.loop_watchdog import watch_loop
+from agents.scheduler import scheduling_context, PRIORITY_BATCH
+from agents.tracing import collect_spans, span
+from jobs import TASK_HANDLERS, get_job_store, maybe_enqueue_finalize, on_task_failed, profiled
+from task_queue import TaskResult, get_task_queue
+
+logger = logging.getLogger(__name__)
+
+
+class Worker:
+    def __init__(self, concurrency: int = 4, poll_interval: float = 1.0, kinds=None):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.kinds = kinds
+        self.queue = get_task_queue()
+        self.lease_seconds = self.queue.default_lease
+        self._stopping = asyncio.Event()
+
+    def stop(self):
+        logger.info(f"Worker {self.worker_id} stopping after in-flight tasks")
+        self._stopping.set()
+
+    async def run(self):
+        logger.info(f"Worker {self.worker_id} started with concurrency {self.concurrency}")
+        slots = asyncio.Semaphore(self.concurrency)
+        running = set()
+        while not self._stopping.is_set():
+            await slots.acquire()
+            # SQLite calls are short but blocking; keep them off the event loop
+            for task in await asyncio.to_thread(self.queue.expire_exhausted):
+                on_task_failed(task, 'lease expired')
+            task = await asyncio.to_thread(self.queue.lease, self.worker_id, self.kinds, self.lease_seconds)
+            if task is None:
+                slots.release()
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            runner = asyncio.create_task(self._run_task(task))
+            running.add(runner)
+            runner.add_done_callback(lambda t: (running.discard(t), slots.release()))
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _heartbeat(self, task_id: int):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            if not await asyncio.to_thread(self.queue.heartbeat, task_id, self.worker_id, self.lease_seconds):
+                logger.warning(f"Lost lease on task {task_id}")
+                return
+
+    async def _run_task(self, task: Dict[str, Any]):
+        handler = TASK_HANDLERS.get(task['kind'])
+        heartbeat = asyncio.create_task(self._heartbeat(task['id']))
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown task kind: {task['kind']}")
+            meta = get_job_store().get(task['job_id']) or {}
+            with collect_spans() as spans:
+                try:
+                    # One trace per job (trace id = job id) across all workers' tasks
+                    with span(f"task.{task['kind']}", trace_id=task['job_id'], job_id=task['job_id'],
+                              run_id=meta.get('run_id'), task_id=task['id'], attempt=task['attempts'],
+                              worker=self.worker_id):
+                        async with scheduling_context(meta.get('tenant'), PRIORITY_BATCH), \
+                                profiled(get_job_store(), task['job_id'], meta, f"{task['kind']}-{task['id']}"):
+                            result = await handler(task['payload'])
+                finally:
+                    get_job_store().append_trace(task['job_id'], spans)
+        except Exception as e:
+            logger.exception(f"Task {task['id']} ({task['kind']}) failed on attempt {task['attempts']}")
+            await asyncio.to_thread(self.queue.fail, task['id'], self.worker_id, str(e))
+            if task['attempts'] >= task['max_attempts']:
+                on_task_failed(task, str(e))
+            return
+        finally:
+            heartbeat.cancel()
+
+        follow_ups = None
+        if isinstance(result, TaskResult):
+            result, follow_ups = result
+        if await asyncio.to_thread(self.queue.complete, task['id'], self.worker_id, result, follow_ups):
+            if task['kind'] == 'student':
+                maybe_enqueue_finalize(task['job_id'])
+        else:
+            logger.warning(f"Task {task['id']} finished after its lease was lost; result discarded")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an assessment worker")
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv("WORKER_CONCURRENCY", "4")))
+    parser.add_argument('--poll-interval', type=float, default=float(os.getenv("WORKER_POLL_INTERVAL", "1")))
+    parser.add_argument('--kinds', help="Comma-separated task kinds to run (default: all)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), ".env"))
+    except ImportError:
+        pass
+
+    warm_cpu_pool()
+
+    async def serve():
+        watch_loop()
+        worker = Worker(args.concurrency, args.poll_interval, args.kinds.split(',') if args.kinds else None)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(serve())
+
+
+if __name__ == '__main__':
+    main()